@@ -0,0 +1,646 @@
+#!/usr/bin/env python
+"""
+Benchmark suite of the hot paths of a running bot: order book diffs and snapshots, the order book tracker routing,
+the throttler, the PubSub event dispatch, the client order tracker and the web assistants.
+
+The workloads are synthetic and seeded, so two runs with the same seed and scale process the same messages: diff
+streams with most updates close to the top of the book, bursts of orders and storms of partial fills. The components
+are driven directly, and end to end through the MockWebServer and MockWebSocketServer on localhost, so the suite runs
+offline.
+
+Each benchmark runs once to warm up and then `--repeat` times. The median time per operation is reported, and can be
+saved as JSON with `--output`. With `--baseline` the results are compared with a previous output file, and the script
+exits with an error if any benchmark is slower than the baseline by more than `--max-regression`.
+
+Usage: python benchmarks/hot_paths.py [--filter order_book] [--repeat 5] [--scale 1] [--seed 42]
+                                      [--output results.json] [--baseline baseline.json] [--max-regression 0.2]
+"""
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import random
+import re
+import statistics
+import subprocess
+import sys
+import time
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.client_order_tracker import ClientOrderTracker
+from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, TradeUpdate
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import NumericOrderBookMessage, OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.core.event.event_listener import EventListener
+from hummingbot.core.event.events import MarketEvent
+from hummingbot.core.mock_api.mock_web_server import MockWebServer
+from hummingbot.core.mock_api.mock_web_socket_server import MockWebSocketServerFactory
+from hummingbot.core.pubsub import PubSub
+from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
+from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+
+MID_PRICE = 100.0
+TICK_SIZE = 0.01
+BOOK_LEVELS = 1000
+MOCK_HOST = "api.mock-exchange.io"
+MOCK_WS_URL = "wss://stream.mock-exchange.io/ws"
+SNAPSHOT_LIMIT_ID = "depth"
+
+
+class BenchmarkCase(NamedTuple):
+    """
+    `run` processes the workload once and returns the seconds spent in the measured section, so the preparation of
+    each round is not included in the timings.
+    """
+    operations: int
+    run: Callable[[], float]
+    close: Callable[[], None] = lambda: None
+
+
+BENCHMARKS: Dict[str, Callable[[random.Random, float], BenchmarkCase]] = {}
+
+
+def benchmark(name: str):
+    def register(factory: Callable[[random.Random, float], BenchmarkCase]):
+        BENCHMARKS[name] = factory
+        return factory
+    return register
+
+
+def run_async(coroutine):
+    return asyncio.get_event_loop().run_until_complete(coroutine)
+
+
+# Synthetic workloads
+
+def book_entries(rng: random.Random, side: int, levels: int) -> List[List[str]]:
+    return [[f"{MID_PRICE + side * (i + 1) * TICK_SIZE:.2f}", f"{rng.uniform(0.1, 10):.4f}"] for i in range(levels)]
+
+
+def snapshot_content(rng: random.Random, trading_pair: str, update_id: int, levels: int = BOOK_LEVELS):
+    return {
+        "trading_pair": trading_pair,
+        "update_id": update_id,
+        "bids": book_entries(rng, -1, levels),
+        "asks": book_entries(rng, 1, levels),
+    }
+
+
+def diff_side_entries(rng: random.Random, side: int) -> List[List[str]]:
+    """
+    Most of the updates of a real diff stream are close to the top of the book, and about a third remove a level.
+    """
+    entries = []
+    for _ in range(rng.randint(0, 6)):
+        level = int(rng.expovariate(0.1)) % BOOK_LEVELS + 1
+        amount = 0 if rng.random() < 0.3 else rng.uniform(0.1, 10)
+        entries.append([f"{MID_PRICE + side * level * TICK_SIZE:.2f}", f"{amount:.4f}"])
+    return entries
+
+
+def diff_contents(rng: random.Random, trading_pair: str, first_update_id: int, count: int) -> List[Dict[str, Any]]:
+    return [{"trading_pair": trading_pair,
+             "first_update_id": update_id,
+             "update_id": update_id,
+             "bids": diff_side_entries(rng, -1),
+             "asks": diff_side_entries(rng, 1)}
+            for update_id in range(first_update_id, first_update_id + count)]
+
+
+def interleaved_diff_contents(rng: random.Random, last_update_ids: Dict[str, int], count: int):
+    """
+    Diffs of several trading pairs in random order, with the update ids of each pair following the last ones.
+    """
+    contents = []
+    for _ in range(count):
+        trading_pair = rng.choice(list(last_update_ids))
+        last_update_ids[trading_pair] += 1
+        contents.extend(diff_contents(rng, trading_pair, last_update_ids[trading_pair], 1))
+    return contents
+
+
+def scaled(count: int, scale: float) -> int:
+    return max(1, int(count * scale))
+
+
+# Order book
+
+def order_book_from_snapshot(content: Dict[str, Any]) -> OrderBook:
+    order_book = OrderBook()
+    order_book.apply_snapshot_message(OrderBookMessage(OrderBookMessageType.SNAPSHOT, content, 0))
+    return order_book
+
+
+def diff_messages_case(rng: random.Random, scale: float, message_class) -> BenchmarkCase:
+    snapshot = snapshot_content(rng, "BTC-USDT", update_id=1)
+    contents = diff_contents(rng, "BTC-USDT", first_update_id=2, count=scaled(5000, scale))
+
+    def run() -> float:
+        order_book = order_book_from_snapshot(snapshot)
+        # New messages every round, so the parsing cached by the numeric messages is measured too
+        messages = [message_class(OrderBookMessageType.DIFF, content, 0) for content in contents]
+        start = time.perf_counter()
+        for message in messages:
+            order_book.apply_diff_message(message)
+        return time.perf_counter() - start
+
+    return BenchmarkCase(len(contents), run)
+
+
+@benchmark("order_book.apply_diff_message")
+def order_book_apply_diff_message(rng: random.Random, scale: float) -> BenchmarkCase:
+    return diff_messages_case(rng, scale, OrderBookMessage)
+
+
+@benchmark("order_book.apply_numeric_diff_message")
+def order_book_apply_numeric_diff_message(rng: random.Random, scale: float) -> BenchmarkCase:
+    return diff_messages_case(rng, scale, NumericOrderBookMessage)
+
+
+@benchmark("order_book.apply_snapshot_message")
+def order_book_apply_snapshot_message(rng: random.Random, scale: float) -> BenchmarkCase:
+    messages = [OrderBookMessage(OrderBookMessageType.SNAPSHOT, snapshot_content(rng, "BTC-USDT", update_id), 0)
+                for update_id in range(1, scaled(100, scale) + 1)]
+    order_book = OrderBook()
+
+    def run() -> float:
+        start = time.perf_counter()
+        for message in messages:
+            order_book.apply_snapshot_message(message)
+        return time.perf_counter() - start
+
+    return BenchmarkCase(len(messages), run)
+
+
+# Order book tracker
+
+class SyntheticDataSource(OrderBookTrackerDataSource):
+    """
+    Serves the snapshots from memory. The diffs are put directly in the tracker diff stream by the benchmark.
+    """
+
+    def __init__(self, snapshots: Dict[str, Dict[str, Any]]):
+        super().__init__(trading_pairs=list(snapshots))
+        self._snapshots = snapshots
+
+    async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None) -> Dict[str, float]:
+        return {trading_pair: MID_PRICE for trading_pair in trading_pairs}
+
+    async def _order_book_snapshot(self, trading_pair: str) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.SNAPSHOT, self._snapshots[trading_pair], time.time())
+
+    async def listen_for_subscriptions(self):
+        pass
+
+
+class MockExchangeDataSource(OrderBookTrackerDataSource):
+    """
+    Requests the snapshots from the MockWebServer and receives the diffs as JSON from the MockWebSocketServer, through
+    the web assistants used by the connectors.
+    """
+
+    def __init__(self, trading_pairs: List[str], api_factory: WebAssistantsFactory, ws_url: str):
+        super().__init__(trading_pairs=trading_pairs)
+        self._api_factory = api_factory
+        self._ws_url = ws_url
+
+    async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None) -> Dict[str, float]:
+        return {trading_pair: MID_PRICE for trading_pair in trading_pairs}
+
+    async def _order_book_snapshot(self, trading_pair: str) -> OrderBookMessage:
+        rest_assistant = await self._api_factory.get_rest_assistant()
+        snapshot = await rest_assistant.execute_request(url=str(MockWebServer.reroute_local(f"https://{MOCK_HOST}/depth")),
+                                                        params={"symbol": trading_pair},
+                                                        throttler_limit_id=SNAPSHOT_LIMIT_ID)
+        return OrderBookMessage(OrderBookMessageType.SNAPSHOT, snapshot, time.time())
+
+    async def _connected_websocket_assistant(self) -> WSAssistant:
+        ws: WSAssistant = await self._api_factory.get_ws_assistant()
+        await ws.connect(ws_url=self._ws_url)
+        return ws
+
+    async def _subscribe_channels(self, ws: WSAssistant):
+        pass
+
+    def _channel_originating_message(self, event_message: Dict[str, Any]) -> str:
+        return self._diff_messages_queue_key
+
+    async def _parse_order_book_diff_message(self, raw_message: Dict[str, Any], message_queue: asyncio.Queue):
+        message_queue.put_nowait(OrderBookMessage(OrderBookMessageType.DIFF, raw_message, time.time()))
+
+
+async def wait_for_diffs(order_books: Dict[str, OrderBook], last_update_ids: Dict[str, int]):
+    while any(order_books[trading_pair].last_diff_uid < update_id for trading_pair, update_id in last_update_ids.items()):
+        await asyncio.sleep(0)
+
+
+def trading_pairs_snapshots(rng: random.Random, count: int) -> Dict[str, Dict[str, Any]]:
+    trading_pairs = [f"COIN{i}-USDT" for i in range(count)]
+    return {trading_pair: snapshot_content(rng, trading_pair, update_id=1) for trading_pair in trading_pairs}
+
+
+@benchmark("order_book_tracker.route_diffs")
+def order_book_tracker_route_diffs(rng: random.Random, scale: float) -> BenchmarkCase:
+    snapshots = trading_pairs_snapshots(rng, 10)
+    tracker = OrderBookTracker(SyntheticDataSource(snapshots), list(snapshots), concurrent_init=True)
+    tracker.start()
+    run_async(asyncio.wait_for(tracker.wait_ready(), timeout=30))
+    last_update_ids = {trading_pair: 1 for trading_pair in snapshots}
+    diffs_per_round = scaled(10000, scale)
+
+    def run() -> float:
+        messages = [OrderBookMessage(OrderBookMessageType.DIFF, content, 0)
+                    for content in interleaved_diff_contents(rng, last_update_ids, diffs_per_round)]
+        start = time.perf_counter()
+        for message in messages:
+            tracker._order_book_diff_stream.put_nowait(message)
+        run_async(wait_for_diffs(tracker.order_books, last_update_ids))
+        return time.perf_counter() - start
+
+    return BenchmarkCase(diffs_per_round, run, close=tracker.stop)
+
+
+def start_mock_web_server(snapshots: Dict[str, Dict[str, Any]]) -> MockWebServer:
+    web_server = MockWebServer.get_instance()
+    web_server.add_host_to_mock(MOCK_HOST)
+    web_server.start()
+    run_async(asyncio.wait_for(web_server.wait_til_started(), timeout=10))
+    for trading_pair, snapshot in snapshots.items():
+        web_server.update_response("get", MOCK_HOST, "/depth", snapshot, params={"symbol": trading_pair})
+    return web_server
+
+
+def start_mock_web_socket_server():
+    ws_server = MockWebSocketServerFactory.start_new_server(MOCK_WS_URL)
+    run_async(asyncio.wait_for(ws_server.wait_til_started(), timeout=10))
+    return ws_server
+
+
+async def send_json_messages(ws_server, contents: List[Dict[str, Any]]):
+    ws_server.wait_til_websocket_is_initialized()
+    for content in contents:
+        await ws_server.websocket.send_json(content)
+
+
+def stop_mock_web_socket_server(ws_server):
+    # MockWebSocketServer.stop shuts the server down from the caller loop, which fails with a client connected
+    asyncio.run_coroutine_threadsafe(ws_server._runner.cleanup(), ws_server.ev_loop).result(timeout=10)
+    ws_server.ev_loop.call_soon_threadsafe(ws_server.ev_loop.stop)
+
+
+def send_from_mock_web_socket_server(ws_server, contents: List[Dict[str, Any]]):
+    asyncio.run_coroutine_threadsafe(send_json_messages(ws_server, contents), ws_server.ev_loop)
+
+
+def web_assistants_factory() -> WebAssistantsFactory:
+    throttler = AsyncThrottler(rate_limits=[RateLimit(limit_id=SNAPSHOT_LIMIT_ID, limit=1000000, time_interval=1)])
+    return WebAssistantsFactory(throttler=throttler)
+
+
+async def close_web_assistants_factory(api_factory: WebAssistantsFactory):
+    shared_client = api_factory._connections_factory._shared_client
+    if shared_client is not None:
+        await shared_client.close()
+
+
+@benchmark("order_book_tracker.mock_exchange")
+def order_book_tracker_mock_exchange(rng: random.Random, scale: float) -> BenchmarkCase:
+    snapshots = trading_pairs_snapshots(rng, 5)
+    web_server = start_mock_web_server(snapshots)
+    ws_server = start_mock_web_socket_server()
+    api_factory = web_assistants_factory()
+    data_source = MockExchangeDataSource(list(snapshots), api_factory, f"ws://{ws_server.host}:{ws_server.port}")
+    tracker = OrderBookTracker(data_source, list(snapshots), concurrent_init=True)
+    tracker.start()
+    run_async(asyncio.wait_for(tracker.wait_ready(), timeout=30))
+    last_update_ids = {trading_pair: 1 for trading_pair in snapshots}
+    diffs_per_round = scaled(2000, scale)
+
+    def run() -> float:
+        contents = interleaved_diff_contents(rng, last_update_ids, diffs_per_round)
+        start = time.perf_counter()
+        send_from_mock_web_socket_server(ws_server, contents)
+        run_async(asyncio.wait_for(wait_for_diffs(tracker.order_books, last_update_ids), timeout=60))
+        return time.perf_counter() - start
+
+    def close():
+        tracker.stop()
+        run_async(close_web_assistants_factory(api_factory))
+        stop_mock_web_socket_server(ws_server)
+        web_server.stop()
+
+    return BenchmarkCase(diffs_per_round, run, close)
+
+
+# Web assistants
+
+@benchmark("rest_assistant.mock_web_server")
+def rest_assistant_mock_web_server(rng: random.Random, scale: float) -> BenchmarkCase:
+    snapshots = trading_pairs_snapshots(rng, 1)
+    web_server = start_mock_web_server({trading_pair: {**snapshot, "bids": snapshot["bids"][:20],
+                                                       "asks": snapshot["asks"][:20]}
+                                        for trading_pair, snapshot in snapshots.items()})
+    api_factory = web_assistants_factory()
+    url = str(MockWebServer.reroute_local(f"https://{MOCK_HOST}/depth"))
+    params = {"symbol": next(iter(snapshots))}
+    requests_per_round = scaled(200, scale)
+
+    async def request_snapshots() -> float:
+        rest_assistant = await api_factory.get_rest_assistant()
+        start = time.perf_counter()
+        for _ in range(requests_per_round):
+            await rest_assistant.execute_request(url=url, params=params, throttler_limit_id=SNAPSHOT_LIMIT_ID)
+        return time.perf_counter() - start
+
+    def close():
+        run_async(close_web_assistants_factory(api_factory))
+        web_server.stop()
+
+    return BenchmarkCase(requests_per_round, lambda: run_async(request_snapshots()), close)
+
+
+@benchmark("ws_assistant.mock_web_socket_server")
+def ws_assistant_mock_web_socket_server(rng: random.Random, scale: float) -> BenchmarkCase:
+    ws_server = start_mock_web_socket_server()
+    api_factory = web_assistants_factory()
+    ws: WSAssistant = run_async(api_factory.get_ws_assistant())
+    run_async(ws.connect(ws_url=f"ws://{ws_server.host}:{ws_server.port}"))
+    messages_per_round = scaled(5000, scale)
+
+    async def receive_messages(count: int):
+        for _ in range(count):
+            await ws.receive()
+
+    def run() -> float:
+        contents = diff_contents(rng, "BTC-USDT", 1, messages_per_round)
+        start = time.perf_counter()
+        send_from_mock_web_socket_server(ws_server, contents)
+        run_async(asyncio.wait_for(receive_messages(messages_per_round), timeout=60))
+        return time.perf_counter() - start
+
+    def close():
+        run_async(ws.disconnect())
+        run_async(close_web_assistants_factory(api_factory))
+        stop_mock_web_socket_server(ws_server)
+
+    return BenchmarkCase(messages_per_round, run, close)
+
+
+# Throttler and events
+
+@benchmark("throttler.acquire_burst")
+def throttler_acquire_burst(rng: random.Random, scale: float) -> BenchmarkCase:
+    """
+    A burst of order requests, each one linked to the global request weight limit, like the connector limits.
+    """
+    rate_limits = [
+        RateLimit(limit_id="global", limit=10000000, time_interval=60),
+        RateLimit(limit_id="orders", limit=1000000, time_interval=10,
+                  linked_limits=[LinkedLimitWeightPair("global", weight=1)]),
+        RateLimit(limit_id="depth", limit=1000000, time_interval=60,
+                  linked_limits=[LinkedLimitWeightPair("global", weight=10)]),
+    ]
+    limit_ids = [rng.choice(("orders", "orders", "orders", "depth")) for _ in range(scaled(1000, scale))]
+
+    async def acquire_burst() -> float:
+        throttler = AsyncThrottler(rate_limits=rate_limits)
+        start = time.perf_counter()
+        for limit_id in limit_ids:
+            async with throttler.execute_task(limit_id=limit_id):
+                pass
+        return time.perf_counter() - start
+
+    return BenchmarkCase(len(limit_ids), lambda: run_async(acquire_burst()))
+
+
+class CountingListener(EventListener):
+    def __init__(self):
+        super().__init__()
+        self.count = 0
+
+    def __call__(self, arg: Any):
+        self.count += 1
+
+
+@benchmark("pubsub.trigger_event")
+def pubsub_trigger_event(rng: random.Random, scale: float) -> BenchmarkCase:
+    pubsub = PubSub()
+    # The PubSub keeps weak references, the listeners live as long as the benchmark
+    listeners = [CountingListener() for _ in range(10)]
+    for listener in listeners:
+        pubsub.add_listener(MarketEvent.OrderFilled, listener)
+    events = scaled(20000, scale)
+
+    def run() -> float:
+        start = time.perf_counter()
+        for _ in range(events):
+            pubsub.trigger_event(MarketEvent.OrderFilled, listeners)
+        return time.perf_counter() - start
+
+    return BenchmarkCase(events, run)
+
+
+# Client order tracker
+
+class MockExchange(ExchangeBase):
+    @property
+    def order_books(self) -> Dict[str, OrderBook]:
+        return dict()
+
+
+def client_order_tracker(orders: int) -> ClientOrderTracker:
+    connector = MockExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+    connector._set_current_timestamp(1640000000.0)
+    tracker = ClientOrderTracker(connector=connector)
+    for i in range(orders):
+        tracker.start_tracking_order(InFlightOrder(client_order_id=f"OID{i}",
+                                                   exchange_order_id=f"EOID{i}",
+                                                   trading_pair="BTC-USDT",
+                                                   order_type=OrderType.LIMIT,
+                                                   trade_type=TradeType.BUY if i % 2 == 0 else TradeType.SELL,
+                                                   amount=Decimal("10"),
+                                                   creation_timestamp=1640000000.0,
+                                                   price=Decimal("100"),
+                                                   initial_state=OrderState.OPEN))
+    return tracker
+
+
+@benchmark("client_order_tracker.order_burst")
+def client_order_tracker_order_burst(rng: random.Random, scale: float) -> BenchmarkCase:
+    """
+    Tracks a burst of orders, and looks each one up by client order id and by exchange order id, like the status
+    updates of the connectors do.
+    """
+    orders = scaled(1000, scale)
+    lookups = [rng.randrange(orders) for _ in range(orders)]
+
+    def run() -> float:
+        start = time.perf_counter()
+        tracker = client_order_tracker(orders)
+        for i in lookups:
+            tracker.fetch_order(client_order_id=f"OID{i}")
+            tracker.fetch_order(exchange_order_id=f"EOID{i}")
+        return time.perf_counter() - start
+
+    return BenchmarkCase(orders, run)
+
+
+@benchmark("client_order_tracker.fill_storm")
+def client_order_tracker_fill_storm(rng: random.Random, scale: float) -> BenchmarkCase:
+    """
+    Partial fills of the tracked orders in random order, each fill of one unit of the ten of the order.
+    """
+    orders = scaled(1000, scale)
+    fills = [(order, fill) for order in range(orders) for fill in range(10)]
+    rng.shuffle(fills)
+    fee = AddedToCostTradeFee(percent=Decimal("0.001"))
+
+    def run() -> float:
+        tracker = client_order_tracker(orders)
+        trade_updates = [TradeUpdate(trade_id=f"T{order}-{fill}",
+                                     client_order_id=f"OID{order}",
+                                     exchange_order_id=f"EOID{order}",
+                                     trading_pair="BTC-USDT",
+                                     fill_timestamp=1640000001.0,
+                                     fill_price=Decimal("100"),
+                                     fill_base_amount=Decimal("1"),
+                                     fill_quote_amount=Decimal("100"),
+                                     fee=fee)
+                         for order, fill in fills]
+        start = time.perf_counter()
+        for trade_update in trade_updates:
+            tracker.process_trade_update(trade_update)
+        return time.perf_counter() - start
+
+    return BenchmarkCase(len(fills), run)
+
+
+# Runner
+
+def measure(name: str, factory: Callable[[random.Random, float], BenchmarkCase], repeat: int, seed: int,
+            scale: float) -> Dict[str, float]:
+    # Each benchmark has its own generator, so its workload does not depend on the other benchmarks selected
+    case = factory(random.Random(f"{seed}-{name}"), scale)
+    try:
+        case.run()
+        timings = [case.run() / case.operations for _ in range(repeat)]
+    finally:
+        case.close()
+    median = statistics.median(timings)
+    return {
+        "operations": case.operations,
+        "median_us": median * 1e6,
+        "min_us": min(timings) * 1e6,
+        "max_us": max(timings) * 1e6,
+        "ops_per_second": 1 / median,
+    }
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]],
+            max_regression: float) -> Dict[str, float]:
+    """
+    Returns the relative change of the median time of the benchmarks that are slower than the baseline by more than
+    max_regression.
+    """
+    regressions = {}
+    for name, result in results.items():
+        if name in baseline:
+            change = result["median_us"] / baseline[name]["median_us"] - 1
+            result["baseline_median_us"] = baseline[name]["median_us"]
+            result["change"] = change
+            if change > max_regression:
+                regressions[name] = change
+    return regressions
+
+
+def print_results(results: Dict[str, Dict[str, float]]):
+    name_width = max(len(name) for name in results)
+    print(f"{'benchmark':<{name_width}}  {'ops':>7}  {'median us/op':>12}  {'min us/op':>10}  {'ops/s':>12}"
+          f"  {'baseline us/op':>14}  {'change':>8}")
+    for name, result in results.items():
+        line = (f"{name:<{name_width}}  {result['operations']:>7}  {result['median_us']:>12.3f}  "
+                f"{result['min_us']:>10.3f}  {result['ops_per_second']:>12,.0f}")
+        if "change" in result:
+            line += f"  {result['baseline_median_us']:>14.3f}  {result['change']:>+8.1%}"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--filter", default=None, help="Regular expression to select the benchmarks by name")
+    parser.add_argument("--repeat", type=int, default=5, help="Measured runs of each benchmark")
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiplier of the workload sizes")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default=None, help="JSON file to save the results to")
+    parser.add_argument("--baseline", default=None, help="JSON results of a previous run to compare with")
+    parser.add_argument("--max-regression", type=float, default=0.2,
+                        help="Relative increase of the median time over the baseline that fails the comparison")
+    parser.add_argument("--list", action="store_true", help="List the benchmarks and exit")
+    args = parser.parse_args()
+
+    names = [name for name in BENCHMARKS if args.filter is None or re.search(args.filter, name)]
+    if args.list:
+        print("\n".join(names))
+        return
+    if not names:
+        parser.error(f"No benchmark matches {args.filter}")
+
+    # The components log their connection errors and warnings, which are not relevant for the timings
+    logging.getLogger("hummingbot").setLevel(logging.ERROR)
+    logging.getLogger("aiohttp").setLevel(logging.WARNING)
+    asyncio.set_event_loop(asyncio.new_event_loop())
+
+    results = {}
+    for name in names:
+        results[name] = measure(name, BENCHMARKS[name], args.repeat, args.seed, args.scale)
+
+    regressions = {}
+    if args.baseline is not None:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+        if baseline["metadata"]["scale"] != args.scale:
+            print(f"warning: the baseline was run with scale {baseline['metadata']['scale']}", file=sys.stderr)
+        regressions = compare(results, baseline["results"], args.max_regression)
+    print_results(results)
+
+    if args.output is not None:
+        with open(args.output, "w") as output_file:
+            json.dump({
+                "metadata": {
+                    "timestamp": time.time(),
+                    "git_commit": git_commit(),
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "seed": args.seed,
+                    "scale": args.scale,
+                    "repeat": args.repeat,
+                },
+                "results": results,
+            }, output_file, indent=2)
+
+    if regressions:
+        for name, change in regressions.items():
+            print(f"regression: {name} is {change:.1%} slower than the baseline", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+"""
+Micro-benchmark of the order book volume and price queries, comparing the cumulative depth index with the linear walk
+over the book entries.
+
+Each round applies a small diff to the book (which invalidates part of the index) and then runs a number of queries,
+like a strategy does on every tick.
+
+Usage: python benchmarks/order_book_depth_index.py [--levels 1000] [--rounds 2000] [--queries-per-round 10]
+"""
+import argparse
+import random
+import time
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+
+MID_PRICE = 100.0
+TICK_SIZE = 0.01
+
+
+def make_snapshot(rng: random.Random, levels: int) -> Tuple[np.ndarray, np.ndarray]:
+    bids = [[MID_PRICE - (i + 1) * TICK_SIZE, rng.uniform(0.1, 10), 1] for i in range(levels)]
+    asks = [[MID_PRICE + (i + 1) * TICK_SIZE, rng.uniform(0.1, 10), 1] for i in range(levels)]
+    return np.array(bids, dtype=np.float64), np.array(asks, dtype=np.float64)
+
+
+def make_diffs(rng: random.Random, levels: int, rounds: int) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Most of the updates of a real diff stream are close to the top of the book.
+    """
+    diffs = []
+    for update_id in range(2, rounds + 2):
+        bids = [[MID_PRICE - (int(rng.expovariate(0.1)) % levels + 1) * TICK_SIZE,
+                 rng.choice([0, rng.uniform(0.1, 10)]),
+                 update_id]
+                for _ in range(rng.randint(1, 3))]
+        asks = [[MID_PRICE + (int(rng.expovariate(0.1)) % levels + 1) * TICK_SIZE,
+                 rng.choice([0, rng.uniform(0.1, 10)]),
+                 update_id]
+                for _ in range(rng.randint(1, 3))]
+        diffs.append((np.array(bids, dtype=np.float64), np.array(asks, dtype=np.float64)))
+    return diffs
+
+
+def query_functions(order_book: OrderBook) -> Dict[str, Callable[[bool, float], object]]:
+    return {
+        "get_price_for_volume": order_book.get_price_for_volume,
+        "get_vwap_for_volume": order_book.get_vwap_for_volume,
+        "get_price_for_quote_volume": lambda is_buy, volume: order_book.get_price_for_quote_volume(
+            is_buy, volume * MID_PRICE),
+        "get_quote_volume_for_base_amount": order_book.get_quote_volume_for_base_amount,
+    }
+
+
+def run(depth_index_enabled: bool, levels: int, rounds: int, queries_per_round: int, seed: int) -> Dict[str, float]:
+    rng = random.Random(seed)
+    order_book = OrderBook()
+    order_book.depth_index_enabled = depth_index_enabled
+    order_book.apply_numpy_snapshot(*make_snapshot(rng, levels))
+    diffs = make_diffs(rng, levels, rounds)
+    # Query volumes reaching up to about a third of the book depth
+    volumes = [rng.uniform(1, levels * 1.5) for _ in range(queries_per_round)]
+
+    results = {}
+    for name, query in query_functions(order_book).items():
+        elapsed = 0.0
+        for bids, asks in diffs:
+            order_book.apply_numpy_diffs(bids, asks)
+            start = time.perf_counter()
+            for volume in volumes:
+                query(True, volume)
+                query(False, volume)
+            elapsed += time.perf_counter() - start
+        results[name] = elapsed / (rounds * queries_per_round * 2) * 1e6
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--levels", type=int, default=1000, help="Number of price levels per side")
+    parser.add_argument("--rounds", type=int, default=2000, help="Number of diffs applied")
+    parser.add_argument("--queries-per-round", type=int, default=10, help="Number of queries per side after each diff")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    linear = run(False, args.levels, args.rounds, args.queries_per_round, args.seed)
+    indexed = run(True, args.levels, args.rounds, args.queries_per_round, args.seed)
+
+    print(f"{args.levels} levels per side, {args.rounds} diffs, {args.queries_per_round * 2} queries per diff")
+    print(f"{'query':<36}{'linear (us)':>14}{'indexed (us)':>14}{'speedup':>10}")
+    for name in linear:
+        print(f"{name:<36}{linear[name]:>14.2f}{indexed[name]:>14.2f}{linear[name] / indexed[name]:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+"""
+Micro-benchmark of the PubSub event dispatch: triggering events with no listeners, like the order book trade events of
+markets nobody listens to, and with a growing number of listeners, like the fill events forwarded to the strategy,
+the markets recorder and the notifiers.
+
+The last case has a listener that removes and adds back another listener while the event is dispatched, which makes
+the PubSub copy the listeners.
+
+Usage: python benchmarks/pubsub_dispatch.py [--events 100000] [--repeat 5]
+"""
+import argparse
+import statistics
+import time
+from enum import Enum
+from typing import Any, Callable, List
+
+from hummingbot.core.event.event_listener import EventListener
+from hummingbot.core.pubsub import PubSub
+
+
+class BenchmarkEvent(Enum):
+    Listened = 1
+    NotListened = 2
+
+
+class CountingListener(EventListener):
+    def __init__(self):
+        super().__init__()
+        self.count = 0
+
+    def __call__(self, arg: Any):
+        self.count += 1
+
+
+class ResubscribingListener(EventListener):
+    def __init__(self, pubsub: PubSub, other: EventListener):
+        super().__init__()
+        self.pubsub = pubsub
+        self.other = other
+
+    def __call__(self, arg: Any):
+        self.pubsub.remove_listener(BenchmarkEvent.Listened, self.other)
+        self.pubsub.add_listener(BenchmarkEvent.Listened, self.other)
+
+
+def make_pubsub(listeners_count: int) -> (PubSub, List[EventListener]):
+    pubsub = PubSub()
+    # The PubSub keeps weak references to the listeners
+    listeners = [CountingListener() for _ in range(listeners_count)]
+    for listener in listeners:
+        pubsub.add_listener(BenchmarkEvent.Listened, listener)
+    return pubsub, listeners
+
+
+def time_per_event(trigger: Callable[[], None], events: int, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(events):
+            trigger()
+        timings.append((time.perf_counter() - start) / events)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=100000, help="Events triggered in each measured run")
+    parser.add_argument("--repeat", type=int, default=5, help="Measured runs of each case")
+    args = parser.parse_args()
+
+    print(f"{'case':<36}  {'ns/event':>10}")
+    pubsub, listeners = make_pubsub(10)
+    ns = time_per_event(lambda: pubsub.trigger_event(BenchmarkEvent.NotListened, None), args.events, args.repeat)
+    print(f"{'no listeners':<36}  {ns * 1e9:>10.0f}")
+
+    for listeners_count in (1, 10, 100):
+        pubsub, listeners = make_pubsub(listeners_count)
+        ns = time_per_event(lambda: pubsub.trigger_event(BenchmarkEvent.Listened, None), args.events, args.repeat)
+        print(f"{f'{listeners_count} listeners':<36}  {ns * 1e9:>10.0f}")
+
+    pubsub, listeners = make_pubsub(10)
+    resubscribing_listener = ResubscribingListener(pubsub, listeners[0])
+    pubsub.add_listener(BenchmarkEvent.Listened, resubscribing_listener)
+    ns = time_per_event(lambda: pubsub.trigger_event(BenchmarkEvent.Listened, None), args.events, args.repeat)
+    print(f"{'10 listeners, mutated on dispatch':<36}  {ns * 1e9:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
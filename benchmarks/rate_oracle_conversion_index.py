@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+"""
+Micro-benchmark of the rate lookups on the RateOracle prices, comparing the conversion index with find_rate, which
+scans all the prices to find cross rates.
+
+The price map imitates the one of the Binance rate source: most assets are quoted in USDT, and part of them also in
+BTC, ETH, BNB, BUSD and some fiat currencies. The queried pairs mix direct, inverse and cross rates, like the ones
+requested by the strategies, the fee conversions and the performance reports.
+
+Usage: python benchmarks/rate_oracle_conversion_index.py [--pairs 2000] [--lookups 20000]
+"""
+import argparse
+import random
+import time
+from decimal import Decimal
+from typing import Dict, List
+
+from hummingbot.core.rate_oracle.utils import ConversionRateIndex, find_rate
+
+QUOTE_TOKENS = ["USDT", "BTC", "ETH", "BNB", "BUSD", "EUR", "TRY", "BRL"]
+QUOTE_TOKENS_WEIGHTS = [50, 15, 8, 8, 10, 3, 3, 3]
+
+
+def make_prices(rng: random.Random, pairs: int) -> Dict[str, Decimal]:
+    prices = {"BTC-USDT": Decimal("20000"), "ETH-USDT": Decimal("1500"), "BNB-USDT": Decimal("300"),
+              "BUSD-USDT": Decimal("1"), "USDT-EUR": Decimal("0.95"), "USDT-TRY": Decimal("18.6"),
+              "USDT-BRL": Decimal("5.2"), "ETH-BTC": Decimal("0.075"), "BNB-BTC": Decimal("0.015")}
+    asset_number = 0
+    while len(prices) < pairs:
+        asset = f"ASSET{asset_number}"
+        asset_number += 1
+        quotes = set(rng.choices(QUOTE_TOKENS, weights=QUOTE_TOKENS_WEIGHTS, k=rng.randint(1, 3)))
+        for quote in quotes:
+            prices[f"{asset}-{quote}"] = Decimal(str(round(rng.uniform(0.0001, 1000), 6)))
+    return prices
+
+
+def make_lookups(rng: random.Random, prices: Dict[str, Decimal], lookups: int) -> List[str]:
+    assets = sorted({pair.split("-")[0] for pair in prices})
+    pairs = list(prices)
+    lookup_pairs = []
+    for _ in range(lookups):
+        kind = rng.random()
+        if kind < 0.4:
+            lookup_pairs.append(rng.choice(pairs))
+        elif kind < 0.6:
+            base, quote = rng.choice(pairs).split("-")
+            lookup_pairs.append(f"{quote}-{base}")
+        else:
+            lookup_pairs.append(f"{rng.choice(assets)}-{rng.choice(['USDT', 'USD', 'BTC', 'EUR', 'ETH'])}")
+    return lookup_pairs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pairs", type=int, default=2000, help="Number of trading pairs in the price map")
+    parser.add_argument("--lookups", type=int, default=20000, help="Number of rate lookups")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    prices = make_prices(rng, args.pairs)
+    lookup_pairs = make_lookups(rng, prices, args.lookups)
+
+    start = time.perf_counter()
+    scan_rates = [find_rate(prices, pair) for pair in lookup_pairs]
+    scan_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    conversion_index = ConversionRateIndex(prices=prices, bridge_tokens=())
+    build_time = time.perf_counter() - start
+    start = time.perf_counter()
+    index_rates = [conversion_index.find_rate(pair) for pair in lookup_pairs]
+    index_time = time.perf_counter() - start
+
+    mismatches = sum(1 for scan_rate, index_rate in zip(scan_rates, index_rates)
+                     if scan_rate is not None and scan_rate != index_rate)
+    bridged_index = ConversionRateIndex(prices=prices)
+    found_with_bridges = sum(1 for pair in lookup_pairs if bridged_index.find_rate(pair) is not None)
+
+    print(f"{len(prices)} prices, {len(lookup_pairs)} lookups ({len(set(lookup_pairs))} distinct pairs)")
+    print(f"{'method':<28}{'per lookup (us)':>18}{'total (ms)':>14}")
+    print(f"{'find_rate scan':<28}{scan_time / len(lookup_pairs) * 1e6:>18.2f}{scan_time * 1e3:>14.2f}")
+    print(f"{'conversion index':<28}{index_time / len(lookup_pairs) * 1e6:>18.2f}{index_time * 1e3:>14.2f}")
+    print(f"{'conversion index build':<28}{'':>18}{build_time * 1e3:>14.2f}")
+    print(f"speedup: {scan_time / (index_time + build_time):.1f}x including the build, {scan_time / index_time:.1f}x "
+          f"without it")
+    print(f"rates found: scan {sum(rate is not None for rate in scan_rates)}, "
+          f"index {sum(rate is not None for rate in index_rates)}, index with bridges {found_with_bridges}; "
+          f"{mismatches} mismatches with the scan")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+"""
+Benchmark of a backtest with the ReplayExchange: a pure market making strategy runs on one day of 1 minute candles of
+one trading pair, with the clock in backtest mode.
+
+The candles are a random walk saved to a temporary CSV file with the format of `scripts/download_candles.py`, unless a
+candles file is provided.
+
+Usage: python benchmarks/replay_backtest.py [--candles data/candles_binance_BTC-USDT_1m.csv] [--tick-size 1]
+"""
+import argparse
+import os
+import tempfile
+import time
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.exchange.paper_trade.replay_data import candles_csv_events
+from hummingbot.connector.exchange.paper_trade.replay_exchange import ReplayExchange
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import MarketEvent
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingbot.strategy.pure_market_making.pure_market_making import PureMarketMakingStrategy
+
+TRADING_PAIR = "BTC-USDT"
+START_TIMESTAMP = 1672531200
+
+
+def write_random_candles(file_path: str, seed: int):
+    rng = np.random.default_rng(seed)
+    candles = 24 * 60
+    close = 20000 * np.exp(np.cumsum(rng.normal(0, 0.001, candles)))
+    open_price = np.concatenate([[20000], close[:-1]])
+    high = np.maximum(open_price, close) * (1 + np.abs(rng.normal(0, 0.0005, candles)))
+    low = np.minimum(open_price, close) * (1 - np.abs(rng.normal(0, 0.0005, candles)))
+    pd.DataFrame({
+        "timestamp": (START_TIMESTAMP + 60 * np.arange(candles)) * 1000,
+        "open": open_price,
+        "high": high,
+        "low": low,
+        "close": close,
+        "volume": rng.uniform(1, 10, candles),
+    }).to_csv(file_path, index=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--candles", help="Candles CSV file, a random walk is used if not provided")
+    parser.add_argument("--tick-size", type=float, default=1.0, help="Clock tick size in seconds")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        candles_path = args.candles
+        if candles_path is None:
+            candles_path = os.path.join(temp_dir, "candles.csv")
+            write_random_candles(candles_path, args.seed)
+        timestamps = pd.read_csv(candles_path, usecols=["timestamp"])["timestamp"]
+        start, end = timestamps.iloc[0] / 1e3, timestamps.iloc[-1] / 1e3 + 60
+
+        exchange = ReplayExchange(ClientConfigAdapter(ClientConfigMap()),
+                                  trading_pairs=[TRADING_PAIR],
+                                  events=candles_csv_events(candles_path, TRADING_PAIR))
+        exchange.set_balance("BTC", Decimal("1"))
+        exchange.set_balance("USDT", Decimal("20000"))
+        strategy = PureMarketMakingStrategy()
+        strategy.init_params(MarketTradingPairTuple(exchange, TRADING_PAIR, "BTC", "USDT"),
+                             bid_spread=Decimal("0.001"),
+                             ask_spread=Decimal("0.001"),
+                             order_amount=Decimal("0.01"),
+                             order_refresh_time=30,
+                             filled_order_delay=30)
+        fill_logger = EventLogger()
+        exchange.add_listener(MarketEvent.OrderFilled, fill_logger)
+        clock = Clock(ClockMode.BACKTEST, args.tick_size, start, end)
+        clock.add_iterator(exchange)
+        clock.add_iterator(strategy)
+
+        run_start = time.perf_counter()
+        clock.backtest()
+        elapsed = time.perf_counter() - run_start
+
+    ticks = int((end - start) / args.tick_size)
+    print(f"replayed {(end - start) / 3600:.1f} hours of {TRADING_PAIR} in {elapsed:.2f} s "
+          f"({ticks} ticks, {elapsed / ticks * 1e6:.1f} us per tick)")
+    print(f"fills: {len(fill_logger.event_log)}, balances: "
+          f"{', '.join(f'{asset} {balance:.4f}' for asset, balance in exchange.get_all_balances().items())}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+"""
+Latency benchmark of `RESTAssistant.execute_request` against the `MockWebServer`, with the requests of the order
+placement and cancelation hot path: an authenticated POST with the order in the body and an authenticated DELETE
+with the order in the query parameters, both signed by `BinanceAuth`.
+
+The latency includes the local HTTP round trip, so the benchmark also times the copy of the request done by
+`RESTAssistant.call` before the pre-processors and the auth run, against the `deepcopy` it replaces.
+
+Usage: python benchmarks/rest_request_latency.py [--requests 2000] [--warmup 100]
+"""
+import argparse
+import asyncio
+import copy
+import logging
+import statistics
+import time
+from typing import Any, Awaitable, Callable, Dict, List
+
+from hummingbot.connector.exchange.binance.binance_auth import BinanceAuth
+from hummingbot.connector.time_synchronizer import TimeSynchronizer
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.mock_api.mock_web_server import MockWebServer
+from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest
+from hummingbot.core.web_assistant.rest_assistant import RESTAssistant
+from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
+
+MOCK_HOST = "api.mock-exchange.io"
+ORDER_PATH = "/api/v3/order"
+ORDER_LIMIT_ID = "order"
+
+
+def order_params(order_number: int) -> Dict[str, Any]:
+    return {"symbol": "COINALPHAHBOT",
+            "side": "BUY",
+            "quantity": "1.00000000",
+            "type": "LIMIT",
+            "newClientOrderId": f"x-XEKWYICX-BCAHT{order_number:016d}",
+            "price": "10.00000000",
+            "timeInForce": "GTC"}
+
+
+def start_mock_web_server() -> MockWebServer:
+    web_server = MockWebServer.get_instance()
+    web_server.add_host_to_mock(MOCK_HOST)
+    web_server.start()
+    asyncio.get_event_loop().run_until_complete(asyncio.wait_for(web_server.wait_til_started(), timeout=10))
+    web_server.update_response("post", MOCK_HOST, ORDER_PATH, {"orderId": 1, "transactTime": 1640780000000})
+    web_server.update_response("delete", MOCK_HOST, ORDER_PATH, {"orderId": 1, "status": "CANCELED"})
+    return web_server
+
+
+async def measure_latencies(send_request: Callable[[int], Awaitable[Any]], requests: int, warmup: int) -> List[float]:
+    for order_number in range(warmup):
+        await send_request(order_number)
+    latencies = []
+    for order_number in range(warmup, warmup + requests):
+        start = time.perf_counter()
+        await send_request(order_number)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def measure_copy(copy_function: Callable[[RESTRequest], RESTRequest], request: RESTRequest, copies: int) -> float:
+    start = time.perf_counter()
+    for _ in range(copies):
+        copy_function(request)
+    return (time.perf_counter() - start) / copies
+
+
+def print_latencies(name: str, latencies: List[float]):
+    latencies_us = sorted(latency * 1e6 for latency in latencies)
+    p50, p90, p99 = (latencies_us[min(int(q * len(latencies_us)), len(latencies_us) - 1)] for q in (0.5, 0.9, 0.99))
+    print(f"{name:<32}{statistics.mean(latencies_us):>10.0f}{p50:>10.0f}{p90:>10.0f}{p99:>10.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000, help="Measured requests of each kind")
+    parser.add_argument("--warmup", type=int, default=100, help="Requests sent before measuring")
+    args = parser.parse_args()
+    logging.getLogger("aiohttp").setLevel(logging.WARNING)
+
+    ev_loop = asyncio.get_event_loop()
+    web_server = start_mock_web_server()
+    throttler = AsyncThrottler(rate_limits=[RateLimit(limit_id=ORDER_LIMIT_ID, limit=1000000, time_interval=1)])
+    auth = BinanceAuth(api_key="someKey", secret_key="someSecret", time_provider=TimeSynchronizer())
+    api_factory = WebAssistantsFactory(throttler=throttler, auth=auth)
+    url = str(MockWebServer.reroute_local(f"https://{MOCK_HOST}{ORDER_PATH}"))
+
+    try:
+        rest_assistant: RESTAssistant = ev_loop.run_until_complete(api_factory.get_rest_assistant())
+
+        def place_order(order_number: int) -> Awaitable[Any]:
+            return rest_assistant.execute_request(url=url, throttler_limit_id=ORDER_LIMIT_ID,
+                                                  data=order_params(order_number), method=RESTMethod.POST,
+                                                  is_auth_required=True)
+
+        def cancel_order(order_number: int) -> Awaitable[Any]:
+            params = {"symbol": "COINALPHAHBOT", "origClientOrderId": f"x-XEKWYICX-BCAHT{order_number:016d}"}
+            return rest_assistant.execute_request(url=url, throttler_limit_id=ORDER_LIMIT_ID, params=params,
+                                                  method=RESTMethod.DELETE, is_auth_required=True)
+
+        print(f"{args.requests} requests of each kind")
+        print(f"{'request (us)':<32}{'mean':>10}{'p50':>10}{'p90':>10}{'p99':>10}")
+        for name, send_request in (("place order (POST)", place_order), ("cancel order (DELETE)", cancel_order)):
+            latencies = ev_loop.run_until_complete(measure_latencies(send_request, args.requests, args.warmup))
+            print_latencies(name, latencies)
+
+        # The request built by execute_request, with the body already encoded
+        request = RESTRequest(method=RESTMethod.POST, url=url, data=api_factory.json_codec.dumps(order_params(1)),
+                              headers={"Content-Type": "application/json"}, is_auth_required=True,
+                              throttler_limit_id=ORDER_LIMIT_ID)
+        copies = args.requests * 10
+        deep_copy = measure_copy(copy.deepcopy, request, copies)
+        request_copy = measure_copy(RESTAssistant._copy_request, request, copies)
+        print()
+        print(f"{'request copy (us)':<32}{'deepcopy':>10}{'assistant':>10}")
+        print(f"{'order request':<32}{deep_copy * 1e6:>10.2f}{request_copy * 1e6:>10.2f}")
+    finally:
+        shared_client = api_factory._connections_factory._shared_client
+        if shared_client is not None:
+            ev_loop.run_until_complete(shared_client.close())
+        web_server.stop()
+
+
+if __name__ == "__main__":
+    main()
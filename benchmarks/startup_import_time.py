@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+"""
+Benchmark of the import phase of the client entry points (bin/hummingbot.py and bin/hummingbot_quickstart.py),
+comparing a cold start, when the connector manifest has to be built by importing the utils modules of all the
+connectors, with a start that builds the connector settings from an up to date manifest.
+
+Every run imports the entry point in a new Python process (the `main` functions are not called), with a temporary
+data directory. The connector settings are built first, and their time is also reported on its own: most of the import
+time is spent in the rest of the client modules and their dependencies.
+
+Usage: python benchmarks/startup_import_time.py [--runs 5]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List
+
+ROOT_PATH = Path(__file__).resolve().parent.parent
+ENTRY_POINTS = ["bin/hummingbot.py", "bin/hummingbot_quickstart.py"]
+
+IMPORT_SCRIPT = """
+import json, runpy, sys, time
+sys.path[:0] = [{root!r}, {bin_dir!r}]
+start = time.perf_counter()
+import hummingbot
+hummingbot.set_data_path({data_path!r})
+from hummingbot.client.settings import AllConnectorSettings
+settings_start = time.perf_counter()
+AllConnectorSettings.get_connector_settings()
+settings_elapsed = time.perf_counter() - settings_start
+utils_modules = [name for name in sys.modules if name.startswith("hummingbot.connector.") and name.endswith("_utils")]
+runpy.run_path({entry_point!r}, run_name="startup_import_time")
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "settings_seconds": settings_elapsed, "utils_modules": len(utils_modules),
+                  "modules": len(sys.modules)}}))
+"""
+
+
+def measure_import(entry_point: str, data_path: str) -> Dict[str, float]:
+    script = IMPORT_SCRIPT.format(root=str(ROOT_PATH),
+                                  bin_dir=str(ROOT_PATH / "bin"),
+                                  data_path=data_path,
+                                  entry_point=str(ROOT_PATH / entry_point))
+    process = subprocess.run([sys.executable, "-c", script], cwd=ROOT_PATH, capture_output=True, text=True)
+    if process.returncode != 0:
+        raise RuntimeError(process.stderr.strip().splitlines()[-1])
+    return json.loads(process.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="Number of processes started for every measurement")
+    args = parser.parse_args()
+
+    print(f"{'entry point':<32}{'manifest':<10}{'median (s)':>12}{'min (s)':>10}{'settings (s)':>14}"
+          f"{'utils modules':>15}{'modules':>10}")
+    for entry_point in ENTRY_POINTS:
+        for mode in ("cold", "warm"):
+            results: List[Dict[str, float]] = []
+            try:
+                with tempfile.TemporaryDirectory() as data_path:
+                    if mode == "warm":
+                        measure_import(entry_point, data_path)
+                    for _ in range(args.runs):
+                        if mode == "cold":
+                            manifest_path = os.path.join(data_path, "connector_manifest.json")
+                            if os.path.exists(manifest_path):
+                                os.remove(manifest_path)
+                        results.append(measure_import(entry_point, data_path))
+            except RuntimeError as e:
+                print(f"{entry_point:<32}{mode:<10}failed: {e}")
+                continue
+            seconds = [result["seconds"] for result in results]
+            settings_seconds = [result["settings_seconds"] for result in results]
+            print(f"{entry_point:<32}{mode:<10}{statistics.median(seconds):>12.3f}{min(seconds):>10.3f}"
+                  f"{statistics.median(settings_seconds):>14.3f}{results[-1]['utils_modules']:>15}"
+                  f"{results[-1]['modules']:>10}")
+
+
+if __name__ == "__main__":
+    main()
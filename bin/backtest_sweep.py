@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+
+import argparse
+import importlib
+import inspect
+import tempfile
+from decimal import Decimal
+from typing import Any, Dict, List, Type
+
+import path_util  # noqa: F401
+
+from hummingbot.client import settings
+from hummingbot.client.settings import STRATEGIES_CONF_DIR_PATH
+from hummingbot.strategy.backtest_sweep import (
+    BacktestDataset,
+    BacktestSweep,
+    ConfigFileStrategyTemplate,
+    ScriptStrategyTemplate,
+)
+from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
+
+
+class CmdlineParser(argparse.ArgumentParser):
+    def __init__(self):
+        super().__init__(description="Backtests a strategy on historical data for every combination of parameters.")
+        strategy = self.add_mutually_exclusive_group(required=True)
+        strategy.add_argument("--config-file-name", "-f",
+                              type=str,
+                              help="Specify a strategy config file in `conf/strategies/` to use as template.")
+        strategy.add_argument("--script",
+                              type=str,
+                              help="Specify a script module in `scripts/` to backtest.")
+        data = self.add_mutually_exclusive_group(required=True)
+        data.add_argument("--candles",
+                          type=str,
+                          help="Candles CSV file to replay, like the ones saved by `scripts/download_candles.py`.")
+        data.add_argument("--market-data-dir",
+                          type=str,
+                          help="Directory of the order book snapshots saved by the columnar market data recorder.")
+        self.add_argument("--exchange",
+                          type=str,
+                          help="Exchange of the recorded order book snapshots.")
+        self.add_argument("--trading-pair",
+                          type=str,
+                          required=True,
+                          help="Trading pair of the historical data, e.g. BTC-USDT.")
+        self.add_argument("--param",
+                          type=str,
+                          action="append",
+                          default=[],
+                          help="Parameter values to sweep, e.g. --param bid_spread=0.1,0.2,0.5. Can be repeated.")
+        self.add_argument("--balance",
+                          type=str,
+                          action="append",
+                          default=[],
+                          help="Initial balance of an asset, e.g. --balance USDT=10000. Can be repeated. "
+                               "The paper trade account balance is used if not specified.")
+        self.add_argument("--tick-size",
+                          type=float,
+                          default=1.0,
+                          help="Clock tick size in seconds.")
+        self.add_argument("--workers",
+                          type=int,
+                          default=None,
+                          help="Number of worker processes, the number of CPUs by default.")
+        self.add_argument("--output", "-o",
+                          type=str,
+                          default=None,
+                          help="CSV file to save the results to.")
+
+
+def parse_key_values(values: List[str]) -> Dict[str, str]:
+    key_values = {}
+    for value in values:
+        key, _, value = value.partition("=")
+        key_values[key.strip()] = value.strip()
+    return key_values
+
+
+def load_script_class(script_name: str) -> Type[ScriptStrategyBase]:
+    script_module = importlib.import_module(f".{script_name}", package=settings.SCRIPT_STRATEGIES_MODULE)
+    return next(member for _, member in inspect.getmembers(script_module)
+                if inspect.isclass(member) and issubclass(member, ScriptStrategyBase) and member is not ScriptStrategyBase)
+
+
+def main():
+    args = CmdlineParser().parse_args()
+    if args.config_file_name is not None:
+        template = ConfigFileStrategyTemplate(STRATEGIES_CONF_DIR_PATH / args.config_file_name)
+    else:
+        template = ScriptStrategyTemplate(load_script_class(args.script))
+    parameter_grid: Dict[str, List[Any]] = {key: value.split(",") for key, value in parse_key_values(args.param).items()}
+    balances = {asset: Decimal(balance) for asset, balance in parse_key_values(args.balance).items()} or None
+
+    with tempfile.TemporaryDirectory() as datasets_dir:
+        if args.candles is not None:
+            dataset = BacktestDataset.from_candles_csv(args.candles, args.trading_pair, datasets_dir)
+        else:
+            dataset = BacktestDataset.from_columnar_market_data(args.market_data_dir, args.exchange,
+                                                                args.trading_pair, datasets_dir)
+        sweep = BacktestSweep(template=template,
+                              datasets=[dataset],
+                              parameter_grid=parameter_grid,
+                              balances=balances,
+                              tick_size=args.tick_size,
+                              max_workers=args.workers)
+        results = sweep.run()
+
+    if args.output is not None:
+        results.to_csv(args.output, index=False)
+    print(results.to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -3,11 +3,11 @@ import threading
 import time
 from datetime import datetime
 from decimal import Decimal
-from typing import TYPE_CHECKING, List, Optional, Set, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 import pandas as pd
 
-from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.client.performance import PerformanceAccumulator, PerformanceMetrics, TradesPerformanceTracker
 from hummingbot.client.settings import MAXIMUM_TRADE_FILLS_DISPLAY_OUTPUT, AllConnectorSettings
 from hummingbot.client.ui.interface_utils import format_df_for_printout
 from hummingbot.core.utils.async_utils import safe_ensure_future
@@ -40,6 +40,16 @@ class HistoryCommand:
             self.notify("\n  Please first import a strategy config file of which to show historical performance.")
             return
         start_time = get_timestamp(days) if days > 0 else self.init_time
+        if days <= 0 and self.performance_tracker is not None:
+            # The performance since the start of the application is kept updated with the fills
+            accumulators = self.performance_tracker.accumulators
+            if not accumulators:
+                self.notify("\n  No past trades to report.")
+                return
+            if verbose:
+                self.list_trades(start_time)
+            safe_ensure_future(self.performance_report(start_time, accumulators, precision))
+            return
         with self.trade_fill_db.get_new_session() as session:
             trades: List[TradeFill] = self._get_trades_from_session(
                 int(start_time * 1e3),
@@ -69,12 +79,18 @@ class HistoryCommand:
                              trades: List[TradeFill],
                              precision: Optional[int] = None,
                              display_report: bool = True) -> Decimal:
-        market_info: Set[Tuple[str, str]] = set((t.market, t.symbol) for t in trades)
+        accumulators = TradesPerformanceTracker.accumulators_for_trades(trades)
+        return await self.performance_report(start_time, accumulators, precision, display_report)
+
+    async def performance_report(self,  # type: HummingbotApplication
+                                 start_time: float,
+                                 accumulators: Dict[Tuple[str, str], PerformanceAccumulator],
+                                 precision: Optional[int] = None,
+                                 display_report: bool = True) -> Decimal:
         if display_report:
             self.report_header(start_time)
         return_pcts = []
-        for market, symbol in market_info:
-            cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
+        for (market, symbol), accumulator in list(accumulators.items()):
             network_timeout = float(self.client_config_map.commands_timeout.other_commands_timeout)
             try:
                 cur_balances = await asyncio.wait_for(self.get_current_balances(market), network_timeout)
@@ -83,7 +99,7 @@ class HistoryCommand:
                     "\nA network error prevented the balances retrieval to complete. See logs for more details."
                 )
                 raise
-            perf = await PerformanceMetrics.create(symbol, cur_trades, cur_balances)
+            perf = await accumulator.performance_metrics(cur_balances)
             if display_report:
                 self.report_performance_by_market(market, symbol, perf, precision)
             return_pcts.append(perf.return_pct)
@@ -203,6 +219,9 @@ class HistoryCommand:
 
         start_time = self.init_time
 
+        if self.performance_tracker is not None:
+            return await self.performance_report(start_time, self.performance_tracker.accumulators, display_report=False)
+
         with self.trade_fill_db.get_new_session() as session:
             trades: List[TradeFill] = self._get_trades_from_session(
                 int(start_time * 1e3),
@@ -0,0 +1,95 @@
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, Optional
+
+from hummingbot.client.settings import DEFAULT_LOG_FILE_PATH
+from hummingbot.client.ui.interface_utils import format_df_for_printout
+from hummingbot.core.clock_profiler import ClockProfiler
+
+if TYPE_CHECKING:
+    from hummingbot.client.hummingbot_application import HummingbotApplication  # noqa: F401
+
+PROFILE_OPTIONS = ("start", "stop", "reset", "export")
+
+
+class ProfileCommand:
+    def profile(self,  # type: HummingbotApplication
+                option: Optional[str] = None,
+                limit: int = 10):
+        if threading.current_thread() != threading.main_thread():
+            self.ev_loop.call_soon_threadsafe(self.profile, option, limit)
+            return
+
+        if option is None:
+            self.show_profile(limit)
+        elif option == "start":
+            self.start_profiling()
+        elif option == "stop":
+            self.stop_profiling()
+        elif option == "reset":
+            if self.clock_profiler is None:
+                self.notify("Tick profiling is not running.")
+            else:
+                self.clock_profiler.reset()
+                self.notify("Tick profile reset.")
+        elif option == "export":
+            self.export_profile()
+        else:
+            self.notify(f"Invalid profile option {option}.")
+
+    def start_profiling(self,  # type: HummingbotApplication
+                        ):
+        if self.clock_profiler is not None:
+            self.notify("Tick profiling is already running.")
+            return
+        self.clock_profiler = ClockProfiler()
+        self.clock_profiler.start()
+        if self.clock is not None:
+            self.clock.profiler = self.clock_profiler
+        self.notify("Tick profiling started. Run `profile` to see the slowest time iterators.")
+
+    def stop_profiling(self,  # type: HummingbotApplication
+                       ):
+        if self.clock_profiler is None:
+            self.notify("Tick profiling is not running.")
+            return
+        self.clock_profiler.stop()
+        self.clock_profiler = None
+        if self.clock is not None:
+            self.clock.profiler = None
+        self.notify("Tick profiling stopped.")
+
+    def show_profile(self,  # type: HummingbotApplication
+                     limit: int = 10):
+        if self.clock_profiler is None:
+            self.notify("Tick profiling is not running. Run `profile start` to time the clock ticks.")
+            return
+        table_format = self.client_config_map.tables_format
+        offenders = self.clock_profiler.top_offenders(limit)
+        lines = ["", "  Tick duration by time iterator:"]
+        if len(offenders) == 0:
+            lines.append("    No ticks recorded yet.")
+        else:
+            lines.extend(["    " + line for line in
+                          format_df_for_printout(offenders.round(3), table_format=table_format).split("\n")])
+        lines.extend(["", "  Lag:"])
+        lines.extend(["    " + line for line in
+                      format_df_for_printout(self.clock_profiler.lag_summary().round(3),
+                                             table_format=table_format).split("\n")])
+        self.notify("\n".join(lines))
+
+    def export_profile(self,  # type: HummingbotApplication
+                       ):
+        if self.clock_profiler is None:
+            self.notify("Tick profiling is not running. Run `profile start` to time the clock ticks.")
+            return
+        path = self.client_config_map.log_file_path
+        if path is None:
+            path = str(DEFAULT_LOG_FILE_PATH)
+        file_path = os.path.join(path, f"clock_profile_{int(time.time())}.json")
+        try:
+            self.clock_profiler.export(file_path)
+            self.notify(f"Tick profile exported to {file_path}")
+        except Exception as e:
+            self.notify(f"Error exporting the tick profile to {path}: {e}")
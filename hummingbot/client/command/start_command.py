@@ -235,6 +235,7 @@ class StartCommand(GatewayChainApiManager):
             tick_size = self.client_config_map.tick_size
             self.logger().info(f"Creating the clock with tick size: {tick_size}")
             self.clock = Clock(ClockMode.REALTIME, tick_size=tick_size)
+            self.clock.profiler = self.clock_profiler
             for market in self.markets.values():
                 if market is not None:
                     self.clock.add_iterator(market)
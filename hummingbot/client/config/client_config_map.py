@@ -178,11 +178,82 @@ class MarketDataCollectionConfigMap(BaseClientModel):
             ),
         ),
     )
+    market_data_collection_columnar: bool = Field(
+        default=False,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Save the market data to columnar segment files instead of the database? (Yes/No)"
+            ),
+        ),
+    )
 
     class Config:
         title = "market_data_collection"
 
 
+class MarketsRecorderConfigMap(BaseClientModel):
+    write_behind_enabled: bool = Field(
+        default=False,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Save orders and trades to the database from a background writer thread? (Yes/No)"
+            ),
+        ),
+    )
+    write_behind_batch_size: int = Field(
+        default=100,
+        ge=1,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the maximum number of records saved in a single database transaction (Default=100)"
+            ),
+        ),
+    )
+    write_behind_stop_timeout: float = Field(
+        default=5,
+        ge=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the maximum time in seconds to wait for the pending records to be saved on stop (Default=5)"
+            ),
+        ),
+    )
+    durable_fills: bool = Field(
+        default=True,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Save trade fills to the database before processing the next event? (Yes/No)"
+            ),
+        ),
+    )
+
+    class Config:
+        title = "markets_recorder"
+
+
+class ExchangeInfoCacheConfigMap(BaseClientModel):
+    exchange_info_cache_enabled: bool = Field(
+        default=False,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Start the connectors from locally cached trading pairs and trading rules? (Yes/No)"
+            ),
+        ),
+    )
+    exchange_info_cache_ttl: float = Field(
+        default=86400,
+        gt=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the maximum age in seconds of the cached trading pairs and trading rules (Default=86400)"
+            ),
+        ),
+    )
+
+    class Config:
+        title = "exchange_info_cache"
+
+
 class ColorConfigMap(BaseClientModel):
     top_pane: str = Field(
         default="#000000",
@@ -761,10 +832,29 @@ class BinanceRateSourceMode(ExchangeRateSourceModeBase):
         const=True,
         client_data=None,
     )
+    stream_prices: bool = Field(
+        default=False,
+        description="Keep the prices current from the Binance tickers websocket stream instead of polling them",
+        client_data=ClientFieldData(
+            prompt=lambda cm: "Would you like to stream the Binance prices from websocket? (Yes/No)",
+        ),
+    )
 
     class Config:
         title = "binance"
 
+    def build_rate_source(self) -> RateSourceBase:
+        return RATE_ORACLE_SOURCES[self.Config.title](stream_prices=self.stream_prices)
+
+    @validator("stream_prices", pre=True)
+    def validate_bool(cls, v: str):
+        """Used for client-friendly error output."""
+        if isinstance(v, str):
+            ret = validate_bool(v)
+            if ret is not None:
+                raise ValueError(ret)
+        return v
+
 
 class CoinGeckoRateSourceMode(RateSourceModeBase):
     name: str = Field(
@@ -1028,6 +1118,16 @@ class ClientConfigMap(BaseClientModel):
         ),
     )
     market_data_collection: MarketDataCollectionConfigMap = Field(default=MarketDataCollectionConfigMap())
+    markets_recorder: MarketsRecorderConfigMap = Field(default=MarketsRecorderConfigMap())
+    exchange_info_cache: ExchangeInfoCacheConfigMap = Field(default=ExchangeInfoCacheConfigMap())
+    fetch_pairs_from_all_exchanges: bool = Field(
+        default=False,
+        description=("Fetch the trading pairs of all the exchanges for autocompletion when the client starts."
+                     "\nIf disabled, the trading pairs of each exchange are fetched the first time they are needed"),
+        client_data=ClientFieldData(
+            prompt=lambda cm: "Would you like to fetch the trading pairs of all the exchanges on start? (Yes/No)",
+        ),
+    )
 
     class Config:
         title = "client_config_map"
@@ -1062,7 +1162,7 @@ class ClientConfigMap(BaseClientModel):
             sub_model = TELEGRAM_MODES[v].construct()
         return sub_model
 
-    @validator("send_error_logs", pre=True)
+    @validator("send_error_logs", "fetch_pairs_from_all_exchanges", pre=True)
     def validate_bool(cls, v: str):
         """Used for client-friendly error output."""
         if isinstance(v, str):
@@ -1154,6 +1254,8 @@ class ClientConfigMap(BaseClientModel):
     def rate_oracle_source_on_validated(cls, values: Dict):
         rate_source_mode: RateSourceModeBase = values["rate_oracle_source"]
         rate_source_name = rate_source_mode.Config.title
-        if rate_source_name != RateOracle.get_instance().source.name:
+        stream_prices = getattr(rate_source_mode, "stream_prices", False)
+        if (rate_source_name != RateOracle.get_instance().source.name
+                or stream_prices != RateOracle.get_instance().source.streams_prices):
             RateOracle.get_instance().source = rate_source_mode.build_rate_source()
         RateOracle.get_instance().quote_token = values["global_token"].global_token_name
@@ -0,0 +1,107 @@
+import hashlib
+import json
+import logging
+import os
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple
+
+from hummingbot import data_path
+from hummingbot.core.data_type.trade_fee import TokenAmount, TradeFeeSchema
+from hummingbot.logger import HummingbotLogger
+
+# Increase the version when the format of the manifest changes, to ignore the files saved with the previous format
+CONNECTOR_MANIFEST_VERSION = 2
+
+
+class ConnectorManifest:
+    """
+    On-disk manifest of the settings read from the `<connector>_utils` modules (name, type, example pair, fees and the
+    module that defines the config keys of every connector and domain).
+    Building the connector settings from the manifest avoids importing all the connector modules when the client
+    starts. The manifest is keyed by a fingerprint of the utils files (their paths, sizes and modification times), so
+    any change in the connectors makes it stale and the settings are built again by importing the modules.
+    The connectors skipped because a dependency of their utils module is not installed are recorded too, as installing
+    the dependency does not change the fingerprint.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, file_path: Optional[str] = None):
+        """
+        :param file_path: path of the manifest file, `connector_manifest.json` in the data path by default
+        """
+        self._file_path = file_path or os.path.join(data_path(), "connector_manifest.json")
+
+    @property
+    def file_path(self) -> str:
+        return self._file_path
+
+    @staticmethod
+    def fingerprint(utils_file_paths: List[str]) -> str:
+        """
+        :param utils_file_paths: paths of the utils files of all the connectors
+        :return: a hash of the manifest version and the path, size and modification time of the files
+        """
+        fingerprint = hashlib.sha1(str(CONNECTOR_MANIFEST_VERSION).encode())
+        for file_path in sorted(utils_file_paths):
+            file_stat = os.stat(file_path)
+            fingerprint.update(f"{file_path}:{file_stat.st_size}:{file_stat.st_mtime_ns};".encode())
+        return fingerprint.hexdigest()
+
+    def load(self, fingerprint: str) -> Optional[Tuple[List[Dict[str, Any]], List[str]]]:
+        """
+        :return: the connector entries and the names of the skipped connectors, or None if there is no manifest for the
+        fingerprint
+        """
+        try:
+            with open(self._file_path) as manifest_file:
+                contents = json.load(manifest_file)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            self.logger().warning("Ignoring the invalid connector manifest.")
+            return None
+        if contents.get("version") != CONNECTOR_MANIFEST_VERSION or contents.get("fingerprint") != fingerprint:
+            return None
+        return contents["connectors"], contents["skipped_connectors"]
+
+    def save(self, fingerprint: str, entries: List[Dict[str, Any]], skipped_connectors: List[str]):
+        contents = json.dumps({"version": CONNECTOR_MANIFEST_VERSION,
+                               "fingerprint": fingerprint,
+                               "connectors": entries,
+                               "skipped_connectors": skipped_connectors})
+        temp_file_path = f"{self._file_path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self._file_path), exist_ok=True)
+            with open(temp_file_path, "w") as manifest_file:
+                manifest_file.write(contents)
+            os.replace(temp_file_path, self._file_path)
+        except OSError:
+            self.logger().warning("Could not save the connector manifest.", exc_info=True)
+
+
+def trade_fee_schema_to_json(trade_fee_schema: TradeFeeSchema) -> Dict[str, Any]:
+    return {
+        "percent_fee_token": trade_fee_schema.percent_fee_token,
+        "maker_percent_fee_decimal": str(trade_fee_schema.maker_percent_fee_decimal),
+        "taker_percent_fee_decimal": str(trade_fee_schema.taker_percent_fee_decimal),
+        "buy_percent_fee_deducted_from_returns": trade_fee_schema.buy_percent_fee_deducted_from_returns,
+        "maker_fixed_fees": [fee.to_json() for fee in trade_fee_schema.maker_fixed_fees],
+        "taker_fixed_fees": [fee.to_json() for fee in trade_fee_schema.taker_fixed_fees],
+    }
+
+
+def trade_fee_schema_from_json(data: Dict[str, Any]) -> TradeFeeSchema:
+    return TradeFeeSchema(
+        percent_fee_token=data["percent_fee_token"],
+        maker_percent_fee_decimal=Decimal(data["maker_percent_fee_decimal"]),
+        taker_percent_fee_decimal=Decimal(data["taker_percent_fee_decimal"]),
+        buy_percent_fee_deducted_from_returns=data["buy_percent_fee_deducted_from_returns"],
+        maker_fixed_fees=[TokenAmount.from_json(fee) for fee in data["maker_fixed_fees"]],
+        taker_fixed_fees=[TokenAmount.from_json(fee) for fee in data["taker_fixed_fees"]],
+    )
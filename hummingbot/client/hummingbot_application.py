@@ -20,6 +20,7 @@ from hummingbot.client.config.config_helpers import (
 from hummingbot.client.config.gateway_ssl_config_map import SSLConfigMap
 from hummingbot.client.config.security import Security
 from hummingbot.client.config.strategy_config_data_types import BaseStrategyConfigMap
+from hummingbot.client.performance import TradesPerformanceTracker
 from hummingbot.client.settings import CLIENT_CONFIG_PATH, AllConnectorSettings, ConnectorType
 from hummingbot.client.tab import __all__ as tab_classes
 from hummingbot.client.tab.data_types import CommandTab
@@ -31,6 +32,7 @@ from hummingbot.connector.exchange.paper_trade import create_paper_trade_market
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.connector.markets_recorder import MarketsRecorder
 from hummingbot.core.clock import Clock
+from hummingbot.core.clock_profiler import ClockProfiler
 from hummingbot.core.gateway.gateway_status_monitor import GatewayStatusMonitor
 from hummingbot.core.utils.kill_switch import KillSwitch
 from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher
@@ -88,6 +90,7 @@ class HummingbotApplication(*commands):
         self.market_pair: Optional[MakerTakerMarketPair] = None
         self.market_trading_pair_tuples: List[MarketTradingPairTuple] = []
         self.clock: Optional[Clock] = None
+        self.clock_profiler: Optional[ClockProfiler] = None
         self.market_trading_pairs_map = {}
         self.token_list = {}
 
@@ -104,6 +107,7 @@ class HummingbotApplication(*commands):
 
         self.trade_fill_db: Optional[SQLConnectionManager] = None
         self.markets_recorder: Optional[MarketsRecorder] = None
+        self.performance_tracker: Optional[TradesPerformanceTracker] = None
         self._pmm_script_iterator = None
         self._binance_connector = None
         self._shared_client = None
@@ -322,8 +326,16 @@ class HummingbotApplication(*commands):
             self.strategy_file_name,
             self.strategy_name,
             self.client_config_map.market_data_collection,
+            self.client_config_map.markets_recorder,
         )
         self.markets_recorder.start()
+        self.performance_tracker = TradesPerformanceTracker(list(self.markets.values()))
+        with self.trade_fill_db.get_new_session() as session:
+            self.performance_tracker.add_trades(self._get_trades_from_session(
+                int(self.init_time * 1e3),
+                session=session,
+                config_file_path=self.strategy_file_name))
+        self.performance_tracker.start()
         if self._mqtt is not None:
             self._mqtt.start_market_events_fw()
 
@@ -1,12 +1,17 @@
+import asyncio
 import logging
+import threading
 from collections import defaultdict
 from dataclasses import dataclass
 from decimal import Decimal
 from typing import Any, Dict, List, Optional, Tuple
 
+from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.connector.utils import combine_to_hb_trading_pair, split_hb_trading_pair
 from hummingbot.core.data_type.common import PositionAction, TradeType
 from hummingbot.core.data_type.trade_fee import DeductedFromReturnsTradeFee, TokenAmount
+from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
+from hummingbot.core.event.events import MarketEvent, OrderFilledEvent
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.logger import HummingbotLogger
 from hummingbot.model.trade_fill import TradeFill
@@ -196,6 +201,11 @@ class PerformanceMetrics:
 
             self.s_vol_quote += self._process_deducted_fees_impact_in_quote_vol(trade)
 
+        self._calculate_totals_and_average_prices()
+
+        return buys, sells
+
+    def _calculate_totals_and_average_prices(self):
         self.tot_vol_base = self.b_vol_base + self.s_vol_base
         self.tot_vol_quote = self.b_vol_quote + self.s_vol_quote
 
@@ -206,8 +216,6 @@ class PerformanceMetrics:
         self.avg_b_price = abs(self.avg_b_price)
         self.avg_s_price = abs(self.avg_s_price)
 
-        return buys, sells
-
     def _process_deducted_fees_impact_in_quote_vol(self, trade):
         fee_percent = None
         fee_type = ""
@@ -248,6 +256,9 @@ class PerformanceMetrics:
             for flat_fee in flat_fees:
                 self.fees[flat_fee.token] += flat_fee.amount
 
+        await self._calculate_fee_in_quote(quote)
+
+    async def _calculate_fee_in_quote(self, quote: str):
         for fee_token, fee_amount in self.fees.items():
             if fee_token == quote:
                 self.fee_in_quote += fee_amount
@@ -302,15 +313,31 @@ class PerformanceMetrics:
         self.num_sells = len(sells)
         self.num_trades = self.num_buys + self.num_sells
 
+        await self._calculate_balances_and_values(trading_pair=trading_pair,
+                                                  current_balances=current_balances,
+                                                  start_price=Decimal(str(trades[0].price)),
+                                                  last_trade_price=Decimal(str(trades[-1].price)))
+        self._calculate_trade_pnl(buys, sells)
+
+        await self._calculate_fees(quote, trades)
+
+        self._calculate_returns()
+
+    async def _calculate_balances_and_values(self,
+                                             trading_pair: str,
+                                             current_balances: Dict[str, Decimal],
+                                             start_price: Decimal,
+                                             last_trade_price: Decimal):
+        base, quote = split_hb_trading_pair(trading_pair)
         self.cur_base_bal = current_balances.get(base, s_decimal_0)
         self.cur_quote_bal = current_balances.get(quote, s_decimal_0)
         self.start_base_bal = self.cur_base_bal - self.tot_vol_base
         self.start_quote_bal = self.cur_quote_bal - self.tot_vol_quote
 
-        self.start_price = Decimal(str(trades[0].price))
+        self.start_price = start_price
         self.cur_price = await RateOracle.get_instance().stored_or_live_rate(trading_pair)
         if self.cur_price is None:
-            self.cur_price = Decimal(str(trades[-1].price))
+            self.cur_price = last_trade_price
         self.start_base_ratio_pct = self.divide(self.start_base_bal * self.start_price,
                                                 (self.start_base_bal * self.start_price) + self.start_quote_bal)
         self.cur_base_ratio_pct = self.divide(self.cur_base_bal * self.cur_price,
@@ -318,9 +345,228 @@ class PerformanceMetrics:
 
         self.hold_value = (self.start_base_bal * self.cur_price) + self.start_quote_bal
         self.cur_value = (self.cur_base_bal * self.cur_price) + self.cur_quote_bal
-        self._calculate_trade_pnl(buys, sells)
-
-        await self._calculate_fees(quote, trades)
 
+    def _calculate_returns(self):
         self.total_pnl = self.trade_pnl - self.fee_in_quote
         self.return_pct = self.divide(self.total_pnl, self.hold_value)
+
+
+class _PositionOrder:
+    """
+    A derivatives order aggregated from its fills, as done by `PerformanceMetrics.aggregate_orders`
+    """
+
+    def __init__(self):
+        self.prices_sum: Decimal = s_decimal_0
+        self.fills: int = 0
+        self.amount: Decimal = s_decimal_0
+
+    @property
+    def price(self) -> Decimal:
+        return self.prices_sum / self.fills
+
+
+class PerformanceAccumulator:
+    """
+    Keeps the running totals of the trades of a single market, so the PerformanceMetrics can be calculated without
+    processing all the trades again. Adding a trade is O(1).
+    """
+
+    def __init__(self, trading_pair: str):
+        self.trading_pair: str = trading_pair
+        self.num_buys: int = 0
+        self.num_sells: int = 0
+        self.b_vol_base: Decimal = s_decimal_0
+        self.s_vol_base: Decimal = s_decimal_0
+        self.b_vol_quote: Decimal = s_decimal_0
+        self.s_vol_quote: Decimal = s_decimal_0
+        self.fees: Dict[str, Decimal] = defaultdict(lambda: s_decimal_0)
+        self.start_price: Optional[Decimal] = None
+        self.last_price: Optional[Decimal] = None
+
+        self._nil_position_buys: int = 0
+        self._nil_position_sells: int = 0
+        # Derivatives orders are paired in the order they are first filled: long positions open with buys and close
+        # with sells, short positions open with sells and close with buys
+        self._position_orders: Dict[Tuple[str, str], Tuple[List[_PositionOrder], int]] = {}
+        self._long_opens: List[_PositionOrder] = []
+        self._long_closes: List[_PositionOrder] = []
+        self._short_opens: List[_PositionOrder] = []
+        self._short_closes: List[_PositionOrder] = []
+        self._derivatives_pnl: Decimal = s_decimal_0
+
+    @property
+    def num_trades(self) -> int:
+        return self.num_buys + self.num_sells
+
+    @property
+    def are_derivatives(self) -> bool:
+        return ((self.num_buys > 0 and self._nil_position_buys == 0)
+                or (self.num_sells > 0 and self._nil_position_sells == 0))
+
+    def add_trade(self, trade: TradeFill):
+        price = Decimal(str(trade.price))
+        amount = Decimal(str(trade.amount))
+        if self.start_price is None:
+            self.start_price = price
+        self.last_price = price
+
+        is_nil_position = trade.position == PositionAction.NIL.value
+        if trade.trade_type.upper() == TradeType.BUY.name.upper():
+            self.num_buys += 1
+            self._nil_position_buys += int(is_nil_position)
+            self.b_vol_base += amount
+            self.b_vol_quote += amount * price * Decimal("-1")
+        elif trade.trade_type.upper() == TradeType.SELL.name.upper():
+            self.num_sells += 1
+            self._nil_position_sells += int(is_nil_position)
+            self.s_vol_base += amount * Decimal("-1")
+            self.s_vol_quote += amount * price
+
+        fee_percent = trade.trade_fee.get("percent")
+        if fee_percent is not None:
+            fee_percent = Decimal(str(fee_percent))
+            if trade.trade_fee.get("fee_type") == DeductedFromReturnsTradeFee.type_descriptor_for_json():
+                self.s_vol_quote += amount * price * fee_percent * Decimal("-1")
+            self.fees[split_hb_trading_pair(self.trading_pair)[1]] += price * amount * fee_percent
+        for flat_fee in trade.trade_fee.get("flat_fees", []):
+            self.fees[flat_fee["token"]] += Decimal(flat_fee["amount"])
+
+        self._add_position_fill(trade, price, amount)
+
+    async def performance_metrics(self, current_balances: Dict[str, Decimal]) -> PerformanceMetrics:
+        """
+        Calculates the same PerformanceMetrics that `PerformanceMetrics.create` returns for all the added trades
+        :param current_balances: current user account balance
+        """
+        quote = split_hb_trading_pair(self.trading_pair)[1]
+        performance = PerformanceMetrics()
+        performance.num_buys = self.num_buys
+        performance.num_sells = self.num_sells
+        performance.num_trades = self.num_trades
+        performance.b_vol_base = self.b_vol_base
+        performance.s_vol_base = self.s_vol_base
+        performance.b_vol_quote = self.b_vol_quote
+        performance.s_vol_quote = self.s_vol_quote
+        performance._calculate_totals_and_average_prices()
+
+        await performance._calculate_balances_and_values(trading_pair=self.trading_pair,
+                                                         current_balances=current_balances,
+                                                         start_price=self.start_price,
+                                                         last_trade_price=self.last_price)
+        performance.trade_pnl = (self._derivatives_pnl
+                                 if self.are_derivatives
+                                 else performance.cur_value - performance.hold_value)
+
+        performance.fees.update(self.fees)
+        await performance._calculate_fee_in_quote(quote)
+
+        performance._calculate_returns()
+        return performance
+
+    def _add_position_fill(self, trade: TradeFill, price: Decimal, amount: Decimal):
+        order_key = (trade.trade_type.upper(), trade.order_id)
+        orders, index = self._position_orders.get(order_key, (None, None))
+        if orders is None:
+            orders = self._position_orders_list(trade)
+            if orders is None:
+                return
+            index = len(orders)
+            orders.append(_PositionOrder())
+            self._position_orders[order_key] = (orders, index)
+        else:
+            self._derivatives_pnl -= self._position_pnl(orders, index)
+
+        order = orders[index]
+        order.prices_sum += price
+        order.fills += 1
+        order.amount += amount
+        self._derivatives_pnl += self._position_pnl(orders, index)
+
+    def _position_orders_list(self, trade: TradeFill) -> Optional[List[_PositionOrder]]:
+        is_buy = trade.trade_type.upper() == TradeType.BUY.name.upper()
+        if trade.position == PositionAction.OPEN.value:
+            return self._long_opens if is_buy else self._short_opens
+        if trade.position == PositionAction.CLOSE.value:
+            return self._short_closes if is_buy else self._long_closes
+        return None
+
+    def _position_pnl(self, orders: List[_PositionOrder], index: int) -> Decimal:
+        if orders is self._long_opens or orders is self._long_closes:
+            opens, closes, direction = self._long_opens, self._long_closes, Decimal("1")
+        else:
+            opens, closes, direction = self._short_opens, self._short_closes, Decimal("-1")
+        if index >= len(opens) or index >= len(closes):
+            return s_decimal_0
+        return (closes[index].price - opens[index].price) * closes[index].amount * direction
+
+
+class TradesPerformanceTracker:
+    """
+    Keeps a PerformanceAccumulator for each market and trading pair, updated with the fills of the connectors.
+    It is seeded once with the trades already recorded, so the performance can be reported in O(markets) instead of
+    loading and processing all the trades each time.
+    """
+    _logger = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, markets: List[ConnectorBase]):
+        self._ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        self._markets: List[ConnectorBase] = markets
+        self._accumulators: Dict[Tuple[str, str], PerformanceAccumulator] = {}
+        self._fill_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_fill_order)
+
+    @property
+    def accumulators(self) -> Dict[Tuple[str, str], PerformanceAccumulator]:
+        """
+        Returns the accumulators by market name and trading pair
+        """
+        return self._accumulators
+
+    @classmethod
+    def accumulators_for_trades(cls, trades: List[TradeFill]) -> Dict[Tuple[str, str], PerformanceAccumulator]:
+        tracker = cls(markets=[])
+        tracker.add_trades(trades)
+        return tracker.accumulators
+
+    def start(self):
+        for market in self._markets:
+            market.add_listener(MarketEvent.OrderFilled, self._fill_order_forwarder)
+
+    def stop(self):
+        for market in self._markets:
+            market.remove_listener(MarketEvent.OrderFilled, self._fill_order_forwarder)
+
+    def add_trades(self, trades: List[TradeFill]):
+        for trade in trades:
+            self.add_trade(trade)
+
+    def add_trade(self, trade: TradeFill):
+        accumulator = self._accumulators.get((trade.market, trade.symbol))
+        if accumulator is None:
+            accumulator = PerformanceAccumulator(trading_pair=trade.symbol)
+            self._accumulators[(trade.market, trade.symbol)] = accumulator
+        accumulator.add_trade(trade)
+
+    def _did_fill_order(self, event_tag: int, market: ConnectorBase, evt: OrderFilledEvent):
+        if threading.current_thread() != threading.main_thread():
+            self._ev_loop.call_soon_threadsafe(self._did_fill_order, event_tag, market, evt)
+            return
+
+        try:
+            self.add_trade(TradeFill(market=market.display_name,
+                                     symbol=evt.trading_pair,
+                                     order_id=evt.order_id,
+                                     trade_type=evt.trade_type.name,
+                                     price=evt.price,
+                                     amount=evt.amount,
+                                     trade_fee=evt.trade_fee.to_json(),
+                                     position=evt.position if evt.position else PositionAction.NIL.value))
+        except Exception:
+            self.logger().error(f"Error processing the fill of order {evt.order_id} for the performance report.",
+                                exc_info=True)
@@ -5,11 +5,12 @@ from enum import Enum
 from os import DirEntry, scandir
 from os.path import exists, join, realpath
 from types import ModuleType
-from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Set, Union, cast
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Set, Tuple, Union, cast
 
 from pydantic import SecretStr
 
 from hummingbot import get_strategy_list, root_path
+from hummingbot.client.connector_manifest import ConnectorManifest, trade_fee_schema_from_json, trade_fee_schema_to_json
 from hummingbot.core.data_type.trade_fee import TradeFeeSchema
 from hummingbot.core.utils.gateway_config_utils import SUPPORTED_CHAINS
 
@@ -354,6 +355,35 @@ class ConnectorSetting(NamedTuple):
         return self.type.name.lower()
 
 
+class ConnectorConfigKeysLoader(NamedTuple):
+    """
+    Reference to the config keys of a connector (or of one of its other domains) in its utils module
+    """
+    utils_module: str
+    domain: Optional[str]
+
+    def load(self) -> Optional["BaseConnectorConfigMap"]:
+        util_module: ModuleType = importlib.import_module(self.utils_module)
+        if self.domain is None:
+            return getattr(util_module, "KEYS", None)
+        return getattr(util_module, "OTHER_DOMAINS_KEYS")[self.domain]
+
+
+class ManifestConnectorSetting(ConnectorSetting):
+    """
+    Connector setting built from the connector manifest. The `config_keys` field holds a ConnectorConfigKeysLoader,
+    and the utils module of the connector is imported the first time the config keys are used.
+    """
+    __slots__ = ()
+
+    @property
+    def config_keys(self) -> Optional["BaseConnectorConfigMap"]:
+        config_keys = super().config_keys
+        if isinstance(config_keys, ConnectorConfigKeysLoader):
+            config_keys = config_keys.load()
+        return config_keys
+
+
 class AllConnectorSettings:
     all_connector_settings: Dict[str, ConnectorSetting] = {}
 
@@ -361,68 +391,39 @@ class AllConnectorSettings:
     def create_connector_settings(cls):
         """
         Iterate over files in specific Python directories to create a dictionary of exchange names to ConnectorSetting.
+        The settings are read from the connector manifest when it is up to date with the connector files, so the
+        connector modules are only imported when their config keys are used. Otherwise, all the utils modules are
+        imported and the manifest is saved again. The manifest is also rebuilt when one of the connectors it skipped
+        for a missing dependency can be imported.
         """
         cls.all_connector_settings = {}  # reset
-        connector_exceptions = ["mock_paper_exchange", "mock_pure_python_paper_exchange", "paper_trade"]
-
-        type_dirs: List[DirEntry] = [
-            cast(DirEntry, f) for f in scandir(f"{root_path() / 'hummingbot' / 'connector'}")
-            if f.is_dir() and f.name not in CONNECTOR_SUBMODULES_THAT_ARE_NOT_CEX_TYPES
-        ]
-        for type_dir in type_dirs:
-            if type_dir.name == 'gateway':
-                continue
-            connector_dirs: List[DirEntry] = [
-                cast(DirEntry, f) for f in scandir(type_dir.path)
-                if f.is_dir() and exists(join(f.path, "__init__.py"))
-            ]
-            for connector_dir in connector_dirs:
-                if connector_dir.name.startswith("_") or connector_dir.name in connector_exceptions:
-                    continue
-                if connector_dir.name in cls.all_connector_settings:
-                    raise Exception(f"Multiple connectors with the same {connector_dir.name} name.")
-                try:
-                    util_module_path: str = f"hummingbot.connector.{type_dir.name}." \
-                                            f"{connector_dir.name}.{connector_dir.name}_utils"
-                    util_module = importlib.import_module(util_module_path)
-                except ModuleNotFoundError:
-                    continue
-                trade_fee_settings: List[float] = getattr(util_module, "DEFAULT_FEES", None)
-                trade_fee_schema: TradeFeeSchema = cls._validate_trade_fee_schema(
-                    connector_dir.name, trade_fee_settings
-                )
-                cls.all_connector_settings[connector_dir.name] = ConnectorSetting(
-                    name=connector_dir.name,
-                    type=ConnectorType[type_dir.name.capitalize()],
-                    centralised=getattr(util_module, "CENTRALIZED", True),
-                    example_pair=getattr(util_module, "EXAMPLE_PAIR", ""),
-                    use_ethereum_wallet=getattr(util_module, "USE_ETHEREUM_WALLET", False),
-                    trade_fee_schema=trade_fee_schema,
-                    config_keys=getattr(util_module, "KEYS", None),
-                    is_sub_domain=False,
-                    parent_name=None,
-                    domain_parameter=None,
-                    use_eth_gas_lookup=getattr(util_module, "USE_ETH_GAS_LOOKUP", False),
-                )
-                # Adds other domains of connector
-                other_domains = getattr(util_module, "OTHER_DOMAINS", [])
-                for domain in other_domains:
-                    trade_fee_settings = getattr(util_module, "OTHER_DOMAINS_DEFAULT_FEES")[domain]
-                    trade_fee_schema = cls._validate_trade_fee_schema(domain, trade_fee_settings)
-                    parent = cls.all_connector_settings[connector_dir.name]
-                    cls.all_connector_settings[domain] = ConnectorSetting(
-                        name=domain,
-                        type=parent.type,
-                        centralised=parent.centralised,
-                        example_pair=getattr(util_module, "OTHER_DOMAINS_EXAMPLE_PAIR")[domain],
-                        use_ethereum_wallet=parent.use_ethereum_wallet,
-                        trade_fee_schema=trade_fee_schema,
-                        config_keys=getattr(util_module, "OTHER_DOMAINS_KEYS")[domain],
-                        is_sub_domain=True,
-                        parent_name=parent.name,
-                        domain_parameter=getattr(util_module, "OTHER_DOMAINS_PARAMETER")[domain],
-                        use_eth_gas_lookup=parent.use_eth_gas_lookup,
-                    )
+        utils_files: List[Tuple[str, str, str]] = cls._connector_utils_files()
+        manifest = ConnectorManifest()
+        fingerprint: str = manifest.fingerprint([file_path for _, _, file_path in utils_files])
+        manifest_contents: Optional[Tuple[List[Dict[str, Any]], List[str]]] = manifest.load(fingerprint)
+        if manifest_contents is not None and cls._any_connector_importable(utils_files, manifest_contents[1]):
+            manifest_contents = None
+        if manifest_contents is None:
+            manifest_contents = cls._connector_manifest_entries(utils_files)
+            manifest.save(fingerprint, *manifest_contents)
+        manifest_entries: List[Dict[str, Any]] = manifest_contents[0]
+        for entry in manifest_entries:
+            cls.all_connector_settings[entry["name"]] = ManifestConnectorSetting(
+                name=entry["name"],
+                type=ConnectorType[entry["type"]],
+                centralised=entry["centralised"],
+                example_pair=entry["example_pair"],
+                use_ethereum_wallet=entry["use_ethereum_wallet"],
+                trade_fee_schema=trade_fee_schema_from_json(entry["trade_fee_schema"]),
+                config_keys=(
+                    ConnectorConfigKeysLoader(utils_module=entry["utils_module"], domain=entry["domain"])
+                    if entry["has_config_keys"] else None
+                ),
+                is_sub_domain=entry["is_sub_domain"],
+                parent_name=entry["parent_name"],
+                domain_parameter=entry["domain_parameter"],
+                use_eth_gas_lookup=entry["use_eth_gas_lookup"],
+            )
 
         # add gateway connectors
         gateway_connections_conf: List[Dict[str, str]] = GatewayConnectionSetting.load()
@@ -452,18 +453,12 @@ class AllConnectorSettings:
         for e in paper_trade_exchanges:
             base_connector_settings: Optional[ConnectorSetting] = cls.all_connector_settings.get(e, None)
             if base_connector_settings:
-                paper_trade_settings = ConnectorSetting(
+                # _replace keeps the class of the base settings, so the config keys are still loaded lazily
+                paper_trade_settings = base_connector_settings._replace(
                     name=f"{e}_paper_trade",
-                    type=base_connector_settings.type,
-                    centralised=base_connector_settings.centralised,
-                    example_pair=base_connector_settings.example_pair,
-                    use_ethereum_wallet=base_connector_settings.use_ethereum_wallet,
-                    trade_fee_schema=base_connector_settings.trade_fee_schema,
-                    config_keys=base_connector_settings.config_keys,
                     is_sub_domain=False,
                     parent_name=base_connector_settings.name,
                     domain_parameter=None,
-                    use_eth_gas_lookup=base_connector_settings.use_eth_gas_lookup,
                 )
                 cls.all_connector_settings.update({f"{e}_paper_trade": paper_trade_settings})
 
@@ -541,6 +536,107 @@ class AllConnectorSettings:
     def get_example_assets(cls) -> Dict[str, str]:
         return {name: cs.example_pair.split("-")[0] for name, cs in cls.get_connector_settings().items()}
 
+    @staticmethod
+    def _connector_utils_files() -> List[Tuple[str, str, str]]:
+        """
+        :return: the type directory name, the connector name and the utils file path of all the non gateway connectors
+        """
+        connector_exceptions = ["mock_paper_exchange", "mock_pure_python_paper_exchange", "paper_trade"]
+        utils_files: List[Tuple[str, str, str]] = []
+
+        type_dirs: List[DirEntry] = [
+            cast(DirEntry, f) for f in scandir(f"{root_path() / 'hummingbot' / 'connector'}")
+            if f.is_dir() and f.name not in CONNECTOR_SUBMODULES_THAT_ARE_NOT_CEX_TYPES
+        ]
+        for type_dir in type_dirs:
+            if type_dir.name == 'gateway':
+                continue
+            connector_dirs: List[DirEntry] = [
+                cast(DirEntry, f) for f in scandir(type_dir.path)
+                if f.is_dir() and exists(join(f.path, "__init__.py"))
+            ]
+            for connector_dir in connector_dirs:
+                if connector_dir.name.startswith("_") or connector_dir.name in connector_exceptions:
+                    continue
+                utils_file_path = join(connector_dir.path, f"{connector_dir.name}_utils.py")
+                if exists(utils_file_path):
+                    utils_files.append((type_dir.name, connector_dir.name, utils_file_path))
+        return utils_files
+
+    @staticmethod
+    def _connector_utils_module_path(type_dir_name: str, connector_name: str) -> str:
+        return f"hummingbot.connector.{type_dir_name}.{connector_name}.{connector_name}_utils"
+
+    @classmethod
+    def _any_connector_importable(cls, utils_files: List[Tuple[str, str, str]], connector_names: List[str]) -> bool:
+        """
+        :return: True if the utils module of any of the connectors can be imported
+        """
+        for type_dir_name, connector_name, _ in utils_files:
+            if connector_name in connector_names:
+                try:
+                    importlib.import_module(cls._connector_utils_module_path(type_dir_name, connector_name))
+                    return True
+                except ModuleNotFoundError:
+                    continue
+        return False
+
+    @classmethod
+    def _connector_manifest_entries(
+        cls, utils_files: List[Tuple[str, str, str]]
+    ) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """
+        Imports the utils modules of the connectors to read their settings.
+        :return: the connector manifest entries of all the connectors and their other domains, and the names of the
+        connectors skipped because their utils module could not be imported
+        """
+        entries: Dict[str, Dict[str, Any]] = {}
+        skipped_connectors: List[str] = []
+        for type_dir_name, connector_name, _ in utils_files:
+            if connector_name in entries:
+                raise Exception(f"Multiple connectors with the same {connector_name} name.")
+            try:
+                util_module_path: str = cls._connector_utils_module_path(type_dir_name, connector_name)
+                util_module = importlib.import_module(util_module_path)
+            except ModuleNotFoundError:
+                skipped_connectors.append(connector_name)
+                continue
+            trade_fee_settings: List[float] = getattr(util_module, "DEFAULT_FEES", None)
+            trade_fee_schema: TradeFeeSchema = cls._validate_trade_fee_schema(connector_name, trade_fee_settings)
+            parent = {
+                "name": connector_name,
+                "type": ConnectorType[type_dir_name.capitalize()].name,
+                "centralised": getattr(util_module, "CENTRALIZED", True),
+                "example_pair": getattr(util_module, "EXAMPLE_PAIR", ""),
+                "use_ethereum_wallet": getattr(util_module, "USE_ETHEREUM_WALLET", False),
+                "trade_fee_schema": trade_fee_schema_to_json(trade_fee_schema),
+                "utils_module": util_module_path,
+                "domain": None,
+                "has_config_keys": getattr(util_module, "KEYS", None) is not None,
+                "is_sub_domain": False,
+                "parent_name": None,
+                "domain_parameter": None,
+                "use_eth_gas_lookup": getattr(util_module, "USE_ETH_GAS_LOOKUP", False),
+            }
+            entries[connector_name] = parent
+            # Adds other domains of connector
+            other_domains = getattr(util_module, "OTHER_DOMAINS", [])
+            for domain in other_domains:
+                trade_fee_settings = getattr(util_module, "OTHER_DOMAINS_DEFAULT_FEES")[domain]
+                trade_fee_schema = cls._validate_trade_fee_schema(domain, trade_fee_settings)
+                entries[domain] = {
+                    **parent,
+                    "name": domain,
+                    "example_pair": getattr(util_module, "OTHER_DOMAINS_EXAMPLE_PAIR")[domain],
+                    "trade_fee_schema": trade_fee_schema_to_json(trade_fee_schema),
+                    "domain": domain,
+                    "has_config_keys": getattr(util_module, "OTHER_DOMAINS_KEYS")[domain] is not None,
+                    "is_sub_domain": True,
+                    "parent_name": connector_name,
+                    "domain_parameter": getattr(util_module, "OTHER_DOMAINS_PARAMETER")[domain],
+                }
+        return list(entries.values()), skipped_connectors
+
     @staticmethod
     def _validate_trade_fee_schema(
         exchange_name: str, trade_fee_schema: Optional[Union[TradeFeeSchema, List[float]]]
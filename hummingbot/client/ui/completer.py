@@ -7,6 +7,7 @@ from prompt_toolkit.completion import CompleteEvent, Completer, WordCompleter
 from prompt_toolkit.document import Document
 
 from hummingbot.client.command.connect_command import OPTIONS as CONNECT_OPTIONS
+from hummingbot.client.command.profile_command import PROFILE_OPTIONS
 from hummingbot.client.settings import (
     GATEWAY_CONNECTORS,
     PMM_SCRIPTS_PATH,
@@ -76,6 +77,7 @@ class HummingbotCompleter(Completer):
         self._script_strategy_completer = WordCompleter(file_name_list(str(SCRIPT_STRATEGIES_PATH), "py"))
         self._rate_oracle_completer = WordCompleter(list(RATE_ORACLE_SOURCES.keys()), ignore_case=True)
         self._mqtt_completer = WordCompleter(["start", "stop", "restart"], ignore_case=True)
+        self._profile_completer = WordCompleter(PROFILE_OPTIONS, ignore_case=True)
         self._gateway_chains = []
         self._gateway_networks = []
         self._list_gateway_wallets_parameters = {"wallets": [], "chain": ""}
@@ -109,7 +111,9 @@ class HummingbotCompleter(Completer):
             if exchange in self.prompt_text:
                 market = exchange
                 break
-        trading_pairs = trading_pair_fetcher.trading_pairs.get(market, []) if trading_pair_fetcher.ready and market else []
+        trading_pairs = (
+            trading_pair_fetcher.trading_pairs_for_connector(market) if trading_pair_fetcher.ready and market else []
+        )
         return WordCompleter(trading_pairs, ignore_case=True, sentence=True)
 
     @property
@@ -253,6 +257,10 @@ class HummingbotCompleter(Completer):
         text_before_cursor: str = document.text_before_cursor
         return text_before_cursor.startswith("mqtt ")
 
+    def _complete_profile_options(self, document: Document) -> bool:
+        text_before_cursor: str = document.text_before_cursor
+        return text_before_cursor.startswith("profile ")
+
     def get_completions(self, document: Document, complete_event: CompleteEvent):
         """
         Get completions for the current scope. This is the defining function for the completer
@@ -322,6 +330,10 @@ class HummingbotCompleter(Completer):
             for c in self._connect_option_completer.get_completions(document, complete_event):
                 yield c
 
+        elif self._complete_profile_options(document):
+            for c in self._profile_completer.get_completions(document, complete_event):
+                yield c
+
         elif self._complete_export_options(document):
             for c in self._export_completer.get_completions(document, complete_event):
                 yield c
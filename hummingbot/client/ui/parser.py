@@ -2,6 +2,7 @@ import argparse
 from typing import TYPE_CHECKING, Any, List
 
 from hummingbot.client.command.connect_command import OPTIONS as CONNECT_OPTIONS
+from hummingbot.client.command.profile_command import PROFILE_OPTIONS
 from hummingbot.exceptions import ArgumentParserError
 
 if TYPE_CHECKING:
@@ -145,6 +146,13 @@ def load_parser(hummingbot: "HummingbotApplication", command_tabs) -> [ThrowingA
     previous_strategy_parser.add_argument("option", nargs="?", choices=["Yes,No"], default=None)
     previous_strategy_parser.set_defaults(func=hummingbot.previous_strategy)
 
+    profile_parser = subparsers.add_parser("profile", help="Time the clock ticks of the strategy and connectors")
+    profile_parser.add_argument("option", nargs="?", choices=PROFILE_OPTIONS, default=None,
+                                help="Start or stop the tick profiling, reset or export the recorded timings")
+    profile_parser.add_argument("-l", "--limit", type=int, default=10, dest="limit",
+                                help="Number of time iterators to show, the slowest first")
+    profile_parser.set_defaults(func=hummingbot.profile)
+
     mqtt_parser = subparsers.add_parser("mqtt", help="Manage MQTT Bridge to Message brokers")
     mqtt_subparsers = mqtt_parser.add_subparsers()
     mqtt_start_parser = mqtt_subparsers.add_parser("start", help="Start the MQTT Bridge")
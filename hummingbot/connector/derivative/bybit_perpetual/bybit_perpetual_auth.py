@@ -7,6 +7,7 @@ from typing import Any, Dict, List
 
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest, WSRequest
+from hummingbot.core.web_assistant.json_codec import get_json_codec
 
 
 class BybitPerpetualAuth(AuthBase):
@@ -32,7 +33,7 @@ class BybitPerpetualAuth(AuthBase):
         return request
 
     async def _authenticate_post(self, request: RESTRequest) -> RESTRequest:
-        data = json.loads(request.data) if request.data is not None else {}
+        data = get_json_codec().loads(request.data) if request.data is not None else {}
         data = self._extend_params_with_authentication_info(data)
         data = {key: value for key, value in sorted(data.items())}
         request.data = json.dumps(data)
@@ -12,6 +12,7 @@ from hummingbot.connector.derivative.kucoin_perpetual import kucoin_perpetual_co
 from hummingbot.connector.time_synchronizer import TimeSynchronizer
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTRequest, WSRequest
+from hummingbot.core.web_assistant.json_codec import get_json_codec
 
 
 class KucoinPerpetualAuth(AuthBase):
@@ -51,7 +52,7 @@ class KucoinPerpetualAuth(AuthBase):
         return request
 
     async def _authenticate_post(self, request: RESTRequest) -> RESTRequest:
-        data = json.loads(request.data) if request.data is not None else {}
+        data = get_json_codec().loads(request.data) if request.data is not None else {}
         data = self._extend_params_with_authentication_info(data)
         data = {key: value for key, value in sorted(data.items())}
         request.data = json.dumps(data)
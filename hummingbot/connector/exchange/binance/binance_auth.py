@@ -1,6 +1,5 @@
 import hashlib
 import hmac
-import json
 from collections import OrderedDict
 from typing import Any, Dict
 from urllib.parse import urlencode
@@ -8,6 +7,7 @@ from urllib.parse import urlencode
 from hummingbot.connector.time_synchronizer import TimeSynchronizer
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest, WSRequest
+from hummingbot.core.web_assistant.json_codec import get_json_codec
 
 
 class BinanceAuth(AuthBase):
@@ -23,7 +23,7 @@ class BinanceAuth(AuthBase):
         :param request: the request to be configured for authenticated interaction
         """
         if request.method == RESTMethod.POST:
-            request.data = self.add_auth_to_params(params=json.loads(request.data))
+            request.data = self.add_auth_to_params(params=get_json_codec().loads(request.data))
         else:
             request.params = self.add_auth_to_params(params=request.params)
 
@@ -3,6 +3,7 @@ from typing import Dict, Optional
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import (
+    NumericOrderBookMessage,
     OrderBookMessage,
     OrderBookMessageType
 )
@@ -24,7 +25,7 @@ class BinanceOrderBook(OrderBook):
         """
         if metadata:
             msg.update(metadata)
-        return OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+        return NumericOrderBookMessage(OrderBookMessageType.SNAPSHOT, {
             "trading_pair": msg["trading_pair"],
             "update_id": msg["lastUpdateId"],
             "bids": msg["bids"],
@@ -45,7 +46,7 @@ class BinanceOrderBook(OrderBook):
         """
         if metadata:
             msg.update(metadata)
-        return OrderBookMessage(OrderBookMessageType.DIFF, {
+        return NumericOrderBookMessage(OrderBookMessageType.DIFF, {
             "trading_pair": msg["trading_pair"],
             "first_update_id": msg["U"],
             "update_id": msg["u"],
@@ -10,6 +10,7 @@ from hummingbot.connector.exchange.gate_io.gate_io_api_order_book_data_source im
 from hummingbot.connector.exchange.gate_io.gate_io_api_user_stream_data_source import GateIoAPIUserStreamDataSource
 from hummingbot.connector.exchange.gate_io.gate_io_auth import GateIoAuth
 from hummingbot.connector.exchange_py_base import ExchangePyBase
+from hummingbot.connector.gateway.common_types import CancelOrderResult, PlaceOrderResult
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import combine_to_hb_trading_pair
 from hummingbot.core.data_type.common import OrderType, PriceType, TradeType
@@ -29,6 +30,8 @@ class GateIoExchange(ExchangePyBase):
 
     # Using 120 seconds here as Gate.io websocket is quiet
     TICK_INTERVAL_LIMIT = 120.0
+    BATCH_ORDER_CREATE_MAX_SIZE = CONSTANTS.MAX_ORDERS_PER_BATCH_CREATE
+    BATCH_ORDER_CANCEL_MAX_SIZE = CONSTANTS.MAX_ORDERS_PER_BATCH_CANCEL
 
     web_utils = web_utils
 
@@ -192,6 +195,33 @@ class GateIoExchange(ExchangePyBase):
                            order_type: OrderType,
                            price: Decimal,
                            **kwargs) -> Tuple[str, float]:
+        data = await self._order_creation_data(
+            order_id=order_id,
+            trading_pair=trading_pair,
+            amount=amount,
+            trade_type=trade_type,
+            order_type=order_type,
+            price=price,
+        )
+        endpoint = CONSTANTS.ORDER_CREATE_PATH_URL
+        order_result = await self._api_post(
+            path_url=endpoint,
+            data=data,
+            is_auth_required=True,
+            limit_id=endpoint,
+        )
+        if order_result.get("status") in {"cancelled"}:
+            raise IOError({"label": "ORDER_REJECTED", "message": "Order rejected."})
+        exchange_order_id = str(order_result["id"])
+        return exchange_order_id, self.current_timestamp
+
+    async def _order_creation_data(self,
+                                   order_id: str,
+                                   trading_pair: str,
+                                   amount: Decimal,
+                                   trade_type: TradeType,
+                                   order_type: OrderType,
+                                   price: Decimal) -> Dict[str, Any]:
         order_type_str = order_type.name.lower().split("_")[0]
         symbol = await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
         # When type is market, it refers to different currency according to side
@@ -223,21 +253,48 @@ class GateIoExchange(ExchangePyBase):
                 data.update({
                     "amount": f"{price * amount:f}",
                 })
-
-        # RESTRequest does not support json, and if we pass a dict
-        # the underlying aiohttp will encode it to params
-        data = data
-        endpoint = CONSTANTS.ORDER_CREATE_PATH_URL
-        order_result = await self._api_post(
-            path_url=endpoint,
+        return data
+
+    async def _place_batch_order_create(self, orders_to_create: List[InFlightOrder]) -> List[PlaceOrderResult]:
+        data = [
+            await self._order_creation_data(
+                order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                amount=order.amount,
+                trade_type=order.trade_type,
+                order_type=order.order_type,
+                price=order.price,
+            )
+            for order in orders_to_create
+        ]
+        orders_results = await self._api_post(
+            path_url=CONSTANTS.BATCH_ORDERS_PATH_URL,
             data=data,
             is_auth_required=True,
-            limit_id=endpoint,
+            limit_id=CONSTANTS.BATCH_ORDERS_PATH_URL,
         )
-        if order_result.get("status") in {"cancelled"}:
-            raise IOError({"label": "ORDER_REJECTED", "message": "Order rejected."})
-        exchange_order_id = str(order_result["id"])
-        return exchange_order_id, self.current_timestamp
+
+        # Each result echoes the client order id in `text`. Orders without a result are left out, to be marked as
+        # failed instead of being placed again
+        orders_results_by_client_order_id = {order_result.get("text"): order_result for order_result in orders_results}
+        place_order_results = []
+        for order in orders_to_create:
+            order_result = orders_results_by_client_order_id.get(order.client_order_id)
+            if order_result is None:
+                continue
+            exception = None
+            if not order_result.get("succeeded", False):
+                exception = IOError({"label": order_result.get("label"), "message": order_result.get("message")})
+            elif order_result.get("status") in {"cancelled"}:
+                exception = IOError({"label": "ORDER_REJECTED", "message": "Order rejected."})
+            place_order_results.append(PlaceOrderResult(
+                update_timestamp=self.current_timestamp,
+                client_order_id=order.client_order_id,
+                exchange_order_id=None if exception is not None else str(order_result["id"]),
+                trading_pair=order.trading_pair,
+                exception=exception,
+            ))
+        return place_order_results
 
     async def _place_cancel(self, order_id: str, tracked_order: InFlightOrder):
         """
@@ -258,6 +315,41 @@ class GateIoExchange(ExchangePyBase):
         canceled = resp.get("status") == "cancelled"
         return canceled
 
+    async def _place_batch_order_cancel(self, orders_to_cancel: List[InFlightOrder]) -> List[CancelOrderResult]:
+        # Orders without exchange id yet are left out of the request, to be canceled individually
+        data = [
+            {
+                "currency_pair": await self.exchange_symbol_associated_to_pair(trading_pair=order.trading_pair),
+                "id": order.exchange_order_id,
+            }
+            for order in orders_to_cancel
+            if order.exchange_order_id is not None
+        ]
+        cancel_results = []
+        if len(data) > 0:
+            cancel_results = await self._api_post(
+                path_url=CONSTANTS.CANCEL_BATCH_ORDERS_PATH_URL,
+                data=data,
+                is_auth_required=True,
+                limit_id=CONSTANTS.CANCEL_BATCH_ORDERS_PATH_URL,
+            )
+        cancel_results_by_exchange_id = {str(cancel_result["id"]): cancel_result for cancel_result in cancel_results}
+
+        cancel_order_results = []
+        for order in orders_to_cancel:
+            cancel_result = cancel_results_by_exchange_id.get(order.exchange_order_id)
+            exception = None
+            if cancel_result is None:
+                exception = IOError(f"The order {order.client_order_id} was not included in the batch cancelation")
+            elif not cancel_result.get("succeeded", False):
+                exception = IOError({"label": cancel_result.get("label"), "message": cancel_result.get("message")})
+            cancel_order_results.append(CancelOrderResult(
+                client_order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                exception=exception,
+            ))
+        return cancel_order_results
+
     async def _update_balances(self):
         """
         Calls REST API to update total and available balances.
@@ -16,6 +16,7 @@ from hummingbot.connector.exchange.kucoin.kucoin_auth import KucoinAuth
 from hummingbot.connector.exchange_py_base import ExchangePyBase
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import combine_to_hb_trading_pair
+from hummingbot.core.api_throttler.async_sliding_window_throttler import AsyncSlidingWindowThrottler
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
@@ -30,6 +31,7 @@ if TYPE_CHECKING:
 
 
 class KucoinExchange(ExchangePyBase):
+    THROTTLER_CLASS = AsyncSlidingWindowThrottler
     web_utils = web_utils
 
     def __init__(self,
@@ -1,6 +1,5 @@
 import hashlib
 import hmac
-import json
 import random
 import string
 import time
@@ -15,6 +14,7 @@ from Crypto.Signature import PKCS1_v1_5
 
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTRequest, WSRequest
+from hummingbot.core.web_assistant.json_codec import get_json_codec
 
 
 class LbankAuth(AuthBase):
@@ -83,7 +83,7 @@ class LbankAuth(AuthBase):
 
         data = {}
         if request.data is not None:
-            data.update(json.loads(request.data))
+            data.update(get_json_codec().loads(request.data))
         data.update(additional_params)
 
         signature: Optional[str] = self._generate_auth_signature(data)
@@ -465,7 +465,7 @@ cdef class PaperTradeExchange(ExchangeBase):
             from_total_balances=True
         )
 
-        adjusted_order_candidate = self._budget_checker.populate_collateral_entries(order_candidate)
+        adjusted_order_candidate = self.budget_checker.populate_collateral_entries(order_candidate)
 
         # Quote currency used, including fees.
         paid_amount = adjusted_order_candidate.order_collateral.amount
@@ -490,16 +490,7 @@ cdef class PaperTradeExchange(ExchangeBase):
                            base_balance + acquired_amount)
 
         # add fee
-        fees = build_trade_fee(
-            exchange=self.name,
-            is_maker=False,
-            base_currency="",
-            quote_currency="",
-            order_type=OrderType.LIMIT,
-            order_side=TradeType.BUY,
-            amount=Decimal("0"),
-            price=Decimal("0"),
-        )
+        fees = self.get_fee(base_asset, quote_asset, OrderType.LIMIT, TradeType.BUY, amount, avg_price, is_maker=False)
 
         order_filled_events = OrderFilledEvent.order_filled_events_from_order_book_rows(
             self._current_timestamp, order_id, trading_pair_str, TradeType.BUY, OrderType.MARKET,
@@ -547,7 +538,7 @@ cdef class PaperTradeExchange(ExchangeBase):
             from_total_balances=True
         )
 
-        adjusted_order_candidate = self._budget_checker.populate_collateral_entries(order_candidate)
+        adjusted_order_candidate = self.budget_checker.populate_collateral_entries(order_candidate)
 
         # Base currency used, including fees.
         sold_amount = adjusted_order_candidate.order_collateral.amount
@@ -572,16 +563,7 @@ cdef class PaperTradeExchange(ExchangeBase):
                            base_balance - sold_amount)
 
         # add fee
-        fees = build_trade_fee(
-            exchange=self.name,
-            is_maker=False,
-            base_currency="",
-            quote_currency="",
-            order_type=OrderType.LIMIT,
-            order_side=TradeType.BUY,
-            amount=Decimal("0"),
-            price=Decimal("0"),
-        )
+        fees = self.get_fee(base_asset, quote_asset, OrderType.LIMIT, TradeType.BUY, amount, avg_price, is_maker=False)
 
         order_filled_events = OrderFilledEvent.order_filled_events_from_order_book_rows(
             self._current_timestamp, order_id, trading_pair_str, TradeType.SELL,
@@ -658,7 +640,7 @@ cdef class PaperTradeExchange(ExchangeBase):
             from_total_balances=True
         )
 
-        adjusted_order_candidate = self._budget_checker.populate_collateral_entries(order_candidate)
+        adjusted_order_candidate = self.budget_checker.populate_collateral_entries(order_candidate)
 
         # Quote currency used, including fees.
         paid_amount = adjusted_order_candidate.order_collateral.amount
@@ -685,16 +667,7 @@ cdef class PaperTradeExchange(ExchangeBase):
                            base_balance + acquired_amount)
 
         # add fee
-        fees = build_trade_fee(
-            exchange=self.name,
-            is_maker=True,
-            base_currency="",
-            quote_currency="",
-            order_type=OrderType.LIMIT,
-            order_side=TradeType.BUY,
-            amount=Decimal("0"),
-            price=Decimal("0"),
-        )
+        fees = self.get_fee(base_asset, quote_asset, OrderType.LIMIT, TradeType.BUY, amount, price, is_maker=True)
 
         # Emit the trade and order completed events.
         self.c_trigger_event(
@@ -750,7 +723,7 @@ cdef class PaperTradeExchange(ExchangeBase):
             from_total_balances=True
         )
 
-        adjusted_order_candidate = self._budget_checker.populate_collateral_entries(order_candidate)
+        adjusted_order_candidate = self.budget_checker.populate_collateral_entries(order_candidate)
 
         # Base currency used, including fees.
         sold_amount = adjusted_order_candidate.order_collateral.amount
@@ -776,16 +749,7 @@ cdef class PaperTradeExchange(ExchangeBase):
                            base_balance - sold_amount)
 
         # add fee
-        fees = build_trade_fee(
-            exchange=self.name,
-            is_maker=True,
-            base_currency="",
-            quote_currency="",
-            order_type=OrderType.LIMIT,
-            order_side=TradeType.SELL,
-            amount=Decimal("0"),
-            price=Decimal("0"),
-        )
+        fees = self.get_fee(base_asset, quote_asset, OrderType.LIMIT, TradeType.SELL, amount, price, is_maker=True)
 
         # Emit the trade and order completed events.
         self.c_trigger_event(
@@ -1013,16 +977,7 @@ cdef class PaperTradeExchange(ExchangeBase):
                           object amount,
                           object price,
                           object is_maker = None):
-        return build_trade_fee(
-            self.name,
-            is_maker=is_maker if is_maker is not None else order_type in [OrderType.LIMIT, OrderType.LIMIT_MAKER],
-            base_currency=base_asset,
-            quote_currency=quote_asset,
-            order_type=order_type,
-            order_side=order_side,
-            amount=amount,
-            price=price,
-        )
+        return self.get_fee(base_asset, quote_asset, order_type, order_side, amount, price, is_maker)
 
     cdef OrderBook c_get_order_book(self, str trading_pair):
         if trading_pair not in self._trading_pairs:
@@ -1116,7 +1071,16 @@ cdef class PaperTradeExchange(ExchangeBase):
                 amount: Decimal,
                 price: Decimal = s_decimal_0,
                 is_maker: Optional[bool] = None):
-        return self.c_get_fee(base_currency, quote_currency, order_type, order_side, amount, price, is_maker)
+        return build_trade_fee(
+            self.name,
+            is_maker=is_maker if is_maker is not None else order_type in [OrderType.LIMIT, OrderType.LIMIT_MAKER],
+            base_currency=base_currency,
+            quote_currency=quote_currency,
+            order_type=order_type,
+            order_side=order_side,
+            amount=amount,
+            price=price,
+        )
 
     def get_order_book(self, trading_pair: str) -> OrderBook:
         return self.c_get_order_book(trading_pair)
@@ -0,0 +1,200 @@
+import heapq
+from operator import attrgetter
+from typing import Iterable, Iterator, NamedTuple, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.utils.columnar_market_data import ColumnarMarketDataReader
+from hummingbot.model.market_data import MarketData
+from hummingbot.model.sql_connection_manager import SQLConnectionManager
+
+
+class ReplayOrderBookSnapshot(NamedTuple):
+    """
+    Order book snapshot replayed by ReplayExchange. The bids and asks are float64 arrays with the [price, amount]
+    of each level.
+    """
+    timestamp: float
+    trading_pair: str
+    bids: np.ndarray
+    asks: np.ndarray
+
+
+class ReplayTrade(NamedTuple):
+    """
+    Public trade replayed by ReplayExchange, from the taker's perspective
+    """
+    timestamp: float
+    trading_pair: str
+    trade_type: TradeType
+    price: float
+    amount: float
+
+
+ReplayEvent = Union[ReplayOrderBookSnapshot, ReplayTrade]
+
+CANDLES_DTYPE = np.dtype([
+    ("timestamp", np.float64),
+    ("open", np.float64),
+    ("high", np.float64),
+    ("low", np.float64),
+    ("close", np.float64),
+    ("volume", np.float64),
+])
+
+
+def merge_replay_events(*sources: Iterable[ReplayEvent]) -> Iterator[ReplayEvent]:
+    """
+    Merges the events of several time ordered sources (e.g. one per trading pair) into a single time ordered stream
+    """
+    return heapq.merge(*sources, key=attrgetter("timestamp"))
+
+
+def columnar_market_data_events(data_dir: str,
+                                exchange: str,
+                                trading_pair: str,
+                                start_timestamp: Optional[float] = None,
+                                end_timestamp: Optional[float] = None) -> Iterator[ReplayOrderBookSnapshot]:
+    """
+    Replays the snapshots saved by the columnar market data recorder.
+
+    :param data_dir: the directory of the columnar market data files
+    :param exchange: the exchange name used when recording
+    :param start_timestamp: the first timestamp to replay in seconds
+    :param end_timestamp: the last timestamp to replay in seconds
+    """
+    records = ColumnarMarketDataReader(data_dir).read(
+        exchange,
+        trading_pair,
+        start_timestamp=None if start_timestamp is None else int(start_timestamp * 1e3),
+        end_timestamp=None if end_timestamp is None else int(end_timestamp * 1e3),
+    )
+    return market_data_records_events(records, trading_pair)
+
+
+def market_data_records_events(records: np.ndarray, trading_pair: str) -> Iterator[ReplayOrderBookSnapshot]:
+    """
+    Replays the snapshots of an array of `market_data_dtype` records, as returned by ColumnarMarketDataReader
+    """
+    for record in records:
+        yield ReplayOrderBookSnapshot(
+            timestamp=record["timestamp"] * 1e-3,
+            trading_pair=trading_pair,
+            bids=_levels_array(record["bid_prices"], record["bid_amounts"]),
+            asks=_levels_array(record["ask_prices"], record["ask_amounts"]),
+        )
+
+
+def market_data_events(sql: SQLConnectionManager,
+                       exchange: str,
+                       trading_pair: str,
+                       start_timestamp: Optional[float] = None,
+                       end_timestamp: Optional[float] = None,
+                       batch_size: int = 1000) -> Iterator[ReplayOrderBookSnapshot]:
+    """
+    Replays the snapshots saved in the MarketData table by the markets recorder.
+
+    :param exchange: the exchange display name used when recording
+    :param start_timestamp: the first timestamp to replay in seconds
+    :param end_timestamp: the last timestamp to replay in seconds
+    """
+    with sql.get_new_session() as session:
+        query = session.query(MarketData).filter(MarketData.exchange == exchange,
+                                                 MarketData.trading_pair == trading_pair)
+        if start_timestamp is not None:
+            query = query.filter(MarketData.timestamp >= int(start_timestamp * 1e3))
+        if end_timestamp is not None:
+            query = query.filter(MarketData.timestamp <= int(end_timestamp * 1e3))
+        for market_data in query.order_by(MarketData.timestamp).yield_per(batch_size):
+            order_book = market_data.order_book or {}
+            yield ReplayOrderBookSnapshot(
+                timestamp=float(market_data.timestamp) * 1e-3,
+                trading_pair=trading_pair,
+                bids=_rows_array(order_book.get("bid", [])),
+                asks=_rows_array(order_book.get("ask", [])),
+            )
+
+
+def read_candles_csv(file_path: str) -> np.ndarray:
+    """
+    Reads a candles CSV file, like the ones saved by `scripts/download_candles.py`.
+
+    :return: the candles as an array of `CANDLES_DTYPE` records, with the timestamps in seconds
+    """
+    candles = pd.read_csv(file_path, usecols=list(CANDLES_DTYPE.names))
+    records = np.zeros(len(candles), dtype=CANDLES_DTYPE)
+    for name in CANDLES_DTYPE.names:
+        records[name] = candles[name].to_numpy(dtype=np.float64)
+    if len(records) > 0 and records["timestamp"][0] > 1e11:
+        records["timestamp"] *= 1e-3  # milliseconds
+    return records
+
+
+def candles_csv_events(file_path: str,
+                       trading_pair: str,
+                       spread: float = 0.001,
+                       levels: int = 10,
+                       level_amount: Optional[float] = None) -> Iterator[ReplayEvent]:
+    """
+    Replays a candles CSV file, like the ones saved by `scripts/download_candles.py`. See `candles_events`.
+    """
+    return candles_events(read_candles_csv(file_path), trading_pair, spread, levels, level_amount)
+
+
+def candles_events(candles: np.ndarray,
+                   trading_pair: str,
+                   spread: float = 0.001,
+                   levels: int = 10,
+                   level_amount: Optional[float] = None) -> Iterator[ReplayEvent]:
+    """
+    Replays an array of `CANDLES_DTYPE` records.
+    Candles have no order book, so every candle is replayed as a synthetic book around the open price, two trades at
+    the low and the high (in the order implied by the candle direction) and a synthetic book around the close price,
+    spread over the candle interval.
+
+    :param spread: relative distance between the best bid and ask, and between consecutive levels
+    :param levels: number of levels on each side of the synthetic books
+    :param level_amount: amount of each level, the candle volume divided by the number of levels by default
+    """
+    timestamps = candles["timestamp"]
+    intervals = np.diff(timestamps)
+    default_interval = intervals[-1] if len(intervals) > 0 else 60.0
+    for position, (timestamp, open_price, high, low, close, volume) in enumerate(candles.tolist()):
+        interval = intervals[position] if position < len(intervals) else default_interval
+        amount = level_amount if level_amount is not None else volume / levels
+        yield _synthetic_snapshot(timestamp, trading_pair, open_price, spread, levels, amount)
+        trades = [(TradeType.SELL, low), (TradeType.BUY, high)]
+        if close < open_price:
+            trades.reverse()
+        for trade_number, (trade_type, trade_price) in enumerate(trades, start=1):
+            yield ReplayTrade(timestamp + interval * trade_number / 4, trading_pair, trade_type, trade_price, volume / 2)
+        yield _synthetic_snapshot(timestamp + interval * 3 / 4, trading_pair, close, spread, levels, amount)
+
+
+def _synthetic_snapshot(timestamp: float,
+                        trading_pair: str,
+                        price: float,
+                        spread: float,
+                        levels: int,
+                        amount: float) -> ReplayOrderBookSnapshot:
+    offsets = spread / 2 + spread * np.arange(levels)
+    amounts = np.full(levels, amount)
+    return ReplayOrderBookSnapshot(
+        timestamp=timestamp,
+        trading_pair=trading_pair,
+        bids=np.column_stack((price * (1 - offsets), amounts)),
+        asks=np.column_stack((price * (1 + offsets), amounts)),
+    )
+
+
+def _levels_array(prices: np.ndarray, amounts: np.ndarray) -> np.ndarray:
+    valid = ~np.isnan(prices)
+    return np.column_stack((prices[valid], amounts[valid]))
+
+
+def _rows_array(rows: list) -> np.ndarray:
+    if len(rows) == 0:
+        return np.zeros((0, 2))
+    return np.array(rows, dtype=np.float64)[:, :2]
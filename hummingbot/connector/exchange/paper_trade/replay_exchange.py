@@ -0,0 +1,226 @@
+from decimal import Decimal
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+import numpy as np
+
+from hummingbot.client.config.trade_fee_schema_loader import TradeFeeSchemaLoader
+from hummingbot.client.settings import AllConnectorSettings
+from hummingbot.connector.budget_checker import BudgetChecker
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import PaperTradeExchange
+from hummingbot.connector.exchange.paper_trade.replay_data import ReplayEvent, ReplayOrderBookSnapshot
+from hummingbot.connector.utils import split_hb_trading_pair
+from hummingbot.core.clock import Clock
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.data_type.order_candidate import OrderCandidate
+from hummingbot.core.data_type.trade_fee import TradeFeeBase, TradeFeeSchema
+from hummingbot.core.event.events import OrderBookTradeEvent
+from hummingbot.core.network_iterator import NetworkStatus
+from hummingbot.core.utils.estimate_fee import build_trade_fee_from_schema
+
+if TYPE_CHECKING:
+    from hummingbot.client.config.config_helpers import ClientConfigAdapter
+
+
+class ReplayOrderBookTrackerDataSource(OrderBookTrackerDataSource):
+    """
+    Data source of the replayed order books, it never connects to the exchange
+    """
+
+    def __init__(self, trading_pairs: List[str], order_books: Dict[str, CompositeOrderBook]):
+        super().__init__(trading_pairs)
+        self._order_books = order_books
+
+    async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None) -> Dict[str, float]:
+        return {trading_pair: self._order_books[trading_pair].last_trade_price for trading_pair in trading_pairs}
+
+
+class ReplayOrderBookTracker(OrderBookTracker):
+    """
+    Holds the order books updated by ReplayExchange. It has no tracking tasks.
+    """
+
+    def __init__(self, trading_pairs: List[str]):
+        super().__init__(data_source=ReplayOrderBookTrackerDataSource(trading_pairs, {}), trading_pairs=trading_pairs)
+        self._data_source._order_books = self._order_books
+
+    @property
+    def ready(self) -> bool:
+        return True
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+
+class ReplayOrderCandidate(OrderCandidate):
+    """
+    Order candidate of a ReplayExchange, its fees are the ones of the exchange instead of the connector settings
+    """
+
+    def _get_fee(self, exchange: "ReplayExchange") -> TradeFeeBase:
+        base, quote = split_hb_trading_pair(self.trading_pair)
+        return exchange.get_fee(base, quote, self.order_type, self.order_side, self.amount, self.price, self.is_maker)
+
+
+class ReplayBudgetChecker(BudgetChecker):
+    """
+    Budget checker of a ReplayExchange, it populates the collateral entries with the fees of the exchange
+    """
+
+    def populate_collateral_entries(self, order_candidate: OrderCandidate) -> OrderCandidate:
+        return super().populate_collateral_entries(ReplayOrderCandidate(
+            trading_pair=order_candidate.trading_pair,
+            is_maker=order_candidate.is_maker,
+            order_type=order_candidate.order_type,
+            order_side=order_candidate.order_side,
+            amount=order_candidate.amount,
+            price=order_candidate.price,
+            from_total_balances=order_candidate.from_total_balances,
+        ))
+
+
+class ReplayExchange(PaperTradeExchange):
+    """
+    Paper trade exchange that replays historical market data, to run strategies in backtests.
+    The order books are updated from the replayed snapshots, and the replayed trades fill the limit orders they cross,
+    with the matching logic of PaperTradeExchange. Events are applied in lock-step with the clock: every tick applies
+    the events up to the tick timestamp, before the pending orders are processed.
+
+    Usage:
+        events = candles_csv_events("data/candles_binance_BTC-USDT_1m.csv", "BTC-USDT")
+        exchange = ReplayExchange(client_config_map, trading_pairs=["BTC-USDT"], events=events)
+        clock = Clock(ClockMode.BACKTEST, tick_size=1, start_time=start, end_time=end)
+        clock.add_iterator(exchange)
+        clock.add_iterator(strategy)
+        clock.backtest()
+    """
+
+    def __init__(self,
+                 client_config_map: "ClientConfigAdapter",
+                 trading_pairs: List[str],
+                 events: Iterable[ReplayEvent],
+                 exchange_name: str = "replay",
+                 trade_fee_schema: Optional[TradeFeeSchema] = None):
+        """
+        :param trading_pairs: the replayed trading pairs
+        :param events: the time ordered events to replay, see `merge_replay_events` to replay several sources
+        :param exchange_name: the connector name, used to look up the trading fees if trade_fee_schema is not provided
+        :param trade_fee_schema: the fees applied to the fills, no fees if the exchange name has no connector settings
+        """
+        order_book_tracker = ReplayOrderBookTracker(trading_pairs)
+        super().__init__(client_config_map, order_book_tracker, ReplayExchange, exchange_name=exchange_name)
+        for trading_pair in trading_pairs:
+            order_book_tracker.order_books[trading_pair] = CompositeOrderBook()
+        self.init_paper_trade_market()
+
+        # The fee schema is kept by the exchange, so that replays do not change the settings of the real connectors
+        if trade_fee_schema is None:
+            trade_fee_schema = (TradeFeeSchemaLoader.configured_schema_for_exchange(exchange_name)
+                                if exchange_name in AllConnectorSettings.get_connector_settings()
+                                else TradeFeeSchema())
+        self._trade_fee_schema: TradeFeeSchema = trade_fee_schema
+        self._replay_budget_checker = ReplayBudgetChecker(exchange=self)
+
+        self._replay_events: Iterator[ReplayEvent] = iter(events)
+        self._replay_next_event: Optional[ReplayEvent] = next(self._replay_events, None)
+        self._replay_update_id = 0
+        self._replay_initialized_pairs: Set[str] = set()
+        self._replay_trading_pairs = trading_pairs
+
+    @staticmethod
+    def split_trading_pair(trading_pair: str) -> Tuple[str, str]:
+        base, quote = trading_pair.split("-")
+        return base, quote
+
+    @staticmethod
+    def convert_from_exchange_trading_pair(trading_pair: str) -> str:
+        return trading_pair
+
+    @staticmethod
+    def convert_to_exchange_trading_pair(trading_pair: str) -> str:
+        return trading_pair
+
+    @property
+    def display_name(self) -> str:
+        return f"{self.name}_Replay"
+
+    @property
+    def budget_checker(self) -> BudgetChecker:
+        return self._replay_budget_checker
+
+    @property
+    def ready(self) -> bool:
+        """
+        The exchange is ready once every trading pair has received its first order book snapshot
+        """
+        return len(self._replay_initialized_pairs) == len(self._replay_trading_pairs)
+
+    @property
+    def status_dict(self) -> Dict[str, bool]:
+        return {"order_books_initialized": self.ready}
+
+    @property
+    def network_status(self) -> NetworkStatus:
+        return NetworkStatus.CONNECTED
+
+    @property
+    def replay_finished(self) -> bool:
+        return self._replay_next_event is None
+
+    @property
+    def next_event_timestamp(self) -> Optional[float]:
+        return None if self._replay_next_event is None else self._replay_next_event.timestamp
+
+    def get_fee(self,
+                base_currency: str,
+                quote_currency: str,
+                order_type: OrderType,
+                order_side: TradeType,
+                amount: Decimal,
+                price: Decimal = Decimal("0"),
+                is_maker: Optional[bool] = None) -> TradeFeeBase:
+        is_maker = is_maker if is_maker is not None else order_type in [OrderType.LIMIT, OrderType.LIMIT_MAKER]
+        return build_trade_fee_from_schema(self._trade_fee_schema, is_maker, order_side)
+
+    def start(self, clock: Clock, timestamp: float):
+        super().start(clock, timestamp)
+        self.replay_until(timestamp)
+
+    def tick(self, timestamp: float):
+        self.replay_until(timestamp)
+
+    def replay_until(self, timestamp: float):
+        """
+        Applies the events up to the timestamp (included)
+        """
+        event = self._replay_next_event
+        while event is not None and event.timestamp <= timestamp:
+            if isinstance(event, ReplayOrderBookSnapshot):
+                self._apply_snapshot(event)
+            else:
+                self.order_books[event.trading_pair].apply_trade(OrderBookTradeEvent(
+                    trading_pair=event.trading_pair,
+                    timestamp=event.timestamp,
+                    type=event.trade_type,
+                    price=Decimal(str(event.price)),
+                    amount=Decimal(str(event.amount)),
+                ))
+            event = next(self._replay_events, None)
+        self._replay_next_event = event
+
+    def _apply_snapshot(self, snapshot: ReplayOrderBookSnapshot):
+        self._replay_update_id += 1
+        order_book: CompositeOrderBook = self.order_books[snapshot.trading_pair]
+        order_book.clear_traded_order_book()
+        order_book.apply_numpy_snapshot(self._with_update_id(snapshot.bids),
+                                        self._with_update_id(snapshot.asks),
+                                        self._replay_update_id)
+        self._replay_initialized_pairs.add(snapshot.trading_pair)
+
+    def _with_update_id(self, levels: np.ndarray) -> np.ndarray:
+        return np.column_stack((levels[:, :2], np.full(len(levels), self._replay_update_id, dtype=np.float64)))
@@ -8,6 +8,7 @@ from hummingbot.connector.time_synchronizer import TimeSynchronizer
 from hummingbot.core.utils.tracking_nonce import NonceCreator
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTRequest, WSRequest
+from hummingbot.core.web_assistant.json_codec import get_json_codec
 
 
 class WhitebitAuth(AuthBase):
@@ -48,7 +49,7 @@ class WhitebitAuth(AuthBase):
             "nonceWindow": True,
         }
 
-        params = json.loads(request.data) if request.data is not None else {}
+        params = get_json_codec().loads(request.data) if request.data is not None else {}
         params.update(authentication_params)
 
         data_json = json.dumps(params, separators=(",", ":"))
@@ -2,24 +2,28 @@ import asyncio
 import copy
 import logging
 import math
+import time
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, AsyncIterable, Callable, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, AsyncIterable, Awaitable, Callable, Dict, List, Optional, Tuple, Type, Union
 
 from async_timeout import timeout
 
 from hummingbot.connector.client_order_tracker import ClientOrderTracker
 from hummingbot.connector.constants import MINUTE, TWELVE_HOURS, s_decimal_0, s_decimal_NaN
 from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.connector.gateway.common_types import CancelOrderResult, PlaceOrderResult
 from hummingbot.connector.time_synchronizer import TimeSynchronizer
 from hummingbot.connector.trading_rule import TradingRule
-from hummingbot.connector.utils import get_new_client_order_id
+from hummingbot.connector.utils import get_new_client_order_id, split_list_in_chunks
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
 from hummingbot.core.api_throttler.data_types import RateLimit
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
 from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.core.data_type.market_order import MarketOrder
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
@@ -28,6 +32,11 @@ from hummingbot.core.data_type.user_stream_tracker import UserStreamTracker
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
+from hummingbot.core.utils.exchange_info_cache import (
+    TRADING_PAIRS_REQUEST_KEY,
+    TRADING_RULES_REQUEST_KEY,
+    ExchangeInfoCache,
+)
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
@@ -45,6 +54,16 @@ class ExchangePyBase(ExchangeBase, ABC):
     TRADING_RULES_INTERVAL = 30 * MINUTE
     TRADING_FEES_INTERVAL = TWELVE_HOURS
     TICK_INTERVAL_LIMIT = 60.0
+    ORDER_BOOK_CONCURRENT_INIT = False
+    ORDER_BOOK_MAX_CONCURRENT_INITS = OrderBookTracker.DEFAULT_MAX_CONCURRENT_INITS
+    # Connectors can use AsyncSlidingWindowThrottler, which keeps a sliding window per rate limit
+    THROTTLER_CLASS: Type[AsyncThrottlerBase] = AsyncThrottler
+    # Maximum number of order status (or trade updates) requests in flight during a status polling cycle
+    ORDER_STATUS_MAX_CONCURRENT_REQUESTS = 10
+    # Maximum number of orders accepted by the exchange in a single batch creation or cancelation request.
+    # Zero means the connector does not implement batch requests, and the orders are created or canceled one by one.
+    BATCH_ORDER_CREATE_MAX_SIZE = 0
+    BATCH_ORDER_CANCEL_MAX_SIZE = 0
 
     def __init__(self, client_config_map: "ClientConfigAdapter"):
         super().__init__(client_config_map)
@@ -61,8 +80,16 @@ class ExchangePyBase(ExchangeBase, ABC):
         self._trading_fees_polling_task: Optional[asyncio.Task] = None
         self._lost_orders_update_task: Optional[asyncio.Task] = None
 
+        self._order_status_polling_cycles: int = 0
+        self._order_status_requests_count: int = 0
+        self._last_order_status_polling_cycle_duration: float = 0
+        self._last_order_status_polling_cycle_requests: int = 0
+
+        self._exchange_info_cache: Optional[ExchangeInfoCache] = ExchangeInfoCache.from_client_config(
+            client_config_map)
+
         self._time_synchronizer = TimeSynchronizer()
-        self._throttler = AsyncThrottler(
+        self._throttler = self.THROTTLER_CLASS(
             rate_limits=self.rate_limits_rules,
             limits_share_percentage=client_config_map.rate_limits_share_pct)
         self._poll_notifier = asyncio.Event()
@@ -76,7 +103,9 @@ class ExchangePyBase(ExchangeBase, ABC):
         self._set_order_book_tracker(OrderBookTracker(
             data_source=self._orderbook_ds,
             trading_pairs=self.trading_pairs,
-            domain=self.domain))
+            domain=self.domain,
+            concurrent_init=self.ORDER_BOOK_CONCURRENT_INIT,
+            max_concurrent_inits=self.ORDER_BOOK_MAX_CONCURRENT_INITS))
 
         # init UserStream Data Source and Tracker
         self._user_stream_tracker = self._create_user_stream_tracker()
@@ -183,6 +212,19 @@ class ExchangePyBase(ExchangeBase, ABC):
         """
         return all(self.status_dict.values())
 
+    @property
+    def order_status_polling_metrics(self) -> Dict[str, float]:
+        """
+        Returns the number of order status polling cycles executed, the duration and number of requests of the last one,
+        and the total number of order status and trade updates requests sent
+        """
+        return {
+            "cycles": self._order_status_polling_cycles,
+            "last_cycle_duration": self._last_order_status_polling_cycle_duration,
+            "last_cycle_requests": self._last_order_status_polling_cycle_requests,
+            "total_requests": self._order_status_requests_count,
+        }
+
     @property
     def name_cap(self) -> str:
         return self.name.capitalize()
@@ -194,6 +236,17 @@ class ExchangePyBase(ExchangeBase, ABC):
         """
         return {key: value.to_json() for key, value in self._order_tracker.all_updatable_orders.items()}
 
+    def tracking_state(self, client_order_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Returns the JSON representation of a single order, as it is included in `tracking_states`
+
+        :param client_order_id: the client id of the order
+        :return: the order JSON representation, or None if the order is not part of the tracking states
+        """
+        order = (self._order_tracker.fetch_tracked_order(client_order_id)
+                 or self._order_tracker.fetch_lost_order(client_order_id=client_order_id))
+        return order.to_json() if order is not None else None
+
     @abstractmethod
     def supported_order_types(self) -> List[OrderType]:
         raise NotImplementedError
@@ -387,6 +440,62 @@ class ExchangePyBase(ExchangeBase, ABC):
         safe_ensure_future(self._execute_cancel(trading_pair, client_order_id))
         return client_order_id
 
+    def batch_order_create(
+            self, orders_to_create: List[Union[LimitOrder, MarketOrder]]
+    ) -> List[Union[LimitOrder, MarketOrder]]:
+        """
+        Issues a batch order creation, sending up to BATCH_ORDER_CREATE_MAX_SIZE orders per request if the connector
+        implements batch requests, or each order individually otherwise.
+
+        :param orders_to_create: A list of LimitOrder or MarketOrder objects representing the orders to create. The
+            order IDs can be blanc.
+
+        :return: A list of LimitOrder or MarketOrder objects representing the created orders, complete with the
+            generated order IDs.
+        """
+        if self.BATCH_ORDER_CREATE_MAX_SIZE == 0:
+            return super().batch_order_create(orders_to_create=orders_to_create)
+
+        orders_with_ids_to_create = []
+        for order in orders_to_create:
+            client_order_id = get_new_client_order_id(
+                is_buy=order.is_buy,
+                trading_pair=order.trading_pair,
+                hbot_order_id_prefix=self.client_order_id_prefix,
+                max_id_len=self.client_order_id_max_length
+            )
+            if isinstance(order, LimitOrder):
+                orders_with_ids_to_create.append(
+                    LimitOrder(
+                        client_order_id=client_order_id,
+                        trading_pair=order.trading_pair,
+                        is_buy=order.is_buy,
+                        base_currency=order.base_currency,
+                        quote_currency=order.quote_currency,
+                        price=order.price,
+                        quantity=order.quantity,
+                        filled_quantity=order.filled_quantity,
+                        creation_timestamp=order.creation_timestamp,
+                        status=order.status,
+                    )
+                )
+            else:
+                orders_with_ids_to_create.append(order._replace(order_id=client_order_id))
+        safe_ensure_future(self._execute_batch_order_create(orders_to_create=orders_with_ids_to_create))
+        return orders_with_ids_to_create
+
+    def batch_order_cancel(self, orders_to_cancel: List[LimitOrder]):
+        """
+        Issues a batch order cancelation, sending up to BATCH_ORDER_CANCEL_MAX_SIZE orders per request if the
+        connector implements batch requests, or each order individually otherwise.
+
+        :param orders_to_cancel: A list of the orders to cancel.
+        """
+        if self.BATCH_ORDER_CANCEL_MAX_SIZE == 0:
+            super().batch_order_cancel(orders_to_cancel=orders_to_cancel)
+        else:
+            safe_ensure_future(self._execute_batch_order_cancel(orders_to_cancel=orders_to_cancel))
+
     async def cancel_all(self, timeout_seconds: float) -> List[CancellationResult]:
         """
         Cancels all currently active orders. The cancellations are performed in parallel tasks.
@@ -438,6 +547,49 @@ class ExchangePyBase(ExchangeBase, ABC):
         :param price: the order price
         """
         exchange_order_id = ""
+        order = self._start_tracking_and_validate_order(
+            trade_type=trade_type,
+            order_id=order_id,
+            trading_pair=trading_pair,
+            amount=amount,
+            order_type=order_type,
+            price=price,
+            **kwargs,
+        )
+        if order is None:
+            return
+
+        try:
+            exchange_order_id = await self._place_order_and_process_update(order=order, **kwargs,)
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as ex:
+            self._on_order_failure(
+                order_id=order_id,
+                trading_pair=trading_pair,
+                amount=order.amount,
+                trade_type=trade_type,
+                order_type=order_type,
+                price=order.price,
+                exception=ex,
+                **kwargs,
+            )
+        return order_id, exchange_order_id
+
+    def _start_tracking_and_validate_order(self,
+                                           trade_type: TradeType,
+                                           order_id: str,
+                                           trading_pair: str,
+                                           amount: Decimal,
+                                           order_type: OrderType,
+                                           price: Optional[Decimal] = None,
+                                           **kwargs) -> Optional[InFlightOrder]:
+        """
+        Quantizes the order amount and price, starts tracking the order and checks it against the trading rules
+
+        :return: the tracked order, or None if the order is not valid (it is then marked as failed)
+        """
         trading_rule = self._trading_rules[trading_pair]
 
         if order_type in [OrderType.LIMIT, OrderType.LIMIT_MAKER]:
@@ -462,37 +614,21 @@ class ExchangePyBase(ExchangeBase, ABC):
         if order_type not in self.supported_order_types():
             self.logger().error(f"{order_type} is not in the list of supported order types")
             self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
-            return
+            return None
 
         if amount < trading_rule.min_order_size:
             self.logger().warning(f"{trade_type.name.title()} order amount {amount} is lower than the minimum order"
                                   f" size {trading_rule.min_order_size}. The order will not be created.")
             self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
-            return
+            return None
         if price is not None and not math.isnan(price) and amount * price < trading_rule.min_notional_size:
             self.logger().warning(f"{trade_type.name.title()} order notional {amount * price} is lower than the "
                                   f"minimum notional size {trading_rule.min_notional_size}. "
                                   "The order will not be created.")
             self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
-            return
-
-        try:
-            exchange_order_id = await self._place_order_and_process_update(order=order, **kwargs,)
+            return None
 
-        except asyncio.CancelledError:
-            raise
-        except Exception as ex:
-            self._on_order_failure(
-                order_id=order_id,
-                trading_pair=trading_pair,
-                amount=amount,
-                trade_type=trade_type,
-                order_type=order_type,
-                price=price,
-                exception=ex,
-                **kwargs,
-            )
-        return order_id, exchange_order_id
+        return order
 
     async def _place_order_and_process_update(self, order: InFlightOrder, **kwargs) -> str:
         exchange_order_id, update_timestamp = await self._place_order(
@@ -568,20 +704,23 @@ class ExchangePyBase(ExchangeBase, ABC):
     async def _execute_order_cancel_and_process_update(self, order: InFlightOrder) -> bool:
         cancelled = await self._place_cancel(order.client_order_id, order)
         if cancelled:
-            update_timestamp = self.current_timestamp
-            if update_timestamp is None or math.isnan(update_timestamp):
-                update_timestamp = self._time()
-            order_update: OrderUpdate = OrderUpdate(
-                client_order_id=order.client_order_id,
-                trading_pair=order.trading_pair,
-                update_timestamp=update_timestamp,
-                new_state=(OrderState.CANCELED
-                           if self.is_cancel_request_in_exchange_synchronous
-                           else OrderState.PENDING_CANCEL),
-            )
-            self._order_tracker.process_order_update(order_update)
+            self._process_order_cancelation(order=order)
         return cancelled
 
+    def _process_order_cancelation(self, order: InFlightOrder):
+        update_timestamp = self.current_timestamp
+        if update_timestamp is None or math.isnan(update_timestamp):
+            update_timestamp = self._time()
+        order_update: OrderUpdate = OrderUpdate(
+            client_order_id=order.client_order_id,
+            trading_pair=order.trading_pair,
+            update_timestamp=update_timestamp,
+            new_state=(OrderState.CANCELED
+                       if self.is_cancel_request_in_exchange_synchronous
+                       else OrderState.PENDING_CANCEL),
+        )
+        self._order_tracker.process_order_update(order_update)
+
     async def _execute_cancel(self, trading_pair: str, order_id: str) -> str:
         """
         Requests the exchange to cancel an active order
@@ -596,6 +735,136 @@ class ExchangePyBase(ExchangeBase, ABC):
 
         return result
 
+    async def _execute_batch_order_create(self, orders_to_create: List[Union[LimitOrder, MarketOrder]]):
+        in_flight_orders_to_create = []
+        for order in orders_to_create:
+            is_limit = isinstance(order, LimitOrder)
+            in_flight_order = self._start_tracking_and_validate_order(
+                trade_type=TradeType.BUY if order.is_buy else TradeType.SELL,
+                order_id=order.client_order_id if is_limit else order.order_id,
+                trading_pair=order.trading_pair,
+                amount=order.quantity if is_limit else Decimal(str(order.amount)),
+                order_type=OrderType.LIMIT if is_limit else OrderType.MARKET,
+                price=order.price if is_limit else s_decimal_NaN,
+            )
+            if in_flight_order is not None:
+                in_flight_orders_to_create.append(in_flight_order)
+
+        await safe_gather(*[
+            self._execute_batch_order_create_request(orders=orders)
+            for orders in split_list_in_chunks(in_flight_orders_to_create, self.BATCH_ORDER_CREATE_MAX_SIZE)
+        ])
+
+    async def _execute_batch_order_create_request(self, orders: List[InFlightOrder]):
+        """
+        Places the orders with a single request. Only the orders the exchange explicitly rejected in the batch
+        response are placed again individually. If the request fails, or the response has no result for an order, the
+        exchange might have created the orders anyway, so they are marked as failed like in `_create_order` instead of
+        being placed again, which could duplicate them.
+        """
+        orders_to_retry = []
+        try:
+            place_order_results = await self._place_batch_order_create(orders_to_create=orders)
+        except asyncio.CancelledError:
+            raise
+        except Exception as ex:
+            for order in orders:
+                self._on_order_failure(
+                    order_id=order.client_order_id,
+                    trading_pair=order.trading_pair,
+                    amount=order.amount,
+                    trade_type=order.trade_type,
+                    order_type=order.order_type,
+                    price=order.price,
+                    exception=ex,
+                )
+            return
+
+        results_by_client_order_id = {place_order_result.client_order_id: place_order_result
+                                      for place_order_result in place_order_results}
+        for order in orders:
+            place_order_result = results_by_client_order_id.get(order.client_order_id)
+            if place_order_result is None:
+                self.logger().warning(
+                    f"The order {order.client_order_id} has no result in the batch response of {self.name_cap}, "
+                    f"it is marked as failed.")
+                self._update_order_after_failure(order_id=order.client_order_id, trading_pair=order.trading_pair)
+            elif place_order_result.exception is not None:
+                self.logger().warning(
+                    f"The order {order.client_order_id} was rejected in the batch request, creating it "
+                    f"individually ({place_order_result.exception}).")
+                orders_to_retry.append(order)
+            else:
+                self._order_tracker.process_order_update(OrderUpdate(
+                    client_order_id=order.client_order_id,
+                    exchange_order_id=str(place_order_result.exchange_order_id),
+                    trading_pair=order.trading_pair,
+                    update_timestamp=place_order_result.update_timestamp,
+                    new_state=OrderState.OPEN,
+                ))
+
+        await safe_gather(*[self._place_order_with_failure_handling(order=order) for order in orders_to_retry])
+
+    async def _place_order_with_failure_handling(self, order: InFlightOrder):
+        try:
+            await self._place_order_and_process_update(order=order)
+        except asyncio.CancelledError:
+            raise
+        except Exception as ex:
+            self._on_order_failure(
+                order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                amount=order.amount,
+                trade_type=order.trade_type,
+                order_type=order.order_type,
+                price=order.price,
+                exception=ex,
+            )
+
+    async def _execute_batch_order_cancel(self, orders_to_cancel: List[LimitOrder]):
+        tracked_orders = []
+        for order in orders_to_cancel:
+            tracked_order = self._order_tracker.fetch_tracked_order(order.client_order_id)
+            if tracked_order is not None:
+                tracked_orders.append(tracked_order)
+
+        await safe_gather(*[
+            self._execute_batch_order_cancel_request(orders=orders)
+            for orders in split_list_in_chunks(tracked_orders, self.BATCH_ORDER_CANCEL_MAX_SIZE)
+        ])
+
+    async def _execute_batch_order_cancel_request(self, orders: List[InFlightOrder]):
+        """
+        Cancels the orders with a single request. The orders that failed to be canceled in the batch request or have
+        no result in its response (or all of them if the request fails) are canceled again individually.
+        """
+        orders_to_retry = []
+        try:
+            cancel_order_results = await self._place_batch_order_cancel(orders_to_cancel=orders)
+            results_by_client_order_id = {cancel_order_result.client_order_id: cancel_order_result
+                                          for cancel_order_result in cancel_order_results}
+            for order in orders:
+                cancel_order_result = results_by_client_order_id.get(order.client_order_id)
+                if cancel_order_result is None:
+                    orders_to_retry.append(order)
+                elif cancel_order_result.not_found:
+                    self.logger().warning(f"Failed to cancel order {order.client_order_id} (order not found)")
+                    await self._order_tracker.process_order_not_found(order.client_order_id)
+                elif cancel_order_result.exception is not None:
+                    orders_to_retry.append(order)
+                else:
+                    self._process_order_cancelation(order=order)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().network(
+                f"Error canceling a batch of {len(orders)} orders in {self.name_cap}, canceling them individually.",
+                exc_info=True,
+            )
+            orders_to_retry = orders
+
+        await safe_gather(*[self._execute_order_cancel(order=order) for order in orders_to_retry])
+
     # === Order Tracking ===
 
     def restore_tracking_states(self, saved_states: Dict[str, Any]):
@@ -669,6 +938,27 @@ class ExchangePyBase(ExchangeBase, ABC):
                            ) -> Tuple[str, float]:
         raise NotImplementedError
 
+    async def _place_batch_order_create(self, orders_to_create: List[InFlightOrder]) -> List[PlaceOrderResult]:
+        """
+        Places the orders in the exchange with a single request. Only called when BATCH_ORDER_CREATE_MAX_SIZE is not
+        zero, with at most that number of orders.
+
+        :return: a PlaceOrderResult for each order, with the client order id of the order it belongs to. Orders
+            rejected by the exchange should have the exception set, they are placed again individually. Orders whose
+            outcome is unknown should be left out of the results, they are marked as failed.
+        """
+        raise NotImplementedError
+
+    async def _place_batch_order_cancel(self, orders_to_cancel: List[InFlightOrder]) -> List[CancelOrderResult]:
+        """
+        Cancels the orders in the exchange with a single request. Only called when BATCH_ORDER_CANCEL_MAX_SIZE is not
+        zero, with at most that number of orders.
+
+        :return: a CancelOrderResult for each order, with the client order id of the order it belongs to. Orders not
+            canceled should have the exception set, or not_found if the exchange does not know the order.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def _get_fee(self,
                  base_currency: str,
@@ -756,6 +1046,7 @@ class ExchangePyBase(ExchangeBase, ABC):
         Updates the trading rules by requesting the latest definitions from the exchange.
         Executes regularly every 30 minutes
         """
+        await self._update_trading_rules_from_cache()
         while True:
             try:
                 await safe_gather(self._update_trading_rules())
@@ -881,12 +1172,39 @@ class ExchangePyBase(ExchangeBase, ABC):
 
     async def _update_trading_rules(self):
         exchange_info = await self._make_trading_rules_request()
+        await self._initialize_trading_rules_from_exchange_info(exchange_info=exchange_info)
+        self._save_exchange_info_to_cache(key=TRADING_RULES_REQUEST_KEY, exchange_info=exchange_info)
+
+    async def _initialize_trading_rules_from_exchange_info(self, exchange_info: Any):
         trading_rules_list = await self._format_trading_rules(exchange_info)
         self._trading_rules.clear()
         for trading_rule in trading_rules_list:
             self._trading_rules[trading_rule.trading_pair] = trading_rule
         self._initialize_trading_pair_symbols_from_exchange_info(exchange_info=exchange_info)
 
+    async def _update_trading_rules_from_cache(self):
+        """
+        Initializes the trading rules with the cached exchange information, if there is any. The polling loop requests
+        the current trading rules right after.
+        """
+        exchange_info = self._cached_exchange_info(key=TRADING_RULES_REQUEST_KEY)
+        if exchange_info is not None:
+            try:
+                await self._initialize_trading_rules_from_exchange_info(exchange_info=exchange_info)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().warning("Could not initialize the trading rules from the cache.", exc_info=True)
+
+    def _cached_exchange_info(self, key: str) -> Optional[Any]:
+        if self._exchange_info_cache is None:
+            return None
+        return self._exchange_info_cache.get(connector_name=self.name, key=key)
+
+    def _save_exchange_info_to_cache(self, key: str, exchange_info: Any):
+        if self._exchange_info_cache is not None:
+            self._exchange_info_cache.set(connector_name=self.name, key=key, data=exchange_info)
+
     async def _api_get(self, *args, **kwargs):
         kwargs["method"] = RESTMethod.GET
         return await self._api_request(*args, **kwargs)
@@ -970,10 +1288,23 @@ class ExchangePyBase(ExchangeBase, ABC):
             self._in_flight_orders_snapshot_timestamp = self.current_timestamp
 
     async def _update_orders_fills(self, orders: List[InFlightOrder]):
-        for order in orders:
+        if len(orders) == 0:
+            return
+
+        trade_updates = await self._request_in_bulk(
+            request_function=self._all_trade_updates_for_orders_in_bulk,
+            orders=orders,
+            description="trade updates")
+        if trade_updates is not None:
+            for trade_update in trade_updates:
+                self._order_tracker.process_trade_update(trade_update)
+            return
+
+        async def _update_order_fills(order: InFlightOrder):
             try:
-                trade_updates = await self._all_trade_updates_for_order(order=order)
-                for trade_update in trade_updates:
+                self._order_status_requests_count += 1
+                order_trade_updates = await self._all_trade_updates_for_order(order=order)
+                for trade_update in order_trade_updates:
                     self._order_tracker.process_trade_update(trade_update)
             except asyncio.CancelledError:
                 raise
@@ -983,6 +1314,8 @@ class ExchangePyBase(ExchangeBase, ABC):
                     exc_info=request_error,
                 )
 
+        await self._request_for_each_order(orders=orders, request_function=_update_order_fills)
+
     async def _handle_update_error_for_active_order(self, order: InFlightOrder, error: Exception):
         try:
             raise error
@@ -1005,8 +1338,22 @@ class ExchangePyBase(ExchangeBase, ABC):
             self.logger().warning(f"Error fetching status update for the order {order.client_order_id}: {error}.")
 
     async def _update_orders_with_error_handler(self, orders: List[InFlightOrder], error_handler: Callable):
-        for order in orders:
+        if len(orders) == 0:
+            return
+
+        order_updates = await self._request_in_bulk(
+            request_function=self._request_order_status_in_bulk,
+            orders=orders,
+            description="order status updates")
+        if order_updates is not None:
+            for order_update in order_updates.values():
+                self._order_tracker.process_order_update(order_update)
+            # Orders not included in the bulk response (i.e. no longer open) are requested one by one
+            orders = [order for order in orders if order.client_order_id not in order_updates]
+
+        async def _update_order(order: InFlightOrder):
             try:
+                self._order_status_requests_count += 1
                 order_update = await self._request_order_status(tracked_order=order)
                 self._order_tracker.process_order_update(order_update)
             except asyncio.CancelledError:
@@ -1014,6 +1361,42 @@ class ExchangePyBase(ExchangeBase, ABC):
             except Exception as request_error:
                 await error_handler(order, request_error)
 
+        await self._request_for_each_order(orders=orders, request_function=_update_order)
+
+    async def _request_in_bulk(self, request_function: Callable, orders: List[InFlightOrder], description: str):
+        """
+        Calls one of the bulk request methods. Returns None if the connector does not support it or the request failed,
+        in which case the orders have to be requested one by one.
+        """
+        try:
+            result = await request_function(orders)
+            if result is not None:
+                self._order_status_requests_count += 1
+            return result
+        except asyncio.CancelledError:
+            raise
+        except Exception as request_error:
+            self._order_status_requests_count += 1
+            self.logger().warning(
+                f"Failed to fetch {description} in bulk, requesting them for each order. Error: {request_error}",
+                exc_info=request_error,
+            )
+            return None
+
+    async def _request_for_each_order(
+            self, orders: List[InFlightOrder], request_function: Callable[[InFlightOrder], Awaitable]):
+        """
+        Runs the request function for each order, with at most ORDER_STATUS_MAX_CONCURRENT_REQUESTS of them in flight.
+        The requests are still subject to the throttler rate limits.
+        """
+        semaphore = asyncio.Semaphore(self.ORDER_STATUS_MAX_CONCURRENT_REQUESTS)
+
+        async def _request_with_semaphore(order: InFlightOrder):
+            async with semaphore:
+                await request_function(order)
+
+        await asyncio.gather(*[_request_with_semaphore(order) for order in orders])
+
     async def _update_orders(self):
         orders_to_update = self.in_flight_orders.copy()
         await self._update_orders_with_error_handler(
@@ -1027,8 +1410,15 @@ class ExchangePyBase(ExchangeBase, ABC):
         )
 
     async def _update_order_status(self):
-        await self._update_orders_fills(orders=list(self._order_tracker.all_fillable_orders.values()))
-        await self._update_orders()
+        start_time = time.perf_counter()
+        initial_requests_count = self._order_status_requests_count
+        try:
+            await self._update_orders_fills(orders=list(self._order_tracker.all_fillable_orders.values()))
+            await self._update_orders()
+        finally:
+            self._order_status_polling_cycles += 1
+            self._last_order_status_polling_cycle_duration = time.perf_counter() - start_time
+            self._last_order_status_polling_cycle_requests = self._order_status_requests_count - initial_requests_count
 
     async def _update_lost_orders_status(self):
         await self._update_orders_fills(orders=list(self._order_tracker.lost_orders.values()))
@@ -1064,6 +1454,23 @@ class ExchangePyBase(ExchangeBase, ABC):
     async def _request_order_status(self, tracked_order: InFlightOrder) -> OrderUpdate:
         raise NotImplementedError
 
+    async def _all_trade_updates_for_orders_in_bulk(self, orders: List[InFlightOrder]) -> Optional[List[TradeUpdate]]:
+        """
+        Connectors for exchanges with an endpoint returning all the account trades (i.e. "my trades since T") can
+        override this method to get the trade updates of all the orders with a single request.
+        :return: the trade updates for the orders, or None if not supported (the trades are requested for each order)
+        """
+        return None
+
+    async def _request_order_status_in_bulk(self, orders: List[InFlightOrder]) -> Optional[Dict[str, OrderUpdate]]:
+        """
+        Connectors for exchanges with an endpoint returning all the open orders can override this method to get the
+        status of the orders with a single request.
+        :return: a dictionary with the order updates by client order id, or None if not supported. The status of the
+            orders not included is requested for each order.
+        """
+        return None
+
     @abstractmethod
     def _create_web_assistants_factory(self) -> WebAssistantsFactory:
         raise NotImplementedError
@@ -1085,11 +1492,29 @@ class ExchangePyBase(ExchangeBase, ABC):
 
     async def _initialize_trading_pair_symbol_map(self):
         try:
-            exchange_info = await self._make_trading_pairs_request()
+            exchange_info = self._cached_exchange_info(key=TRADING_PAIRS_REQUEST_KEY)
+            if exchange_info is None:
+                exchange_info = await self._make_trading_pairs_request()
+                self._save_exchange_info_to_cache(key=TRADING_PAIRS_REQUEST_KEY, exchange_info=exchange_info)
+            else:
+                safe_ensure_future(self._refresh_trading_pair_symbol_map())
             self._initialize_trading_pair_symbols_from_exchange_info(exchange_info=exchange_info)
         except Exception:
             self.logger().exception("There was an error requesting exchange info.")
 
+    async def _refresh_trading_pair_symbol_map(self):
+        """
+        Updates the symbol map initialized from the cache with the current exchange information
+        """
+        try:
+            exchange_info = await self._make_trading_pairs_request()
+            self._initialize_trading_pair_symbols_from_exchange_info(exchange_info=exchange_info)
+            self._save_exchange_info_to_cache(key=TRADING_PAIRS_REQUEST_KEY, exchange_info=exchange_info)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().network("Error refreshing the exchange info.", exc_info=True)
+
     async def _make_network_check_request(self):
         await self._api_get(path_url=self.check_network_request_path)
 
@@ -4,15 +4,17 @@ import os.path
 import threading
 import time
 from decimal import Decimal
-from shutil import move
-from typing import Dict, List, Optional, Tuple, Union
+from itertools import islice
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import pandas as pd
+from sqlalchemy import event
 from sqlalchemy.orm import Query, Session
 
 from hummingbot import data_path
-from hummingbot.client.config.client_config_map import MarketDataCollectionConfigMap
+from hummingbot.client.config.client_config_map import MarketDataCollectionConfigMap, MarketsRecorderConfigMap
 from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.connector.exchange_py_base import ExchangePyBase
 from hummingbot.connector.utils import TradeFillOrderDetails
 from hummingbot.core.data_type.common import PriceType
 from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
@@ -33,19 +35,25 @@ from hummingbot.core.event.events import (
     SellOrderCompletedEvent,
     SellOrderCreatedEvent,
 )
+from hummingbot.core.utils.columnar_market_data import ColumnarMarketDataWriter
+from hummingbot.core.utils.csv_sink import CSVSink
 from hummingbot.logger import HummingbotLogger
 from hummingbot.model.funding_payment import FundingPayment
 from hummingbot.model.market_data import MarketData
 from hummingbot.model.market_state import MarketState
+from hummingbot.model.market_state_journal import MarketStateJournal
 from hummingbot.model.order import Order
 from hummingbot.model.order_status import OrderStatus
 from hummingbot.model.range_position_collected_fees import RangePositionCollectedFees
 from hummingbot.model.range_position_update import RangePositionUpdate
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
+from hummingbot.model.sql_write_behind_queue import SQLWrite, SQLWriteBehindQueue
 from hummingbot.model.trade_fill import TradeFill
 
 
 class MarketsRecorder:
+    MARKET_STATE_COMPACTION_INTERVAL = 100
+
     _logger = None
     market_event_tag_map: Dict[int, MarketEvent] = {
         event_obj.value: event_obj
@@ -63,7 +71,8 @@ class MarketsRecorder:
                  markets: List[ConnectorBase],
                  config_file_path: str,
                  strategy_name: str,
-                 market_data_collection: MarketDataCollectionConfigMap):
+                 market_data_collection: MarketDataCollectionConfigMap,
+                 markets_recorder_config: Optional[MarketsRecorderConfigMap] = None):
         if threading.current_thread() != threading.main_thread():
             raise EnvironmentError("MarketsRecorded can only be initialized from the main thread.")
 
@@ -74,6 +83,19 @@ class MarketsRecorder:
         self._strategy_name: str = strategy_name
         self._market_data_collection_config: MarketDataCollectionConfigMap = market_data_collection
         self._market_data_collection_task: Optional[asyncio.Task] = None
+        self._market_data_writer: Optional[ColumnarMarketDataWriter] = None
+        if market_data_collection.market_data_collection_columnar:
+            self._market_data_writer = ColumnarMarketDataWriter(
+                data_dir=os.path.join(data_path(), "market_data"),
+                depth=market_data_collection.market_data_collection_depth,
+            )
+        self._markets_recorder_config: Optional[MarketsRecorderConfigMap] = markets_recorder_config
+        self._write_queue: Optional[SQLWriteBehindQueue] = None
+        self._trades_csv_sinks: Dict[str, CSVSink] = {}
+        self._market_state_journal_sizes: Dict[str, int] = {}
+        if markets_recorder_config is not None and markets_recorder_config.write_behind_enabled:
+            self._write_queue = SQLWriteBehindQueue(sql=sql,
+                                                    max_batch_size=markets_recorder_config.write_behind_batch_size)
         # Internal collection of trade fills in connector will be used for remote/local history reconciliation
         for market in self._markets:
             trade_fills = self.get_trades_for_config(self._config_file_path, 2000)
@@ -120,28 +142,10 @@ class MarketsRecorder:
         while True:
             try:
                 if all(ex.ready for ex in self._markets):
-                    with self._sql_manager.get_new_session() as session:
-                        with session.begin():
-                            for market in self._markets:
-                                exchange = market.display_name
-                                for trading_pair in market.trading_pairs:
-                                    mid_price = market.get_price_by_type(trading_pair, PriceType.MidPrice)
-                                    best_bid = market.get_price_by_type(trading_pair, PriceType.BestBid)
-                                    best_ask = market.get_price_by_type(trading_pair, PriceType.BestAsk)
-                                    order_book = market.get_order_book(trading_pair)
-                                    depth = self._market_data_collection_config.market_data_collection_depth + 1
-                                    market_data = MarketData(
-                                        timestamp=self.db_timestamp,
-                                        exchange=exchange,
-                                        trading_pair=trading_pair,
-                                        mid_price=mid_price,
-                                        best_bid=best_bid,
-                                        best_ask=best_ask,
-                                        order_book={
-                                            "bid": list(order_book.bid_entries())[:depth],
-                                            "ask": list(order_book.ask_entries())[:depth]}
-                                    )
-                                    session.add(market_data)
+                    if self._market_data_writer is not None:
+                        self._record_market_data_to_segments()
+                    else:
+                        self._record_market_data_to_database()
             except asyncio.CancelledError:
                 raise
             except Exception as e:
@@ -149,6 +153,48 @@ class MarketsRecorder:
             finally:
                 await self._sleep(self._market_data_collection_config.market_data_collection_interval)
 
+    def _record_market_data_to_database(self):
+        with self._sql_manager.get_new_session() as session:
+            with session.begin():
+                for market in self._markets:
+                    exchange = market.display_name
+                    for trading_pair in market.trading_pairs:
+                        mid_price = market.get_price_by_type(trading_pair, PriceType.MidPrice)
+                        best_bid = market.get_price_by_type(trading_pair, PriceType.BestBid)
+                        best_ask = market.get_price_by_type(trading_pair, PriceType.BestAsk)
+                        order_book = market.get_order_book(trading_pair)
+                        depth = self._market_data_collection_config.market_data_collection_depth + 1
+                        market_data = MarketData(
+                            timestamp=self.db_timestamp,
+                            exchange=exchange,
+                            trading_pair=trading_pair,
+                            mid_price=mid_price,
+                            best_bid=best_bid,
+                            best_ask=best_ask,
+                            order_book={
+                                "bid": list(islice(order_book.bid_entries(), depth)),
+                                "ask": list(islice(order_book.ask_entries(), depth))}
+                        )
+                        session.add(market_data)
+
+    def _record_market_data_to_segments(self):
+        timestamp = self.db_timestamp
+        for market in self._markets:
+            exchange = market.display_name
+            for trading_pair in market.trading_pairs:
+                order_book = market.get_order_book(trading_pair)
+                self._market_data_writer.append(
+                    exchange=exchange,
+                    trading_pair=trading_pair,
+                    timestamp=timestamp,
+                    mid_price=float(market.get_price_by_type(trading_pair, PriceType.MidPrice)),
+                    best_bid=float(market.get_price_by_type(trading_pair, PriceType.BestBid)),
+                    best_ask=float(market.get_price_by_type(trading_pair, PriceType.BestAsk)),
+                    bids=order_book.bid_entries(),
+                    asks=order_book.ask_entries(),
+                )
+        self._market_data_writer.flush()
+
     @property
     def sql_manager(self) -> SQLConnectionManager:
         return self._sql_manager
@@ -165,7 +211,16 @@ class MarketsRecorder:
     def db_timestamp(self) -> int:
         return int(time.time() * 1e3)
 
+    @property
+    def write_queue_metrics(self) -> Optional[Dict[str, Any]]:
+        """
+        Returns the depth of the write-behind queue and the commit latencies, or None if write-behind is not enabled
+        """
+        return self._write_queue.metrics if self._write_queue is not None else None
+
     def start(self):
+        if self._write_queue is not None:
+            self._write_queue.start()
         for market in self._markets:
             for event_pair in self._event_pairs:
                 market.add_listener(event_pair[0], event_pair[1])
@@ -178,6 +233,29 @@ class MarketsRecorder:
                 market.remove_listener(event_pair[0], event_pair[1])
         if self._market_data_collection_task is not None:
             self._market_data_collection_task.cancel()
+        if self._market_data_writer is not None:
+            self._market_data_writer.close()
+        for market in self._markets:
+            if self._market_state_journal_sizes.get(market.display_name, 0) > 0:
+                self._write(self._market_states_write(market, order_id=None))
+        if self._write_queue is not None:
+            self._write_queue.stop(timeout=self._markets_recorder_config.write_behind_stop_timeout)
+        for csv_sink in self._trades_csv_sinks.values():
+            csv_sink.close()
+
+    def _write(self, write: SQLWrite, durable: bool = False):
+        """
+        Executes a database write. With write-behind enabled the write is queued to be committed by the writer thread,
+        unless it has to be durable. Durable writes are committed before returning, after the writes already queued.
+        """
+        if self._write_queue is not None and not durable:
+            self._write_queue.put(write)
+            return
+        if self._write_queue is not None:
+            self._write_queue.flush(timeout=self._markets_recorder_config.write_behind_stop_timeout)
+        with self._sql_manager.get_new_session() as session:
+            with session.begin():
+                write(session)
 
     def get_orders_for_config_and_market(self, config_file_path: str, market: ConnectorBase,
                                          with_exchange_order_id_present: Optional[bool] = False,
@@ -208,25 +286,93 @@ class MarketsRecorder:
                 return query.limit(number_of_rows).all()
 
     def save_market_states(self, config_file_path: str, market: ConnectorBase, session: Session):
-        market_states: Optional[MarketState] = self.get_market_states(config_file_path, market, session=session)
+        self._market_state_journal_sizes[market.display_name] = 0
+        self._save_tracking_states(config_file_path, market.display_name, market.tracking_states, session=session)
+
+    def _market_states_write(self, market: ConnectorBase, order_id: Optional[str]) -> SQLWrite:
+        """
+        Takes the changes in the market tracking states caused by an order event, and returns the write that saves them.
+        The states are taken when the event is received, because the write might be executed from the writer thread.
+        Connectors that can serialize a single order only journal the state of the order of the event. The complete
+        tracking states are saved once every MARKET_STATE_COMPACTION_INTERVAL events, replacing the journal.
+        """
+        market_name: str = market.display_name
+        journal_size: int = self._market_state_journal_sizes.get(market_name, 0)
+        if (order_id is not None
+                and isinstance(market, ExchangePyBase)
+                and journal_size < self.MARKET_STATE_COMPACTION_INTERVAL):
+            order_state: Optional[Dict[str, Any]] = market.tracking_state(order_id)
+            self._market_state_journal_sizes[market_name] = journal_size + 1
+
+            def write(session: Session):
+                self._add_market_state_journal_entry(
+                    self._config_file_path, market_name, order_id, order_state, session=session)
+        else:
+            tracking_states: Dict[str, Any] = market.tracking_states
+            self._market_state_journal_sizes[market_name] = 0
+
+            def write(session: Session):
+                self._save_tracking_states(self._config_file_path, market_name, tracking_states, session=session)
+        return write
+
+    def _add_market_state_journal_entry(self,
+                                        config_file_path: str,
+                                        market_name: str,
+                                        order_id: str,
+                                        order_state: Optional[Dict[str, Any]],
+                                        session: Session):
+        session.add(MarketStateJournal(config_file_path=config_file_path,
+                                       market=market_name,
+                                       timestamp=self.db_timestamp,
+                                       order_id=order_id,
+                                       saved_state=order_state))
+
+    def _save_tracking_states(self,
+                              config_file_path: str,
+                              market_name: str,
+                              tracking_states: Dict[str, Any],
+                              session: Session):
+        query: Query = (session
+                        .query(MarketState)
+                        .filter(MarketState.config_file_path == config_file_path,
+                                MarketState.market == market_name))
+        market_states: Optional[MarketState] = query.one_or_none()
         timestamp: int = self.db_timestamp
 
         if market_states is not None:
-            market_states.saved_state = market.tracking_states
+            market_states.saved_state = tracking_states
             market_states.timestamp = timestamp
         else:
             market_states = MarketState(config_file_path=config_file_path,
-                                        market=market.display_name,
+                                        market=market_name,
                                         timestamp=timestamp,
-                                        saved_state=market.tracking_states)
+                                        saved_state=tracking_states)
             session.add(market_states)
+        # The snapshot includes all the changes journaled before it
+        (session
+         .query(MarketStateJournal)
+         .filter(MarketStateJournal.config_file_path == config_file_path,
+                 MarketStateJournal.market == market_name)
+         .delete(synchronize_session=False))
 
     def restore_market_states(self, config_file_path: str, market: ConnectorBase):
         with self._sql_manager.get_new_session() as session:
             market_states: Optional[MarketState] = self.get_market_states(config_file_path, market, session=session)
-
-            if market_states is not None:
-                market.restore_tracking_states(market_states.saved_state)
+            journal: List[MarketStateJournal] = (session
+                                                 .query(MarketStateJournal)
+                                                 .filter(MarketStateJournal.config_file_path == config_file_path,
+                                                         MarketStateJournal.market == market.display_name)
+                                                 .order_by(MarketStateJournal.id)
+                                                 .all())
+
+            if market_states is not None or len(journal) > 0:
+                saved_states: Dict[str, Any] = dict(market_states.saved_state) if market_states is not None else {}
+                for journal_entry in journal:
+                    if journal_entry.saved_state is None:
+                        saved_states.pop(journal_entry.order_id, None)
+                    else:
+                        saved_states[journal_entry.order_id] = journal_entry.saved_state
+                market.restore_tracking_states(saved_states)
 
     def get_market_states(self,
                           config_file_path: str,
@@ -250,32 +396,35 @@ class MarketsRecorder:
         base_asset, quote_asset = evt.trading_pair.split("-")
         timestamp = int(evt.creation_timestamp * 1e3)
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
-
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                order_record: Order = Order(id=evt.order_id,
-                                            config_file_path=self._config_file_path,
-                                            strategy=self._strategy_name,
-                                            market=market.display_name,
-                                            symbol=evt.trading_pair,
-                                            base_asset=base_asset,
-                                            quote_asset=quote_asset,
-                                            creation_timestamp=timestamp,
-                                            order_type=evt.type.name,
-                                            amount=Decimal(evt.amount),
-                                            leverage=evt.leverage if evt.leverage else 1,
-                                            price=Decimal(evt.price) if evt.price == evt.price else Decimal(0),
-                                            position=evt.position if evt.position else PositionAction.NIL.value,
-                                            last_status=event_type.name,
-                                            last_update_timestamp=timestamp,
-                                            exchange_order_id=evt.exchange_order_id)
-                order_status: OrderStatus = OrderStatus(order=order_record,
-                                                        timestamp=timestamp,
-                                                        status=event_type.name)
-                session.add(order_record)
-                session.add(order_status)
-                market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
-                self.save_market_states(self._config_file_path, market, session=session)
+        market_name: str = market.display_name
+        save_market_states: SQLWrite = self._market_states_write(market, evt.order_id)
+
+        def write(session: Session):
+            order_record: Order = Order(id=evt.order_id,
+                                        config_file_path=self._config_file_path,
+                                        strategy=self._strategy_name,
+                                        market=market_name,
+                                        symbol=evt.trading_pair,
+                                        base_asset=base_asset,
+                                        quote_asset=quote_asset,
+                                        creation_timestamp=timestamp,
+                                        order_type=evt.type.name,
+                                        amount=Decimal(evt.amount),
+                                        leverage=evt.leverage if evt.leverage else 1,
+                                        price=Decimal(evt.price) if evt.price == evt.price else Decimal(0),
+                                        position=evt.position if evt.position else PositionAction.NIL.value,
+                                        last_status=event_type.name,
+                                        last_update_timestamp=timestamp,
+                                        exchange_order_id=evt.exchange_order_id)
+            order_status: OrderStatus = OrderStatus(order=order_record,
+                                                    timestamp=timestamp,
+                                                    status=event_type.name)
+            session.add(order_record)
+            session.add(order_status)
+            save_market_states(session)
+
+        market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
+        self._write(write)
 
     def _did_fill_order(self,
                         event_tag: int,
@@ -289,47 +438,56 @@ class MarketsRecorder:
         timestamp: int = int(evt.timestamp * 1e3) if evt.timestamp is not None else self.db_timestamp
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
-
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                # Try to find the order record, and update it if necessary.
-                order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-                if order_record is not None:
-                    order_record.last_status = event_type.name
-                    order_record.last_update_timestamp = timestamp
-
-                # Order status and trade fill record should be added even if the order record is not found, because it's
-                # possible for fill event to come in before the order created event for market orders.
-                order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                        timestamp=timestamp,
-                                                        status=event_type.name)
-
-                trade_fill_record: TradeFill = TradeFill(
-                    config_file_path=self.config_file_path,
-                    strategy=self.strategy_name,
-                    market=market.display_name,
-                    symbol=evt.trading_pair,
-                    base_asset=base_asset,
-                    quote_asset=quote_asset,
-                    timestamp=timestamp,
-                    order_id=order_id,
-                    trade_type=evt.trade_type.name,
-                    order_type=evt.order_type.name,
-                    price=evt.price,
-                    amount=evt.amount,
-                    leverage=evt.leverage if evt.leverage else 1,
-                    trade_fee=evt.trade_fee.to_json(),
-                    exchange_trade_id=evt.exchange_trade_id,
-                    position=evt.position if evt.position else PositionAction.NIL.value,
-                )
-                session.add(order_status)
-                session.add(trade_fill_record)
-                self.save_market_states(self._config_file_path, market, session=session)
-
-                market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(trade_fill_record.market,
-                                                                                   trade_fill_record.exchange_trade_id,
-                                                                                   trade_fill_record.symbol)})
-                self.append_to_csv(trade_fill_record)
+        market_name: str = market.display_name
+        save_market_states: SQLWrite = self._market_states_write(market, order_id)
+
+        def write(session: Session):
+            # Try to find the order record, and update it if necessary.
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+            if order_record is not None:
+                order_record.last_status = event_type.name
+                order_record.last_update_timestamp = timestamp
+
+            # Order status and trade fill record should be added even if the order record is not found, because it's
+            # possible for fill event to come in before the order created event for market orders.
+            order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                    timestamp=timestamp,
+                                                    status=event_type.name)
+
+            trade_fill_record: TradeFill = TradeFill(
+                config_file_path=self.config_file_path,
+                strategy=self.strategy_name,
+                market=market_name,
+                symbol=evt.trading_pair,
+                base_asset=base_asset,
+                quote_asset=quote_asset,
+                timestamp=timestamp,
+                order_id=order_id,
+                trade_type=evt.trade_type.name,
+                order_type=evt.order_type.name,
+                price=evt.price,
+                amount=evt.amount,
+                leverage=evt.leverage if evt.leverage else 1,
+                trade_fee=evt.trade_fee.to_json(),
+                exchange_trade_id=evt.exchange_trade_id,
+                position=evt.position if evt.position else PositionAction.NIL.value,
+            )
+            session.add(order_status)
+            session.add(trade_fill_record)
+            save_market_states(session)
+            # The row is written once the fill is committed. A write that is rolled back, because its batch failed
+            # and it is committed again on its own, or because it fails for good, must not add a row.
+            field_names, field_data = self._trade_csv_row(trade_fill_record)
+            event.listen(session,
+                         "after_commit",
+                         lambda _: self._trades_csv_sink(self.config_file_path, field_names).write_row(field_data),
+                         once=True)
+
+        market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(market_name,
+                                                                           evt.exchange_trade_id,
+                                                                           evt.trading_pair)})
+        durable = self._markets_recorder_config is not None and self._markets_recorder_config.durable_fills
+        self._write(write, durable=durable)
 
     def _did_complete_funding_payment(self,
                                       event_tag: int,
@@ -340,30 +498,29 @@ class MarketsRecorder:
             return
 
         timestamp: float = evt.timestamp
-
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                # Try to find the funding payment has been recorded already.
-                payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(
-                    FundingPayment.timestamp == timestamp).one_or_none()
-                if payment_record is None:
-                    funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
-                                                                            config_file_path=self.config_file_path,
-                                                                            market=market.display_name,
-                                                                            rate=evt.funding_rate,
-                                                                            symbol=evt.trading_pair,
-                                                                            amount=float(evt.amount))
-                    session.add(funding_payment_record)
-
-    @staticmethod
-    def _csv_matches_header(file_path: str, header: tuple) -> bool:
-        df = pd.read_csv(file_path, header=None)
-        return tuple(df.iloc[0].values) == header
+        market_name: str = market.display_name
+
+        def write(session: Session):
+            # Try to find the funding payment has been recorded already.
+            payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(
+                FundingPayment.timestamp == timestamp).one_or_none()
+            if payment_record is None:
+                funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
+                                                                        config_file_path=self.config_file_path,
+                                                                        market=market_name,
+                                                                        rate=evt.funding_rate,
+                                                                        symbol=evt.trading_pair,
+                                                                        amount=float(evt.amount))
+                session.add(funding_payment_record)
+
+        self._write(write)
 
     def append_to_csv(self, trade: TradeFill):
-        csv_filename = "trades_" + trade.config_file_path[:-4] + ".csv"
-        csv_path = os.path.join(data_path(), csv_filename)
+        field_names, field_data = self._trade_csv_row(trade)
+        self._trades_csv_sink(trade.config_file_path, field_names).write_row(field_data)
 
+    @staticmethod
+    def _trade_csv_row(trade: TradeFill) -> Tuple[Tuple[str, ...], Tuple[Any, ...]]:
         field_names = tuple(trade.attribute_names_for_file_export())
         field_data = tuple(getattr(trade, attr) for attr in field_names)
 
@@ -373,15 +530,17 @@ class MarketsRecorder:
             '%H:%M:%S') if (trade.order is not None and "//" not in trade.order_id) else "n/a"
         field_names += ("age",)
         field_data += (age,)
-
-        if (os.path.exists(csv_path) and (not self._csv_matches_header(csv_path, field_names))):
-            move(csv_path, csv_path[:-4] + '_old_' + pd.Timestamp.utcnow().strftime("%Y%m%d-%H%M%S") + ".csv")
-
-        if not os.path.exists(csv_path):
-            df_header = pd.DataFrame([field_names])
-            df_header.to_csv(csv_path, mode='a', header=False, index=False)
-        df = pd.DataFrame([field_data])
-        df.to_csv(csv_path, mode='a', header=False, index=False)
+        return field_names, field_data
+
+    def _trades_csv_sink(self, config_file_path: str, field_names: Tuple[str, ...]) -> CSVSink:
+        csv_sink: Optional[CSVSink] = self._trades_csv_sinks.get(config_file_path)
+        if csv_sink is None or csv_sink.header != field_names:
+            if csv_sink is not None:
+                csv_sink.close()
+            csv_filename = "trades_" + config_file_path[:-4] + ".csv"
+            csv_sink = CSVSink(file_path=os.path.join(data_path(), csv_filename), header=field_names)
+            self._trades_csv_sinks[config_file_path] = csv_sink
+        return csv_sink
 
     def _update_order_status(self,
                              event_tag: int,
@@ -398,19 +557,23 @@ class MarketsRecorder:
         timestamp: int = self.db_timestamp
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
+        save_market_states: SQLWrite = self._market_states_write(market, order_id)
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+        def write(session: Session):
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+
+            if order_record is not None:
+                order_record.last_status = event_type.name
+                order_record.last_update_timestamp = timestamp
+                order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                        timestamp=timestamp,
+                                                        status=event_type.name)
+                session.add(order_status)
+            # The market states are saved even if the order record is missing, otherwise the journal would keep the
+            # last active state of the order (and a compaction would be skipped after resetting the journal size)
+            save_market_states(session)
 
-                if order_record is not None:
-                    order_record.last_status = event_type.name
-                    order_record.last_update_timestamp = timestamp
-                    order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                            timestamp=timestamp,
-                                                            status=event_type.name)
-                    session.add(order_status)
-                    self.save_market_states(self._config_file_path, market, session=session)
+        self._write(write)
 
     def _did_cancel_order(self,
                           event_tag: int,
@@ -445,16 +608,18 @@ class MarketsRecorder:
             return
 
         timestamp: int = self.db_timestamp
+        save_market_states: SQLWrite = self._market_states_write(connector, evt.order_id)
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                rp_update: RangePositionUpdate = RangePositionUpdate(hb_id=evt.order_id,
-                                                                     timestamp=timestamp,
-                                                                     tx_hash=evt.exchange_order_id,
-                                                                     token_id=evt.token_id,
-                                                                     trade_fee=evt.trade_fee.to_json())
-                session.add(rp_update)
-                self.save_market_states(self._config_file_path, connector, session=session)
+        def write(session: Session):
+            rp_update: RangePositionUpdate = RangePositionUpdate(hb_id=evt.order_id,
+                                                                 timestamp=timestamp,
+                                                                 tx_hash=evt.exchange_order_id,
+                                                                 token_id=evt.token_id,
+                                                                 trade_fee=evt.trade_fee.to_json())
+            session.add(rp_update)
+            save_market_states(session)
+
+        self._write(write)
 
     def _did_close_position(self,
                             event_tag: int,
@@ -464,17 +629,20 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_close_position, event_tag, connector, evt)
             return
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                rp_fees: RangePositionCollectedFees = RangePositionCollectedFees(config_file_path=self._config_file_path,
-                                                                                 strategy=self._strategy_name,
-                                                                                 token_id=evt.token_id,
-                                                                                 token_0=evt.token_0,
-                                                                                 token_1=evt.token_1,
-                                                                                 claimed_fee_0=Decimal(evt.claimed_fee_0),
-                                                                                 claimed_fee_1=Decimal(evt.claimed_fee_1))
-                session.add(rp_fees)
-                self.save_market_states(self._config_file_path, connector, session=session)
+        save_market_states: SQLWrite = self._market_states_write(connector, None)
+
+        def write(session: Session):
+            rp_fees: RangePositionCollectedFees = RangePositionCollectedFees(config_file_path=self._config_file_path,
+                                                                             strategy=self._strategy_name,
+                                                                             token_id=evt.token_id,
+                                                                             token_0=evt.token_0,
+                                                                             token_1=evt.token_1,
+                                                                             claimed_fee_0=Decimal(evt.claimed_fee_0),
+                                                                             claimed_fee_1=Decimal(evt.claimed_fee_1))
+            session.add(rp_fees)
+            save_market_states(session)
+
+        self._write(write)
 
     @staticmethod
     async def _sleep(delay):
@@ -40,7 +40,7 @@ class NetworkMockingAssistant:
     def _get_next_api_response_status(self, http_mock):
         return self._response_status_queues[http_mock].popleft()
 
-    async def _get_next_api_response_json(self, http_mock):
+    async def _get_next_api_response_json(self, http_mock, *args, **kwargs):
         ret = await self._response_json_queues[http_mock].get()
         return ret
 
@@ -97,7 +97,7 @@ class NetworkMockingAssistant:
     def create_websocket_mock(self):
         ws = AsyncMock()
         ws.__aenter__.return_value = ws
-        ws.send_json.side_effect = lambda sent_message: self._sent_websocket_json_messages[ws].append(sent_message)
+        ws.send_json.side_effect = lambda sent_message, **kwargs: self._sent_websocket_json_messages[ws].append(sent_message)
         ws.send.side_effect = lambda sent_message: self._sent_websocket_text_messages[ws].append(sent_message)
         ws.send_str.side_effect = lambda sent_message: self._sent_websocket_text_messages[ws].append(sent_message)
         ws.receive_json.side_effect = self.async_partial(self._get_next_websocket_json_message, ws)
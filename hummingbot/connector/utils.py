@@ -5,7 +5,7 @@ import os
 import platform
 from collections import namedtuple
 from hashlib import md5
-from typing import Any, Callable, Dict, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from zero_ex.order_utils import Order as ZeroExOrder
 
@@ -121,6 +121,10 @@ def get_new_numeric_client_order_id(nonce_creator: NonceCreator, max_id_bit_coun
     return client_order_id
 
 
+def split_list_in_chunks(elements: List[Any], chunk_size: int) -> List[List[Any]]:
+    return [elements[i:i + chunk_size] for i in range(0, len(elements), chunk_size)]
+
+
 class TimeSynchronizerRESTPreProcessor(RESTPreProcessorBase):
     """
     This pre processor is intended to be used in those connectors that require synchronization with the server time
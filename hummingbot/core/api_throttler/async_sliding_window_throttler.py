@@ -0,0 +1,273 @@
+import asyncio
+import time
+from collections import deque
+from decimal import Decimal
+from typing import Deque, Dict, List, Optional, Set, Tuple
+
+from hummingbot.core.api_throttler.async_request_context_base import (
+    MAX_CAPACITY_REACHED_WARNING_INTERVAL,
+    AsyncRequestContextBase,
+)
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.api_throttler.data_types import RateLimit
+
+# Float timestamps around the current epoch have a resolution of about 0.2 microseconds. Entries are kept for an extra
+# microsecond so that rounding never expires them early.
+EXPIRATION_TOLERANCE = 1e-6
+
+
+class RateLimitWindow:
+    """
+    Sliding window with the capacity used on a single RateLimit.
+    The acquired weights are kept in a deque in acquisition order, together with their sum, so expiring old entries and
+    checking the capacity are O(1) amortized.
+    """
+
+    def __init__(self, rate_limit: RateLimit, safety_margin_pct: float):
+        self._entries: Deque[Tuple[float, int]] = deque()
+        self._safety_margin_pct = safety_margin_pct
+        self.capacity_used: int = 0
+        self.update_rate_limit(rate_limit)
+
+    @property
+    def rate_limit(self) -> RateLimit:
+        return self._rate_limit
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    def update_rate_limit(self, rate_limit: RateLimit):
+        self._rate_limit = rate_limit
+        self._limit = int(rate_limit.limit)
+        self._duration = rate_limit.time_interval * (1 + self._safety_margin_pct) + EXPIRATION_TOLERANCE
+
+    def expire(self, now: float):
+        oldest_valid_timestamp = now - self._duration
+        while len(self._entries) > 0 and self._entries[0][0] < oldest_valid_timestamp:
+            self.capacity_used -= self._entries.popleft()[1]
+
+    def has_capacity(self, weight: int) -> bool:
+        return self.capacity_used + weight <= self._limit
+
+    def add(self, timestamp: float, weight: int):
+        self._entries.append((timestamp, weight))
+        self.capacity_used += weight
+
+    def capacity_available_time(self, weight: int) -> Optional[float]:
+        """
+        Returns the time at which enough entries will have expired to fit the weight, or None if it never will.
+        """
+        if self.has_capacity(weight):
+            return 0
+        if weight > self._limit:
+            return None
+        capacity_to_free = self.capacity_used + weight - self._limit
+        for timestamp, entry_weight in self._entries:
+            capacity_to_free -= entry_weight
+            if capacity_to_free <= 0:
+                return timestamp + self._duration
+        return None
+
+
+class AsyncSlidingWindowRequestContext:
+    """
+    An async context class ('async with' syntax) that waits until all the rate limits of the task have capacity.
+    Waiting tasks are queued in the throttler and woken in order when the capacity is freed, instead of polling.
+    """
+
+    def __init__(self,
+                 throttler: "AsyncSlidingWindowThrottler",
+                 rate_limit: Optional[RateLimit],
+                 related_limits: List[Tuple[RateLimit, int]]):
+        """
+        :param throttler: The throttler that keeps the rate limit windows
+        :param rate_limit: The RateLimit associated with this API Request
+        :param related_limits: List of linked rate limits with its corresponding weight associated with this API Request
+        """
+        self._throttler = throttler
+        self._rate_limit = rate_limit
+        self._related_limits = related_limits
+        self.windows: List[Tuple[RateLimitWindow, int]] = []
+        if rate_limit is not None:
+            self.windows = [(throttler.window(rate_limit.limit_id), rate_limit.weight)]
+            self.windows.extend((throttler.window(limit.limit_id), weight) for limit, weight in related_limits)
+        self.limit_ids: Set[str] = {window.rate_limit.limit_id for window, _ in self.windows}
+
+    def within_capacity(self) -> bool:
+        """
+        Checks if an additional task is within the defined RateLimit(s).
+        :return: True if it is within capacity to add a new task
+        """
+        return self._throttler.within_capacity(self, self._throttler._time())
+
+    async def acquire(self):
+        await self._throttler.acquire(self)
+
+    async def __aenter__(self):
+        await self.acquire()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        pass
+
+
+class AsyncSlidingWindowThrottler(AsyncThrottlerBase):
+    """
+    Handles call rate limits like AsyncThrottler, keeping a sliding window per rate limit instead of a shared list of
+    task logs. Acquiring capacity is O(1) amortized per rate limit, and uses float math.
+    Tasks waiting for capacity are queued and woken in FIFO order when the capacity they need is freed. A task only
+    waits behind earlier tasks that share at least one of its rate limits.
+    """
+
+    def __init__(self,
+                 rate_limits: List[RateLimit],
+                 retry_interval: float = 0.1,
+                 safety_margin_pct: Optional[float] = 0.05,  # An extra safety margin, in percentage.
+                 limits_share_percentage: Optional[Decimal] = None
+                 ):
+        """
+        :param rate_limits: List of RateLimit(s).
+        :param retry_interval: Not used, waiting tasks are woken when the capacity is freed. Kept for compatibility
+            with AsyncThrottler.
+        :param safety_margin_pct: Percentage of limit to be added as a safety margin when calculating capacity to ensure
+            calls are within the limit.
+        :param limits_share_percentage: Percentage of the limits to be used by this instance (important when multiple
+            bots operate with the same account)
+        """
+        self._windows: Dict[str, RateLimitWindow] = {}
+        self._waiters: Deque[Tuple[AsyncSlidingWindowRequestContext, asyncio.Future]] = deque()
+        self._waiting_limit_ids: Dict[str, int] = {}
+        self._wakeup_handle: Optional[asyncio.TimerHandle] = None
+        self._wakeup_time: Optional[float] = None
+        # The windows are created in set_rate_limits, which is called by the base class constructor
+        self._safety_margin_pct = safety_margin_pct
+        super().__init__(
+            rate_limits=rate_limits,
+            retry_interval=retry_interval,
+            safety_margin_pct=safety_margin_pct,
+            limits_share_percentage=limits_share_percentage)
+
+    def set_rate_limits(self, rate_limits: List[RateLimit]):
+        super().set_rate_limits(rate_limits)
+        # Keep the capacity already used on the limits that are still defined
+        windows = {}
+        for limit_id, rate_limit in self._id_to_limit_map.items():
+            window = self._windows.get(limit_id)
+            if window is None:
+                window = RateLimitWindow(rate_limit=rate_limit, safety_margin_pct=self._safety_margin_pct)
+            else:
+                window.update_rate_limit(rate_limit)
+            windows[limit_id] = window
+        self._windows = windows
+
+    def window(self, limit_id: str) -> RateLimitWindow:
+        return self._windows[limit_id]
+
+    def execute_task(self, limit_id: str) -> AsyncSlidingWindowRequestContext:
+        """
+        Creates an async context where code within the context (a task) can be run only when all rate
+        limits have capacity for the new task.
+        :param limit_id: the limit_id associated with the APi request
+        :return: An async context (used with async with syntax)
+        """
+        rate_limit, related_rate_limits = self.get_related_limits(limit_id=limit_id)
+        return AsyncSlidingWindowRequestContext(
+            throttler=self,
+            rate_limit=rate_limit,
+            related_limits=related_rate_limits,
+        )
+
+    def _time(self) -> float:
+        return time.time()
+
+    def within_capacity(self, context: AsyncSlidingWindowRequestContext, now: float) -> bool:
+        for window, weight in context.windows:
+            window.expire(now)
+            if not window.has_capacity(weight):
+                if AsyncRequestContextBase._last_max_cap_warning_ts < now - MAX_CAPACITY_REACHED_WARNING_INTERVAL:
+                    rate_limit = window.rate_limit
+                    msg = f"API rate limit on {rate_limit.limit_id} ({rate_limit.limit} calls per " \
+                          f"{rate_limit.time_interval}s) has almost reached. Limits used " \
+                          f"is {window.capacity_used} in the last " \
+                          f"{rate_limit.time_interval} seconds"
+                    self.logger().notify(msg)
+                    AsyncRequestContextBase._last_max_cap_warning_ts = now
+                return False
+        return True
+
+    async def acquire(self, context: AsyncSlidingWindowRequestContext):
+        now = self._time()
+        if self._waiting_limit_ids.keys().isdisjoint(context.limit_ids) and self.within_capacity(context, now):
+            self._consume_capacity(context, now)
+            return
+
+        future = asyncio.get_event_loop().create_future()
+        self._waiters.append((context, future))
+        for limit_id in context.limit_ids:
+            self._waiting_limit_ids[limit_id] = self._waiting_limit_ids.get(limit_id, 0) + 1
+        future.add_done_callback(self._on_waiter_done)
+        self._schedule_wakeup(now)
+        await future
+
+    def _consume_capacity(self, context: AsyncSlidingWindowRequestContext, now: float):
+        for window, weight in context.windows:
+            window.add(now, weight)
+
+    def _on_waiter_done(self, future: asyncio.Future):
+        if future.cancelled():
+            # The limits of a cancelled task might not block the following ones anymore
+            self._schedule_wakeup(self._time(), immediately=True)
+
+    def _schedule_wakeup(self, now: float, immediately: bool = False):
+        wakeup_time = now if immediately else self._next_wakeup_time(now)
+        if wakeup_time is None or (self._wakeup_time is not None and self._wakeup_time <= wakeup_time):
+            return
+        if self._wakeup_handle is not None:
+            self._wakeup_handle.cancel()
+        self._wakeup_time = wakeup_time
+        self._wakeup_handle = asyncio.get_event_loop().call_later(max(wakeup_time - now, 0), self._process_waiters)
+
+    def _next_wakeup_time(self, now: float) -> Optional[float]:
+        """
+        Returns the earliest time at which one of the waiting tasks that is not queued behind another one could get
+        the capacity it needs.
+        """
+        next_wakeup_time = None
+        blocked_limit_ids = set()
+        for context, future in self._waiters:
+            if future.done():
+                continue
+            if blocked_limit_ids.isdisjoint(context.limit_ids):
+                available_times = [window.capacity_available_time(weight) for window, weight in context.windows]
+                if None not in available_times:
+                    available_time = max([now] + available_times)
+                    next_wakeup_time = (available_time
+                                        if next_wakeup_time is None
+                                        else min(next_wakeup_time, available_time))
+            blocked_limit_ids.update(context.limit_ids)
+        return next_wakeup_time
+
+    def _process_waiters(self):
+        self._wakeup_handle = None
+        self._wakeup_time = None
+        now = self._time()
+        blocked_limit_ids = set()
+        waiters = deque()
+        for context, future in self._waiters:
+            if future.done():
+                self._remove_waiting_limit_ids(context)
+            elif blocked_limit_ids.isdisjoint(context.limit_ids) and self.within_capacity(context, now):
+                self._consume_capacity(context, now)
+                self._remove_waiting_limit_ids(context)
+                future.set_result(None)
+            else:
+                blocked_limit_ids.update(context.limit_ids)
+                waiters.append((context, future))
+        self._waiters = waiters
+        self._schedule_wakeup(now)
+
+    def _remove_waiting_limit_ids(self, context: AsyncSlidingWindowRequestContext):
+        for limit_id in context.limit_ids:
+            self._waiting_limit_ids[limit_id] -= 1
+            if self._waiting_limit_ids[limit_id] == 0:
+                del self._waiting_limit_ids[limit_id]
@@ -10,3 +10,6 @@ cdef class Clock:
         list _current_context
         double _current_tick
         bint _started
+        object _profiler
+
+    cdef c_tick_iterator(self, object child_iterator)
@@ -3,11 +3,12 @@
 import asyncio
 import logging
 import time
-from typing import List
+from typing import List, Optional
 
 from hummingbot.core.time_iterator import TimeIterator
 from hummingbot.core.time_iterator cimport TimeIterator
 from hummingbot.core.clock_mode import ClockMode
+from hummingbot.core.clock_profiler import ClockProfiler
 from hummingbot.logger import HummingbotLogger
 
 s_logger = None
@@ -36,6 +37,7 @@ cdef class Clock:
         self._child_iterators = []
         self._current_context = None
         self._started = False
+        self._profiler = None
 
     @property
     def clock_mode(self) -> ClockMode:
@@ -57,6 +59,17 @@ cdef class Clock:
     def current_timestamp(self) -> float:
         return self._current_tick
 
+    @property
+    def profiler(self) -> Optional[ClockProfiler]:
+        return self._profiler
+
+    @profiler.setter
+    def profiler(self, profiler: Optional[ClockProfiler]):
+        """
+        Enables the timing of the ticks with a ClockProfiler, or disables it when set to None.
+        """
+        self._profiler = profiler
+
     def __enter__(self) -> Clock:
         if self._current_context is not None:
             raise EnvironmentError("Clock context is not re-entrant.")
@@ -111,12 +124,14 @@ cdef class Clock:
                 next_tick_time = ((now // self._tick_size) + 1) * self._tick_size
                 await asyncio.sleep(next_tick_time - now)
                 self._current_tick = next_tick_time
+                if self._profiler is not None:
+                    self._profiler.record_tick_lag(time.time() - next_tick_time)
 
                 # Run through all the child iterators.
                 for ci in self._current_context:
                     child_iterator = ci
                     try:
-                        child_iterator.c_tick(self._current_tick)
+                        self.c_tick_iterator(child_iterator)
                     except StopIteration:
                         self.logger().error("Stop iteration triggered in real time mode. This is not expected.")
                         return
@@ -127,6 +142,17 @@ cdef class Clock:
                 child_iterator = ci
                 child_iterator._clock = None
 
+    cdef c_tick_iterator(self, object child_iterator):
+        cdef double tick_start
+        if self._profiler is None:
+            (<TimeIterator>child_iterator).c_tick(self._current_tick)
+            return
+        tick_start = time.perf_counter()
+        try:
+            (<TimeIterator>child_iterator).c_tick(self._current_tick)
+        finally:
+            self._profiler.record_iterator_tick(child_iterator, time.perf_counter() - tick_start)
+
     def backtest_til(self, timestamp: float):
         cdef TimeIterator child_iterator
 
@@ -142,7 +168,7 @@ cdef class Clock:
                 for ci in self._child_iterators:
                     child_iterator = ci
                     try:
-                        child_iterator.c_tick(self._current_tick)
+                        self.c_tick_iterator(child_iterator)
                     except StopIteration:
                         raise
                     except Exception:
@@ -0,0 +1,219 @@
+import asyncio
+import json
+import logging
+import time
+from bisect import bisect_left
+from typing import Any, Dict, Optional, Sequence, Set
+
+import pandas as pd
+
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
+
+# Upper bounds in seconds of the histogram buckets, the last bucket counts the values above the last bound
+DEFAULT_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+s_logger = None
+
+
+class DurationHistogram:
+    """
+    Histogram of durations in seconds with fixed buckets, so recording a value takes constant time and memory.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self._buckets = tuple(buckets)
+        self._counts = [0] * (len(self._buckets) + 1)
+        self._count = 0
+        self._total = 0.0
+        self._max = 0.0
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def total(self) -> float:
+        return self._total
+
+    @property
+    def max(self) -> float:
+        return self._max
+
+    @property
+    def mean(self) -> float:
+        return self._total / self._count if self._count > 0 else 0.0
+
+    def record(self, value: float):
+        self._counts[bisect_left(self._buckets, value)] += 1
+        self._count += 1
+        self._total += value
+        if value > self._max:
+            self._max = value
+
+    def quantile(self, q: float) -> float:
+        """
+        Returns the upper bound of the bucket of the q quantile, or the maximum value if it is in the last bucket.
+        """
+        if self._count == 0:
+            return 0.0
+        rank = q * self._count
+        cumulative_count = 0
+        for bound, count in zip(self._buckets, self._counts):
+            cumulative_count += count
+            if cumulative_count >= rank:
+                return min(bound, self._max)
+        return self._max
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self._count,
+            "total": self._total,
+            "max": self._max,
+            # "+Inf" like the Prometheus histograms, as JSON has no infinity
+            "buckets": [{"le": bound, "count": count} for bound, count in zip(self._buckets + ("+Inf",), self._counts)],
+        }
+
+
+class ClockProfiler:
+    """
+    Collects the timings of the clock ticks when assigned to `Clock.profiler`: the duration of the tick of each time
+    iterator and how late each tick started with respect to its scheduled time. A watchdog task also measures the lag
+    of the asyncio event loop, the delay to wake up from a sleep, which shows when the loop is congested by other
+    tasks between ticks.
+    """
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        global s_logger
+        if s_logger is None:
+            s_logger = logging.getLogger(__name__)
+        return s_logger
+
+    def __init__(self, loop_lag_sample_interval: float = 0.5):
+        """
+        :param loop_lag_sample_interval: seconds between the event loop lag samples of the watchdog task
+        """
+        self._loop_lag_sample_interval = loop_lag_sample_interval
+        self._iterator_names: Dict[int, str] = {}
+        self._iterator_durations: Dict[str, DurationHistogram] = {}
+        self._tick_lag = DurationHistogram()
+        self._loop_lag = DurationHistogram()
+        self._start_time = time.time()
+        self._watchdog_task: Optional[asyncio.Task] = None
+
+    @property
+    def iterator_durations(self) -> Dict[str, DurationHistogram]:
+        return self._iterator_durations
+
+    @property
+    def tick_lag(self) -> DurationHistogram:
+        return self._tick_lag
+
+    @property
+    def loop_lag(self) -> DurationHistogram:
+        return self._loop_lag
+
+    @property
+    def started(self) -> bool:
+        return self._watchdog_task is not None
+
+    def start(self):
+        self.stop()
+        self._watchdog_task = safe_ensure_future(self._loop_lag_watchdog())
+
+    def stop(self):
+        if self._watchdog_task is not None:
+            self._watchdog_task.cancel()
+            self._watchdog_task = None
+
+    def reset(self):
+        self._iterator_durations.clear()
+        self._tick_lag = DurationHistogram()
+        self._loop_lag = DurationHistogram()
+        self._start_time = time.time()
+
+    def record_iterator_tick(self, iterator: Any, duration: float):
+        iterator_name = self._iterator_names.get(id(iterator))
+        if iterator_name is None:
+            iterator_name = self._iterator_name(iterator)
+        histogram = self._iterator_durations.get(iterator_name)
+        if histogram is None:
+            histogram = self._iterator_durations[iterator_name] = DurationHistogram()
+        histogram.record(duration)
+
+    def record_tick_lag(self, lag: float):
+        self._tick_lag.record(max(lag, 0.0))
+
+    def record_loop_lag(self, lag: float):
+        self._loop_lag.record(max(lag, 0.0))
+
+    def top_offenders(self, limit: Optional[int] = None) -> pd.DataFrame:
+        """
+        Returns the tick duration statistics of the time iterators in milliseconds, the iterators taking more time in
+        total first.
+        """
+        rows = [{"Iterator": name,
+                 "Ticks": histogram.count,
+                 "Mean (ms)": histogram.mean * 1e3,
+                 "p50 (ms)": histogram.quantile(0.5) * 1e3,
+                 "p99 (ms)": histogram.quantile(0.99) * 1e3,
+                 "Max (ms)": histogram.max * 1e3,
+                 "Total (s)": histogram.total}
+                for name, histogram in self._iterator_durations.items()]
+        df = pd.DataFrame(rows, columns=["Iterator", "Ticks", "Mean (ms)", "p50 (ms)", "p99 (ms)", "Max (ms)",
+                                         "Total (s)"])
+        df = df.sort_values(by="Total (s)", ascending=False, ignore_index=True)
+        return df if limit is None else df.head(limit)
+
+    def lag_summary(self) -> pd.DataFrame:
+        rows = [{"Lag": name,
+                 "Samples": histogram.count,
+                 "Mean (ms)": histogram.mean * 1e3,
+                 "p50 (ms)": histogram.quantile(0.5) * 1e3,
+                 "p99 (ms)": histogram.quantile(0.99) * 1e3,
+                 "Max (ms)": histogram.max * 1e3}
+                for name, histogram in (("Tick start", self._tick_lag), ("Event loop", self._loop_lag))]
+        return pd.DataFrame(rows)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "start_time": self._start_time,
+            "end_time": time.time(),
+            "iterator_tick_durations": {name: histogram.to_dict()
+                                        for name, histogram in self._iterator_durations.items()},
+            "tick_lag": self._tick_lag.to_dict(),
+            "loop_lag": self._loop_lag.to_dict(),
+        }
+
+    def export(self, file_path: str):
+        """
+        Saves the histograms as JSON, to load them in dashboards or compare them between runs.
+        """
+        with open(file_path, "w") as export_file:
+            json.dump(self.to_dict(), export_file, indent=2)
+
+    def _iterator_name(self, iterator: Any) -> str:
+        base_name = getattr(iterator, "display_name", None)
+        if not isinstance(base_name, str):
+            base_name = type(iterator).__name__
+        # Iterators with the same name are told apart by a counter
+        names: Set[str] = set(self._iterator_names.values())
+        iterator_name = base_name
+        counter = 1
+        while iterator_name in names:
+            counter += 1
+            iterator_name = f"{base_name} ({counter})"
+        self._iterator_names[id(iterator)] = iterator_name
+        return iterator_name
+
+    async def _loop_lag_watchdog(self):
+        while True:
+            try:
+                sleep_start = time.perf_counter()
+                await asyncio.sleep(self._loop_lag_sample_interval)
+                self.record_loop_lag(time.perf_counter() - sleep_start - self._loop_lag_sample_interval)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().error("Unexpected error sampling the event loop lag.", exc_info=True)
@@ -20,6 +20,8 @@ cdef class CompositeOrderBook(OrderBook):
     def __init__(self, order_book: OrderBook = None):
         super().__init__()
         self._traded_order_book = OrderBook()
+        # The queries must walk the composite entries, which the depth index of the underlying book does not reflect.
+        self._depth_index_enabled = False
 
     @property
     def traded_order_book(self) -> OrderBook:
@@ -20,16 +20,33 @@ cdef class OrderBook(PubSub):
     cdef double _last_applied_trade
     cdef double _last_trade_price_rest_updated
     cdef bint _dex
+    cdef bint _depth_index_enabled
+    # Cumulative depth index, per side and in top of book order. Entries from the dirty price down the book (bids) or
+    # up the book (asks) have changed since the last rebuild.
+    cdef vector[double] _bid_index_prices
+    cdef vector[double] _bid_index_amounts
+    cdef vector[double] _bid_index_cum_base
+    cdef vector[double] _bid_index_cum_quote
+    cdef double _bid_index_dirty_price
+    cdef vector[double] _ask_index_prices
+    cdef vector[double] _ask_index_amounts
+    cdef vector[double] _ask_index_cum_base
+    cdef vector[double] _ask_index_cum_quote
+    cdef double _ask_index_dirty_price
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_trade(self, object trade_event)
     cdef c_apply_numpy_diffs(self,
                              np.ndarray[np.float64_t, ndim=2] bids_array,
-                             np.ndarray[np.float64_t, ndim=2] asks_array)
+                             np.ndarray[np.float64_t, ndim=2] asks_array,
+                             int64_t update_id=*)
     cdef c_apply_numpy_snapshot(self,
                                 np.ndarray[np.float64_t, ndim=2] bids_array,
-                                np.ndarray[np.float64_t, ndim=2] asks_array)
+                                np.ndarray[np.float64_t, ndim=2] asks_array,
+                                int64_t update_id=*)
+    cdef c_invalidate_depth_index(self)
+    cdef c_update_depth_index(self, bint is_buy)
     cdef double c_get_price(self, bint is_buy) except? -1
     cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume)
     cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume)
@@ -19,9 +19,11 @@ from cython.operator cimport(
     address as ref,
     dereference as deref,
     postincrement as inc,
+    predecrement as dec,
 )
+from libc.math cimport INFINITY
 
-from hummingbot.core.data_type.order_book_message import OrderBookMessage
+from hummingbot.core.data_type.order_book_message import NumericOrderBookMessage, OrderBookMessage
 from hummingbot.core.data_type.order_book_query_result import OrderBookQueryResult
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.OrderBookEntry cimport truncateOverlapEntries
@@ -37,6 +39,94 @@ ob_logger = None
 NaN = float("nan")
 
 
+cdef int64_t c_entries_from_numpy(np.ndarray[np.float64_t, ndim=2] entries_array,
+                                  vector[OrderBookEntry] *entries):
+    """
+    Fills the entries vector with the rows ([price, amount, update_id]) of the array, reading the values directly
+    from the array buffer. Returns the largest update id found.
+    """
+    cdef:
+        Py_ssize_t i
+        int64_t entry_update_id
+        int64_t last_update_id = 0
+
+    deref(entries).reserve(entries_array.shape[0])
+    for i in range(entries_array.shape[0]):
+        entry_update_id = <int64_t>entries_array[i, 2]
+        deref(entries).push_back(OrderBookEntry(entries_array[i, 0], entries_array[i, 1], entry_update_id))
+        if entry_update_id > last_update_id:
+            last_update_id = entry_update_id
+    return last_update_id
+
+
+cdef size_t c_first_not_less(vector[double] *values, double value):
+    """
+    Binary search over an ascending vector. Returns the position of the first element >= value, or the vector size.
+    """
+    cdef:
+        size_t low = 0
+        size_t high = deref(values).size()
+        size_t middle
+    while low < high:
+        middle = (low + high) // 2
+        if deref(values)[middle] >= value:
+            high = middle
+        else:
+            low = middle + 1
+    return low
+
+
+cdef size_t c_first_greater(vector[double] *values, double value):
+    """
+    Binary search over an ascending vector. Returns the position of the first element > value, or the vector size.
+    """
+    cdef:
+        size_t low = 0
+        size_t high = deref(values).size()
+        size_t middle
+    while low < high:
+        middle = (low + high) // 2
+        if deref(values)[middle] > value:
+            high = middle
+        else:
+            low = middle + 1
+    return low
+
+
+cdef size_t c_first_not_greater(vector[double] *values, double value):
+    """
+    Binary search over a descending vector. Returns the position of the first element <= value, or the vector size.
+    """
+    cdef:
+        size_t low = 0
+        size_t high = deref(values).size()
+        size_t middle
+    while low < high:
+        middle = (low + high) // 2
+        if deref(values)[middle] <= value:
+            high = middle
+        else:
+            low = middle + 1
+    return low
+
+
+cdef size_t c_first_less(vector[double] *values, double value):
+    """
+    Binary search over a descending vector. Returns the position of the first element < value, or the vector size.
+    """
+    cdef:
+        size_t low = 0
+        size_t high = deref(values).size()
+        size_t middle
+    while low < high:
+        middle = (low + high) // 2
+        if deref(values)[middle] < value:
+            high = middle
+        else:
+            low = middle + 1
+    return low
+
+
 cdef class OrderBook(PubSub):
     ORDER_BOOK_TRADE_EVENT_TAG = OrderBookEvent.TradeEvent.value
 
@@ -56,6 +146,8 @@ cdef class OrderBook(PubSub):
         self._last_applied_trade = -1000.0
         self._last_trade_price_rest_updated = -1000
         self._dex = dex
+        self._depth_index_enabled = True
+        self.c_invalidate_depth_index()
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -66,6 +158,8 @@ cdef class OrderBook(PubSub):
             set[OrderBookEntry].iterator result
             OrderBookEntry top_bid
             OrderBookEntry top_ask
+            size_t bid_book_size
+            size_t ask_book_size
 
         # Apply the diffs. Diffs with 0 amounts mean deletion.
         for bid in bids:
@@ -74,15 +168,26 @@ cdef class OrderBook(PubSub):
                 self._bid_book.erase(result)
             if bid.getAmount() > 0:
                 self._bid_book.insert(bid)
+            if bid.getPrice() > self._bid_index_dirty_price:
+                self._bid_index_dirty_price = bid.getPrice()
         for ask in asks:
             result = self._ask_book.find(ask)
             if result != ask_book_end:
                 self._ask_book.erase(result)
             if ask.getAmount() > 0:
                 self._ask_book.insert(ask)
+            if ask.getPrice() < self._ask_index_dirty_price:
+                self._ask_index_dirty_price = ask.getPrice()
 
         # If any overlapping entries between the bid and ask books, centralised: newer entries win, dex: see OrderBookEntry.cpp
+        bid_book_size = self._bid_book.size()
+        ask_book_size = self._ask_book.size()
         truncateOverlapEntries(self._bid_book, self._ask_book, self._dex)
+        # Truncation removes entries from the top of the book, which shifts every cumulative depth of that side.
+        if self._bid_book.size() != bid_book_size:
+            self._bid_index_dirty_price = INFINITY
+        if self._ask_book.size() != ask_book_size:
+            self._ask_index_dirty_price = -INFINITY
 
         # Record the current best prices, for faster c_get_price() calls.
         bid_iterator = self._bid_book.rbegin()
@@ -109,6 +214,7 @@ cdef class OrderBook(PubSub):
         # Start with an empty order book, and then insert all entries.
         self._bid_book.clear()
         self._ask_book.clear()
+        self.c_invalidate_depth_index()
         for bid in bids:
             self._bid_book.insert(bid)
             if not (bid.getPrice() <= best_bid_price):
@@ -137,6 +243,89 @@ cdef class OrderBook(PubSub):
         # Remember the last snapshot update ID.
         self._snapshot_uid = update_id
 
+    cdef c_invalidate_depth_index(self):
+        self._bid_index_dirty_price = INFINITY
+        self._ask_index_dirty_price = -INFINITY
+
+    cdef c_update_depth_index(self, bint is_buy):
+        """
+        Brings the cumulative depth index of one side of the book up to date. The levels better than the first changed
+        price are kept, and the rest of the index is rebuilt from the book entries.
+        """
+        cdef:
+            vector[double] *prices
+            vector[double] *amounts
+            vector[double] *cum_base
+            vector[double] *cum_quote
+            size_t valid_size
+            double cumulative_base = 0
+            double cumulative_quote = 0
+            set[OrderBookEntry].iterator it
+            OrderBookEntry entry
+
+        if is_buy:
+            if self._ask_index_dirty_price == INFINITY:
+                return
+            prices = ref(self._ask_index_prices)
+            amounts = ref(self._ask_index_amounts)
+            cum_base = ref(self._ask_index_cum_base)
+            cum_quote = ref(self._ask_index_cum_quote)
+            valid_size = c_first_not_less(prices, self._ask_index_dirty_price)
+        else:
+            if self._bid_index_dirty_price == -INFINITY:
+                return
+            prices = ref(self._bid_index_prices)
+            amounts = ref(self._bid_index_amounts)
+            cum_base = ref(self._bid_index_cum_base)
+            cum_quote = ref(self._bid_index_cum_quote)
+            valid_size = c_first_not_greater(prices, self._bid_index_dirty_price)
+
+        deref(prices).resize(valid_size)
+        deref(amounts).resize(valid_size)
+        deref(cum_base).resize(valid_size)
+        deref(cum_quote).resize(valid_size)
+        if valid_size > 0:
+            cumulative_base = deref(cum_base)[valid_size - 1]
+            cumulative_quote = deref(cum_quote)[valid_size - 1]
+
+        if is_buy:
+            it = self._ask_book.lower_bound(OrderBookEntry(self._ask_index_dirty_price, 0, 0))
+            while it != self._ask_book.end():
+                entry = deref(it)
+                cumulative_base += entry.getAmount()
+                cumulative_quote += entry.getAmount() * entry.getPrice()
+                deref(prices).push_back(entry.getPrice())
+                deref(amounts).push_back(entry.getAmount())
+                deref(cum_base).push_back(cumulative_base)
+                deref(cum_quote).push_back(cumulative_quote)
+                inc(it)
+            self._ask_index_dirty_price = INFINITY
+        else:
+            it = self._bid_book.upper_bound(OrderBookEntry(self._bid_index_dirty_price, 0, 0))
+            while it != self._bid_book.begin():
+                dec(it)
+                entry = deref(it)
+                cumulative_base += entry.getAmount()
+                cumulative_quote += entry.getAmount() * entry.getPrice()
+                deref(prices).push_back(entry.getPrice())
+                deref(amounts).push_back(entry.getAmount())
+                deref(cum_base).push_back(cumulative_base)
+                deref(cum_quote).push_back(cumulative_quote)
+            self._bid_index_dirty_price = -INFINITY
+
+    @property
+    def depth_index_enabled(self) -> bool:
+        return self._depth_index_enabled
+
+    @depth_index_enabled.setter
+    def depth_index_enabled(self, value: bool):
+        """
+        When enabled, the volume and price queries use a cumulative depth index (binary search) instead of walking the
+        book entries one by one.
+        """
+        self._depth_index_enabled = value
+        self.c_invalidate_depth_index()
+
     cdef c_apply_trade(self, object trade_event):
         self._last_trade_price = trade_event.price
         self._last_applied_trade = time.perf_counter()
@@ -209,16 +398,18 @@ cdef class OrderBook(PubSub):
         """
         self.apply_numpy_diffs(bids_df.values, asks_df.values)
 
-    def apply_numpy_diffs(self, bids_array: np.ndarray, asks_array: np.ndarray):
+    def apply_numpy_diffs(self, bids_array: np.ndarray, asks_array: np.ndarray, update_id: Optional[int] = None):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
         All columns are of double type.
+        If no update_id is specified, the largest update id in the arrays is used as the diff update id.
         """
-        self.c_apply_numpy_diffs(bids_array, asks_array)
+        self.c_apply_numpy_diffs(bids_array, asks_array, -1 if update_id is None else update_id)
 
     cdef c_apply_numpy_diffs(self,
                              np.ndarray[np.float64_t, ndim=2] bids_array,
-                             np.ndarray[np.float64_t, ndim=2] asks_array):
+                             np.ndarray[np.float64_t, ndim=2] asks_array,
+                             int64_t update_id=-1):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
         All columns are of double type.
@@ -228,24 +419,22 @@ cdef class OrderBook(PubSub):
             vector[OrderBookEntry] cpp_asks
             int64_t last_update_id = 0
 
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        self.c_apply_diffs(cpp_bids, cpp_asks, last_update_id)
+        last_update_id = max(c_entries_from_numpy(bids_array, ref(cpp_bids)),
+                             c_entries_from_numpy(asks_array, ref(cpp_asks)))
+        self.c_apply_diffs(cpp_bids, cpp_asks, last_update_id if update_id < 0 else update_id)
 
-    def apply_numpy_snapshot(self, bids_array: np.ndarray, asks_array: np.ndarray):
+    def apply_numpy_snapshot(self, bids_array: np.ndarray, asks_array: np.ndarray, update_id: Optional[int] = None):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
         All columns are of double type.
+        If no update_id is specified, the largest update id in the arrays is used as the snapshot update id.
         """
-        self.c_apply_numpy_snapshot(bids_array, asks_array)
+        self.c_apply_numpy_snapshot(bids_array, asks_array, -1 if update_id is None else update_id)
 
     cdef c_apply_numpy_snapshot(self,
                                 np.ndarray[np.float64_t, ndim=2] bids_array,
-                                np.ndarray[np.float64_t, ndim=2] asks_array):
+                                np.ndarray[np.float64_t, ndim=2] asks_array,
+                                int64_t update_id=-1):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
         All columns are of double type.
@@ -255,13 +444,29 @@ cdef class OrderBook(PubSub):
             vector[OrderBookEntry] cpp_asks
             int64_t last_update_id = 0
 
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        self.c_apply_snapshot(cpp_bids, cpp_asks, last_update_id)
+        last_update_id = max(c_entries_from_numpy(bids_array, ref(cpp_bids)),
+                             c_entries_from_numpy(asks_array, ref(cpp_asks)))
+        self.c_apply_snapshot(cpp_bids, cpp_asks, last_update_id if update_id < 0 else update_id)
+
+    def apply_diff_message(self, diff: OrderBookMessage):
+        """
+        Applies the changes of a diff message. Numeric messages are applied from their parsed arrays, without creating
+        the OrderBookRow instances.
+        """
+        if isinstance(diff, NumericOrderBookMessage):
+            self.c_apply_numpy_diffs(diff.bids_array, diff.asks_array, diff.update_id)
+        else:
+            self.apply_diffs(diff.bids, diff.asks, diff.update_id)
+
+    def apply_snapshot_message(self, snapshot: OrderBookMessage):
+        """
+        Applies the content of a snapshot message. Numeric messages are applied from their parsed arrays, without
+        creating the OrderBookRow instances.
+        """
+        if isinstance(snapshot, NumericOrderBookMessage):
+            self.c_apply_numpy_snapshot(snapshot.bids_array, snapshot.asks_array, snapshot.update_id)
+        else:
+            self.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
 
     def bid_entries(self) -> Iterator[OrderBookRow]:
         cdef:
@@ -323,8 +528,21 @@ cdef class OrderBook(PubSub):
         cdef:
             double cumulative_volume = 0
             double result_price = NaN
-
-        if is_buy:
+            vector[double] *prices
+            vector[double] *cum_base
+            size_t index
+
+        if self._depth_index_enabled:
+            self.c_update_depth_index(is_buy)
+            prices = ref(self._ask_index_prices) if is_buy else ref(self._bid_index_prices)
+            cum_base = ref(self._ask_index_cum_base) if is_buy else ref(self._bid_index_cum_base)
+            index = c_first_not_less(cum_base, volume)
+            if index < deref(cum_base).size():
+                cumulative_volume = deref(cum_base)[index]
+                result_price = deref(prices)[index]
+            elif index > 0:
+                cumulative_volume = deref(cum_base)[index - 1]
+        elif is_buy:
             for order_book_row in self.ask_entries():
                 cumulative_volume += order_book_row.amount
                 if cumulative_volume >= volume:
@@ -344,7 +562,32 @@ cdef class OrderBook(PubSub):
             double total_cost = 0
             double total_volume = 0
             double result_vwap = NaN
-        if is_buy:
+            double row_price
+            double row_amount
+            vector[double] *prices
+            vector[double] *amounts
+            vector[double] *cum_base
+            vector[double] *cum_quote
+            size_t index
+        if self._depth_index_enabled:
+            self.c_update_depth_index(is_buy)
+            prices = ref(self._ask_index_prices) if is_buy else ref(self._bid_index_prices)
+            amounts = ref(self._ask_index_amounts) if is_buy else ref(self._bid_index_amounts)
+            cum_base = ref(self._ask_index_cum_base) if is_buy else ref(self._bid_index_cum_base)
+            cum_quote = ref(self._ask_index_cum_quote) if is_buy else ref(self._bid_index_cum_quote)
+            index = c_first_not_less(cum_base, volume)
+            if index < deref(cum_base).size():
+                row_price = deref(prices)[index]
+                row_amount = deref(amounts)[index]
+                total_cost = deref(cum_quote)[index] - row_amount * row_price
+                total_volume = deref(cum_base)[index] - row_amount
+                incremental_amount = volume - total_volume
+                total_cost += incremental_amount * row_price
+                total_volume += incremental_amount
+                result_vwap = total_cost / total_volume
+            elif index > 0:
+                total_volume = deref(cum_base)[index - 1]
+        elif is_buy:
             for order_book_row in self.ask_entries():
                 total_cost += order_book_row.amount * order_book_row.price
                 total_volume += order_book_row.amount
@@ -375,8 +618,21 @@ cdef class OrderBook(PubSub):
         cdef:
             double cumulative_volume = 0
             double result_price = NaN
-
-        if is_buy:
+            vector[double] *prices
+            vector[double] *cum_quote
+            size_t index
+
+        if self._depth_index_enabled:
+            self.c_update_depth_index(is_buy)
+            prices = ref(self._ask_index_prices) if is_buy else ref(self._bid_index_prices)
+            cum_quote = ref(self._ask_index_cum_quote) if is_buy else ref(self._bid_index_cum_quote)
+            index = c_first_not_less(cum_quote, quote_volume)
+            if index < deref(cum_quote).size():
+                cumulative_volume = deref(cum_quote)[index]
+                result_price = deref(prices)[index]
+            elif index > 0:
+                cumulative_volume = deref(cum_quote)[index - 1]
+        elif is_buy:
             for order_book_row in self.ask_entries():
                 cumulative_volume += order_book_row.amount * order_book_row.price
                 if cumulative_volume >= quote_volume:
@@ -396,8 +652,33 @@ cdef class OrderBook(PubSub):
             double cumulative_volume = 0
             double cumulative_base_amount = 0
             double row_amount = 0
-
-        if is_buy:
+            vector[double] *prices
+            vector[double] *amounts
+            vector[double] *cum_base
+            vector[double] *cum_quote
+            size_t index
+
+        if self._depth_index_enabled:
+            self.c_update_depth_index(is_buy)
+            prices = ref(self._ask_index_prices) if is_buy else ref(self._bid_index_prices)
+            amounts = ref(self._ask_index_amounts) if is_buy else ref(self._bid_index_amounts)
+            cum_base = ref(self._ask_index_cum_base) if is_buy else ref(self._bid_index_cum_base)
+            cum_quote = ref(self._ask_index_cum_quote) if is_buy else ref(self._bid_index_cum_quote)
+            # All the levels before the index are taken in full, the remaining amount is taken from the next ones.
+            index = c_first_not_less(cum_base, base_amount)
+            if index > 0:
+                cumulative_base_amount = deref(cum_base)[index - 1]
+                cumulative_volume = deref(cum_quote)[index - 1]
+            while index < deref(amounts).size():
+                row_amount = deref(amounts)[index]
+                if row_amount + cumulative_base_amount >= base_amount:
+                    row_amount = base_amount - cumulative_base_amount
+                cumulative_base_amount += row_amount
+                cumulative_volume += row_amount * deref(prices)[index]
+                if cumulative_base_amount >= base_amount:
+                    break
+                index += 1
+        elif is_buy:
             for order_book_row in self.ask_entries():
                 row_amount = order_book_row.amount
                 if row_amount + cumulative_base_amount >= base_amount:
@@ -422,8 +703,19 @@ cdef class OrderBook(PubSub):
         cdef:
             double cumulative_volume = 0
             double result_price = NaN
-
-        if is_buy:
+            vector[double] *prices
+            vector[double] *cum_base
+            size_t levels
+
+        if self._depth_index_enabled:
+            self.c_update_depth_index(is_buy)
+            prices = ref(self._ask_index_prices) if is_buy else ref(self._bid_index_prices)
+            cum_base = ref(self._ask_index_cum_base) if is_buy else ref(self._bid_index_cum_base)
+            levels = c_first_greater(prices, price) if is_buy else c_first_less(prices, price)
+            if levels > 0:
+                cumulative_volume = deref(cum_base)[levels - 1]
+                result_price = deref(prices)[levels - 1]
+        elif is_buy:
             for order_book_row in self.ask_entries():
                 if order_book_row.price > price:
                     break
@@ -442,8 +734,19 @@ cdef class OrderBook(PubSub):
         cdef:
             double cumulative_volume = 0
             double result_price = NaN
-
-        if is_buy:
+            vector[double] *prices
+            vector[double] *cum_quote
+            size_t levels
+
+        if self._depth_index_enabled:
+            self.c_update_depth_index(is_buy)
+            prices = ref(self._ask_index_prices) if is_buy else ref(self._bid_index_prices)
+            cum_quote = ref(self._ask_index_cum_quote) if is_buy else ref(self._bid_index_cum_quote)
+            levels = c_first_greater(prices, price) if is_buy else c_first_less(prices, price)
+            if levels > 0:
+                cumulative_volume = deref(cum_quote)[levels - 1]
+                result_price = deref(prices)[levels - 1]
+        elif is_buy:
             for order_book_row in self.ask_entries():
                 if order_book_row.price > price:
                     break
@@ -487,6 +790,6 @@ cdef class OrderBook(PubSub):
     def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: List[OrderBookMessage]):
         replay_position = bisect.bisect_right(diffs, snapshot)
         replay_diffs = diffs[replay_position:]
-        self.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
+        self.apply_snapshot_message(snapshot)
         for diff in replay_diffs:
-            self.apply_diffs(diff.bids, diff.asks, diff.update_id)
+            self.apply_diff_message(diff)
@@ -1,7 +1,9 @@
 from collections import namedtuple
 from enum import Enum
-from functools import total_ordering
-from typing import Dict, List, Optional
+from functools import cached_property, total_ordering
+from typing import Any, Dict, List, Optional
+
+import numpy as np
 
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
@@ -68,6 +70,14 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
     def has_update_id(self) -> bool:
         return self.type in {OrderBookMessageType.DIFF, OrderBookMessageType.SNAPSHOT}
 
+    @property
+    def has_first_update_id(self) -> bool:
+        """
+        Indicates if the diff message carries the id of the first update it contains. Only in that case the sequence
+        of diff messages can be checked for gaps.
+        """
+        return self.type is OrderBookMessageType.DIFF and "first_update_id" in self.content
+
     @property
     def has_trade_id(self) -> bool:
         return self.type == OrderBookMessageType.TRADE
@@ -95,3 +105,37 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
             )
         )
         return eq
+
+
+class NumericOrderBookMessage(OrderBookMessage):
+    """
+    Order book message that parses the price and amount of the bids and asks only once, into contiguous float64 arrays
+    with the columns [price, amount, update_id].
+    The arrays are applied to the order book directly (see OrderBook.apply_diff_message), without creating a Python
+    object for each entry. The parsed arrays are kept with the message, so replaying it again is also cheap.
+    """
+
+    @cached_property
+    def bids_array(self) -> np.ndarray:
+        return self._entries_array(self.content["bids"])
+
+    @cached_property
+    def asks_array(self) -> np.ndarray:
+        return self._entries_array(self.content["asks"])
+
+    @property
+    def asks(self) -> List[OrderBookRow]:
+        update_id = self.update_id
+        return [OrderBookRow(price, amount, update_id) for price, amount, _ in self.asks_array.tolist()]
+
+    @property
+    def bids(self) -> List[OrderBookRow]:
+        update_id = self.update_id
+        return [OrderBookRow(price, amount, update_id) for price, amount, _ in self.bids_array.tolist()]
+
+    def _entries_array(self, entries: List[List[Any]]) -> np.ndarray:
+        entries_array = np.empty((len(entries), 3), dtype=np.float64)
+        if len(entries) > 0:
+            entries_array[:, 0:2] = np.array(entries, dtype=np.float64)[:, 0:2]
+        entries_array[:, 2] = self.update_id
+        return entries_array
@@ -12,7 +12,7 @@ from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.event.events import OrderBookTradeEvent
-from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.logger import HummingbotLogger
 
 
@@ -23,6 +23,9 @@ class OrderBookTrackerDataSourceType(Enum):
 
 class OrderBookTracker:
     PAST_DIFF_WINDOW_SIZE: int = 32
+    DEFAULT_MAX_CONCURRENT_INITS: int = 5
+    MAX_RESYNC_ATTEMPTS: int = 5
+    RESYNC_RETRY_DELAY: float = 1.0
     _obt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -31,11 +34,27 @@ class OrderBookTracker:
             cls._obt_logger = logging.getLogger(__name__)
         return cls._obt_logger
 
-    def __init__(self, data_source: OrderBookTrackerDataSource, trading_pairs: List[str], domain: Optional[str] = None):
+    def __init__(self,
+                 data_source: OrderBookTrackerDataSource,
+                 trading_pairs: List[str],
+                 domain: Optional[str] = None,
+                 concurrent_init: bool = False,
+                 max_concurrent_inits: int = DEFAULT_MAX_CONCURRENT_INITS):
+        """
+        :param data_source: the data source providing the order book snapshots and real time updates
+        :param trading_pairs: the trading pairs to track
+        :param domain: the domain of the exchange (if any)
+        :param concurrent_init: if True the initial snapshots are requested in parallel instead of one at a time.
+            The requests are still subject to the rate limits of the throttler used by the data source.
+        :param max_concurrent_inits: maximum number of snapshot requests in flight when using concurrent init
+        """
         self._domain: Optional[str] = domain
         self._data_source: OrderBookTrackerDataSource = data_source
         self._trading_pairs: List[str] = trading_pairs
+        self._concurrent_init: bool = concurrent_init
+        self._max_concurrent_inits: int = max(1, max_concurrent_inits)
         self._order_books_initialized: asyncio.Event = asyncio.Event()
+        self._order_book_initialized_events: Dict[str, asyncio.Event] = defaultdict(asyncio.Event)
         self._tracking_tasks: Dict[str, asyncio.Task] = {}
         self._order_books: Dict[str, OrderBook] = {}
         self._tracking_message_queues: Dict[str, asyncio.Queue] = {}
@@ -45,6 +64,8 @@ class OrderBookTracker:
         self._order_book_trade_stream: asyncio.Queue = asyncio.Queue()
         self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
         self._saved_message_queues: Dict[str, Deque[OrderBookMessage]] = defaultdict(lambda: deque(maxlen=1000))
+        self._sequence_gaps_count: Dict[str, int] = defaultdict(int)
+        self._resyncs_count: Dict[str, int] = defaultdict(int)
 
         self._emit_trade_event_task: Optional[asyncio.Task] = None
         self._init_order_books_task: Optional[asyncio.Task] = None
@@ -68,6 +89,24 @@ class OrderBookTracker:
     def ready(self) -> bool:
         return self._order_books_initialized.is_set()
 
+    @property
+    def ready_trading_pairs(self) -> List[str]:
+        return [trading_pair for trading_pair in self._trading_pairs if self.is_order_book_ready(trading_pair)]
+
+    @property
+    def sequence_gaps_count(self) -> Dict[str, int]:
+        """
+        Number of gaps detected in the diff messages update ids chain, per trading pair
+        """
+        return dict(self._sequence_gaps_count)
+
+    @property
+    def resyncs_count(self) -> Dict[str, int]:
+        """
+        Number of successful order book resynchronizations triggered by a sequence gap, per trading pair
+        """
+        return dict(self._resyncs_count)
+
     @property
     def snapshot(self) -> Dict[str, Tuple[pd.DataFrame, pd.DataFrame]]:
         return {
@@ -138,10 +177,25 @@ class OrderBookTracker:
                 task.cancel()
             self._tracking_tasks.clear()
         self._order_books_initialized.clear()
+        for event in self._order_book_initialized_events.values():
+            event.clear()
 
     async def wait_ready(self):
         await self._order_books_initialized.wait()
 
+    def is_order_book_ready(self, trading_pair: str) -> bool:
+        """
+        Checks if the order book for a single trading pair has been initialized, even if the tracker is still
+        initializing the order books for other trading pairs.
+
+        :param trading_pair: the trading pair to check
+        """
+        return trading_pair in self._order_book_initialized_events and self._order_book_initialized_events[
+            trading_pair].is_set()
+
+    async def wait_order_book_ready(self, trading_pair: str):
+        await self._order_book_initialized_events[trading_pair].wait()
+
     async def _update_last_trade_prices_loop(self):
         '''
         Updates last trade price for all order books through REST API, it is to initiate last_trade_price and as
@@ -176,15 +230,40 @@ class OrderBookTracker:
         """
         Initialize order books
         """
-        for index, trading_pair in enumerate(self._trading_pairs):
-            self._order_books[trading_pair] = await self._initial_order_book_for_trading_pair(trading_pair)
-            self._tracking_message_queues[trading_pair] = asyncio.Queue()
-            self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
-            self.logger().info(f"Initialized order book for {trading_pair}. "
-                               f"{index + 1}/{len(self._trading_pairs)} completed.")
-            await self._sleep(delay=1)
+        if self._concurrent_init:
+            await self._init_order_books_concurrently()
+        else:
+            for index, trading_pair in enumerate(self._trading_pairs):
+                await self._init_order_book(trading_pair=trading_pair)
+                self.logger().info(f"Initialized order book for {trading_pair}. "
+                                   f"{index + 1}/{len(self._trading_pairs)} completed.")
+                await self._sleep(delay=1)
         self._order_books_initialized.set()
 
+    async def _init_order_books_concurrently(self):
+        """
+        Initialize the order books requesting the snapshots in parallel. The number of requests in flight is capped
+        by max_concurrent_inits, and the data source requests still go through the connector throttler.
+        """
+        semaphore = asyncio.Semaphore(self._max_concurrent_inits)
+        initialized_count = 0
+
+        async def init_with_semaphore(trading_pair: str):
+            nonlocal initialized_count
+            async with semaphore:
+                await self._init_order_book(trading_pair=trading_pair)
+            initialized_count += 1
+            self.logger().info(f"Initialized order book for {trading_pair}. "
+                               f"{initialized_count}/{len(self._trading_pairs)} completed.")
+
+        await safe_gather(*[init_with_semaphore(trading_pair) for trading_pair in self._trading_pairs])
+
+    async def _init_order_book(self, trading_pair: str):
+        self._order_books[trading_pair] = await self._initial_order_book_for_trading_pair(trading_pair)
+        self._tracking_message_queues[trading_pair] = asyncio.Queue()
+        self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
+        self._order_book_initialized_events[trading_pair].set()
+
     async def _order_book_diff_router(self):
         """
         Routes the real-time order book diff messages to the correct order book.
@@ -272,7 +351,20 @@ class OrderBookTracker:
                     message = await message_queue.get()
 
                 if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
+                    if message.has_first_update_id:
+                        last_update_id = max(order_book.snapshot_uid, order_book.last_diff_uid)
+                        if message.update_id <= last_update_id:
+                            # The changes are already included in the order book
+                            continue
+                        if message.first_update_id > last_update_id + 1:
+                            self._sequence_gaps_count[trading_pair] += 1
+                            self.logger().warning(
+                                f"Order book diff sequence gap detected for {trading_pair} (expected update id "
+                                f"{last_update_id + 1}, received {message.first_update_id}). Resynchronizing.")
+                            past_diffs_window.append(message)
+                            await self._resync_order_book(trading_pair=trading_pair)
+                            continue
+                    order_book.apply_diff_message(message)
                     past_diffs_window.append(message)
                     diff_messages_accepted += 1
 
@@ -295,6 +387,44 @@ class OrderBookTracker:
                 )
                 await asyncio.sleep(5.0)
 
+    async def _resync_order_book(self, trading_pair: str):
+        """
+        Requests a new snapshot for the order book and replays the buffered diffs on top of it. The diffs received
+        while the snapshot is requested stay in the tracking queue and are applied afterwards.
+        If the buffered diffs do not connect with the snapshot, a new snapshot is requested.
+        """
+        order_book: OrderBook = self._order_books[trading_pair]
+        past_diffs_window: Deque[OrderBookMessage] = self._past_diffs_windows[trading_pair]
+
+        for attempt in range(self.MAX_RESYNC_ATTEMPTS):
+            snapshot: OrderBookMessage = await self._data_source.get_order_book_snapshot(trading_pair=trading_pair)
+            past_diffs: List[OrderBookMessage] = sorted(
+                [diff for diff in past_diffs_window if diff.update_id > snapshot.update_id],
+                key=lambda diff: diff.update_id)
+            if self._diffs_connect_with_snapshot(snapshot=snapshot, diffs=past_diffs):
+                order_book.restore_from_snapshot_and_diffs(snapshot, past_diffs)
+                self._resyncs_count[trading_pair] += 1
+                self.logger().info(f"Order book for {trading_pair} resynchronized with snapshot {snapshot.update_id}.")
+                return
+            await self._sleep(delay=self.RESYNC_RETRY_DELAY)
+
+        self.logger().network(
+            f"Could not resynchronize the order book for {trading_pair} after {self.MAX_RESYNC_ATTEMPTS} attempts.",
+            app_warning_msg=f"The order book for {trading_pair} might be out of sync with the exchange.")
+
+    @staticmethod
+    def _diffs_connect_with_snapshot(snapshot: OrderBookMessage, diffs: List[OrderBookMessage]) -> bool:
+        """
+        Checks that the diffs (sorted and more recent than the snapshot) form an uninterrupted chain of update ids
+        starting right after the snapshot.
+        """
+        expected_update_id = snapshot.update_id + 1
+        for diff in diffs:
+            if diff.has_first_update_id and diff.first_update_id > expected_update_id:
+                return False
+            expected_update_id = diff.update_id + 1
+        return True
+
     async def _emit_trade_event_loop(self):
         last_message_timestamp: float = time.time()
         messages_accepted: int = 0
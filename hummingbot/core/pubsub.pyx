@@ -1,20 +1,9 @@
 # distutils: language=c++
-# distutils: sources=hummingbot/core/cpp/PyRef.cpp
-
-from cpython cimport(
-    PyObject,
-    PyWeakref_NewRef,
-    PyWeakref_GetObject
-)
-from cython.operator cimport(
-    postincrement as inc,
-    dereference as deref,
-    address
-)
-from libcpp.vector cimport vector
+
+from cpython cimport PyWeakref_GetObject
 from enum import Enum
 import logging
-import random
+import weakref
 from typing import List
 
 from hummingbot.logger import HummingbotLogger
@@ -24,26 +13,53 @@ from hummingbot.core.event.event_listener cimport EventListener
 class_logger = None
 
 
-cdef class PubSub:
+cdef class EventListeners:
+    """
+    The listeners of an event, as weak references in the order they were added (the dict values are not used).
+
+    The events are dispatched iterating the dict directly. When the listeners of an event are changed while the event
+    is being dispatched (listeners are allowed to add or remove listeners), the PubSub changes a copy instead, so the
+    dispatch in progress is not affected. See PubSub.c_mutable_listeners().
     """
-    PubSub with weak references. This avoids the lapsed listener problem by periodically performing GC on dead
-    event listener.
 
-    Dead listener is done by calling c_remove_dead_listeners(), which checks whether the listener weak references are
-    alive or not, and removes the dead ones. Each call to c_remove_dead_listeners() takes O(n).
+    def __init__(self, dict listener_refs=None):
+        self._listener_refs = {} if listener_refs is None else listener_refs
+        self._dispatch_depth = 0
 
-    Here's how the dead listener GC is performed:
+    cdef EventListeners c_copy(self):
+        return EventListeners(self._listener_refs.copy())
 
-    1. c_add_listener():
-       Randomly with ADD_LISTENER_GC_PROBABILITY. This assumes c_add_listener() is called frequently and so it doesn't
-       make sense to do the GC every time.
-    2. c_remove_listener():
-       Every time. This assumes c_remove_listener() is called infrequently.
-    3. c_get_listeners() and c_trigger_event():
-       Every time. Both functions take O(n) already.
+
+cdef class DeadListenerCallback:
+    """
+    Weak reference callback that reports to the PubSub that a listener of an event has been garbage collected.
+    It only keeps a weak reference to the PubSub, which owns the listener weak references holding the callback.
     """
+    cdef:
+        object _pubsub_ref
+        int64_t _event_tag
+
+    def __init__(self, PubSub pubsub, int64_t event_tag):
+        self._pubsub_ref = weakref.ref(pubsub)
+        self._event_tag = event_tag
+
+    def __call__(self, listener_ref: weakref.ref):
+        cdef PubSub pubsub = self._pubsub_ref()
+        if pubsub is not None:
+            pubsub._dead_listener_tags.add(self._event_tag)
+
+
+cdef class PubSub:
+    """
+    PubSub with weak references. This avoids the lapsed listener problem by removing the dead event listeners.
+
+    The weak reference of each listener has a callback that reports the event of the listener when it's garbage
+    collected. The dead listeners of the reported events are removed on the next call to c_trigger_event() or
+    c_get_listeners(), so the O(n) scan of the listeners only happens after a listener has died, instead of on every
+    event. c_remove_listener() also removes the dead listeners of the event.
 
-    ADD_LISTENER_GC_PROBABILITY = 0.005
+    Triggering an event without listeners is a single dict lookup.
+    """
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -52,8 +68,11 @@ cdef class PubSub:
             class_logger = logging.getLogger(__name__)
         return class_logger
 
-    def __init__(self):
-        self._events = Events()
+    def __cinit__(self):
+        # Initialized before __init__(), subclasses can add listeners before calling super().__init__()
+        self._events = {}
+        self._dead_listener_callbacks = {}
+        self._dead_listener_tags = set()
 
     def add_listener(self, event_tag: Enum, listener: EventListener):
         self.c_add_listener(event_tag.value, listener)
@@ -65,105 +84,115 @@ cdef class PubSub:
         return self.c_get_listeners(event_tag.value)
 
     def trigger_event(self, event_tag: Enum, message: any):
-        self.c_trigger_event(event_tag.value, message)
+        # _value_ is the attribute behind the Enum.value property, without the cost of the property lookup
+        self.c_trigger_event(event_tag._value_, message)
 
     cdef c_log_exception(self, int64_t event_tag, object arg):
         self.logger().error(f"Unexpected error while processing event {event_tag}.", exc_info=True)
 
     cdef c_add_listener(self, int64_t event_tag, EventListener listener):
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection new_listeners
-            EventListenersCollection *listeners_ptr
-            object listener_weakref = PyWeakref_NewRef(listener, None)
-            PyRef listener_wrapper = PyRef(<PyObject *>listener_weakref)
-        if it != self._events.end():
-            listeners_ptr = address(deref(it).second)
-            deref(listeners_ptr).insert(listener_wrapper)
-        else:
-            new_listeners.insert(listener_wrapper)
-            self._events.insert(EventsPair(event_tag, new_listeners))
-
-        if random.random() < PubSub.ADD_LISTENER_GC_PROBABILITY:
-            self.c_remove_dead_listeners(event_tag)
+            EventListeners listeners = self._events.get(event_tag)
+            object callback = self._dead_listener_callbacks.get(event_tag)
+        if callback is None:
+            callback = self._dead_listener_callbacks[event_tag] = DeadListenerCallback(self, event_tag)
+        listener_ref = weakref.ref(listener, callback)
+        if listeners is not None and listener_ref in listeners._listener_refs:
+            return
+        listeners = self.c_mutable_listeners(event_tag)
+        listeners._listener_refs[listener_ref] = None
 
     cdef c_remove_listener(self, int64_t event_tag, EventListener listener):
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection *listeners_ptr
-            object listener_weakref = PyWeakref_NewRef(listener, None)
-            PyRef listener_wrapper = PyRef(<PyObject *>listener_weakref)
-            EventListenersIterator lit
-        if it == self._events.end():
+            EventListeners listeners = self._events.get(event_tag)
+        if listeners is None:
             return
-        listeners_ptr = address(deref(it).second)
-        lit = deref(listeners_ptr).find(listener_wrapper)
-        if lit != deref(listeners_ptr).end():
-            deref(listeners_ptr).erase(lit)
+        # Weak references compare equal when their referents are alive and equal
+        listener_ref = weakref.ref(listener)
+        if listener_ref in listeners._listener_refs:
+            listeners = self.c_mutable_listeners(event_tag)
+            del listeners._listener_refs[listener_ref]
+            if len(listeners._listener_refs) == 0:
+                del self._events[event_tag]
         self.c_remove_dead_listeners(event_tag)
 
     cdef c_remove_dead_listeners(self, int64_t event_tag):
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection *listeners_ptr
-            object listener_weakref
-            EventListenersIterator lit
-            vector[EventListenersIterator] lit_to_remove
-        if it == self._events.end():
+            EventListeners listeners = self._events.get(event_tag)
+            list dead_listener_refs
+        if listeners is None:
+            return
+        dead_listener_refs = [listener_ref for listener_ref in listeners._listener_refs
+                              if <object>PyWeakref_GetObject(listener_ref) is None]
+        if len(dead_listener_refs) == 0:
             return
-        listeners_ptr = address(deref(it).second)
-        lit = deref(listeners_ptr).begin()
-        while lit != deref(listeners_ptr).end():
-            listener_weakref = <object>(deref(lit).get())
-            if <object>(PyWeakref_GetObject(listener_weakref)) is None:
-                lit_to_remove.push_back(lit)
-            inc(lit)
-        for lit in lit_to_remove:
-            deref(listeners_ptr).erase(lit)
-        if deref(listeners_ptr).size() < 1:
-            self._events.erase(it)
+        listeners = self.c_mutable_listeners(event_tag)
+        for listener_ref in dead_listener_refs:
+            del listeners._listener_refs[listener_ref]
+        if len(listeners._listener_refs) == 0:
+            del self._events[event_tag]
+
+    cdef c_remove_reported_dead_listeners(self):
+        cdef set event_tags = self._dead_listener_tags
+        self._dead_listener_tags = set()
+        for event_tag in event_tags:
+            self.c_remove_dead_listeners(event_tag)
 
-    cdef c_get_listeners(self, int64_t event_tag):
-        self.c_remove_dead_listeners(event_tag)
+    cdef EventListeners c_mutable_listeners(self, int64_t event_tag):
+        """
+        Returns the listeners of the event to be changed, which are a copy if the event is being dispatched.
+        """
+        cdef EventListeners listeners = self._events.get(event_tag)
+        if listeners is None:
+            listeners = EventListeners()
+            self._events[event_tag] = listeners
+        elif listeners._dispatch_depth > 0:
+            listeners = listeners.c_copy()
+            self._events[event_tag] = listeners
+        return listeners
 
+    cdef c_get_listeners(self, int64_t event_tag):
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection *listeners_ptr
-            object listener_weafref
-            EventListener typed_listener
-
-        if it == self._events.end():
-            return []
-
-        retval = []
-        listeners_ptr = address(deref(it).second)
-        for pyref in deref(listeners_ptr):
-            listener_weafref = <object>pyref.get()
-            typed_listener = <object>PyWeakref_GetObject(listener_weafref)
-            retval.append(typed_listener)
+            EventListeners listeners
+            list retval = []
+        if len(self._dead_listener_tags) > 0:
+            self.c_remove_reported_dead_listeners()
+        listeners = self._events.get(event_tag)
+        if listeners is None:
+            return retval
+        for listener_ref in listeners._listener_refs:
+            listener = <object>PyWeakref_GetObject(listener_ref)
+            if listener is not None:
+                retval.append(listener)
         return retval
 
     cdef c_trigger_event(self, int64_t event_tag, object arg):
-        self.c_remove_dead_listeners(event_tag)
-
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection listeners
-            object listener_weafref
+            EventListeners listeners
+            dict listener_refs
             EventListener typed_listener
-        if it == self._events.end():
+        if len(self._dead_listener_tags) > 0:
+            self.c_remove_reported_dead_listeners()
+        listeners = self._events.get(event_tag)
+        if listeners is None:
             return
 
-        # It is extremely important that this set of listeners is a C++ copy - because listeners are allowed to call
-        # c_remove_listener(), which breaks the iterator if we're using the underlying set.
-        listeners = deref(it).second
-        for pyref in listeners:
-            listener_weafref = <object>pyref.get()
-            typed_listener = <object>PyWeakref_GetObject(listener_weafref)
-            try:
-                typed_listener.c_set_event_info(event_tag, self)
-                typed_listener.c_call(arg)
-            except Exception:
-                self.c_log_exception(event_tag, arg)
-            finally:
-                typed_listener.c_set_event_info(0, None)
+        # Listeners are allowed to call c_add_listener() and c_remove_listener(). While the event is being dispatched
+        # those change a copy of the listeners, not the dict being iterated here.
+        listener_refs = listeners._listener_refs
+        listeners._dispatch_depth += 1
+        try:
+            for listener_ref in listener_refs:
+                listener = <object>PyWeakref_GetObject(listener_ref)
+                if listener is None:
+                    continue
+                typed_listener = listener
+                try:
+                    typed_listener.c_set_event_info(event_tag, self)
+                    typed_listener.c_call(arg)
+                except Exception:
+                    self.c_log_exception(event_tag, arg)
+                finally:
+                    typed_listener.c_set_event_info(0, None)
+        finally:
+            listeners._dispatch_depth -= 1
@@ -1,7 +1,7 @@
 import asyncio
 import logging
 from decimal import Decimal
-from typing import Dict, Optional
+from typing import Dict, Iterable, Optional, Tuple
 
 import hummingbot.client.settings  # noqa
 from hummingbot.connector.utils import combine_to_hb_trading_pair
@@ -13,7 +13,7 @@ from hummingbot.core.rate_oracle.sources.coin_gecko_rate_source import CoinGecko
 from hummingbot.core.rate_oracle.sources.gate_io_rate_source import GateIoRateSource
 from hummingbot.core.rate_oracle.sources.kucoin_rate_source import KucoinRateSource
 from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
-from hummingbot.core.rate_oracle.utils import find_rate
+from hummingbot.core.rate_oracle.utils import DEFAULT_BRIDGE_TOKENS, ConversionRateIndex
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.logger import HummingbotLogger
 
@@ -30,7 +30,8 @@ class RateOracle(NetworkBase):
     """
     RateOracle provides conversion rates for any given pair token symbols in both async and sync fashions.
     It achieves this by query URL on a given source for prices and store them, either in cache or as an object member.
-    The find_rate is then used on these prices to find a rate on a given pair.
+    Rates are found from the stored or the fetched prices with a conversion index, which for the stored prices is
+    rebuilt only when they are refreshed.
     """
     _logger: Optional[HummingbotLogger] = None
     _shared_instance: "RateOracle" = None
@@ -47,10 +48,15 @@ class RateOracle(NetworkBase):
             cls._logger = logging.getLogger(__name__)
         return cls._logger
 
-    def __init__(self, source: Optional[RateSourceBase] = None, quote_token: Optional[str] = None):
+    def __init__(self,
+                 source: Optional[RateSourceBase] = None,
+                 quote_token: Optional[str] = None,
+                 bridge_tokens: Iterable[str] = DEFAULT_BRIDGE_TOKENS):
         super().__init__()
         self._source: RateSourceBase = source if source is not None else BinanceRateSource()
         self._prices: Dict[str, Decimal] = {}
+        self._bridge_tokens: Tuple[str, ...] = tuple(bridge_tokens)
+        self._conversion_index: Optional[ConversionRateIndex] = None
         self._fetch_price_task: Optional[asyncio.Task] = None
         self._ready_event = asyncio.Event()
         self._quote_token = quote_token if quote_token is not None else "USD"
@@ -81,6 +87,9 @@ class RateOracle(NetworkBase):
 
     @source.setter
     def source(self, new_source: RateSourceBase):
+        if self._fetch_price_task is not None:
+            safe_ensure_future(self._source.stop_network())
+            safe_ensure_future(new_source.start_network())
         self._source = new_source
 
     @property
@@ -93,6 +102,18 @@ class RateOracle(NetworkBase):
             self._quote_token = new_token
             self._prices = {}
 
+    @property
+    def bridge_tokens(self) -> Tuple[str, ...]:
+        """
+        Tokens used, in order of preference, to find rates that need more than one intermediate asset
+        """
+        return self._bridge_tokens
+
+    @bridge_tokens.setter
+    def bridge_tokens(self, new_tokens: Iterable[str]):
+        self._bridge_tokens = tuple(new_tokens)
+        self._conversion_index = None
+
     @property
     def prices(self) -> Dict[str, Decimal]:
         """
@@ -102,12 +123,14 @@ class RateOracle(NetworkBase):
 
     async def start_network(self):
         await self.stop_network()
+        await self._source.start_network()
         self._fetch_price_task = safe_ensure_future(self._fetch_price_loop())
 
     async def stop_network(self):
         if self._fetch_price_task is not None:
             self._fetch_price_task.cancel()
             self._fetch_price_task = None
+            await self._source.stop_network()
         # Reset stored prices so that they are not used if they are not being updated
         self._prices = {}
 
@@ -141,9 +164,8 @@ class RateOracle(NetworkBase):
         :param base_token: The token symbol that we want to price, e.g. BTC
         :return A conversion rate
         """
-        prices = await self._source.get_prices(quote_token=self._quote_token)
         pair = combine_to_hb_trading_pair(base=base_token, quote=self._quote_token)
-        return find_rate(prices, pair)
+        return await self.rate_async(pair)
 
     def get_pair_rate(self, pair: str) -> Decimal:
         """
@@ -153,7 +175,7 @@ class RateOracle(NetworkBase):
         :param pair: A trading pair, e.g. BTC-USDT
         :return A conversion rate
         """
-        return find_rate(self._prices, pair)
+        return self._get_conversion_index().find_rate(pair)
 
     async def stored_or_live_rate(self, pair: str) -> Decimal:
         """
@@ -174,12 +196,25 @@ class RateOracle(NetworkBase):
     async def rate_async(self, pair: str) -> Decimal:
         """
         Finds a conversion rate in an async operation, it is a class method which can be used directly without having to
-        start the RateOracle network.
+        start the RateOracle network. If the network is started the stored prices are used instead of fetching them.
         :param pair: A trading pair, e.g. BTC-USDT
         :return A conversion rate
         """
+        if self._prices:
+            return self.get_pair_rate(pair)
+        # The fetched prices are routed like the stored ones, so the rate does not depend on the network being started
         prices = await self._source.get_prices(quote_token=self._quote_token)
-        return find_rate(prices, pair)
+        return self._get_conversion_index(prices).find_rate(pair)
+
+    def _get_conversion_index(self, prices: Optional[Dict[str, Decimal]] = None) -> ConversionRateIndex:
+        """
+        :param prices: The prices to find rates from, the stored prices by default
+        """
+        prices = self._prices if prices is None else prices
+        # The prices are replaced (not updated) on every refresh, so the index is valid while it refers to them
+        if self._conversion_index is None or not self._conversion_index.is_built_from(prices):
+            self._conversion_index = ConversionRateIndex(prices=prices, bridge_tokens=self._bridge_tokens)
+        return self._conversion_index
 
     async def _fetch_price_loop(self):
         while True:
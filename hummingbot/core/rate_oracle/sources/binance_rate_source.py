@@ -1,27 +1,69 @@
+import asyncio
 from decimal import Decimal
-from typing import TYPE_CHECKING, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
 
+from hummingbot.connector.exchange.binance import binance_constants as CONSTANTS, binance_web_utils as web_utils
 from hummingbot.connector.utils import split_hb_trading_pair
 from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
 from hummingbot.core.utils import async_ttl_cache
-from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
+from hummingbot.core.web_assistant.connections.data_types import WSJSONRequest
+from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
+from hummingbot.core.web_assistant.ws_assistant import WSAssistant
 
 if TYPE_CHECKING:
     from hummingbot.connector.exchange.binance.binance_exchange import BinanceExchange
 
+ALL_MARKET_TICKERS_STREAM = "!ticker@arr"
+STREAM_RECONNECT_DELAY = 5.0
+
 
 class BinanceRateSource(RateSourceBase):
-    def __init__(self):
+    def __init__(self, stream_prices: bool = False):
+        """
+        :param stream_prices: if True, once the network is started the prices are kept current from the all market
+        tickers websocket streams, and the REST tickers are only requested when (re)connecting to them
+        """
         super().__init__()
         self._binance_exchange: Optional[BinanceExchange] = None  # delayed because of circular reference
         self._binance_us_exchange: Optional[BinanceExchange] = None  # delayed because of circular reference
+        self._stream_prices = stream_prices
+        self._streamed_prices: Dict[str, Decimal] = {}
+        self._live_stream_domains: Set[str] = set()
+        self._stream_tasks: List[asyncio.Task] = []
+        self._ws_factory: Optional[WebAssistantsFactory] = None
 
     @property
     def name(self) -> str:
         return "binance"
 
-    @async_ttl_cache(ttl=30, maxsize=1)
+    @property
+    def streams_prices(self) -> bool:
+        return self._stream_prices
+
     async def get_prices(self, quote_token: Optional[str] = None) -> Dict[str, Decimal]:
+        if self._stream_tasks and len(self._live_stream_domains) == len(self._stream_tasks):
+            return dict(self._streamed_prices)
+        return await self._get_rest_prices(quote_token=quote_token)
+
+    async def start_network(self):
+        await self.stop_network()
+        if self._stream_prices:
+            self._ensure_exchanges()
+            self._stream_tasks = [
+                safe_ensure_future(self._listen_to_tickers_stream(exchange=self._binance_exchange)),
+                safe_ensure_future(self._listen_to_tickers_stream(exchange=self._binance_us_exchange, quote_token="USD")),
+            ]
+
+    async def stop_network(self):
+        for task in self._stream_tasks:
+            task.cancel()
+        self._stream_tasks = []
+        self._live_stream_domains.clear()
+        self._streamed_prices = {}
+
+    @async_ttl_cache(ttl=30, maxsize=1)
+    async def _get_rest_prices(self, quote_token: Optional[str] = None) -> Dict[str, Decimal]:
         self._ensure_exchanges()
         results = {}
         tasks = [
@@ -45,6 +87,59 @@ class BinanceRateSource(RateSourceBase):
             self._binance_exchange = self._build_binance_connector_without_private_keys(domain="com")
             self._binance_us_exchange = self._build_binance_connector_without_private_keys(domain="us")
 
+    async def _listen_to_tickers_stream(self, exchange: 'BinanceExchange', quote_token: Optional[str] = None):
+        while True:
+            ws: Optional[WSAssistant] = None
+            try:
+                ws = await self._connected_websocket_assistant(domain=exchange.domain)
+                # Tickers are only sent when they change, so the REST snapshot fills the prices (and any gap while
+                # the stream was disconnected) before applying the stream updates
+                self._streamed_prices.update(await self._get_binance_prices(exchange=exchange, quote_token=quote_token))
+                symbol_map = await exchange.trading_pair_symbol_map()
+                self._live_stream_domains.add(exchange.domain)
+                async for ws_response in ws.iter_messages():
+                    if isinstance(ws_response.data, list):
+                        self._process_tickers(tickers=ws_response.data, symbol_map=symbol_map, quote_token=quote_token)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network(
+                    f"Unexpected error while listening to the Binance ({exchange.domain}) tickers stream. "
+                    f"Retrying in {STREAM_RECONNECT_DELAY} seconds.",
+                    exc_info=True,
+                )
+                await self._sleep(STREAM_RECONNECT_DELAY)
+            finally:
+                self._live_stream_domains.discard(exchange.domain)
+                ws and await ws.disconnect()
+
+    async def _connected_websocket_assistant(self, domain: str) -> WSAssistant:
+        if self._ws_factory is None:
+            self._ws_factory = web_utils.build_api_factory_without_time_synchronizer_pre_processor(
+                throttler=web_utils.create_throttler())
+        ws: WSAssistant = await self._ws_factory.get_ws_assistant()
+        await ws.connect(ws_url=CONSTANTS.WSS_URL.format(domain), ping_timeout=CONSTANTS.WS_HEARTBEAT_TIME_INTERVAL)
+        await ws.send(WSJSONRequest(payload={"method": "SUBSCRIBE", "params": [ALL_MARKET_TICKERS_STREAM], "id": 1}))
+        return ws
+
+    def _process_tickers(self, tickers: List[Dict[str, Any]], symbol_map: Dict[str, str], quote_token: Optional[str]):
+        for ticker in tickers:
+            trading_pair = symbol_map.get(ticker.get("s"))
+            if trading_pair is None:
+                continue  # skip pairs that we don't track
+            if quote_token is not None and not trading_pair.endswith(f"-{quote_token}"):
+                continue
+            bid_price = ticker.get("b")
+            ask_price = ticker.get("a")
+            if bid_price is not None and ask_price is not None:
+                bid_price = Decimal(bid_price)
+                ask_price = Decimal(ask_price)
+                if 0 < bid_price <= ask_price:
+                    self._streamed_prices[trading_pair] = (bid_price + ask_price) / Decimal("2")
+
+    async def _sleep(self, delay: float):
+        await asyncio.sleep(delay)
+
     @staticmethod
     async def _get_binance_prices(exchange: 'BinanceExchange', quote_token: str = None) -> Dict[str, Decimal]:
         """
@@ -20,6 +20,22 @@ class RateSourceBase(ABC):
             cls._logger = logging.getLogger(__name__)
         return cls._logger
 
+    @property
+    def streams_prices(self) -> bool:
+        """
+        True if the source keeps its prices current from a websocket stream instead of requesting them on demand
+        """
+        return False
+
     @abstractmethod
     async def get_prices(self, quote_token: Optional[str] = None) -> Dict[str, Decimal]:
         ...
+
+    async def start_network(self):
+        """
+        Starts the connections the source needs to keep its prices current, if any
+        """
+        pass
+
+    async def stop_network(self):
+        pass
@@ -1,5 +1,5 @@
 from decimal import Decimal
-from typing import Dict
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from hummingbot.connector.utils import combine_to_hb_trading_pair, split_hb_trading_pair
 from hummingbot.core.gateway.utils import unwrap_token_symbol
@@ -35,3 +35,110 @@ def find_rate(prices: Dict[str, Decimal], pair: str) -> Decimal:
         common_denom_pair = combine_to_hb_trading_pair(base=quote, quote=link_quote)
         if common_denom_pair in prices:
             return proxy_price / prices[common_denom_pair]
+
+
+DEFAULT_BRIDGE_TOKENS: Tuple[str, ...] = ("USDT", "USDC", "BTC")
+
+
+class ConversionRateIndex:
+    """
+    Conversion graph built once from a dictionary of prices, to find rates without scanning the prices on every lookup.
+    Rates are first found with the routes of find_rate (direct, inverse and one intermediate asset, tried in the same
+    order on the prices as they are keyed), so the index returns the rate find_rate would return whenever find_rate
+    finds one. Only if none of those routes exists, the rate is routed through one of the bridge tokens
+    (base -> bridge -> quote). The two legs of a bridged route are found in a graph that maps every asset to the rates
+    to its neighbour assets, in which wrapped tokens are unwrapped and every price is also used inversely (direct
+    prices take precedence over the inverse of the reverse pair), with up to one intermediate asset on each leg.
+    Found rates are memoized, the index must be rebuilt when the prices change.
+    """
+
+    def __init__(self, prices: Dict[str, Decimal], bridge_tokens: Iterable[str] = DEFAULT_BRIDGE_TOKENS):
+        """
+        :param prices: The dictionary of trading pairs and their prices
+        :param bridge_tokens: The tokens used, in order of preference, to route conversions that find_rate can not
+        """
+        self._prices = prices
+        self._prices_count = len(prices)
+        self._bridge_tokens: Tuple[str, ...] = tuple(bridge_tokens)
+        # Quote assets and prices of the pairs of every base asset, as keyed in the prices, in the order of the prices
+        self._base_pairs: Dict[str, List[Tuple[str, Decimal]]] = {}
+        # Rates of every asset to its neighbours, as (price, is_inverse) to divide instead of multiplying by inverses
+        self._rates: Dict[str, Dict[str, Tuple[Decimal, bool]]] = {}
+        self._memo: Dict[str, Optional[Decimal]] = {}
+        self._build()
+
+    def is_built_from(self, prices: Dict[str, Decimal]) -> bool:
+        return prices is self._prices and len(prices) == self._prices_count
+
+    def find_rate(self, pair: str) -> Optional[Decimal]:
+        try:
+            return self._memo[pair]
+        except KeyError:
+            rate = self._find_rate(pair)
+            self._memo[pair] = rate
+            return rate
+
+    def _build(self):
+        reverse_pairs = []
+        for pair, price in self._prices.items():
+            base, quote = split_hb_trading_pair(trading_pair=pair)
+            self._base_pairs.setdefault(base, []).append((quote, price))
+            if self._bridge_tokens:
+                base = unwrap_token_symbol(base)
+                quote = unwrap_token_symbol(quote)
+                self._rates.setdefault(base, {}).setdefault(quote, (price, False))
+                if price != 0:
+                    reverse_pairs.append((quote, base, price))
+        for base, quote, price in reverse_pairs:
+            self._rates.setdefault(base, {}).setdefault(quote, (price, True))
+
+    def _find_rate(self, pair: str) -> Optional[Decimal]:
+        if pair in self._prices:
+            return self._prices[pair]
+        base, quote = split_hb_trading_pair(trading_pair=pair)
+        base = unwrap_token_symbol(base)
+        quote = unwrap_token_symbol(quote)
+        rate = self._find_rate_routes_rate(base, quote)
+        if rate is None:
+            for bridge in self._bridge_tokens:
+                if bridge in (base, quote):
+                    continue
+                base_to_bridge = self._one_hop_rate(base, bridge)
+                if base_to_bridge is not None:
+                    bridge_to_quote = self._one_hop_rate(bridge, quote)
+                    if bridge_to_quote is not None:
+                        rate = base_to_bridge * bridge_to_quote
+                        break
+        return rate
+
+    def _find_rate_routes_rate(self, base: str, quote: str) -> Optional[Decimal]:
+        if base == quote:
+            return Decimal("1")
+        reverse_pair = combine_to_hb_trading_pair(base=quote, quote=base)
+        if reverse_pair in self._prices:
+            return Decimal("1") / self._prices[reverse_pair]
+        for link_quote, proxy_price in self._base_pairs.get(base, ()):
+            link_pair = combine_to_hb_trading_pair(base=link_quote, quote=quote)
+            if link_pair in self._prices:
+                return proxy_price * self._prices[link_pair]
+            common_denom_pair = combine_to_hb_trading_pair(base=quote, quote=link_quote)
+            if common_denom_pair in self._prices:
+                return proxy_price / self._prices[common_denom_pair]
+        return None
+
+    def _one_hop_rate(self, base: str, quote: str) -> Optional[Decimal]:
+        if base == quote:
+            return Decimal("1")
+        base_rates = self._rates.get(base)
+        if base_rates is None:
+            return None
+        if quote in base_rates:
+            price, is_inverse = base_rates[quote]
+            return Decimal("1") / price if is_inverse else price
+        for link, (base_price, is_base_inverse) in base_rates.items():
+            link_rates = self._rates.get(link)
+            if link_rates is not None and quote in link_rates:
+                rate = Decimal("1") / base_price if is_base_inverse else base_price
+                link_price, is_link_inverse = link_rates[quote]
+                return rate / link_price if is_link_inverse else rate * link_price
+        return None
@@ -1,3 +1,4 @@
+import asyncio
 import cachetools
 import errno
 import functools
@@ -7,17 +8,49 @@ import pandas as pd
 
 
 def async_ttl_cache(ttl: int = 3600, maxsize: int = 1):
+    """
+    Caches the results of a coroutine function for `ttl` seconds.
+    Concurrent calls with the same arguments share a single in-flight call instead of all awaiting their own.
+    """
     cache = cachetools.TTLCache(ttl=ttl, maxsize=maxsize)
+    in_flight_calls = {}
 
     def decorator(fn):
         @functools.wraps(fn)
         async def memoize(*args, **kwargs):
             key = str((args, kwargs))
+            while True:
+                try:
+                    return cache[key]
+                except KeyError:
+                    pass
+                in_flight_call = in_flight_calls.get(key)
+                if in_flight_call is None:
+                    break
+                try:
+                    return await asyncio.shield(in_flight_call)
+                except asyncio.CancelledError:
+                    if not in_flight_call.cancelled():
+                        raise
+                    # The caller running the call was cancelled, one of the waiting callers runs it again
+
+            in_flight_call = asyncio.get_event_loop().create_future()
+            in_flight_calls[key] = in_flight_call
             try:
-                return cache[key]
-            except KeyError:
-                cache[key] = await fn(*args, **kwargs)
-                return cache[key]
+                result = await fn(*args, **kwargs)
+            except asyncio.CancelledError:
+                in_flight_call.cancel()
+                raise
+            except Exception as exception:
+                in_flight_call.set_exception(exception)
+                in_flight_call.exception()  # marks the exception as retrieved if nobody else is waiting
+                raise
+            else:
+                cache[key] = result
+                in_flight_call.set_result(result)
+                return result
+            finally:
+                in_flight_calls.pop(key, None)
 
         memoize.cache_clear = lambda: cache.clear()
         return memoize
@@ -0,0 +1,279 @@
+import json
+import os
+from itertools import islice
+from typing import IO, Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+# Increase the version when the format of the segment files changes
+COLUMNAR_MARKET_DATA_VERSION = 1
+INDEX_FILE_NAME = "index.json"
+
+
+def market_data_dtype(depth: int) -> np.dtype:
+    """
+    :param depth: number of order book levels saved on each side
+    :return: the fixed-width record of one market data snapshot
+    """
+    return np.dtype([
+        ("timestamp", "<i8"),
+        ("mid_price", "<f8"),
+        ("best_bid", "<f8"),
+        ("best_ask", "<f8"),
+        ("bid_prices", "<f8", (depth,)),
+        ("bid_amounts", "<f8", (depth,)),
+        ("ask_prices", "<f8", (depth,)),
+        ("ask_amounts", "<f8", (depth,)),
+    ])
+
+
+class _PairSegmentWriter:
+    """
+    Appends the snapshots of one trading pair to the last segment of its directory
+    """
+
+    def __init__(self, pair_dir: str, depth: int, max_segment_records: int):
+        self._pair_dir = pair_dir
+        self._depth = depth
+        self._dtype = market_data_dtype(depth)
+        self._max_segment_records = max_segment_records
+        self._index: Dict[str, Any] = _read_index(pair_dir)
+        self._file: Optional[IO] = None
+        self._segment_records = 0
+
+    def append(self, record: np.ndarray):
+        if self._file is None or self._segment_records >= self._max_segment_records:
+            self._open_segment(first_timestamp=int(record["timestamp"][0]))
+        self._file.write(record.tobytes())
+        self._segment_records += 1
+
+    def flush(self):
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _open_segment(self, first_timestamp: int):
+        self.close()
+        segments = self._index["segments"]
+        last_segment = segments[-1] if len(segments) > 0 else None
+        if last_segment is not None and last_segment["depth"] == self._depth:
+            file_path = os.path.join(self._pair_dir, last_segment["file"])
+            records = os.path.getsize(file_path) // self._dtype.itemsize if os.path.exists(file_path) else 0
+            if records < self._max_segment_records:
+                # Drops the incomplete record written by an interrupted process before appending
+                with open(file_path, "ab") as segment_file:
+                    segment_file.truncate(records * self._dtype.itemsize)
+                self._file = open(file_path, "ab")
+                self._segment_records = records
+                return
+        file_name = f"segment_{len(segments):06d}.bin"
+        segments.append({"file": file_name, "depth": self._depth, "first_timestamp": first_timestamp})
+        _write_index(self._pair_dir, self._index)
+        self._file = open(os.path.join(self._pair_dir, file_name), "ab")
+        self._segment_records = 0
+
+
+class ColumnarMarketDataWriter:
+    """
+    Saves the market data snapshots in append-only segment files, with one directory per exchange and trading pair.
+    Every snapshot is a fixed-width record (see `market_data_dtype`) with the timestamp, the mid price, the best bid and
+    ask, and float64 arrays with the prices and amounts of the top `depth` levels of each side of the order book (NaN
+    where the book has fewer levels). The segments can be memory mapped by ColumnarMarketDataReader, and the index file
+    of each directory only changes when a new segment is started.
+    """
+
+    def __init__(self, data_dir: str, depth: int, max_segment_records: int = 100000):
+        """
+        :param data_dir: root directory of the market data files
+        :param depth: number of order book levels saved on each side
+        :param max_segment_records: number of snapshots after which a new segment file is started
+        """
+        self._data_dir = data_dir
+        self._depth = depth
+        self._dtype = market_data_dtype(depth)
+        self._max_segment_records = max_segment_records
+        self._pair_writers: Dict[Tuple[str, str], _PairSegmentWriter] = {}
+
+    @property
+    def data_dir(self) -> str:
+        return self._data_dir
+
+    @property
+    def depth(self) -> int:
+        return self._depth
+
+    def append(self,
+               exchange: str,
+               trading_pair: str,
+               timestamp: int,
+               mid_price: float,
+               best_bid: float,
+               best_ask: float,
+               bids: Iterable[OrderBookRow],
+               asks: Iterable[OrderBookRow]):
+        """
+        Appends a snapshot of the order book. Only the first `depth` entries of the bids and asks are consumed, so
+        the order book iterators can be passed directly.
+
+        :param timestamp: the snapshot timestamp in milliseconds
+        """
+        record = np.zeros(1, dtype=self._dtype)
+        record["timestamp"] = timestamp
+        record["mid_price"] = mid_price
+        record["best_bid"] = best_bid
+        record["best_ask"] = best_ask
+        self._fill_levels(record, "bid", bids)
+        self._fill_levels(record, "ask", asks)
+        self._pair_writer(exchange, trading_pair).append(record)
+
+    def flush(self):
+        for pair_writer in self._pair_writers.values():
+            pair_writer.flush()
+
+    def close(self):
+        for pair_writer in self._pair_writers.values():
+            pair_writer.close()
+        self._pair_writers.clear()
+
+    def _fill_levels(self, record: np.ndarray, side: str, entries: Iterable[OrderBookRow]):
+        prices = record[f"{side}_prices"][0]
+        amounts = record[f"{side}_amounts"][0]
+        prices.fill(np.nan)
+        amounts.fill(np.nan)
+        for level, entry in enumerate(islice(entries, self._depth)):
+            prices[level] = entry.price
+            amounts[level] = entry.amount
+
+    def _pair_writer(self, exchange: str, trading_pair: str) -> _PairSegmentWriter:
+        pair_writer = self._pair_writers.get((exchange, trading_pair))
+        if pair_writer is None:
+            pair_dir = os.path.join(self._data_dir, exchange, trading_pair)
+            os.makedirs(pair_dir, exist_ok=True)
+            pair_writer = _PairSegmentWriter(pair_dir, self._depth, self._max_segment_records)
+            self._pair_writers[(exchange, trading_pair)] = pair_writer
+        return pair_writer
+
+
+class ColumnarMarketDataReader:
+    """
+    Reads the market data saved by ColumnarMarketDataWriter. The segment files are memory mapped, and only the
+    snapshots in the requested time range are copied.
+    """
+
+    def __init__(self, data_dir: str):
+        self._data_dir = data_dir
+
+    def markets(self) -> List[Tuple[str, str]]:
+        """
+        :return: the (exchange, trading pair) tuples with saved market data
+        """
+        markets = []
+        if not os.path.isdir(self._data_dir):
+            return markets
+        for exchange in sorted(os.listdir(self._data_dir)):
+            exchange_dir = os.path.join(self._data_dir, exchange)
+            if not os.path.isdir(exchange_dir):
+                continue
+            for trading_pair in sorted(os.listdir(exchange_dir)):
+                if os.path.exists(os.path.join(exchange_dir, trading_pair, INDEX_FILE_NAME)):
+                    markets.append((exchange, trading_pair))
+        return markets
+
+    def read(self,
+             exchange: str,
+             trading_pair: str,
+             start_timestamp: Optional[int] = None,
+             end_timestamp: Optional[int] = None) -> np.ndarray:
+        """
+        :param start_timestamp: first timestamp in milliseconds to include, from the beginning if None
+        :param end_timestamp: last timestamp in milliseconds to include, until the end if None
+        :return: the snapshots in the time range as an array of `market_data_dtype` records. Segments saved with a
+            smaller depth are padded with NaN up to the largest depth in the range
+        """
+        pair_dir = os.path.join(self._data_dir, exchange, trading_pair)
+        segments = _read_index(pair_dir)["segments"]
+        selected: List[np.ndarray] = []
+        for position, segment in enumerate(segments):
+            next_first_timestamp = (segments[position + 1]["first_timestamp"]
+                                    if position + 1 < len(segments) else None)
+            if start_timestamp is not None and next_first_timestamp is not None and next_first_timestamp < start_timestamp:
+                continue
+            if end_timestamp is not None and segment["first_timestamp"] > end_timestamp:
+                break
+            records = self._map_segment(os.path.join(pair_dir, segment["file"]), segment["depth"])
+            if len(records) == 0:
+                continue
+            timestamps = records["timestamp"]
+            start = 0 if start_timestamp is None else np.searchsorted(timestamps, start_timestamp, side="left")
+            end = len(records) if end_timestamp is None else np.searchsorted(timestamps, end_timestamp, side="right")
+            if start < end:
+                selected.append(records[start:end])
+        if len(selected) == 0:
+            return np.zeros(0, dtype=market_data_dtype(segments[-1]["depth"] if len(segments) > 0 else 0))
+        depth = max(records.dtype["bid_prices"].shape[0] for records in selected)
+        return np.concatenate([_with_depth(records, depth) for records in selected])
+
+    def read_dataframe(self,
+                       exchange: str,
+                       trading_pair: str,
+                       start_timestamp: Optional[int] = None,
+                       end_timestamp: Optional[int] = None) -> pd.DataFrame:
+        """
+        :return: the snapshots in the time range, with one row per snapshot and the levels of the order book in the
+            `bid_price_<level>`, `bid_amount_<level>`, `ask_price_<level>` and `ask_amount_<level>` columns
+        """
+        records = self.read(exchange, trading_pair, start_timestamp, end_timestamp)
+        columns: Dict[str, np.ndarray] = {name: records[name] for name in ("timestamp", "mid_price", "best_bid",
+                                                                           "best_ask")}
+        for side in ("bid", "ask"):
+            for level in range(records.dtype[f"{side}_prices"].shape[0]):
+                columns[f"{side}_price_{level}"] = records[f"{side}_prices"][:, level]
+                columns[f"{side}_amount_{level}"] = records[f"{side}_amounts"][:, level]
+        return pd.DataFrame(columns)
+
+    @staticmethod
+    def _map_segment(file_path: str, depth: int) -> np.ndarray:
+        dtype = market_data_dtype(depth)
+        records = os.path.getsize(file_path) // dtype.itemsize if os.path.exists(file_path) else 0
+        if records == 0:
+            return np.zeros(0, dtype=dtype)
+        return np.memmap(file_path, dtype=dtype, mode="r", shape=(records,))
+
+
+def _with_depth(records: np.ndarray, depth: int) -> np.ndarray:
+    records_depth = records.dtype["bid_prices"].shape[0]
+    if records_depth == depth:
+        return records
+    padded = np.zeros(len(records), dtype=market_data_dtype(depth))
+    for name in ("timestamp", "mid_price", "best_bid", "best_ask"):
+        padded[name] = records[name]
+    for name in ("bid_prices", "bid_amounts", "ask_prices", "ask_amounts"):
+        padded[name] = np.nan
+        padded[name][:, :records_depth] = records[name]
+    return padded
+
+
+def _read_index(pair_dir: str) -> Dict[str, Any]:
+    try:
+        with open(os.path.join(pair_dir, INDEX_FILE_NAME)) as index_file:
+            index = json.load(index_file)
+    except FileNotFoundError:
+        return {"version": COLUMNAR_MARKET_DATA_VERSION, "segments": []}
+    if index.get("version") != COLUMNAR_MARKET_DATA_VERSION:
+        raise ValueError(f"Unsupported market data format version {index.get('version')} in {pair_dir}.")
+    return index
+
+
+def _write_index(pair_dir: str, index: Dict[str, Any]):
+    file_path = os.path.join(pair_dir, INDEX_FILE_NAME)
+    temp_file_path = f"{file_path}.tmp"
+    with open(temp_file_path, "w") as index_file:
+        json.dump(index, index_file)
+    os.replace(temp_file_path, file_path)
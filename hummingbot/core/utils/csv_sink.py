@@ -0,0 +1,101 @@
+import csv
+import os
+import threading
+from shutil import move
+from typing import IO, Any, Iterable, Optional, Sequence, Tuple
+
+import pandas as pd
+
+
+class CSVSink:
+    """
+    Appends rows to a CSV file that is kept open between writes.
+    The header of an existing file is checked only once, when the file is opened. If it does not match, the existing
+    file is renamed with an `_old_<timestamp>` suffix and a new one is started.
+    Rows are buffered and flushed to disk after `flush_interval` seconds, when the sink is rotated and when it is closed.
+    The sink can be used from any thread.
+    """
+
+    def __init__(self, file_path: str, header: Sequence[str], flush_interval: float = 1.0):
+        """
+        :param file_path: path of the CSV file
+        :param header: the column names, written as the first row of new files
+        :param flush_interval: maximum number of seconds a written row is kept in the buffer
+        """
+        self._file_path: str = file_path
+        self._header: Tuple[str, ...] = tuple(header)
+        self._flush_interval: float = flush_interval
+        self._file: Optional[IO] = None
+        self._writer = None
+        self._flush_timer: Optional[threading.Timer] = None
+        self._lock = threading.RLock()
+
+    @property
+    def file_path(self) -> str:
+        return self._file_path
+
+    @property
+    def header(self) -> Tuple[str, ...]:
+        return self._header
+
+    @property
+    def is_open(self) -> bool:
+        return self._file is not None
+
+    def write_row(self, row: Sequence[Any]):
+        self.write_rows([row])
+
+    def write_rows(self, rows: Iterable[Sequence[Any]]):
+        with self._lock:
+            if self._file is None:
+                self._open()
+            self._writer.writerows(rows)
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(self._flush_interval, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def flush(self):
+        with self._lock:
+            self._cancel_flush_timer()
+            if self._file is not None:
+                self._file.flush()
+
+    def rotate(self, file_path: str):
+        """
+        Closes the current file and continues writing the next rows in a new one
+        """
+        with self._lock:
+            if file_path != self._file_path:
+                self.close()
+                self._file_path = file_path
+
+    def close(self):
+        with self._lock:
+            self._cancel_flush_timer()
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+                self._writer = None
+
+    def _open(self):
+        file_has_rows = os.path.exists(self._file_path) and os.path.getsize(self._file_path) > 0
+        if file_has_rows and not self._file_matches_header():
+            move(self._file_path,
+                 self._file_path[:-4] + '_old_' + pd.Timestamp.utcnow().strftime("%Y%m%d-%H%M%S") + ".csv")
+            file_has_rows = False
+        write_header = not file_has_rows
+        self._file = open(self._file_path, mode="a", newline="")
+        self._writer = csv.writer(self._file)
+        if write_header:
+            self._writer.writerow(self._header)
+
+    def _file_matches_header(self) -> bool:
+        with open(self._file_path, newline="") as csv_file:
+            first_row = next(csv.reader(csv_file), None)
+        return tuple(first_row or ()) == self._header
+
+    def _cancel_flush_timer(self):
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
@@ -28,6 +28,18 @@ def build_trade_fee(
     Uses the exchange's `TradeFeeSchema` to build a `TradeFee`, given the trade parameters.
     """
     trade_fee_schema: TradeFeeSchema = TradeFeeSchemaLoader.configured_schema_for_exchange(exchange_name=exchange)
+    return build_trade_fee_from_schema(trade_fee_schema, is_maker, order_side, extra_flat_fees)
+
+
+def build_trade_fee_from_schema(
+    trade_fee_schema: TradeFeeSchema,
+    is_maker: bool,
+    order_side: TradeType,
+    extra_flat_fees: Optional[List[TokenAmount]] = None,
+) -> TradeFeeBase:
+    """
+    Builds a `TradeFee` from a given `TradeFeeSchema`, without looking up the schema of an exchange.
+    """
     fee_percent: Decimal = (
         trade_fee_schema.maker_percent_fee_decimal
         if is_maker
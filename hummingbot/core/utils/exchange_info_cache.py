@@ -0,0 +1,107 @@
+import json
+import logging
+import os
+import time
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from hummingbot import data_path
+from hummingbot.logger import HummingbotLogger
+
+if TYPE_CHECKING:
+    from hummingbot.client.config.config_helpers import ClientConfigAdapter
+
+# Increase the version when the format of the cache files changes, to ignore the files saved with the previous format
+EXCHANGE_INFO_CACHE_VERSION = 1
+
+TRADING_PAIRS_REQUEST_KEY = "trading_pairs_request"
+TRADING_RULES_REQUEST_KEY = "trading_rules_request"
+ALL_TRADING_PAIRS_KEY = "all_trading_pairs"
+
+
+class ExchangeInfoCache:
+    """
+    On-disk cache of the exchange information the connectors request when they start (the responses used to build the
+    symbol maps and the trading rules, and the lists of trading pairs used for autocompletion).
+    Every connector has its own JSON file in the cache directory, with one entry per key. Entries older than the TTL,
+    and files saved with a different cache version, are ignored.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    @classmethod
+    def from_client_config(cls, client_config_map: "ClientConfigAdapter") -> Optional["ExchangeInfoCache"]:
+        """
+        Creates the cache with the client configuration, or returns None if the cache is disabled
+        """
+        cache_config = client_config_map.exchange_info_cache
+        if not cache_config.exchange_info_cache_enabled:
+            return None
+        return cls(ttl=cache_config.exchange_info_cache_ttl)
+
+    def __init__(self, ttl: float, cache_dir: Optional[str] = None):
+        """
+        :param ttl: number of seconds the entries are valid after being saved
+        :param cache_dir: directory of the cache files, `exchange_info_cache` in the data path by default
+        """
+        self._ttl = ttl
+        self._cache_dir = cache_dir or os.path.join(data_path(), "exchange_info_cache")
+
+    @property
+    def ttl(self) -> float:
+        return self._ttl
+
+    def get(self, connector_name: str, key: str) -> Optional[Any]:
+        """
+        :return: the cached data, or None if there is no valid entry for the key
+        """
+        entry = self._read_entries(connector_name).get(key)
+        if entry is None or time.time() - entry["timestamp"] > self._ttl:
+            return None
+        return entry["data"]
+
+    def set(self, connector_name: str, key: str, data: Any):
+        """
+        Saves the data for the key, it must be serializable to JSON
+        """
+        entries = self._read_entries(connector_name)
+        entries[key] = {"timestamp": time.time(), "data": data}
+        try:
+            contents = json.dumps({"version": EXCHANGE_INFO_CACHE_VERSION, "entries": entries})
+        except (TypeError, ValueError):
+            self.logger().debug(f"The {key} of {connector_name} can't be cached.", exc_info=True)
+            return
+        os.makedirs(self._cache_dir, exist_ok=True)
+        file_path = self._file_path(connector_name)
+        temp_file_path = f"{file_path}.tmp"
+        try:
+            with open(temp_file_path, "w") as cache_file:
+                cache_file.write(contents)
+            os.replace(temp_file_path, file_path)
+        except OSError:
+            self.logger().warning(f"Could not save the exchange information cache of {connector_name}.", exc_info=True)
+
+    def clear(self, connector_name: str):
+        file_path = self._file_path(connector_name)
+        if os.path.exists(file_path):
+            os.remove(file_path)
+
+    def _file_path(self, connector_name: str) -> str:
+        return os.path.join(self._cache_dir, f"{connector_name}.json")
+
+    def _read_entries(self, connector_name: str) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self._file_path(connector_name)) as cache_file:
+                contents = json.load(cache_file)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError):
+            self.logger().warning(f"Ignoring the invalid exchange information cache of {connector_name}.")
+            return {}
+        if contents.get("version") != EXCHANGE_INFO_CACHE_VERSION:
+            return {}
+        return contents["entries"]
@@ -1,6 +1,7 @@
 from decimal import Decimal
+from typing import Optional
 
-from hummingbot.core.rate_oracle.utils import find_rate
+from hummingbot.core.rate_oracle.utils import ConversionRateIndex
 
 
 class FixedRateSource:
@@ -9,6 +10,7 @@ class FixedRateSource:
         super().__init__()
 
         self._known_rates: dict = {}
+        self._conversion_index: Optional[ConversionRateIndex] = None
 
     def __str__(self):
         return "fixed rates"
@@ -19,6 +21,7 @@ class FixedRateSource:
         :param rate: The rate to associate to the token pair
         """
         self._known_rates[token_pair] = rate
+        self._conversion_index = None
 
     def get_pair_rate(self, pair: str) -> Decimal:
         """
@@ -28,4 +31,6 @@ class FixedRateSource:
         :param pair: A trading pair, e.g. BTC-USDT
         :return A conversion rate
         """
-        return find_rate(self._known_rates, pair)
+        if self._conversion_index is None:
+            self._conversion_index = ConversionRateIndex(prices=self._known_rates, bridge_tokens=())
+        return self._conversion_index.find_rate(pair)
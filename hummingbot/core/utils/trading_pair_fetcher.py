@@ -1,8 +1,10 @@
+import asyncio
 import logging
 from typing import Any, Awaitable, Callable, Dict, List, Optional
 
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.client.settings import AllConnectorSettings, ConnectorSetting
+from hummingbot.core.utils.exchange_info_cache import ALL_TRADING_PAIRS_KEY, ExchangeInfoCache
 from hummingbot.logger import HummingbotLogger
 
 from .async_utils import safe_ensure_future
@@ -28,7 +30,38 @@ class TradingPairFetcher:
     def __init__(self, client_config_map: ClientConfigAdapter):
         self.ready = False
         self.trading_pairs: Dict[str, Any] = {}
-        self._fetch_task = safe_ensure_future(self.fetch_all(client_config_map))
+        self._fetch_pairs_tasks: Dict[str, asyncio.Task] = {}
+        self._exchange_info_cache: Optional[ExchangeInfoCache] = ExchangeInfoCache.from_client_config(
+            client_config_map)
+        if client_config_map.fetch_pairs_from_all_exchanges:
+            self._fetch_task = safe_ensure_future(self.fetch_all(client_config_map))
+        else:
+            # The trading pairs of each connector are fetched the first time they are requested
+            self._fetch_task = None
+            self.ready = True
+
+    def trading_pairs_for_connector(self, connector_name: str) -> List[str]:
+        """
+        Returns the trading pairs already fetched for the connector. The first time a connector is requested its
+        trading pairs are fetched in the background, unless they are in the exchange info cache.
+
+        :param connector_name: the name of the connector, e.g. binance
+        :return: the list of trading pairs of the connector, empty if they are not available yet
+        """
+        if connector_name not in self.trading_pairs and connector_name not in self._fetch_pairs_tasks:
+            self._fetch_pairs_for_connector(connector_name=connector_name)
+        return self.trading_pairs.get(connector_name, [])
+
+    def _fetch_pairs_for_connector(self, connector_name: str):
+        connector_settings = self._all_connector_settings()
+        conn_setting = connector_settings.get(connector_name)
+        if conn_setting is None:
+            return
+        cached_pairs = self._cached_trading_pairs(connector_name=connector_name)
+        if cached_pairs is not None:
+            self.trading_pairs[connector_name] = cached_pairs
+        else:
+            self._fetch_pairs_from_connector_settings(conn_setting=conn_setting, connector_settings=connector_settings)
 
     def _fetch_pairs_from_connector_setting(
             self,
@@ -36,26 +69,33 @@ class TradingPairFetcher:
             connector_name: Optional[str] = None):
         connector_name = connector_name or connector_setting.name
         connector = connector_setting.non_trading_connector_instance_with_default_configuration()
-        safe_ensure_future(self.call_fetch_pairs(connector.all_trading_pairs(), connector_name))
+        self._fetch_pairs_tasks[connector_name] = safe_ensure_future(
+            self.call_fetch_pairs(connector.all_trading_pairs(), connector_name))
+
+    def _fetch_pairs_from_connector_settings(
+            self,
+            conn_setting: ConnectorSetting,
+            connector_settings: Dict[str, ConnectorSetting]):
+        # XXX(martin_kou): Some connectors, e.g. uniswap v3, aren't completed yet. Ignore if you can't find the
+        # data source module for them.
+        try:
+            if conn_setting.base_name().endswith("paper_trade"):
+                self._fetch_pairs_from_connector_setting(
+                    connector_setting=connector_settings[conn_setting.parent_name],
+                    connector_name=conn_setting.name
+                )
+            else:
+                self._fetch_pairs_from_connector_setting(connector_setting=conn_setting)
+        except ModuleNotFoundError:
+            pass
+        except Exception:
+            self.logger().exception(f"An error occurred when fetching trading pairs for {conn_setting.name}."
+                                    "Please check the logs")
 
     async def fetch_all(self, client_config_map: ClientConfigAdapter):
         connector_settings = self._all_connector_settings()
         for conn_setting in connector_settings.values():
-            # XXX(martin_kou): Some connectors, e.g. uniswap v3, aren't completed yet. Ignore if you can't find the
-            # data source module for them.
-            try:
-                if conn_setting.base_name().endswith("paper_trade"):
-                    self._fetch_pairs_from_connector_setting(
-                        connector_setting=connector_settings[conn_setting.parent_name],
-                        connector_name=conn_setting.name
-                    )
-                else:
-                    self._fetch_pairs_from_connector_setting(connector_setting=conn_setting)
-            except ModuleNotFoundError:
-                continue
-            except Exception:
-                self.logger().exception(f"An error occurred when fetching trading pairs for {conn_setting.name}."
-                                        "Please check the logs")
+            self._fetch_pairs_from_connector_settings(conn_setting=conn_setting, connector_settings=connector_settings)
 
         self.ready = True
 
@@ -63,12 +103,19 @@ class TradingPairFetcher:
         try:
             pairs = await fetch_fn
             self.trading_pairs[exchange_name] = pairs
+            if self._exchange_info_cache is not None and len(pairs) > 0:
+                self._exchange_info_cache.set(connector_name=exchange_name, key=ALL_TRADING_PAIRS_KEY, data=pairs)
         except Exception:
             self.logger().error(f"Connector {exchange_name} failed to retrieve its trading pairs. "
                                 f"Trading pairs autocompletion won't work.", exc_info=True)
             # In case of error just assign empty list, this is st. the bot won't stop working
             self.trading_pairs[exchange_name] = []
 
+    def _cached_trading_pairs(self, connector_name: str) -> Optional[List[str]]:
+        if self._exchange_info_cache is None:
+            return None
+        return self._exchange_info_cache.get(connector_name=connector_name, key=ALL_TRADING_PAIRS_KEY)
+
     def _all_connector_settings(self) -> Dict[str, ConnectorSetting]:
         # Method created to enabling patching in unit tests
         return AllConnectorSettings.get_connector_settings()
@@ -1,8 +1,10 @@
 from typing import Optional
 
 import aiohttp
+
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
 from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
+from hummingbot.core.web_assistant.json_codec import JSONCodec, get_json_codec
 
 
 class ConnectionsFactory:
@@ -17,17 +19,18 @@ class ConnectionsFactory:
     `aiohttp` and `WSConnection`s using `signalr_aio`.
     """
 
-    def __init__(self):
+    def __init__(self, json_codec: Optional[JSONCodec] = None):
         self._shared_client: Optional[aiohttp.ClientSession] = None
+        self._json_codec = json_codec or get_json_codec()
 
     async def get_rest_connection(self) -> RESTConnection:
         shared_client = await self._get_shared_client()
-        connection = RESTConnection(aiohttp_client_session=shared_client)
+        connection = RESTConnection(aiohttp_client_session=shared_client, json_codec=self._json_codec)
         return connection
 
     async def get_ws_connection(self) -> WSConnection:
         shared_client = await self._get_shared_client()
-        connection = WSConnection(aiohttp_client_session=shared_client)
+        connection = WSConnection(aiohttp_client_session=shared_client, json_codec=self._json_codec)
         return connection
 
     async def _get_shared_client(self) -> aiohttp.ClientSession:
@@ -4,7 +4,8 @@ from enum import Enum
 from typing import TYPE_CHECKING, Any, Mapping, Optional
 
 import aiohttp
-import ujson
+
+from hummingbot.core.web_assistant.json_codec import JSONCodec, get_json_codec
 
 if TYPE_CHECKING:
     from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
@@ -73,7 +74,7 @@ class EndpointRESTRequest(RESTRequest, ABC):
     def _ensure_data(self):
         if self.method == RESTMethod.POST:
             if self.data is not None:
-                self.data = ujson.dumps(self.data)
+                self.data = get_json_codec().dumps(self.data)
         elif self.data is not None:
             raise ValueError(
                 "The `data` field should be used only for POST requests. Use `params` instead."
@@ -87,8 +88,9 @@ class RESTResponse:
     status: int
     headers: Optional[Mapping[str, str]]
 
-    def __init__(self, aiohttp_response: aiohttp.ClientResponse):
+    def __init__(self, aiohttp_response: aiohttp.ClientResponse, json_codec: Optional[JSONCodec] = None):
         self._aiohttp_response = aiohttp_response
+        self._json_codec = json_codec or get_json_codec()
 
     @property
     def url(self) -> str:
@@ -111,7 +113,7 @@ class RESTResponse:
         return headers_
 
     async def json(self) -> Any:
-        json_ = await self._aiohttp_response.json()
+        json_ = await self._aiohttp_response.json(loads=self._json_codec.loads)
         return json_
 
     async def text(self) -> str:
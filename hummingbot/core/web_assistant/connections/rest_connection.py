@@ -1,10 +1,15 @@
+from typing import Optional
+
 import aiohttp
+
 from hummingbot.core.web_assistant.connections.data_types import RESTRequest, RESTResponse
+from hummingbot.core.web_assistant.json_codec import JSONCodec, get_json_codec
 
 
 class RESTConnection:
-    def __init__(self, aiohttp_client_session: aiohttp.ClientSession):
+    def __init__(self, aiohttp_client_session: aiohttp.ClientSession, json_codec: Optional[JSONCodec] = None):
         self._client_session = aiohttp_client_session
+        self._json_codec = json_codec or get_json_codec()
 
     async def call(self, request: RESTRequest) -> RESTResponse:
         aiohttp_resp = await self._client_session.request(
@@ -18,7 +23,6 @@ class RESTConnection:
         resp = await self._build_resp(aiohttp_resp)
         return resp
 
-    @staticmethod
-    async def _build_resp(aiohttp_resp: aiohttp.ClientResponse) -> RESTResponse:
-        resp = RESTResponse(aiohttp_resp)
+    async def _build_resp(self, aiohttp_resp: aiohttp.ClientResponse) -> RESTResponse:
+        resp = RESTResponse(aiohttp_resp, json_codec=self._json_codec)
         return resp
@@ -6,11 +6,13 @@ from typing import Any, Dict, Mapping, Optional
 import aiohttp
 
 from hummingbot.core.web_assistant.connections.data_types import WSRequest, WSResponse
+from hummingbot.core.web_assistant.json_codec import JSONCodec, get_json_codec
 
 
 class WSConnection:
-    def __init__(self, aiohttp_client_session: aiohttp.ClientSession):
+    def __init__(self, aiohttp_client_session: aiohttp.ClientSession, json_codec: Optional[JSONCodec] = None):
         self._client_session = aiohttp_client_session
+        self._json_codec = json_codec or get_json_codec()
         self._connection: Optional[aiohttp.ClientWebSocketResponse] = None
         self._connected = False
         self._message_timeout: Optional[float] = None
@@ -117,18 +119,17 @@ class WSConnection:
         self._last_recv_time = time.time()
 
     async def _send_json(self, payload: Mapping[str, Any]):
-        await self._connection.send_json(payload)
+        await self._connection.send_json(payload, dumps=self._json_codec.dumps)
 
     async def _send_plain_text(self, payload: str):
         await self._connection.send_str(payload)
 
-    @staticmethod
-    def _build_resp(msg: aiohttp.WSMessage) -> WSResponse:
+    def _build_resp(self, msg: aiohttp.WSMessage) -> WSResponse:
         if msg.type == aiohttp.WSMsgType.BINARY:
             data = msg.data
         else:
             try:
-                data = msg.json()
+                data = self._json_codec.loads(msg.data)
             except JSONDecodeError:
                 data = msg.data
         response = WSResponse(data)
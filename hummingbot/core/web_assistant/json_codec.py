@@ -0,0 +1,70 @@
+import json
+from typing import Any, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class JSONCodec:
+    """Encodes the request payloads and decodes the response payloads of the web assistants.
+
+    This base class uses the standard library `json` module. Faster backends are plugged in by subclassing it, and
+    they can fall back on it for the payloads they do not support.
+    """
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> str:
+        return json.dumps(obj)
+
+    def loads(self, data: Union[str, bytes, bytearray]) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """Uses `orjson`, which encodes and decodes several times faster than the standard library.
+
+    The payloads `orjson` rejects, like integers over 64 bits or the `NaN` and `Infinity` literals, are handled by the
+    standard library instead, so the codec accepts the same payloads as `JSONCodec`. Note that the encoded JSON is
+    compact, without the spaces the standard library adds after the separators.
+    """
+
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("The orjson package is not installed.")
+
+    def dumps(self, obj: Any) -> str:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            return super().dumps(obj)
+
+    def loads(self, data: Union[str, bytes, bytearray]) -> Any:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Raises the same error the standard library would if the payload is not valid JSON
+            return super().loads(data)
+
+
+_json_codec: Optional[JSONCodec] = None
+
+
+def get_json_codec() -> JSONCodec:
+    """Returns the codec used by default by the web assistants: `orjson` if it is installed, the standard library
+    `json` module otherwise.
+    """
+    global _json_codec
+    if _json_codec is None:
+        _json_codec = OrjsonCodec() if orjson is not None else JSONCodec()
+    return _json_codec
+
+
+def set_json_codec(codec: Optional[JSONCodec]):
+    """Replaces the default codec of the web assistants created from then on. `None` restores the automatic choice."""
+    global _json_codec
+    _json_codec = codec
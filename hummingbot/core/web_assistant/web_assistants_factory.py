@@ -3,6 +3,7 @@ from typing import List, Optional
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.connections_factory import ConnectionsFactory
+from hummingbot.core.web_assistant.json_codec import JSONCodec, get_json_codec
 from hummingbot.core.web_assistant.rest_assistant import RESTAssistant
 from hummingbot.core.web_assistant.rest_post_processors import RESTPostProcessorBase
 from hummingbot.core.web_assistant.rest_pre_processors import RESTPreProcessorBase
@@ -19,6 +20,9 @@ class WebAssistantsFactory:
     lists. Consult the documentation of the relevant assistant and/or pre-/post-processor class for
     additional information.
 
+    The JSON payloads are encoded and decoded with `json_codec`, by default the fastest JSON backend installed (see
+    `get_json_codec`).
+
     todo: integrate AsyncThrottler
     """
     def __init__(
@@ -29,8 +33,10 @@ class WebAssistantsFactory:
         ws_pre_processors: Optional[List[WSPreProcessorBase]] = None,
         ws_post_processors: Optional[List[WSPostProcessorBase]] = None,
         auth: Optional[AuthBase] = None,
+        json_codec: Optional[JSONCodec] = None,
     ):
-        self._connections_factory = ConnectionsFactory()
+        self._json_codec = json_codec or get_json_codec()
+        self._connections_factory = ConnectionsFactory(json_codec=self._json_codec)
         self._rest_pre_processors = rest_pre_processors or []
         self._rest_post_processors = rest_post_processors or []
         self._ws_pre_processors = ws_pre_processors or []
@@ -42,6 +48,10 @@ class WebAssistantsFactory:
     def throttler(self) -> AsyncThrottlerBase:
         return self._throttler
 
+    @property
+    def json_codec(self) -> JSONCodec:
+        return self._json_codec
+
     @property
     def auth(self) -> Optional[AuthBase]:
         return self._auth
@@ -53,7 +63,8 @@ class WebAssistantsFactory:
             throttler=self._throttler,
             rest_pre_processors=self._rest_pre_processors,
             rest_post_processors=self._rest_post_processors,
-            auth=self._auth
+            auth=self._auth,
+            json_codec=self._json_codec,
         )
         return assistant
 
@@ -0,0 +1,27 @@
+#!/usr/bin/env python
+from sqlalchemy import JSON, BigInteger, Column, Index, Integer, Text
+
+from . import HummingbotBase
+
+
+class MarketStateJournal(HummingbotBase):
+    """
+    Table schema used to record the changes of single orders in the market tracking states, after the last MarketState
+    snapshot. A null saved_state means that the order is no longer tracked.
+    """
+    __tablename__ = "MarketStateJournal"
+    __table_args__ = (Index("msj_config_market_index",
+                            "config_file_path", "market"),
+                      )
+
+    id = Column(Integer, primary_key=True, nullable=False)
+    config_file_path = Column(Text, nullable=False)
+    market = Column(Text, nullable=False)
+    timestamp = Column(BigInteger, nullable=False)
+    order_id = Column(Text, nullable=False)
+    saved_state = Column(JSON, nullable=True)
+
+    def __repr__(self) -> str:
+        return f"MarketStateJournal(id={self.id}, config_file_path='{self.config_file_path}', " \
+               f"market='{self.market}', timestamp={self.timestamp}, order_id='{self.order_id}', " \
+               f"saved_state={self.saved_state})"
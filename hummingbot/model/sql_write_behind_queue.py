@@ -0,0 +1,159 @@
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from hummingbot.logger import HummingbotLogger
+from hummingbot.model.sql_connection_manager import SQLConnectionManager
+
+SQLWrite = Callable[[Session], None]
+
+
+class SQLWriteBehindQueue:
+    """
+    Runs database writes in a dedicated thread, so the event loop does not wait for the database to commit them.
+    The writes are executed in the order they are queued. The writer thread drains the writes pending in the queue and
+    commits them together, in a single transaction.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, sql: SQLConnectionManager, max_batch_size: int = 100):
+        """
+        :param sql: the connection manager used to open the writer sessions
+        :param max_batch_size: the maximum number of writes committed in a single transaction
+        """
+        self._sql_manager: SQLConnectionManager = sql
+        self._max_batch_size: int = max_batch_size
+        self._queue: queue.Queue = queue.Queue()
+        self._writer_thread: Optional[threading.Thread] = None
+        self._committed_writes: int = 0
+        self._failed_writes: int = 0
+        self._committed_batches: int = 0
+        self._last_commit_latency: float = 0
+        self._max_commit_latency: float = 0
+
+    @property
+    def started(self) -> bool:
+        return self._writer_thread is not None and self._writer_thread.is_alive()
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    @property
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Returns the number of writes waiting in the queue, together with the writer statistics (latencies are in
+        seconds)
+        """
+        return {
+            "queue_depth": self.queue_depth,
+            "committed_writes": self._committed_writes,
+            "failed_writes": self._failed_writes,
+            "committed_batches": self._committed_batches,
+            "last_commit_latency": self._last_commit_latency,
+            "max_commit_latency": self._max_commit_latency,
+        }
+
+    def start(self):
+        if not self.started:
+            self._writer_thread = threading.Thread(target=self._write_loop, name="SQLWriteBehindQueue", daemon=True)
+            self._writer_thread.start()
+
+    def stop(self, timeout: float) -> bool:
+        """
+        Stops the writer thread once all the writes queued before the call have been committed.
+
+        :param timeout: maximum number of seconds to wait for the pending writes
+        :return: True if all the pending writes were committed before the timeout
+        """
+        if not self.started:
+            return self.queue_depth == 0
+        self._queue.put(None)
+        self._writer_thread.join(timeout)
+        flushed = not self._writer_thread.is_alive()
+        if not flushed:
+            self.logger().warning(f"The database writer did not finish in {timeout} seconds. "
+                                  f"{self.queue_depth} pending writes might not be saved.")
+        self._writer_thread = None
+        return flushed
+
+    def put(self, write: SQLWrite):
+        """
+        Queues a write. The function is called from the writer thread with the session of the batch transaction.
+        """
+        self._queue.put(write)
+
+    def flush(self, timeout: float) -> bool:
+        """
+        Waits until all the writes queued before the call have been committed.
+
+        :param timeout: maximum number of seconds to wait
+        :return: True if the writes were committed before the timeout
+        """
+        if not self.started:
+            return self.queue_depth == 0
+        flushed_event = threading.Event()
+        self._queue.put(flushed_event)
+        return flushed_event.wait(timeout)
+
+    def _write_loop(self):
+        stopped = False
+        while not stopped:
+            items = [self._queue.get()]
+            while len(items) < self._max_batch_size:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            writes: List[SQLWrite] = []
+            for item in items:
+                if item is None:
+                    stopped = True
+                elif isinstance(item, threading.Event):
+                    # Flush markers are released once the writes queued before them are committed
+                    self._commit(writes)
+                    writes = []
+                    item.set()
+                else:
+                    writes.append(item)
+            self._commit(writes)
+
+    def _commit(self, writes: List[SQLWrite]):
+        if len(writes) == 0:
+            return
+        start_time = time.perf_counter()
+        try:
+            self._execute_in_transaction(writes)
+            self._committed_writes += len(writes)
+        except Exception:
+            self.logger().error(f"Error committing a batch of {len(writes)} database writes. "
+                                f"Committing them one by one.",
+                                exc_info=True)
+            # A failing write should not discard the rest of the batch
+            for write in writes:
+                try:
+                    self._execute_in_transaction([write])
+                    self._committed_writes += 1
+                except Exception:
+                    self._failed_writes += 1
+                    self.logger().error("Error committing a database write.", exc_info=True)
+        self._committed_batches += 1
+        self._last_commit_latency = time.perf_counter() - start_time
+        self._max_commit_latency = max(self._max_commit_latency, self._last_commit_latency)
+
+    def _execute_in_transaction(self, writes: List[SQLWrite]):
+        with self._sql_manager.get_new_session() as session:
+            with session.begin():
+                for write in writes:
+                    write(session)
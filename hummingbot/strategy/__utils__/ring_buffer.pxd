@@ -7,14 +7,27 @@ cdef class RingBuffer:
         np.float64_t[:] _buffer
         int64_t _delimiter
         int64_t _length
+        int64_t _size
         bint _is_full
+        # Rolling sums of the stored values minus _shift. Shifting the values keeps the variance accurate when their
+        # mean is large compared to their spread, which is the usual case for prices.
+        double _shift
+        double _shifted_sum
+        double _shifted_sum_of_squares
 
-    cdef void c_add_value(self, float val)
+    cdef void c_reset(self, int64_t length)
+    cdef void c_add_value(self, double val)
     cdef void c_increment_delimiter(self)
+    cdef void c_recalculate_sums(self)
     cdef double c_get_last_value(self)
     cdef bint c_is_full(self)
     cdef bint c_is_empty(self)
+    cdef int64_t c_size(self)
+    cdef double c_sum(self)
+    cdef double c_window_mean(self)
+    cdef double c_window_variance(self)
     cdef double c_mean_value(self)
     cdef double c_variance(self)
     cdef double c_std_dev(self)
     cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self)
+    cdef tuple c_get_views(self)
@@ -1,5 +1,6 @@
 import numpy as np
 import logging
+from libc.math cimport isfinite, sqrt
 cimport numpy as np
 
 
@@ -13,19 +14,61 @@ cdef class RingBuffer:
             pmm_logger = logging.getLogger(__name__)
         return pmm_logger
 
-    def __cinit__(self, int length):
+    def __cinit__(self, int64_t length):
+        self.c_reset(length)
+
+    def __dealloc__(self):
+        self._buffer = None
+
+    cdef void c_reset(self, int64_t length):
         self._length = length
         self._buffer = np.zeros(length, dtype=np.float64)
         self._delimiter = 0
+        self._size = 0
         self._is_full = False
+        self._shift = 0
+        self._shifted_sum = 0
+        self._shifted_sum_of_squares = 0
 
-    def __dealloc__(self):
-        self._buffer = None
+    cdef void c_add_value(self, double val):
+        cdef:
+            double removed_value
+            bint recalculate = False
+
+        if self._is_full:
+            removed_value = self._buffer[self._delimiter]
+            if isfinite(removed_value):
+                self._shifted_sum -= removed_value - self._shift
+                self._shifted_sum_of_squares -= (removed_value - self._shift) * (removed_value - self._shift)
+            else:
+                # A nan or infinite value can't be subtracted from the sums, they have to be recalculated without it
+                recalculate = True
+        else:
+            if self._size == 0 and isfinite(val):
+                self._shift = val
+            self._size += 1
 
-    cdef void c_add_value(self, float val):
         self._buffer[self._delimiter] = val
+        self._shifted_sum += val - self._shift
+        self._shifted_sum_of_squares += (val - self._shift) * (val - self._shift)
         self.c_increment_delimiter()
 
+        # Recalculating the sums once per cycle keeps the rounding errors from accumulating, for an amortized O(1) cost
+        if recalculate or self._delimiter == 0:
+            self.c_recalculate_sums()
+
+    cdef void c_recalculate_sums(self):
+        cdef:
+            int64_t i
+            double last_value = self.c_get_last_value()
+
+        self._shift = last_value if isfinite(last_value) else 0
+        self._shifted_sum = 0
+        self._shifted_sum_of_squares = 0
+        for i in range(self._size):
+            self._shifted_sum += self._buffer[i] - self._shift
+            self._shifted_sum_of_squares += (self._buffer[i] - self._shift) * (self._buffer[i] - self._shift)
+
     cdef void c_increment_delimiter(self):
         self._delimiter = (self._delimiter + 1) % self._length
         if not self._is_full and self._delimiter == 0:
@@ -42,39 +85,73 @@ cdef class RingBuffer:
     cdef bint c_is_full(self):
         return self._is_full
 
+    cdef int64_t c_size(self):
+        return self._size
+
+    cdef double c_sum(self):
+        return self._shifted_sum + self._shift * self._size
+
+    cdef double c_window_mean(self):
+        if self._size == 0:
+            return np.nan
+        return self._shift + self._shifted_sum / self._size
+
+    cdef double c_window_variance(self):
+        cdef:
+            double shifted_mean
+            double variance
+        if self._size == 0:
+            return np.nan
+        shifted_mean = self._shifted_sum / self._size
+        variance = self._shifted_sum_of_squares / self._size - shifted_mean * shifted_mean
+        # Rounding errors can make the variance of (almost) constant values slightly negative
+        if variance < 0:
+            variance = 0
+        return variance
+
     cdef double c_mean_value(self):
         result = np.nan
         if self._is_full:
-            result=np.mean(self.c_get_as_numpy_array())
+            result = self.c_window_mean()
         return result
 
     cdef double c_variance(self):
         result = np.nan
         if self._is_full:
-            result = np.var(self.c_get_as_numpy_array())
+            result = self.c_window_variance()
         return result
 
     cdef double c_std_dev(self):
         result = np.nan
         if self._is_full:
-            result = np.std(self.c_get_as_numpy_array())
+            result = sqrt(self.c_window_variance())
         return result
 
     cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self):
-        cdef np.ndarray[np.int16_t, ndim=1] indexes
+        cdef np.ndarray[np.double_t, ndim=1] buffer = np.asarray(self._buffer)
 
         if not self._is_full:
-            indexes = np.arange(0, stop=self._delimiter, dtype=np.int16)
+            return buffer[:self._delimiter].copy()
+        return np.concatenate((buffer[self._delimiter:], buffer[:self._delimiter]))
+
+    cdef tuple c_get_views(self):
+        cdef:
+            np.ndarray[np.double_t, ndim=1] buffer = np.asarray(self._buffer)
+            np.ndarray[np.double_t, ndim=1] older_values
+            np.ndarray[np.double_t, ndim=1] newer_values
+
+        if not self._is_full:
+            older_values = buffer[:self._delimiter]
+            newer_values = buffer[:0]
         else:
-            indexes = np.arange(self._delimiter, stop=self._delimiter + self._length,
-                                dtype=np.int16) % self._length
-        return np.asarray(self._buffer)[indexes]
+            older_values = buffer[self._delimiter:]
+            newer_values = buffer[:self._delimiter]
+        older_values.flags.writeable = False
+        newer_values.flags.writeable = False
+        return older_values, newer_values
 
     def __init__(self, length):
-        self._length = length
-        self._buffer = np.zeros(length, dtype=np.double)
-        self._delimiter = 0
-        self._is_full = False
+        self.c_reset(length)
 
     def add_value(self, val):
         self.c_add_value(val)
@@ -82,6 +159,13 @@ cdef class RingBuffer:
     def get_as_numpy_array(self):
         return self.c_get_as_numpy_array()
 
+    def get_views(self):
+        """
+        Returns the stored values, from the oldest to the newest, as two read only numpy views over the buffer memory.
+        No values are copied, so the views are only valid until the next value is added.
+        """
+        return self.c_get_views()
+
     def get_last_value(self):
         return self.c_get_last_value()
 
@@ -89,6 +173,28 @@ cdef class RingBuffer:
     def is_full(self):
         return self.c_is_full()
 
+    @property
+    def size(self) -> int:
+        return self.c_size()
+
+    @property
+    def sum(self) -> float:
+        return self.c_sum()
+
+    @property
+    def window_mean(self) -> float:
+        """
+        Mean of the values currently stored, available before the buffer is full.
+        """
+        return self.c_window_mean()
+
+    @property
+    def window_variance(self) -> float:
+        """
+        Population variance of the values currently stored, available before the buffer is full.
+        """
+        return self.c_window_variance()
+
     @property
     def mean_value(self):
         return self.c_mean_value()
@@ -109,10 +215,7 @@ cdef class RingBuffer:
     def length(self, value):
         data = self.get_as_numpy_array()
 
-        self._length = value
-        self._buffer = np.zeros(value, dtype=np.float64)
-        self._delimiter = 0
-        self._is_full = False
+        self.c_reset(value)
 
         for val in data[-value:]:
             self.add_value(val)
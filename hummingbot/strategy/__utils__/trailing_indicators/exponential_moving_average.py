@@ -1,17 +1,49 @@
-from base_trailing_indicator import BaseTrailingIndicator
-import pandas as pd
+from .base_trailing_indicator import BaseTrailingIndicator
 
 
 class ExponentialMovingAverageIndicator(BaseTrailingIndicator):
+    """
+    Adjusted exponential moving average (pandas ewm with adjust=True and span=sampling_length) of the samples in the
+    sampling buffer. The weighted sums are updated incrementally, each sample is O(1).
+    """
     def __init__(self, sampling_length: int = 30, processing_length: int = 1):
         if processing_length != 1:
             raise Exception("Exponential moving average processing_length should be 1")
         super().__init__(sampling_length, processing_length)
+        self._reset_weighted_sums()
+
+    def _reset_weighted_sums(self):
+        self._decay = 1 - 2 / (self._sampling_buffer.length + 1)
+        # Weight of a sample once it is about to leave the full sampling buffer
+        self._evicted_sample_weight = self._decay ** self._sampling_buffer.length
+        self._weighted_sum = 0.0
+        self._weights_sum = 0.0
+        for value in self._sampling_buffer.get_as_numpy_array():
+            self._weighted_sum = self._decay * self._weighted_sum + value
+            self._weights_sum = self._decay * self._weights_sum + 1
+
+    def add_sample(self, value: float):
+        self._weighted_sum *= self._decay
+        self._weights_sum *= self._decay
+        if self._sampling_buffer.is_full:
+            older_values, newer_values = self._sampling_buffer.get_views()
+            self._weighted_sum -= self._evicted_sample_weight * older_values[0]
+            self._weights_sum -= self._evicted_sample_weight
+        self._weighted_sum += float(value)
+        self._weights_sum += 1
+        super().add_sample(value)
 
     def _indicator_calculation(self) -> float:
-        ema = pd.Series(self._sampling_buffer.get_as_numpy_array())\
-            .ewm(span=self._sampling_length, adjust=True).mean()
-        return ema[-1]
+        return self._weighted_sum / self._weights_sum
 
     def _processing_calculation(self) -> float:
         return self._processing_buffer.get_last_value()
+
+    @property
+    def sampling_length(self) -> int:
+        return self._sampling_buffer.length
+
+    @sampling_length.setter
+    def sampling_length(self, value):
+        self._sampling_buffer.length = value
+        self._reset_weighted_sums()
@@ -1,18 +1,41 @@
 from .base_trailing_indicator import BaseTrailingIndicator
+from ..ring_buffer import RingBuffer
 import numpy as np
 
 
 class HistoricalVolatilityIndicator(BaseTrailingIndicator):
     def __init__(self, sampling_length: int = 30, processing_length: int = 15):
         super().__init__(sampling_length, processing_length)
+        self._log_returns_buffer = self._create_log_returns_buffer()
 
-    def _indicator_calculation(self) -> float:
+    def _create_log_returns_buffer(self) -> RingBuffer:
+        # Keeps the log returns between the consecutive prices of the sampling buffer
+        log_returns_buffer = RingBuffer(max(self._sampling_buffer.length - 1, 1))
         prices = self._sampling_buffer.get_as_numpy_array()
-        if prices.size > 0:
-            log_returns = np.diff(np.log(prices))
-            return np.var(log_returns)
+        if self._sampling_buffer.length > 1:
+            for log_return in np.diff(np.log(prices)):
+                log_returns_buffer.add_value(log_return)
+        return log_returns_buffer
+
+    def add_sample(self, value: float):
+        if self._sampling_buffer.length > 1 and self._sampling_buffer.size > 0:
+            self._log_returns_buffer.add_value(np.log(float(value)) - np.log(self._sampling_buffer.get_last_value()))
+        super().add_sample(value)
+
+    def _indicator_calculation(self) -> float:
+        return self._log_returns_buffer.window_variance
 
     def _processing_calculation(self) -> float:
-        processing_array = self._processing_buffer.get_as_numpy_array()
-        if processing_array.size > 0:
-            return np.sqrt(np.mean(np.nan_to_num(processing_array)))
+        older_values, newer_values = self._processing_buffer.get_views()
+        if older_values.size + newer_values.size > 0:
+            return np.sqrt((np.sum(np.nan_to_num(older_values)) + np.sum(np.nan_to_num(newer_values)))
+                           / (older_values.size + newer_values.size))
+
+    @property
+    def sampling_length(self) -> int:
+        return self._sampling_buffer.length
+
+    @sampling_length.setter
+    def sampling_length(self, value):
+        self._sampling_buffer.length = value
+        self._log_returns_buffer = self._create_log_returns_buffer()
@@ -12,17 +12,31 @@ cdef class TradingIntensityIndicator:
     cdef:
         double _alpha
         double _kappa
-        dict _trade_samples
         list _current_trade_sample
         object _trades_forwarder
         OrderBook _order_book
         object _price_delegate
-        list _last_quotes
         int _sampling_length
         int _samples_length
+        # Mid price quotes, in ascending timestamp order
+        object _quote_timestamps
+        object _quote_prices
+        int64_t _quotes_count
+        # Trades matched with the last quote before them, keyed by the quote timestamp + 1
+        object _sample_timestamps
+        object _sample_price_levels
+        object _sample_amounts
+        int64_t _samples_count
+        int _trade_samples_count
+        bint _estimate_pending
+        bint _fit_in_background
+        object _fit_future
 
     cdef c_calculate(self, timestamp)
     cdef c_register_trade(self, object trade)
+    cdef c_add_quote(self, double timestamp, double price)
+    cdef c_process_trades(self)
+    cdef c_trim_trade_samples(self)
     cdef c_estimate_intensity(self)
 
 cdef class TradesForwarder(EventListener):
@@ -2,13 +2,13 @@
 # distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
 
 import warnings
-from decimal import Decimal
-from typing import Tuple
+from typing import Optional, Tuple
 
 import numpy as np
 from scipy.optimize import curve_fit
 from scipy.optimize import OptimizeWarning
 
+from hummingbot import get_executor
 from hummingbot.core.data_type.common import (
     PriceType,
 )
@@ -17,6 +17,34 @@ from hummingbot.core.event.event_listener cimport EventListener
 from hummingbot.core.event.events import OrderBookEvent
 from hummingbot.strategy.asset_price_delegate import AssetPriceDelegate
 
+# Quotes older than this many ticks are dropped, trades older than the oldest quote kept are not sampled
+MAX_QUOTES = 3600
+INITIAL_SAMPLES_CAPACITY = 1024
+
+
+def intensity_curve(t, a, b):
+    return a * np.exp(-b * t)
+
+
+def fit_intensity(price_levels: np.ndarray,
+                  lambdas: np.ndarray,
+                  alpha: float,
+                  kappa: float) -> Optional[Tuple[float, float]]:
+    """
+    Fits the probability density function of the trading intensity. Returns (alpha, kappa), or None when the fit fails.
+    """
+    try:
+        params = curve_fit(intensity_curve,
+                           price_levels,
+                           lambdas,
+                           p0=(alpha, kappa),
+                           method='dogbox',
+                           bounds=([0, 0], [np.inf, np.inf]))
+        return params[0][0], params[0][1]
+    except (RuntimeError, ValueError):
+        return None
+
+
 cdef class TradesForwarder(EventListener):
     def __init__(self, indicator: 'TradingIntensityIndicator'):
         self._indicator = indicator
@@ -27,10 +55,17 @@ cdef class TradesForwarder(EventListener):
 
 cdef class TradingIntensityIndicator:
 
-    def __init__(self, order_book: OrderBook, price_delegate: AssetPriceDelegate, sampling_length: int = 30):
+    def __init__(self,
+                 order_book: OrderBook,
+                 price_delegate: AssetPriceDelegate,
+                 sampling_length: int = 30,
+                 fit_in_background: bool = False):
+        """
+        :param fit_in_background: if True the curve fit runs in the shared executor, and its result is used from the
+        first calculation after it finishes
+        """
         self._alpha = 0
         self._kappa = 0
-        self._trade_samples = {}
         self._current_trade_sample = []
         self._trades_forwarder = TradesForwarder(self)
         self._order_book = order_book
@@ -38,7 +73,17 @@ cdef class TradingIntensityIndicator:
         self._price_delegate = price_delegate
         self._sampling_length = sampling_length
         self._samples_length = 0
-        self._last_quotes = []
+        self._quote_timestamps = np.empty(MAX_QUOTES, dtype=np.float64)
+        self._quote_prices = np.empty(MAX_QUOTES, dtype=np.float64)
+        self._quotes_count = 0
+        self._sample_timestamps = np.empty(INITIAL_SAMPLES_CAPACITY, dtype=np.float64)
+        self._sample_price_levels = np.empty(INITIAL_SAMPLES_CAPACITY, dtype=np.float64)
+        self._sample_amounts = np.empty(INITIAL_SAMPLES_CAPACITY, dtype=np.float64)
+        self._samples_count = 0
+        self._trade_samples_count = 0
+        self._estimate_pending = False
+        self._fit_in_background = fit_in_background
+        self._fit_future = None
 
         warnings.simplefilter("ignore", OptimizeWarning)
 
@@ -48,12 +93,12 @@ cdef class TradingIntensityIndicator:
 
     @property
     def is_sampling_buffer_full(self) -> bool:
-        return len(self._trade_samples.keys()) == self._sampling_length
+        return self._trade_samples_count == self._sampling_length
 
     @property
     def is_sampling_buffer_changed(self) -> bool:
-        is_changed = self._samples_length != len(self._trade_samples.keys())
-        self._samples_length = len(self._trade_samples.keys())
+        is_changed = self._samples_length != self._trade_samples_count
+        self._samples_length = self._trade_samples_count
         return is_changed
 
     @property
@@ -63,16 +108,20 @@ cdef class TradingIntensityIndicator:
     @sampling_length.setter
     def sampling_length(self, new_len: int):
         self._sampling_length = new_len
+        self.c_trim_trade_samples()
 
     @property
     def last_quotes(self) -> list:
         """A helper method to be used in unit tests"""
-        return self._last_quotes
+        return [{"timestamp": self._quote_timestamps[i], "price": self._quote_prices[i]}
+                for i in range(self._quotes_count - 1, -1, -1)]
 
     @last_quotes.setter
     def last_quotes(self, value):
         """A helper method to be used in unit tests"""
-        self._last_quotes = value
+        self._quotes_count = 0
+        for quote in reversed(value[:MAX_QUOTES]):
+            self.c_add_quote(quote["timestamp"], float(quote["price"]))
 
     def calculate(self, timestamp):
         """A helper method to be used in unit tests"""
@@ -80,41 +129,90 @@ cdef class TradingIntensityIndicator:
 
     cdef c_calculate(self, timestamp):
         price = self._price_delegate.get_price_by_type(PriceType.MidPrice)
-        # Descending order of price-timestamp quotes
-        self._last_quotes = [{'timestamp': timestamp, 'price': price}] + self._last_quotes
+        self.c_add_quote(timestamp, float(price))
 
-        latest_processed_quote_idx = None
-        for trade in self._current_trade_sample:
-            for i, quote in enumerate(self._last_quotes):
-                if quote["timestamp"] < trade.timestamp:
-                    if latest_processed_quote_idx is None or i < latest_processed_quote_idx:
-                        latest_processed_quote_idx = i
-                    trade = {"price_level": abs(trade.price - float(quote["price"])), "amount": trade.amount}
+        if len(self._current_trade_sample) > 0:
+            self.c_process_trades()
 
-                    if quote["timestamp"] + 1 not in self._trade_samples.keys():
-                        self._trade_samples[quote["timestamp"] + 1] = []
+        if self._fit_future is not None and self._fit_future.done():
+            result = self._fit_future.result()
+            self._fit_future = None
+            if result is not None:
+                self._alpha, self._kappa = result
 
-                    self._trade_samples[quote["timestamp"] + 1] += [trade]
-                    break
+        # The intensity only changes when new trade samples arrive
+        if self.is_sampling_buffer_full and self._estimate_pending and self._fit_future is None:
+            self.c_estimate_intensity()
 
-        # THere are no trades left to process
+    cdef c_add_quote(self, double timestamp, double price):
+        if self._quotes_count == MAX_QUOTES:
+            # Keep the most recent half of the quotes
+            self._quote_timestamps[:MAX_QUOTES // 2] = self._quote_timestamps[MAX_QUOTES - MAX_QUOTES // 2:]
+            self._quote_prices[:MAX_QUOTES // 2] = self._quote_prices[MAX_QUOTES - MAX_QUOTES // 2:]
+            self._quotes_count = MAX_QUOTES // 2
+        self._quote_timestamps[self._quotes_count] = timestamp
+        self._quote_prices[self._quotes_count] = price
+        self._quotes_count += 1
+
+    cdef c_process_trades(self):
+        cdef:
+            int64_t matches_count
+            int64_t new_samples_count
+
+        trade_timestamps = np.array([trade.timestamp for trade in self._current_trade_sample], dtype=np.float64)
+        trade_prices = np.array([float(trade.price) for trade in self._current_trade_sample], dtype=np.float64)
+        trade_amounts = np.array([float(trade.amount) for trade in self._current_trade_sample], dtype=np.float64)
+        # There are no trades left to process
         self._current_trade_sample = []
-        # Store quotes that happened after the latest trade + one before
-        if latest_processed_quote_idx is not None:
-            self._last_quotes = self._last_quotes[0:latest_processed_quote_idx + 1]
 
-        if len(self._trade_samples.keys()) > self._sampling_length:
-            timestamps = list(self._trade_samples.keys())
-            timestamps.sort()
-            timestamps = timestamps[-self._sampling_length:]
+        # Each trade is matched with the last quote that happened before it
+        quote_timestamps = self._quote_timestamps[:self._quotes_count]
+        quote_indexes = np.searchsorted(quote_timestamps, trade_timestamps, side="left") - 1
+        matched = quote_indexes >= 0
+        quote_indexes = quote_indexes[matched]
+        matches_count = quote_indexes.size
+        if matches_count == 0:
+            return
+
+        new_samples_count = self._samples_count + matches_count
+        if new_samples_count > self._sample_timestamps.size:
+            capacity = max(new_samples_count, 2 * self._sample_timestamps.size)
+            self._sample_timestamps = np.resize(self._sample_timestamps, capacity)
+            self._sample_price_levels = np.resize(self._sample_price_levels, capacity)
+            self._sample_amounts = np.resize(self._sample_amounts, capacity)
+        self._sample_timestamps[self._samples_count:new_samples_count] = quote_timestamps[quote_indexes] + 1
+        self._sample_price_levels[self._samples_count:new_samples_count] = np.abs(
+            trade_prices[matched] - self._quote_prices[quote_indexes])
+        self._sample_amounts[self._samples_count:new_samples_count] = trade_amounts[matched]
+        self._samples_count = new_samples_count
+        self._estimate_pending = True
 
-            trade_samples = {}
-            for timestamp in timestamps:
-                trade_samples[timestamp] = self._trade_samples[timestamp]
-            self._trade_samples = trade_samples
+        # Store quotes that happened after the latest trade + one before
+        first_quote_index = quote_indexes.max()
+        self._quote_timestamps[:self._quotes_count - first_quote_index] = quote_timestamps[first_quote_index:]
+        self._quote_prices[:self._quotes_count - first_quote_index] = self._quote_prices[first_quote_index:self._quotes_count]
+        self._quotes_count -= first_quote_index
 
-        if self.is_sampling_buffer_full:
-            self.c_estimate_intensity()
+        self.c_trim_trade_samples()
+
+    cdef c_trim_trade_samples(self):
+        cdef:
+            int64_t kept_samples_count
+
+        sample_timestamps = np.unique(self._sample_timestamps[:self._samples_count])
+        self._trade_samples_count = sample_timestamps.size
+        if self._trade_samples_count <= self._sampling_length:
+            return
+
+        # Keep the samples of the last sampling_length timestamps
+        kept = self._sample_timestamps[:self._samples_count] >= sample_timestamps[-self._sampling_length]
+        kept_samples_count = np.count_nonzero(kept)
+        self._sample_timestamps[:kept_samples_count] = self._sample_timestamps[:self._samples_count][kept]
+        self._sample_price_levels[:kept_samples_count] = self._sample_price_levels[:self._samples_count][kept]
+        self._sample_amounts[:kept_samples_count] = self._sample_amounts[:self._samples_count][kept]
+        self._samples_count = kept_samples_count
+        self._trade_samples_count = self._sampling_length
+        self._estimate_pending = True
 
     def register_trade(self, trade):
         """A helper method to be used in unit tests"""
@@ -124,43 +222,20 @@ cdef class TradingIntensityIndicator:
         self._current_trade_sample.append(trade)
 
     cdef c_estimate_intensity(self):
-        cdef:
-            dict trades_consolidated
-            list lambdas
-            list price_levels
-
-        # Calculate lambdas / trading intensities
-        lambdas = []
-
-        trades_consolidated = {}
-        price_levels = []
-        for timestamp in self._trade_samples.keys():
-            tick = self._trade_samples[timestamp]
-            for trade in tick:
-                if trade['price_level'] not in trades_consolidated.keys():
-                    trades_consolidated[trade['price_level']] = 0
-                    price_levels += [trade['price_level']]
-
-                trades_consolidated[trade['price_level']] += trade['amount']
-
-        price_levels = sorted(price_levels, reverse=True)
-
-        for price_level in price_levels:
-            lambdas += [trades_consolidated[price_level]]
+        # Calculate lambdas / trading intensities, the traded amount per price level in descending price level order
+        price_levels, level_indexes = np.unique(self._sample_price_levels[:self._samples_count], return_inverse=True)
+        lambdas = np.bincount(level_indexes, weights=self._sample_amounts[:self._samples_count])
+        price_levels = price_levels[::-1]
+        lambdas = lambdas[::-1]
 
         # Adjust to be able to calculate log
-        lambdas_adj = [10**-10 if x==0 else x for x in lambdas]
+        lambdas[lambdas == 0] = 10**-10
 
         # Fit the probability density function; reuse previously calculated parameters as initial values
-        try:
-            params = curve_fit(lambda t, a, b: a*np.exp(-b*t),
-                               price_levels,
-                               lambdas_adj,
-                               p0=(self._alpha, self._kappa),
-                               method='dogbox',
-                               bounds=([0, 0], [np.inf, np.inf]))
-
-            self._kappa = Decimal(str(params[0][1]))
-            self._alpha = Decimal(str(params[0][0]))
-        except (RuntimeError, ValueError) as e:
-            pass
+        self._estimate_pending = False
+        if self._fit_in_background:
+            self._fit_future = get_executor().submit(fit_intensity, price_levels, lambdas, self._alpha, self._kappa)
+        else:
+            result = fit_intensity(price_levels, lambdas, self._alpha, self._kappa)
+            if result is not None:
+                self._alpha, self._kappa = result
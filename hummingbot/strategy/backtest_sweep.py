@@ -0,0 +1,461 @@
+import asyncio
+import itertools
+import logging
+import os
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Type, Union
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import (
+    ClientConfigAdapter,
+    get_strategy_starter_file,
+    load_strategy_config_map_from_file,
+    parse_cvar_value,
+    strategy_name_from_file,
+)
+from hummingbot.client.config.config_var import ConfigVar
+from hummingbot.connector.exchange.paper_trade.replay_data import (
+    ReplayEvent,
+    candles_events,
+    market_data_records_events,
+    merge_replay_events,
+    read_candles_csv,
+)
+from hummingbot.connector.exchange.paper_trade.replay_exchange import ReplayExchange
+from hummingbot.connector.utils import split_hb_trading_pair
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.data_type.common import PriceType, TradeType
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import MarketEvent, OrderFilledEvent
+from hummingbot.core.utils.columnar_market_data import ColumnarMarketDataReader
+from hummingbot.logger import HummingbotLogger
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
+from hummingbot.strategy.strategy_base import StrategyBase
+
+s_decimal_0 = Decimal("0")
+PAPER_TRADE_SUFFIX = "_paper_trade"
+
+# Records of the datasets memory mapped by the current process, by file path
+_dataset_records: Dict[str, np.ndarray] = {}
+
+
+class BacktestDataset(NamedTuple):
+    """
+    Historical data of one trading pair, saved as a numpy file. The file is memory mapped once by each process of a
+    sweep, so all the workers share the same pages of the dataset.
+    Candles datasets hold `CANDLES_DTYPE` records, order book datasets hold the `market_data_dtype` records of the
+    columnar market data recorder.
+    """
+    file_path: str
+    trading_pair: str
+
+    @classmethod
+    def from_candles_csv(cls, csv_path: str, trading_pair: str, output_dir: str) -> "BacktestDataset":
+        """
+        Creates a dataset from a candles CSV file, like the ones saved by `scripts/download_candles.py`
+        """
+        return cls._save(read_candles_csv(csv_path), trading_pair, output_dir)
+
+    @classmethod
+    def from_columnar_market_data(cls,
+                                  data_dir: str,
+                                  exchange: str,
+                                  trading_pair: str,
+                                  output_dir: str,
+                                  start_timestamp: Optional[int] = None,
+                                  end_timestamp: Optional[int] = None) -> "BacktestDataset":
+        """
+        Creates a dataset from the order book snapshots saved by the columnar market data recorder
+
+        :param start_timestamp: first timestamp in milliseconds to include, from the beginning if None
+        :param end_timestamp: last timestamp in milliseconds to include, until the end if None
+        """
+        records = ColumnarMarketDataReader(data_dir).read(exchange, trading_pair, start_timestamp, end_timestamp)
+        return cls._save(records, trading_pair, output_dir)
+
+    @classmethod
+    def _save(cls, records: np.ndarray, trading_pair: str, output_dir: str) -> "BacktestDataset":
+        if len(records) == 0:
+            raise ValueError(f"No historical data for {trading_pair}.")
+        file_path = os.path.join(output_dir, f"{trading_pair}_{len(records)}_{int(records['timestamp'][0])}.npy")
+        np.save(file_path, records)
+        return cls(file_path=file_path, trading_pair=trading_pair)
+
+    @property
+    def records(self) -> np.ndarray:
+        records = _dataset_records.get(self.file_path)
+        if records is None:
+            records = np.load(self.file_path, mmap_mode="r")
+            _dataset_records[self.file_path] = records
+        return records
+
+    @property
+    def is_candles(self) -> bool:
+        return "open" in self.records.dtype.names
+
+    def time_range(self) -> Tuple[float, float]:
+        """
+        :return: the first and last timestamps of the dataset in seconds, the last candle is included until its close
+        """
+        timestamps = self.records["timestamp"]
+        if not self.is_candles:
+            return timestamps[0] * 1e-3, timestamps[-1] * 1e-3
+        interval = timestamps[-1] - timestamps[-2] if len(timestamps) > 1 else 60.0
+        return float(timestamps[0]), float(timestamps[-1] + interval)
+
+    def events(self) -> Iterator[ReplayEvent]:
+        if self.is_candles:
+            return candles_events(self.records, self.trading_pair)
+        return market_data_records_events(self.records, self.trading_pair)
+
+
+class BacktestContext:
+    """
+    Stands in for HummingbotApplication while a strategy is created and run on historical data. It provides the
+    attributes and methods the strategies `start` functions use, and creates a ReplayExchange for every connector.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self,
+                 client_config_map: ClientConfigAdapter,
+                 datasets: Sequence[BacktestDataset],
+                 balances: Dict[str, Decimal],
+                 strategy_file_name: Optional[str] = None,
+                 strategy_config_map: Optional[Union[ClientConfigAdapter, Dict[str, ConfigVar]]] = None):
+        self.client_config_map = client_config_map
+        self.strategy_file_name = strategy_file_name
+        self.strategy_config_map = strategy_config_map
+        self.markets: Dict[str, ReplayExchange] = {}
+        self.market_trading_pair_tuples: List[MarketTradingPairTuple] = []
+        self.strategy: Optional[StrategyBase] = None
+        self.trade_fill_db = None
+        self.notifications: List[str] = []
+        self._datasets: Dict[str, BacktestDataset] = {dataset.trading_pair: dataset for dataset in datasets}
+        self._balances = balances
+
+    @staticmethod
+    def _initialize_market_assets(market_name: str, trading_pairs: List[str]) -> List[Tuple[str, str]]:
+        return [split_hb_trading_pair(trading_pair) for trading_pair in trading_pairs]
+
+    def _initialize_markets(self, market_names: List[Tuple[str, List[str]]]):
+        for connector_name, trading_pairs in market_names:
+            missing_pairs = [trading_pair for trading_pair in trading_pairs if trading_pair not in self._datasets]
+            if len(missing_pairs) > 0:
+                raise ValueError(f"No historical data for {', '.join(missing_pairs)} on {connector_name}.")
+            # Like the paper trade markets, the replayed market uses the name and trading fees of the exchange
+            exchange_name = connector_name
+            if connector_name.endswith(PAPER_TRADE_SUFFIX):
+                exchange_name = connector_name[:-len(PAPER_TRADE_SUFFIX)]
+            market = ReplayExchange(
+                self.client_config_map,
+                trading_pairs=trading_pairs,
+                events=merge_replay_events(*(self._datasets[trading_pair].events() for trading_pair in trading_pairs)),
+                exchange_name=exchange_name,
+            )
+            for asset, balance in self._balances.items():
+                market.set_balance(asset, balance)
+            self.markets[connector_name] = market
+
+    def notify(self, msg: str):
+        self.notifications.append(msg)
+
+
+class StrategyTemplate(ABC):
+    """
+    Creates the strategy of every backtest of a sweep, with the parameters of the run
+    """
+
+    @abstractmethod
+    def create_strategy(self, context: BacktestContext, params: Dict[str, Any]) -> StrategyBase:
+        ...
+
+
+class ConfigFileStrategyTemplate(StrategyTemplate):
+    """
+    Creates the strategy from a strategy config file (e.g. a pure market making or Avellaneda config), with the same
+    `start` function the client uses. The parameters of the run override the config values, nested values of the
+    pydantic configs are set with dotted names, e.g. `order_levels_mode.order_levels`.
+    """
+
+    def __init__(self, config_file_path: Union[str, Path]):
+        self.config_file_path = Path(config_file_path)
+        self._config_map: Optional[Union[ClientConfigAdapter, Dict[str, ConfigVar]]] = None
+
+    def __getstate__(self):
+        # The loaded config map is not sent to the workers, each of them loads the config file
+        return {"config_file_path": self.config_file_path, "_config_map": None}
+
+    def create_strategy(self, context: BacktestContext, params: Dict[str, Any]) -> StrategyBase:
+        config_map = self._load_config_map()
+        for key, value in params.items():
+            if isinstance(config_map, dict):
+                config_var = config_map[key]
+                config_var.value = parse_cvar_value(config_var, value)
+            else:
+                *parents, name = key.split(".")
+                target = config_map
+                for parent in parents:
+                    target = getattr(target, parent)
+                setattr(target, name, value)
+        context.strategy_file_name = self.config_file_path.name
+        context.strategy_config_map = config_map
+        get_strategy_starter_file(strategy_name_from_file(self.config_file_path))(context)
+        if context.strategy is None:
+            raise ValueError(f"Could not create the strategy of {self.config_file_path.name}: "
+                             f"{' '.join(context.notifications)}")
+        return context.strategy
+
+    def _load_config_map(self) -> Union[ClientConfigAdapter, Dict[str, ConfigVar]]:
+        if self._config_map is None:
+            loop = asyncio.new_event_loop()
+            try:
+                self._config_map = loop.run_until_complete(load_strategy_config_map_from_file(self.config_file_path))
+            finally:
+                loop.close()
+        return self._config_map
+
+
+class ScriptStrategyTemplate(StrategyTemplate):
+    """
+    Creates a script strategy. The parameters of the run override the class attributes of the script, string values
+    are converted to the type of the attribute they override.
+    """
+
+    def __init__(self, script_class: Type[ScriptStrategyBase]):
+        self.script_class = script_class
+
+    def create_strategy(self, context: BacktestContext, params: Dict[str, Any]) -> StrategyBase:
+        attributes = {key: self._attribute_value(key, value) for key, value in params.items()}
+        script_class = type(self.script_class.__name__, (self.script_class,), attributes)
+        context._initialize_markets([(connector_name, list(trading_pairs))
+                                     for connector_name, trading_pairs in script_class.markets.items()])
+        context.strategy = script_class(context.markets)
+        return context.strategy
+
+    def _attribute_value(self, key: str, value: Any) -> Any:
+        if not hasattr(self.script_class, key):
+            raise ValueError(f"{self.script_class.__name__} has no attribute {key}.")
+        current_value = getattr(self.script_class, key)
+        if not isinstance(value, str) or isinstance(current_value, str) or current_value is None:
+            return value
+        if isinstance(current_value, bool):
+            return value.lower() in ("true", "yes", "y", "1")
+        return type(current_value)(value)
+
+
+class BacktestSweep:
+    """
+    Runs a strategy on historical data once for every combination of a parameter grid. The runs are spread over a
+    process pool, each run has its own ReplayExchange and Clock in backtest mode, and the datasets are memory mapped
+    once per worker.
+
+    Usage:
+        dataset = BacktestDataset.from_candles_csv("data/candles_binance_BTC-USDT_1m.csv", "BTC-USDT", temp_dir)
+        sweep = BacktestSweep(template=ConfigFileStrategyTemplate("conf/strategies/conf_pure_mm_1.yml"),
+                              datasets=[dataset],
+                              parameter_grid={"bid_spread": [0.1, 0.2], "order_refresh_time": [10, 30]},
+                              balances={"BTC": Decimal("1"), "USDT": Decimal("20000")})
+        results = sweep.run()
+    """
+
+    def __init__(self,
+                 template: StrategyTemplate,
+                 datasets: Sequence[BacktestDataset],
+                 parameter_grid: Dict[str, Sequence[Any]],
+                 balances: Optional[Dict[str, Decimal]] = None,
+                 tick_size: float = 1.0,
+                 start_timestamp: Optional[float] = None,
+                 end_timestamp: Optional[float] = None,
+                 max_workers: Optional[int] = None,
+                 log_level: int = logging.WARNING):
+        """
+        :param datasets: the historical data of the traded pairs
+        :param parameter_grid: the values of each parameter, every combination of them is backtested
+        :param balances: the initial balances of every exchange, the paper trade account balance by default
+        :param tick_size: the clock tick size in seconds
+        :param start_timestamp: the backtests start time in seconds, the beginning of the datasets by default
+        :param end_timestamp: the backtests end time in seconds, the end of the datasets by default
+        :param max_workers: number of worker processes, the number of CPUs by default
+        :param log_level: level of the hummingbot logs during the runs, the strategies log every order at INFO level
+        """
+        self._template = template
+        self._datasets = list(datasets)
+        self._parameter_grid = parameter_grid
+        self._balances = balances
+        self._tick_size = tick_size
+        self._start_timestamp = start_timestamp
+        self._end_timestamp = end_timestamp
+        self._max_workers = max_workers
+        self._log_level = log_level
+
+    @property
+    def parameter_sets(self) -> List[Dict[str, Any]]:
+        keys = list(self._parameter_grid.keys())
+        return [dict(zip(keys, values)) for values in itertools.product(*self._parameter_grid.values())]
+
+    def run(self) -> pd.DataFrame:
+        """
+        :return: one row per run and traded pair, with the run parameters and the PnL, fills and inventory stats
+        """
+        parameter_sets = self.parameter_sets
+        rows: List[Dict[str, Any]] = []
+        if self._max_workers == 1:
+            for params in parameter_sets:
+                rows.extend(self._run_one(params))
+        else:
+            with ProcessPoolExecutor(max_workers=self._max_workers,
+                                     initializer=_load_datasets,
+                                     initargs=(self._datasets,)) as executor:
+                for run_rows in executor.map(self._run_one, parameter_sets):
+                    rows.extend(run_rows)
+        return pd.DataFrame(rows)
+
+    def _run_one(self, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        try:
+            return run_backtest(template=self._template,
+                                datasets=self._datasets,
+                                params=params,
+                                balances=self._balances,
+                                tick_size=self._tick_size,
+                                start_timestamp=self._start_timestamp,
+                                end_timestamp=self._end_timestamp,
+                                log_level=self._log_level)
+        except Exception as e:
+            BacktestContext.logger().error(f"Backtest with parameters {params} failed.", exc_info=True)
+            return [{**params, "error": str(e)}]
+
+
+def run_backtest(template: StrategyTemplate,
+                 datasets: Sequence[BacktestDataset],
+                 params: Dict[str, Any],
+                 balances: Optional[Dict[str, Decimal]] = None,
+                 tick_size: float = 1.0,
+                 start_timestamp: Optional[float] = None,
+                 end_timestamp: Optional[float] = None,
+                 log_level: int = logging.WARNING) -> List[Dict[str, Any]]:
+    """
+    Runs one backtest, see BacktestSweep.
+
+    :return: one result row per traded pair
+    """
+    client_config_map = ClientConfigAdapter(ClientConfigMap())
+    if balances is None:
+        balances = client_config_map.paper_trade.paper_trade_account_balance or {}
+    balances = {asset: Decimal(str(balance)) for asset, balance in balances.items()}
+    time_ranges = [dataset.time_range() for dataset in datasets]
+    start_timestamp = start_timestamp if start_timestamp is not None else min(start for start, _ in time_ranges)
+    end_timestamp = end_timestamp if end_timestamp is not None else max(end for _, end in time_ranges)
+
+    context = BacktestContext(client_config_map, datasets, balances)
+    with _main_application(context), _log_level(log_level):
+        strategy = template.create_strategy(context, params)
+        fill_loggers: Dict[str, EventLogger] = {}
+        clock = Clock(ClockMode.BACKTEST, tick_size, start_timestamp, end_timestamp)
+        for connector_name, market in context.markets.items():
+            fill_loggers[connector_name] = EventLogger()
+            market.add_listener(MarketEvent.OrderFilled, fill_loggers[connector_name])
+            clock.add_iterator(market)
+        clock.add_iterator(strategy)
+        clock.backtest()
+
+    rows = []
+    for connector_name, market in context.markets.items():
+        fills: List[OrderFilledEvent] = list(fill_loggers[connector_name].event_log)
+        for trading_pair in market.order_books:
+            pair_fills = [fill for fill in fills if fill.trading_pair == trading_pair]
+            rows.append({**params,
+                         "connector": connector_name,
+                         "trading_pair": trading_pair,
+                         **_performance_stats(market, trading_pair, pair_fills, balances)})
+    return rows
+
+
+def _performance_stats(market: ReplayExchange,
+                       trading_pair: str,
+                       fills: List[OrderFilledEvent],
+                       start_balances: Dict[str, Decimal]) -> Dict[str, Any]:
+    base, quote = split_hb_trading_pair(trading_pair)
+    price = market.get_price_by_type(trading_pair, PriceType.MidPrice)
+    base_balance = start_base_balance = start_balances.get(base, s_decimal_0)
+    min_base_balance = max_base_balance = base_balance
+    buys = sells = 0
+    base_volume = quote_volume = fees = s_decimal_0
+    for fill in fills:
+        if fill.trade_type == TradeType.BUY:
+            buys += 1
+            base_balance += fill.amount
+        else:
+            sells += 1
+            base_balance -= fill.amount
+        min_base_balance = min(min_base_balance, base_balance)
+        max_base_balance = max(max_base_balance, base_balance)
+        base_volume += fill.amount
+        quote_volume += fill.amount * fill.price
+        fees += fill.trade_fee.fee_amount_in_token(trading_pair, fill.price, fill.amount, token=quote, exchange=market)
+    end_base_balance = market.get_balance(base)
+    end_quote_balance = market.get_balance(quote)
+    hold_value = start_base_balance * price + start_balances.get(quote, s_decimal_0)
+    current_value = end_base_balance * price + end_quote_balance
+    pnl = current_value - hold_value
+    return {
+        "fills": len(fills),
+        "buys": buys,
+        "sells": sells,
+        "base_volume": float(base_volume),
+        "quote_volume": float(quote_volume),
+        "fees": float(fees),
+        "pnl": float(pnl),
+        "return_pct": float(pnl / hold_value * 100) if hold_value != s_decimal_0 else 0.0,
+        "end_price": float(price),
+        "start_base_balance": float(start_base_balance),
+        "end_base_balance": float(end_base_balance),
+        "min_base_balance": float(min_base_balance),
+        "max_base_balance": float(max_base_balance),
+        "end_quote_balance": float(end_quote_balance),
+        "end_base_pct": float(end_base_balance * price / current_value * 100) if current_value != s_decimal_0 else 0.0,
+    }
+
+
+def _load_datasets(datasets: Iterable[BacktestDataset]):
+    for dataset in datasets:
+        dataset.records  # memory maps the dataset file
+
+
+@contextmanager
+def _log_level(level: int):
+    logger = logging.getLogger("hummingbot")
+    previous_level = logger.level
+    logger.setLevel(level)
+    try:
+        yield
+    finally:
+        logger.setLevel(previous_level)
+
+
+@contextmanager
+def _main_application(context: BacktestContext):
+    """
+    The strategies notify and look up the main application, the backtest context stands in for it during the run
+    """
+    from hummingbot.client.hummingbot_application import HummingbotApplication
+
+    main_app = HummingbotApplication._main_app
+    HummingbotApplication._main_app = context
+    try:
+        yield
+    finally:
+        HummingbotApplication._main_app = main_app
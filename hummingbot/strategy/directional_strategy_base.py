@@ -1,7 +1,6 @@
 import datetime
-import os
 from decimal import Decimal
-from typing import Dict, List, Set
+from typing import Dict, List, Optional, Set, Tuple
 
 import pandas as pd
 import pandas_ta as ta  # noqa: F401
@@ -9,6 +8,7 @@ import pandas_ta as ta  # noqa: F401
 from hummingbot import data_path
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.core.data_type.common import OrderType, PositionAction, PositionMode, PositionSide, TradeType
+from hummingbot.core.utils.csv_sink import CSVSink
 from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
 from hummingbot.smart_components.position_executor.data_types import PositionConfig, TrailingStop
 from hummingbot.smart_components.position_executor.position_executor import PositionExecutor
@@ -75,6 +75,32 @@ class DirectionalStrategyBase(ScriptStrategyBase):
     order_amount_usd = Decimal("10")
     markets: Dict[str, Set[str]] = {}
 
+    executors_csv_header: Tuple[str, ...] = (
+        "timestamp",
+        "exchange",
+        "trading_pair",
+        "side",
+        "amount",
+        "trade_pnl",
+        "trade_pnl_quote",
+        "cum_fee_quote",
+        "net_pnl_quote",
+        "net_pnl",
+        "close_timestamp",
+        "executor_status",
+        "close_type",
+        "entry_price",
+        "close_price",
+        "sl",
+        "tp",
+        "tl",
+        "open_order_type",
+        "take_profit_order_type",
+        "stop_loss_order_type",
+        "time_limit_order_type",
+        "leverage",
+    )
+
     @property
     def all_candles_ready(self):
         """
@@ -97,6 +123,7 @@ class DirectionalStrategyBase(ScriptStrategyBase):
     def __init__(self, connectors: Dict[str, ConnectorBase]):
         # Is necessary to start the Candles Feed.
         super().__init__(connectors)
+        self._executors_csv_sink: Optional[CSVSink] = None
         for candle in self.candles:
             candle.start()
 
@@ -118,6 +145,8 @@ class DirectionalStrategyBase(ScriptStrategyBase):
             self.close_open_positions()
         for candle in self.candles:
             candle.stop()
+        if self._executors_csv_sink is not None:
+            self._executors_csv_sink.close()
 
     def get_active_executors(self):
         return [signal_executor for signal_executor in self.active_executors
@@ -213,58 +242,36 @@ class DirectionalStrategyBase(ScriptStrategyBase):
     def clean_and_store_executors(self):
         executors_to_store = [executor for executor in self.active_executors if executor.is_closed]
         csv_path = self.get_csv_path()
-        if not os.path.exists(csv_path):
-            df_header = pd.DataFrame([("timestamp",
-                                       "exchange",
-                                       "trading_pair",
-                                       "side",
-                                       "amount",
-                                       "trade_pnl",
-                                       "trade_pnl_quote",
-                                       "cum_fee_quote",
-                                       "net_pnl_quote",
-                                       "net_pnl",
-                                       "close_timestamp",
-                                       "executor_status",
-                                       "close_type",
-                                       "entry_price",
-                                       "close_price",
-                                       "sl",
-                                       "tp",
-                                       "tl",
-                                       "open_order_type",
-                                       "take_profit_order_type",
-                                       "stop_loss_order_type",
-                                       "time_limit_order_type",
-                                       "leverage"
-                                       )])
-            df_header.to_csv(csv_path, mode='a', header=False, index=False)
+        if self._executors_csv_sink is None:
+            self._executors_csv_sink = CSVSink(file_path=csv_path, header=self.executors_csv_header)
+        else:
+            # The file name changes every day
+            self._executors_csv_sink.rotate(csv_path)
         for executor in executors_to_store:
             self.stored_executors.append(executor)
-            df = pd.DataFrame([(executor.position_config.timestamp,
-                                executor.exchange,
-                                executor.trading_pair,
-                                executor.side,
-                                executor.amount,
-                                executor.trade_pnl,
-                                executor.trade_pnl_quote,
-                                executor.cum_fee_quote,
-                                executor.net_pnl_quote,
-                                executor.net_pnl,
-                                executor.close_timestamp,
-                                executor.executor_status,
-                                executor.close_type,
-                                executor.entry_price,
-                                executor.close_price,
-                                executor.position_config.stop_loss,
-                                executor.position_config.take_profit,
-                                executor.position_config.time_limit,
-                                executor.open_order_type,
-                                executor.take_profit_order_type,
-                                executor.stop_loss_order_type,
-                                executor.time_limit_order_type,
-                                self.leverage)])
-            df.to_csv(self.get_csv_path(), mode='a', header=False, index=False)
+            self._executors_csv_sink.write_row((executor.position_config.timestamp,
+                                                executor.exchange,
+                                                executor.trading_pair,
+                                                executor.side,
+                                                executor.amount,
+                                                executor.trade_pnl,
+                                                executor.trade_pnl_quote,
+                                                executor.cum_fee_quote,
+                                                executor.net_pnl_quote,
+                                                executor.net_pnl,
+                                                executor.close_timestamp,
+                                                executor.executor_status,
+                                                executor.close_type,
+                                                executor.entry_price,
+                                                executor.close_price,
+                                                executor.position_config.stop_loss,
+                                                executor.position_config.take_profit,
+                                                executor.position_config.time_limit,
+                                                executor.open_order_type,
+                                                executor.take_profit_order_type,
+                                                executor.stop_loss_order_type,
+                                                executor.time_limit_order_type,
+                                                self.leverage))
         self.active_executors = [executor for executor in self.active_executors if not executor.is_closed]
 
     def close_open_positions(self):
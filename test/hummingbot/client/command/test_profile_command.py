@@ -0,0 +1,69 @@
+import asyncio
+import unittest
+from test.mock.mock_cli import CLIMockingAssistant
+from typing import Awaitable
+from unittest.mock import MagicMock, patch
+
+from hummingbot.client.config.config_helpers import read_system_configs_from_yml
+from hummingbot.client.hummingbot_application import HummingbotApplication
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.time_iterator import TimeIterator
+
+
+class ProfileCommandTests(unittest.TestCase):
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher")
+    def setUp(self, _: MagicMock) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+
+        self.async_run_with_timeout(read_system_configs_from_yml())
+
+        self.app = HummingbotApplication()
+        self.cli_mock_assistant = CLIMockingAssistant(self.app.app)
+        self.cli_mock_assistant.start()
+
+    def tearDown(self) -> None:
+        if self.app.clock_profiler is not None:
+            self.app.clock_profiler.stop()
+        self.cli_mock_assistant.stop()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def test_profile_not_running(self):
+        self.app.profile()
+
+        self.assertTrue(self.cli_mock_assistant.check_log_called_with(
+            msg="Tick profiling is not running. Run `profile start` to time the clock ticks."))
+
+    def test_start_and_stop_profiling_running_clock(self):
+        self.app.clock = Clock(ClockMode.BACKTEST, start_time=0, end_time=10)
+
+        self.app.profile("start")
+
+        self.assertIsNotNone(self.app.clock_profiler)
+        self.assertIs(self.app.clock_profiler, self.app.clock.profiler)
+        self.assertTrue(self.app.clock_profiler.started)
+
+        profiler = self.app.clock_profiler
+        self.app.profile("stop")
+
+        self.assertIsNone(self.app.clock_profiler)
+        self.assertIsNone(self.app.clock.profiler)
+        self.assertFalse(profiler.started)
+        self.assertTrue(self.cli_mock_assistant.check_log_called_with(msg="Tick profiling stopped."))
+
+    def test_show_profile(self):
+        self.app.clock = Clock(ClockMode.BACKTEST, start_time=0, end_time=10)
+        self.app.clock.add_iterator(TimeIterator())
+        self.app.profile("start")
+        self.app.clock.backtest()
+
+        self.app.profile()
+
+        report = self.cli_mock_assistant._log_calls[-1]
+        self.assertIn("Tick duration by time iterator:", report)
+        self.assertIn("TimeIterator", report)
+        self.assertIn("Event loop", report)
@@ -0,0 +1,149 @@
+import importlib
+import os
+import tempfile
+import unittest
+from decimal import Decimal
+from unittest.mock import patch
+
+from hummingbot.client.connector_manifest import ConnectorManifest, trade_fee_schema_from_json, trade_fee_schema_to_json
+from hummingbot.client.settings import (
+    AllConnectorSettings,
+    ConnectorConfigKeysLoader,
+    ConnectorType,
+    ManifestConnectorSetting,
+)
+from hummingbot.connector.exchange.binance.binance_utils import KEYS, OTHER_DOMAINS_KEYS
+from hummingbot.core.data_type.trade_fee import TokenAmount, TradeFeeSchema
+
+
+class ConnectorManifestTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.manifest_path = os.path.join(self.temp_dir.name, "connector_manifest.json")
+        self.utils_file_path = os.path.join(self.temp_dir.name, "test_utils.py")
+        with open(self.utils_file_path, "w") as utils_file:
+            utils_file.write("KEYS = None\n")
+        self.previous_settings = AllConnectorSettings.all_connector_settings
+
+    def tearDown(self) -> None:
+        AllConnectorSettings.all_connector_settings = self.previous_settings
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def test_load_returns_saved_entries_for_same_fingerprint(self):
+        manifest = ConnectorManifest(file_path=self.manifest_path)
+        fingerprint = manifest.fingerprint([self.utils_file_path])
+        manifest.save(fingerprint, [{"name": "test"}], ["skipped"])
+
+        self.assertEqual(([{"name": "test"}], ["skipped"]), manifest.load(fingerprint))
+
+    def test_load_ignores_manifest_when_utils_files_change(self):
+        manifest = ConnectorManifest(file_path=self.manifest_path)
+        fingerprint = manifest.fingerprint([self.utils_file_path])
+        manifest.save(fingerprint, [{"name": "test"}], [])
+
+        with open(self.utils_file_path, "a") as utils_file:
+            utils_file.write("EXAMPLE_PAIR = 'BTC-USDT'\n")
+        new_fingerprint = manifest.fingerprint([self.utils_file_path])
+
+        self.assertNotEqual(fingerprint, new_fingerprint)
+        self.assertIsNone(manifest.load(new_fingerprint))
+
+    def test_load_ignores_missing_and_invalid_manifest(self):
+        manifest = ConnectorManifest(file_path=self.manifest_path)
+        self.assertIsNone(manifest.load("fingerprint"))
+
+        with open(self.manifest_path, "w") as manifest_file:
+            manifest_file.write("invalid")
+        self.assertIsNone(manifest.load("fingerprint"))
+
+    def test_trade_fee_schema_json_round_trip(self):
+        trade_fee_schema = TradeFeeSchema(
+            percent_fee_token="BNB",
+            maker_percent_fee_decimal=Decimal("0.00075"),
+            taker_percent_fee_decimal=Decimal("0.001"),
+            maker_fixed_fees=[TokenAmount("ETH", Decimal("0.01"))],
+            taker_fixed_fees=[TokenAmount("ETH", Decimal("0.02"))],
+        )
+
+        self.assertEqual(trade_fee_schema, trade_fee_schema_from_json(trade_fee_schema_to_json(trade_fee_schema)))
+
+    @patch("hummingbot.client.settings.ConnectorManifest")
+    def test_connector_settings_built_from_manifest_load_config_keys_lazily(self, manifest_class_mock):
+        manifest_class_mock.side_effect = lambda: ConnectorManifest(file_path=self.manifest_path)
+        manifest_class_mock.fingerprint = ConnectorManifest.fingerprint
+        cold_settings = dict(AllConnectorSettings.create_connector_settings())
+        self.assertTrue(os.path.exists(self.manifest_path))
+
+        with patch("hummingbot.client.settings.importlib.import_module") as import_module_mock:
+            warm_settings = AllConnectorSettings.create_connector_settings()
+            import_module_mock.assert_not_called()
+
+        self.assertEqual(cold_settings.keys(), warm_settings.keys())
+        binance_settings = warm_settings["binance"]
+        self.assertIsInstance(binance_settings, ManifestConnectorSetting)
+        self.assertEqual(cold_settings["binance"].trade_fee_schema, binance_settings.trade_fee_schema)
+        self.assertEqual(cold_settings["binance_us"].example_pair, warm_settings["binance_us"].example_pair)
+        self.assertTrue(warm_settings["binance_us"].is_sub_domain)
+        self.assertEqual("binance", warm_settings["binance_us"].parent_name)
+        self.assertIs(KEYS, binance_settings.config_keys)
+        self.assertIs(OTHER_DOMAINS_KEYS["binance_us"], warm_settings["binance_us"].config_keys)
+
+    @patch("hummingbot.client.settings.ConnectorManifest")
+    def test_connector_skipped_for_missing_dependency_is_added_once_importable(self, manifest_class_mock):
+        manifest_class_mock.side_effect = lambda: ConnectorManifest(file_path=self.manifest_path)
+        manifest_class_mock.fingerprint = ConnectorManifest.fingerprint
+        binance_utils_module = "hummingbot.connector.exchange.binance.binance_utils"
+        import_module = importlib.import_module
+
+        def import_module_without_binance(module_name: str):
+            if module_name == binance_utils_module:
+                raise ModuleNotFoundError("No module named 'binance_dependency'")
+            return import_module(module_name)
+
+        with patch("hummingbot.client.settings.importlib.import_module") as import_module_mock:
+            import_module_mock.side_effect = import_module_without_binance
+            cold_settings = dict(AllConnectorSettings.create_connector_settings())
+            self.assertNotIn("binance", cold_settings)
+
+            # Only the skipped connector is imported again while its dependency is still missing
+            import_module_mock.reset_mock()
+            warm_settings = dict(AllConnectorSettings.create_connector_settings())
+            import_module_mock.assert_called_once_with(binance_utils_module)
+            self.assertEqual(cold_settings.keys(), warm_settings.keys())
+
+        installed_settings = AllConnectorSettings.create_connector_settings()
+
+        self.assertIn("binance", installed_settings)
+        self.assertIn("binance_us", installed_settings)
+        manifest_entries, skipped_connectors = ConnectorManifest(file_path=self.manifest_path).load(
+            ConnectorManifest.fingerprint([file_path for _, _, file_path in AllConnectorSettings._connector_utils_files()])
+        )
+        self.assertIn("binance", [entry["name"] for entry in manifest_entries])
+        self.assertNotIn("binance", skipped_connectors)
+
+    def test_paper_trade_settings_keep_lazy_config_keys(self):
+        binance_settings = ManifestConnectorSetting(
+            name="binance",
+            type=ConnectorType.Exchange,
+            example_pair="BTC-USDT",
+            centralised=True,
+            use_ethereum_wallet=False,
+            trade_fee_schema=TradeFeeSchema(),
+            config_keys=ConnectorConfigKeysLoader(
+                utils_module="hummingbot.connector.exchange.binance.binance_utils", domain=None
+            ),
+            is_sub_domain=False,
+            parent_name=None,
+            domain_parameter=None,
+            use_eth_gas_lookup=False,
+        )
+        AllConnectorSettings.all_connector_settings = {"binance": binance_settings}
+
+        AllConnectorSettings.initialize_paper_trade_settings(["binance"])
+
+        paper_trade_settings = AllConnectorSettings.all_connector_settings["binance_paper_trade"]
+        self.assertIsInstance(paper_trade_settings, ManifestConnectorSetting)
+        self.assertEqual("binance", paper_trade_settings.parent_name)
+        self.assertIs(KEYS, paper_trade_settings.config_keys)
@@ -1,14 +1,16 @@
 import asyncio
+import threading
 import time
 import unittest
 from decimal import Decimal
 from typing import Awaitable
 from unittest.mock import MagicMock, patch
 
-from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.client.performance import PerformanceAccumulator, PerformanceMetrics, TradesPerformanceTracker
 from hummingbot.core.data_type.common import OrderType, PositionAction, TradeType
 from hummingbot.core.data_type.trade import Trade
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, DeductedFromReturnsTradeFee, TokenAmount
+from hummingbot.core.event.events import MarketEvent, OrderFilledEvent
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.model.order import Order  # noqa — Order needs to be defined for TradeFill
 from hummingbot.model.order_status import OrderStatus  # noqa — Order needs to be defined for TradeFill
@@ -341,3 +343,126 @@ class PerformanceMetricsUnitTest(unittest.TestCase):
         performance_metric = PerformanceMetrics()
         returned_impact = performance_metric._process_deducted_fees_impact_in_quote_vol(dummy_trade)
         self.assertEqual(returned_impact, Decimal("-100.0"))
+
+    def trade_fill(self, order_id, trade_type, price, amount, position=PositionAction.NIL.value, trade_fee=None):
+        trade_fee = trade_fee or AddedToCostTradeFee(flat_fees=[TokenAmount(quote, Decimal("0"))])
+        return TradeFill(
+            config_file_path="some-strategy.yml",
+            strategy="pure_market_making",
+            market="binance",
+            symbol=trading_pair,
+            base_asset=base,
+            quote_asset=quote,
+            timestamp=int(time.time()),
+            order_id=order_id,
+            trade_type=trade_type,
+            order_type="LIMIT",
+            price=price,
+            amount=amount,
+            trade_fee=trade_fee.to_json(),
+            exchange_trade_id=f"exchange-{order_id}",
+            position=position,
+        )
+
+    def assert_same_metrics(self, trades):
+        cur_bals = {base: Decimal("100"), quote: Decimal("10000")}
+        accumulator = PerformanceAccumulator(trading_pair)
+        for trade in trades:
+            accumulator.add_trade(trade)
+        metrics = self.async_run_with_timeout(accumulator.performance_metrics(cur_bals))
+        # PerformanceMetrics modifies the trades when aggregating the derivatives orders
+        expected = self.async_run_with_timeout(PerformanceMetrics.create(trading_pair, trades, cur_bals))
+
+        for attribute in ["num_buys", "num_sells", "num_trades", "b_vol_base", "s_vol_base", "tot_vol_base",
+                          "b_vol_quote", "s_vol_quote", "tot_vol_quote", "avg_b_price", "avg_s_price",
+                          "avg_tot_price", "start_base_bal", "start_quote_bal", "start_price", "cur_price",
+                          "hold_value", "cur_value", "trade_pnl", "fee_in_quote", "total_pnl", "return_pct"]:
+            self.assertEqual(getattr(expected, attribute), getattr(metrics, attribute), attribute)
+        self.assertEqual(dict(expected.fees), dict(metrics.fees))
+
+    def test_performance_accumulator_matches_performance_metrics(self):
+        rate_oracle = RateOracle()
+        rate_oracle._prices["USDT-HBOT"] = Decimal("5")
+        rate_oracle._prices["BNB-USDT"] = Decimal("300")
+        RateOracle._shared_instance = rate_oracle
+
+        trades = [
+            self.trade_fill("someId0", "BUY", 100, 10),
+            self.trade_fill("someId1", "SELL", 120, 15,
+                            trade_fee=AddedToCostTradeFee(flat_fees=[TokenAmount("BNB", Decimal("0.01"))])),
+            self.trade_fill("someId2", "SELL", 110, 2,
+                            trade_fee=DeductedFromReturnsTradeFee(percent=Decimal("0.001"))),
+            self.trade_fill("someId3", "BUY", 105, 3,
+                            trade_fee=AddedToCostTradeFee(percent=Decimal("0.002"))),
+        ]
+
+        self.assert_same_metrics(trades)
+
+    def test_performance_accumulator_matches_performance_metrics_for_derivatives(self):
+        rate_oracle = RateOracle()
+        rate_oracle._prices[trading_pair] = Decimal("17")
+        RateOracle._shared_instance = rate_oracle
+
+        trades = [
+            self.trade_fill("order1", "BUY", Decimal("10"), Decimal("60"), position="OPEN"),
+            self.trade_fill("order2", "SELL", Decimal("20"), Decimal("100"), position="OPEN"),
+            self.trade_fill("order3", "SELL", Decimal("15"), Decimal("50"), position="CLOSE"),
+            self.trade_fill("order1", "BUY", Decimal("12"), Decimal("40"), position="OPEN"),
+            self.trade_fill("order4", "BUY", Decimal("15"), Decimal("100"), position="CLOSE",
+                            trade_fee=AddedToCostTradeFee(Decimal("0.1"))),
+            self.trade_fill("order3", "SELL", Decimal("16"), Decimal("50"), position="CLOSE"),
+            self.trade_fill("order5", "BUY", Decimal("18"), Decimal("10"), position="OPEN"),
+        ]
+
+        self.assert_same_metrics(trades)
+
+    def test_performance_tracker_accumulates_fill_events(self):
+        market = MagicMock()
+        market.display_name = "binance"
+        tracker = TradesPerformanceTracker(markets=[market])
+        tracker.add_trades([self.trade_fill("someId0", "BUY", 100, 10)])
+
+        tracker.start()
+        market.add_listener.assert_called_once_with(MarketEvent.OrderFilled, tracker._fill_order_forwarder)
+        tracker._did_fill_order(
+            MarketEvent.OrderFilled.value,
+            market,
+            OrderFilledEvent(timestamp=1640001112.223,
+                             order_id="someId1",
+                             trading_pair=trading_pair,
+                             trade_type=TradeType.SELL,
+                             order_type=OrderType.LIMIT,
+                             price=Decimal("120"),
+                             amount=Decimal("15"),
+                             trade_fee=AddedToCostTradeFee(percent=Decimal("0.01"))))
+
+        accumulator = tracker.accumulators[("binance", trading_pair)]
+        self.assertEqual(1, len(tracker.accumulators))
+        self.assertEqual(2, accumulator.num_trades)
+        self.assertEqual(Decimal("10"), accumulator.b_vol_base)
+        self.assertEqual(Decimal("-15"), accumulator.s_vol_base)
+        self.assertEqual(Decimal("18"), accumulator.fees[quote])
+        self.assertEqual(Decimal("100"), accumulator.start_price)
+        self.assertEqual(Decimal("120"), accumulator.last_price)
+
+    def test_performance_tracker_processes_fills_from_other_threads_in_event_loop(self):
+        market = MagicMock()
+        market.display_name = "binance"
+        tracker = TradesPerformanceTracker(markets=[market])
+        fill_event = OrderFilledEvent(timestamp=1640001112.223,
+                                      order_id="someId1",
+                                      trading_pair=trading_pair,
+                                      trade_type=TradeType.BUY,
+                                      order_type=OrderType.LIMIT,
+                                      price=Decimal("120"),
+                                      amount=Decimal("15"),
+                                      trade_fee=AddedToCostTradeFee())
+
+        fill_thread = threading.Thread(target=tracker._did_fill_order,
+                                       args=(MarketEvent.OrderFilled.value, market, fill_event))
+        fill_thread.start()
+        fill_thread.join()
+        self.assertEqual(0, len(tracker.accumulators))
+
+        self.async_run_with_timeout(asyncio.sleep(0))
+        self.assertEqual(1, tracker.accumulators[("binance", trading_pair)].num_trades)
@@ -1,6 +1,7 @@
 import asyncio
 import json
 import re
+import tempfile
 from decimal import Decimal
 from typing import Any, Callable, Dict, List, Optional, Tuple
 from unittest.mock import AsyncMock, patch
@@ -16,9 +17,10 @@ from hummingbot.connector.test_support.exchange_connector_test import AbstractEx
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
 from hummingbot.core.data_type.common import OrderType, TradeType
-from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState
+from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate
 from hummingbot.core.data_type.trade_fee import DeductedFromReturnsTradeFee, TokenAmount, TradeFeeBase
 from hummingbot.core.event.events import MarketOrderFailureEvent, OrderFilledEvent
+from hummingbot.core.utils.exchange_info_cache import ExchangeInfoCache
 
 
 class BinanceExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests):
@@ -1227,6 +1229,131 @@ class BinanceExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests
 
         self.assertEqual(result[0].min_notional_size, Decimal("10"))
 
+    def _start_tracking_orders(self, count: int) -> List[InFlightOrder]:
+        for i in range(count):
+            self.exchange.start_tracking_order(
+                order_id=f"{self.client_order_id_prefix}{i}",
+                exchange_order_id=str(i),
+                trading_pair=self.trading_pair,
+                order_type=OrderType.LIMIT,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("1"),
+            )
+        return list(self.exchange.in_flight_orders.values())
+
+    def _open_order_update(self, order: InFlightOrder) -> OrderUpdate:
+        return OrderUpdate(
+            client_order_id=order.client_order_id,
+            exchange_order_id=order.exchange_order_id,
+            trading_pair=order.trading_pair,
+            update_timestamp=1640780000,
+            new_state=OrderState.OPEN,
+        )
+
+    @aioresponses()
+    def test_trading_pair_symbol_map_initialized_from_exchange_info_cache(self, mock_api):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            self.exchange._exchange_info_cache = ExchangeInfoCache(ttl=60, cache_dir=cache_dir)
+            self.exchange._set_trading_pair_symbol_map(None)
+            self.configure_all_symbols_response(mock_api=mock_api)
+
+            all_trading_pairs = self.async_run_with_timeout(coroutine=self.exchange.all_trading_pairs())
+
+            # The second initialization uses the cache, without waiting for the request refreshing it
+            self.exchange._set_trading_pair_symbol_map(None)
+            mock_api.get(self.all_symbols_url, exception=asyncio.TimeoutError)
+
+            cached_trading_pairs = self.async_run_with_timeout(coroutine=self.exchange.all_trading_pairs())
+
+            self.assertEqual(1, len(mock_api.requests))
+            self.assertEqual(all_trading_pairs, cached_trading_pairs)
+            self.assertIn(self.trading_pair, cached_trading_pairs)
+
+    @aioresponses()
+    def test_trading_rules_initialized_from_exchange_info_cache(self, mock_api):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            self.exchange._exchange_info_cache = ExchangeInfoCache(ttl=60, cache_dir=cache_dir)
+            self.configure_trading_rules_response(mock_api=mock_api)
+            self.async_run_with_timeout(coroutine=self.exchange._update_trading_rules())
+            self.exchange._trading_rules.clear()
+
+            self.async_run_with_timeout(coroutine=self.exchange._update_trading_rules_from_cache())
+
+            self.assertEqual(repr(self.expected_trading_rule), repr(self.exchange.trading_rules[self.trading_pair]))
+
+    def test_update_order_status_requests_orders_concurrently(self):
+        self.exchange._set_current_timestamp(1640780000)
+        self.exchange.ORDER_STATUS_MAX_CONCURRENT_REQUESTS = 3
+        orders = self._start_tracking_orders(count=8)
+        requests_in_flight = []
+        max_requests_in_flight = []
+
+        async def request_with_delay(result):
+            requests_in_flight.append(1)
+            max_requests_in_flight.append(len(requests_in_flight))
+            await asyncio.sleep(0.01)
+            requests_in_flight.pop()
+            return result
+
+        async def all_trade_updates_for_order(order: InFlightOrder):
+            return await request_with_delay([])
+
+        async def request_order_status(tracked_order: InFlightOrder):
+            return await request_with_delay(self._open_order_update(tracked_order))
+
+        self.exchange._all_trade_updates_for_order = all_trade_updates_for_order
+        self.exchange._request_order_status = request_order_status
+
+        self.async_run_with_timeout(self.exchange._update_order_status())
+
+        self.assertEqual(3, max(max_requests_in_flight))
+        self.assertEqual(16, len(max_requests_in_flight))
+        self.assertTrue(all(order.current_state == OrderState.OPEN for order in orders))
+        metrics = self.exchange.order_status_polling_metrics
+        self.assertEqual(1, metrics["cycles"])
+        self.assertEqual(16, metrics["last_cycle_requests"])
+        self.assertEqual(16, metrics["total_requests"])
+        self.assertGreater(metrics["last_cycle_duration"], 0)
+
+    def test_update_order_status_uses_bulk_requests(self):
+        self.exchange._set_current_timestamp(1640780000)
+        orders = self._start_tracking_orders(count=3)
+        open_orders = orders[:2]
+        closed_order = orders[2]
+        canceled_update = self._open_order_update(closed_order)._replace(new_state=OrderState.CANCELED)
+
+        self.exchange._all_trade_updates_for_orders_in_bulk = AsyncMock(return_value=[])
+        self.exchange._request_order_status_in_bulk = AsyncMock(
+            return_value={order.client_order_id: self._open_order_update(order) for order in open_orders})
+        self.exchange._all_trade_updates_for_order = AsyncMock()
+        self.exchange._request_order_status = AsyncMock(return_value=canceled_update)
+
+        self.async_run_with_timeout(self.exchange._update_order_status())
+
+        self.exchange._all_trade_updates_for_order.assert_not_called()
+        # Only the order missing from the open orders response is requested individually
+        self.exchange._request_order_status.assert_called_once_with(tracked_order=closed_order)
+        self.assertTrue(all(order.is_open for order in open_orders))
+        self.assertTrue(closed_order.is_cancelled)
+        self.assertEqual(3, self.exchange.order_status_polling_metrics["last_cycle_requests"])
+
+    def test_update_order_status_falls_back_to_each_order_when_bulk_request_fails(self):
+        self.exchange._set_current_timestamp(1640780000)
+        orders = self._start_tracking_orders(count=2)
+
+        self.exchange._request_order_status_in_bulk = AsyncMock(side_effect=IOError("test error"))
+        self.exchange._all_trade_updates_for_order = AsyncMock(return_value=[])
+        self.exchange._request_order_status = AsyncMock(side_effect=self._open_order_update)
+
+        self.async_run_with_timeout(self.exchange._update_order_status())
+
+        self.assertEqual(2, self.exchange._request_order_status.call_count)
+        self.assertTrue(all(order.is_open for order in orders))
+        self.assertTrue(self.is_logged(
+            "WARNING",
+            "Failed to fetch order status updates in bulk, requesting them for each order. Error: test error"))
+
     def _validate_auth_credentials_taking_parameters_from_argument(self,
                                                                    request_call_tuple: RequestCall,
                                                                    params: Dict[str, Any]):
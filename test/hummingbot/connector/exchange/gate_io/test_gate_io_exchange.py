@@ -19,6 +19,7 @@ from hummingbot.connector.utils import get_new_client_order_id
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, PositionAction, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState
+from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.trade_fee import TokenAmount
 from hummingbot.core.event.event_logger import EventLogger
 from hummingbot.core.event.events import (
@@ -932,6 +933,213 @@ class TestGateIoExchange(unittest.TestCase):
             )
         )
 
+    def _limit_orders_to_create(self) -> List[LimitOrder]:
+        return [
+            LimitOrder(
+                client_order_id="OID1",
+                trading_pair=self.trading_pair,
+                is_buy=True,
+                base_currency=self.base_asset,
+                quote_currency=self.quote_asset,
+                price=Decimal("5.1"),
+                quantity=Decimal("1"),
+            ),
+            LimitOrder(
+                client_order_id="OID2",
+                trading_pair=self.trading_pair,
+                is_buy=False,
+                base_currency=self.base_asset,
+                quote_currency=self.quote_asset,
+                price=Decimal("5.2"),
+                quantity=Decimal("2"),
+            ),
+        ]
+
+    def test_batch_order_create_assigns_client_order_ids(self):
+        self.exchange._execute_batch_order_create = AsyncMock()
+
+        created_orders = self.exchange.batch_order_create(orders_to_create=self._limit_orders_to_create())
+
+        self.assertEqual(2, len(created_orders))
+        self.assertTrue(created_orders[0].client_order_id.startswith(CONSTANTS.HBOT_ORDER_ID))
+        self.assertNotEqual(created_orders[0].client_order_id, created_orders[1].client_order_id)
+        self.assertEqual(Decimal("2"), created_orders[1].quantity)
+
+    @aioresponses()
+    def test_batch_order_create(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        url = f"{CONSTANTS.REST_URL}/{CONSTANTS.BATCH_ORDERS_PATH_URL}"
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        resp = [
+            dict(self.get_order_create_response_mock(exchange_order_id="1"), text="OID1", succeeded=True),
+            dict(self.get_order_create_response_mock(exchange_order_id="2"), text="OID2", succeeded=True),
+        ]
+        mock_api.post(regex_url, body=json.dumps(resp), status=201)
+
+        self.async_run_with_timeout(
+            self.exchange._execute_batch_order_create(orders_to_create=self._limit_orders_to_create()))
+
+        order_request = next(((key, value) for key, value in mock_api.requests.items()
+                              if key[1].human_repr().startswith(url)))
+        request_data = json.loads(order_request[1][0].kwargs["data"])
+        self.assertEqual(["OID1", "OID2"], [order_data["text"] for order_data in request_data])
+        self.assertEqual(["buy", "sell"], [order_data["side"] for order_data in request_data])
+        self.assertEqual(Decimal("5.2"), Decimal(request_data[1]["price"]))
+
+        self.assertEqual("1", self.exchange.in_flight_orders["OID1"].exchange_order_id)
+        self.assertEqual("2", self.exchange.in_flight_orders["OID2"].exchange_order_id)
+        self.assertEqual(1, len(self.buy_order_created_logger.event_log))
+        self.assertEqual(1, len(self.sell_order_created_logger.event_log))
+
+    @aioresponses()
+    def test_batch_order_create_places_rejected_orders_individually(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        url = f"{CONSTANTS.REST_URL}/{CONSTANTS.BATCH_ORDERS_PATH_URL}"
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        resp = [
+            dict(self.get_order_create_response_mock(exchange_order_id="1"), text="OID1", succeeded=True),
+            {"text": "OID2", "succeeded": False, "label": "TOO_MANY_REQUESTS", "message": "Request rate limit"},
+        ]
+        mock_api.post(regex_url, body=json.dumps(resp), status=201)
+        single_order_url = f"{CONSTANTS.REST_URL}/{CONSTANTS.ORDER_CREATE_PATH_URL}"
+        regex_url = re.compile(f"^{single_order_url}".replace(".", r"\.").replace("?", r"\?"))
+        mock_api.post(regex_url, body=json.dumps(self.get_order_create_response_mock(exchange_order_id="2")))
+
+        self.async_run_with_timeout(
+            self.exchange._execute_batch_order_create(orders_to_create=self._limit_orders_to_create()))
+
+        single_order_request = next(((key, value) for key, value in mock_api.requests.items()
+                                     if key[1].human_repr().startswith(single_order_url)))
+        request_data = json.loads(single_order_request[1][0].kwargs["data"])
+        self.assertEqual("OID2", request_data["text"])
+        self.assertEqual("1", self.exchange.in_flight_orders["OID1"].exchange_order_id)
+        self.assertEqual("2", self.exchange.in_flight_orders["OID2"].exchange_order_id)
+        self.assertEqual(0, len(self.order_failure_logger.event_log))
+
+    @aioresponses()
+    def test_batch_order_create_fails_and_raises_failure_events(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        url = f"{CONSTANTS.REST_URL}/{CONSTANTS.BATCH_ORDERS_PATH_URL}"
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        mock_api.post(regex_url, status=400)
+
+        self.async_run_with_timeout(
+            self.exchange._execute_batch_order_create(orders_to_create=self._limit_orders_to_create()))
+
+        # The exchange might have created the orders, so they are not placed again individually
+        single_order_url = f"{CONSTANTS.REST_URL}/{CONSTANTS.ORDER_CREATE_PATH_URL}"
+        self.assertFalse(any(key[1].human_repr().startswith(single_order_url) for key in mock_api.requests))
+        self.assertEqual(2, len(self.order_failure_logger.event_log))
+        self.assertEqual(
+            {"OID1", "OID2"}, {failure_event.order_id for failure_event in self.order_failure_logger.event_log})
+        self.assertTrue(
+            self._is_logged(
+                "NETWORK",
+                f"Error submitting buy LIMIT order to {self.exchange.name_cap} for 1.000000 {self.trading_pair} "
+                f"5.1000."
+            )
+        )
+
+    @aioresponses()
+    def test_batch_order_create_matches_results_by_client_order_id(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        url = f"{CONSTANTS.REST_URL}/{CONSTANTS.BATCH_ORDERS_PATH_URL}"
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        # The result of OID1 is missing and the other one is not in the position of its order
+        resp = [
+            dict(self.get_order_create_response_mock(exchange_order_id="2"), text="OID2", succeeded=True),
+        ]
+        mock_api.post(regex_url, body=json.dumps(resp), status=201)
+
+        self.async_run_with_timeout(
+            self.exchange._execute_batch_order_create(orders_to_create=self._limit_orders_to_create()))
+
+        single_order_url = f"{CONSTANTS.REST_URL}/{CONSTANTS.ORDER_CREATE_PATH_URL}"
+        self.assertFalse(any(key[1].human_repr().startswith(single_order_url) for key in mock_api.requests))
+        self.assertNotIn("OID1", self.exchange.in_flight_orders)
+        self.assertEqual("2", self.exchange.in_flight_orders["OID2"].exchange_order_id)
+        self.assertEqual(["OID1"], [failure_event.order_id for failure_event in self.order_failure_logger.event_log])
+        self.assertEqual(1, len(self.sell_order_created_logger.event_log))
+        self.assertTrue(
+            self._is_logged(
+                "WARNING",
+                f"The order OID1 has no result in the batch response of {self.exchange.name_cap}, it is marked as "
+                f"failed."
+            )
+        )
+
+    @aioresponses()
+    def test_batch_order_cancel(self, mock_api):
+        self.exchange._set_current_timestamp(1640780000)
+        for client_order_id, exchange_order_id in [("OID1", "4"), ("OID2", "5")]:
+            self.exchange.start_tracking_order(
+                order_id=client_order_id,
+                exchange_order_id=exchange_order_id,
+                trading_pair=self.trading_pair,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("100"),
+                order_type=OrderType.LIMIT,
+            )
+        url = f"{CONSTANTS.REST_URL}/{CONSTANTS.CANCEL_BATCH_ORDERS_PATH_URL}"
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        resp = [
+            {"currency_pair": self.ex_trading_pair, "id": "4", "succeeded": True},
+            {"currency_pair": self.ex_trading_pair, "id": "5", "succeeded": False,
+             "label": "ORDER_NOT_FOUND", "message": "Order not found"},
+        ]
+        mock_api.post(regex_url, body=json.dumps(resp))
+        # The order not canceled in the batch request is canceled individually
+        single_cancel_url = f"{CONSTANTS.REST_URL}/{CONSTANTS.ORDER_DELETE_PATH_URL.format(order_id='5')}"
+        regex_url = re.compile(f"^{single_cancel_url}".replace(".", r"\.").replace("?", r"\?"))
+        mock_api.delete(
+            regex_url, body=json.dumps(self.get_order_create_response_mock(cancelled=True, exchange_order_id="5")))
+
+        self.async_run_with_timeout(
+            self.exchange._execute_batch_order_cancel(orders_to_cancel=self._limit_orders_to_create()))
+
+        cancel_request = next(((key, value) for key, value in mock_api.requests.items()
+                               if key[1].human_repr().startswith(url)))
+        request_data = json.loads(cancel_request[1][0].kwargs["data"])
+        self.assertEqual(
+            [{"currency_pair": self.ex_trading_pair, "id": "4"}, {"currency_pair": self.ex_trading_pair, "id": "5"}],
+            request_data)
+        self.assertEqual(
+            ["OID1", "OID2"], [cancel_event.order_id for cancel_event in self.order_cancelled_logger.event_log])
+
+    @aioresponses()
+    def test_batch_order_cancel_cancels_orders_without_result_individually(self, mock_api):
+        self.exchange._set_current_timestamp(1640780000)
+        for client_order_id, exchange_order_id in [("OID1", "4"), ("OID2", "5")]:
+            self.exchange.start_tracking_order(
+                order_id=client_order_id,
+                exchange_order_id=exchange_order_id,
+                trading_pair=self.trading_pair,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("100"),
+                order_type=OrderType.LIMIT,
+            )
+        url = f"{CONSTANTS.REST_URL}/{CONSTANTS.CANCEL_BATCH_ORDERS_PATH_URL}"
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        resp = [{"currency_pair": self.ex_trading_pair, "id": "5", "succeeded": True}]
+        mock_api.post(regex_url, body=json.dumps(resp))
+        single_cancel_url = f"{CONSTANTS.REST_URL}/{CONSTANTS.ORDER_DELETE_PATH_URL.format(order_id='4')}"
+        regex_url = re.compile(f"^{single_cancel_url}".replace(".", r"\.").replace("?", r"\?"))
+        mock_api.delete(
+            regex_url, body=json.dumps(self.get_order_create_response_mock(cancelled=True, exchange_order_id="4")))
+
+        self.async_run_with_timeout(
+            self.exchange._execute_batch_order_cancel(orders_to_cancel=self._limit_orders_to_create()))
+
+        self.assertTrue(any(key[1].human_repr().startswith(single_cancel_url) for key in mock_api.requests))
+        self.assertEqual(
+            {"OID1", "OID2"}, {cancel_event.order_id for cancel_event in self.order_cancelled_logger.event_log})
+
     @aioresponses()
     def test_update_balances(self, mock_api):
         url = f"{CONSTANTS.REST_URL}/{CONSTANTS.USER_BALANCES_PATH_URL}"
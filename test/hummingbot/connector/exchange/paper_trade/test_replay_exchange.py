@@ -0,0 +1,207 @@
+import os
+import tempfile
+from decimal import Decimal
+from unittest import TestCase
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import create_engine
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.client.config.fee_overrides_config_map import fee_overrides_config_map
+from hummingbot.client.settings import AllConnectorSettings
+from hummingbot.connector.exchange.paper_trade.replay_data import (
+    ReplayOrderBookSnapshot,
+    ReplayTrade,
+    candles_csv_events,
+    columnar_market_data_events,
+    market_data_events,
+    merge_replay_events,
+)
+from hummingbot.connector.exchange.paper_trade.replay_exchange import ReplayExchange
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.order_candidate import OrderCandidate
+from hummingbot.core.data_type.trade_fee import TradeFeeSchema
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import MarketEvent
+from hummingbot.core.utils.columnar_market_data import ColumnarMarketDataWriter
+from hummingbot.model.market_data import MarketData
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+
+
+class ReplayDataTests(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.trading_pair = "COINALPHA-HBOT"
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def test_candles_csv_events(self):
+        file_path = os.path.join(self.temp_dir.name, "candles.csv")
+        pd.DataFrame({
+            "timestamp": [1672531200000, 1672531260000],
+            "open": [100.0, 102.0],
+            "high": [103.0, 103.0],
+            "low": [99.0, 97.0],
+            "close": [102.0, 98.0],
+            "volume": [10.0, 20.0],
+            "quote_asset_volume": [1000.0, 2000.0],
+        }).to_csv(file_path, index=False)
+
+        events = list(candles_csv_events(file_path, self.trading_pair, spread=0.01, levels=2))
+
+        self.assertEqual(8, len(events))
+        self.assertEqual([1672531200, 1672531215, 1672531230, 1672531245],
+                         [event.timestamp for event in events[:4]])
+        opening_book = events[0]
+        self.assertIsInstance(opening_book, ReplayOrderBookSnapshot)
+        np.testing.assert_allclose([99.5, 98.5], opening_book.bids[:, 0])
+        np.testing.assert_allclose([100.5, 101.5], opening_book.asks[:, 0])
+        self.assertEqual([5.0, 5.0], opening_book.asks[:, 1].tolist())
+        self.assertEqual((TradeType.SELL, 99.0), (events[1].trade_type, events[1].price))
+        self.assertEqual((TradeType.BUY, 103.0), (events[2].trade_type, events[2].price))
+        self.assertAlmostEqual(102.0 * 1.005, events[3].asks[0, 0])
+        # Bearish candle, the high is replayed before the low
+        self.assertEqual((TradeType.BUY, 103.0), (events[5].trade_type, events[5].price))
+        self.assertEqual((TradeType.SELL, 97.0), (events[6].trade_type, events[6].price))
+
+    def test_columnar_market_data_events(self):
+        writer = ColumnarMarketDataWriter(data_dir=self.temp_dir.name, depth=3)
+        for timestamp in (1000, 2000, 3000):
+            writer.append(exchange="binance", trading_pair=self.trading_pair, timestamp=timestamp,
+                          mid_price=100.5, best_bid=100.0, best_ask=101.0,
+                          bids=[OrderBookRow(100.0, 1.0, 1), OrderBookRow(99.0, 2.0, 1)],
+                          asks=[OrderBookRow(101.0, 3.0, 1)])
+        writer.close()
+
+        events = list(columnar_market_data_events(self.temp_dir.name, "binance", self.trading_pair,
+                                                  start_timestamp=2, end_timestamp=3))
+
+        self.assertEqual([2.0, 3.0], [event.timestamp for event in events])
+        self.assertEqual([[100.0, 1.0], [99.0, 2.0]], events[0].bids.tolist())
+        self.assertEqual([[101.0, 3.0]], events[0].asks.tolist())
+
+    @patch("hummingbot.model.sql_connection_manager.create_engine")
+    def test_market_data_events(self, engine_mock):
+        engine_mock.return_value = create_engine("sqlite:///:memory:")
+        sql = SQLConnectionManager(ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS,
+                                   db_name="test_DB")
+        with sql.get_new_session() as session:
+            with session.begin():
+                for timestamp in (2000, 1000):
+                    session.add(MarketData(timestamp=timestamp, exchange="binance", trading_pair=self.trading_pair,
+                                           mid_price=Decimal("100.5"), best_bid=Decimal("100"), best_ask=Decimal("101"),
+                                           order_book={"bid": [OrderBookRow(100.0, 1.0, 1)],
+                                                       "ask": [OrderBookRow(101.0, 2.0, 1)]}))
+
+        events = list(market_data_events(sql, "binance", self.trading_pair))
+
+        self.assertEqual([1.0, 2.0], [event.timestamp for event in events])
+        self.assertEqual([[100.0, 1.0]], events[0].bids.tolist())
+        self.assertEqual([[101.0, 2.0]], events[0].asks.tolist())
+
+    def test_merge_replay_events(self):
+        first = [ReplayTrade(1, "A-B", TradeType.BUY, 1, 1), ReplayTrade(3, "A-B", TradeType.BUY, 1, 1)]
+        second = [ReplayTrade(2, "C-D", TradeType.BUY, 1, 1)]
+
+        self.assertEqual([1, 2, 3], [event.timestamp for event in merge_replay_events(first, second)])
+
+
+class ReplayExchangeTests(TestCase):
+    start_timestamp = 1672531200
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.trading_pair = "COINALPHA-HBOT"
+        self.events = [
+            self.snapshot(self.start_timestamp, mid_price=100),
+            ReplayTrade(self.start_timestamp + 5, self.trading_pair, TradeType.SELL, 98.5, 1),
+            self.snapshot(self.start_timestamp + 10, mid_price=110),
+        ]
+        self.exchange = ReplayExchange(ClientConfigAdapter(ClientConfigMap()),
+                                       trading_pairs=[self.trading_pair],
+                                       events=self.events)
+        self.exchange.set_balance("COINALPHA", Decimal("10"))
+        self.exchange.set_balance("HBOT", Decimal("1000"))
+        self.clock = Clock(ClockMode.BACKTEST, 1, self.start_timestamp, self.start_timestamp + 20)
+        self.clock.add_iterator(self.exchange)
+        self.fill_logger = EventLogger()
+        self.exchange.add_listener(MarketEvent.OrderFilled, self.fill_logger)
+
+    def snapshot(self, timestamp: float, mid_price: float) -> ReplayOrderBookSnapshot:
+        return ReplayOrderBookSnapshot(
+            timestamp=timestamp,
+            trading_pair=self.trading_pair,
+            bids=np.array([[mid_price - 1, 10], [mid_price - 2, 10]], dtype=np.float64),
+            asks=np.array([[mid_price + 1, 10], [mid_price + 2, 10]], dtype=np.float64),
+        )
+
+    def test_order_books_follow_replayed_snapshots(self):
+        self.assertFalse(self.exchange.ready)
+
+        self.clock.backtest_til(self.start_timestamp)
+        self.assertTrue(self.exchange.ready)
+        self.assertEqual(Decimal("99"), self.exchange.get_price(self.trading_pair, False))
+        self.assertEqual(Decimal("101"), self.exchange.get_price(self.trading_pair, True))
+        self.assertEqual(self.start_timestamp + 5, self.exchange.next_event_timestamp)
+
+        self.clock.backtest_til(self.start_timestamp + 10)
+        self.assertEqual(Decimal("109"), self.exchange.get_price(self.trading_pair, False))
+        self.assertTrue(self.exchange.replay_finished)
+
+    def test_replayed_trade_fills_crossed_limit_order(self):
+        self.clock.backtest_til(self.start_timestamp)
+        order_id = self.exchange.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("99"))
+
+        self.clock.backtest_til(self.start_timestamp + 4)
+        self.assertEqual(0, len(self.fill_logger.event_log))
+
+        self.clock.backtest_til(self.start_timestamp + 5)
+        self.assertEqual(1, len(self.fill_logger.event_log))
+        fill = self.fill_logger.event_log[0]
+        self.assertEqual(order_id, fill.order_id)
+        self.assertEqual(Decimal("99"), fill.price)
+        self.assertEqual(Decimal("11"), self.exchange.get_balance("COINALPHA"))
+
+    def test_trade_fee_schema_is_kept_by_the_exchange(self):
+        binance_settings = AllConnectorSettings.get_connector_settings()["binance"]
+        fee_overrides = dict(fee_overrides_config_map)
+        exchange = ReplayExchange(ClientConfigAdapter(ClientConfigMap()),
+                                  trading_pairs=[self.trading_pair],
+                                  events=self.events,
+                                  exchange_name="binance",
+                                  trade_fee_schema=TradeFeeSchema(maker_percent_fee_decimal=Decimal("0.01")))
+        exchange.set_balance("COINALPHA", Decimal("10"))
+        exchange.set_balance("HBOT", Decimal("1000"))
+        exchange.add_listener(MarketEvent.OrderFilled, self.fill_logger)
+        clock = Clock(ClockMode.BACKTEST, 1, self.start_timestamp, self.start_timestamp + 20)
+        clock.add_iterator(exchange)
+
+        self.assertIs(binance_settings, AllConnectorSettings.get_connector_settings()["binance"])
+        self.assertEqual(fee_overrides, fee_overrides_config_map)
+        self.assertNotIn("replay", AllConnectorSettings.get_connector_settings())
+
+        clock.backtest_til(self.start_timestamp)
+        exchange.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("99"))
+        clock.backtest_til(self.start_timestamp + 5)
+
+        fill = self.fill_logger.event_log[0]
+        self.assertEqual(Decimal("0.01"), fill.trade_fee.percent)
+        order_candidate = exchange.budget_checker.populate_collateral_entries(OrderCandidate(
+            trading_pair=self.trading_pair,
+            is_maker=True,
+            order_type=OrderType.LIMIT,
+            order_side=TradeType.BUY,
+            amount=Decimal("1"),
+            price=Decimal("99"),
+        ))
+        self.assertEqual(Decimal("0.99"), order_candidate.percent_fee_collateral.amount)
+        self.assertEqual(binance_settings.trade_fee_schema,
+                         AllConnectorSettings.get_connector_settings()["binance"].trade_fee_schema)
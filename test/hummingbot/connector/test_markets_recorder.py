@@ -1,15 +1,24 @@
 import asyncio
+import csv
+import os
+import tempfile
 import time
 from decimal import Decimal
 from typing import Awaitable
 from unittest import TestCase
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import numpy as np
 from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
 
-from hummingbot.client.config.client_config_map import ClientConfigMap, MarketDataCollectionConfigMap
+from hummingbot.client.config.client_config_map import (
+    ClientConfigMap,
+    MarketDataCollectionConfigMap,
+    MarketsRecorderConfigMap,
+)
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.exchange_py_base import ExchangePyBase
 from hummingbot.connector.markets_recorder import MarketsRecorder
 from hummingbot.core.data_type.common import OrderType, PositionAction, PriceType, TradeType
 from hummingbot.core.data_type.order_book import OrderBook
@@ -18,17 +27,59 @@ from hummingbot.core.event.events import (
     BuyOrderCompletedEvent,
     BuyOrderCreatedEvent,
     MarketEvent,
+    MarketOrderFailureEvent,
+    OrderCancelledEvent,
     OrderFilledEvent,
     SellOrderCreatedEvent,
 )
+from hummingbot.core.utils.columnar_market_data import ColumnarMarketDataReader
 from hummingbot.logger import HummingbotLogger
 from hummingbot.model.market_data import MarketData
+from hummingbot.model.market_state import MarketState
+from hummingbot.model.market_state_journal import MarketStateJournal
 from hummingbot.model.order import Order
 from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
 from hummingbot.model.trade_fill import TradeFill
 
 
 class MarketsRecorderTests(TestCase):
+    @patch("hummingbot.connector.markets_recorder.MarketsRecorder._sleep")
+    def test_market_data_collection_to_columnar_segments(self, sleep_mock):
+        sleep_mock.side_effect = [asyncio.CancelledError]
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        with patch("hummingbot.connector.markets_recorder.data_path", return_value=temp_dir.name):
+            recorder = MarketsRecorder(
+                sql=self.manager,
+                markets=[self],
+                config_file_path=self.config_file_path,
+                strategy_name=self.strategy_name,
+                market_data_collection=MarketDataCollectionConfigMap(
+                    market_data_collection_enabled=True,
+                    market_data_collection_interval=1,
+                    market_data_collection_depth=2,
+                    market_data_collection_columnar=True,
+                ),
+            )
+        prices = {PriceType.MidPrice: Decimal("100"), PriceType.BestBid: Decimal("99"), PriceType.BestAsk: Decimal("101")}
+        order_book = OrderBook(dex=False)
+        bids_array = np.array([[1, 1, 1], [2, 1, 2], [3, 1, 3]], dtype=np.float64)
+        asks_array = np.array([[4, 1, 1], [5, 1, 2], [6, 1, 3], [7, 1, 4]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+        with patch.object(self, "get_price_by_type", side_effect=lambda trading_pair, price_type: prices[price_type]):
+            with patch.object(self, "get_order_book", return_value=order_book):
+                with self.assertRaises(asyncio.CancelledError):
+                    self.async_run_with_timeout(recorder._record_market_data())
+        recorder.stop()
+
+        with self.manager.get_new_session() as session:
+            self.assertEqual(0, session.query(MarketData).count())
+        records = ColumnarMarketDataReader(f"{temp_dir.name}/market_data").read(self.display_name, self.trading_pair)
+        self.assertEqual(1, len(records))
+        self.assertEqual(100, records["mid_price"][0])
+        self.assertEqual([3, 2], records["bid_prices"][0].tolist())
+        self.assertEqual([4, 5], records["ask_prices"][0].tolist())
+
     @staticmethod
     def async_run_with_timeout(coroutine: Awaitable, timeout: int = 1):
         ret = asyncio.get_event_loop().run_until_complete(asyncio.wait_for(coroutine, timeout))
@@ -67,6 +118,21 @@ class MarketsRecorderTests(TestCase):
     def add_exchange_order_ids_from_market_recorder(self, current_exchange_order_ids):
         pass
 
+    def add_listener(self, event_tag, listener):
+        pass
+
+    def remove_listener(self, event_tag, listener):
+        pass
+
+    @patch("hummingbot.model.sql_connection_manager.create_engine")
+    def _thread_shared_sql_manager(self, engine_mock) -> SQLConnectionManager:
+        # The in memory database has to be shared with the writer thread
+        engine_mock.return_value = create_engine(
+            "sqlite:///:memory:", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        return SQLConnectionManager(
+            ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS, db_name="test_DB"
+        )
+
     def test_properties(self):
         recorder = MarketsRecorder(
             sql=self.manager,
@@ -356,3 +422,331 @@ class MarketsRecorderTests(TestCase):
         self.assertEqual(market_data[0].best_ask, Decimal("101"))
         self.assertEqual(market_data[0].best_bid, Decimal("99"))
         self.assertEqual(market_data[0].mid_price, Decimal("100"))
+
+    def test_write_behind_records_events_from_writer_thread(self):
+        manager = self._thread_shared_sql_manager()
+        recorder = MarketsRecorder(
+            sql=manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+            markets_recorder_config=MarketsRecorderConfigMap(
+                write_behind_enabled=True,
+                durable_fills=False,
+            ),
+        )
+        recorder.start()
+
+        create_event = BuyOrderCreatedEvent(
+            timestamp=1642010000,
+            type=OrderType.LIMIT,
+            trading_pair=self.trading_pair,
+            amount=Decimal(1),
+            price=Decimal(1000),
+            order_id="OID1-1642010000000000",
+            creation_timestamp=1640001112.223,
+            exchange_order_id="EOID1",
+        )
+        fill_event = OrderFilledEvent(
+            timestamp=1642020000,
+            order_id=create_event.order_id,
+            trading_pair=create_event.trading_pair,
+            trade_type=TradeType.BUY,
+            order_type=create_event.type,
+            price=Decimal(1010),
+            amount=create_event.amount,
+            trade_fee=AddedToCostTradeFee(),
+            exchange_trade_id="TradeId1"
+        )
+        complete_event = BuyOrderCompletedEvent(
+            timestamp=1642020000,
+            order_id=create_event.order_id,
+            base_asset=self.base,
+            quote_asset=self.quote,
+            base_asset_amount=create_event.amount,
+            quote_asset_amount=create_event.amount * create_event.price,
+            order_type=create_event.type)
+
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, create_event)
+        recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event)
+        recorder._did_complete_order(MarketEvent.BuyOrderCompleted.value, self, complete_event)
+        recorder.stop()
+
+        with manager.get_new_session() as session:
+            orders = session.query(Order).all()
+            order_status = orders[0].status
+            trade_fills = orders[0].trade_fills
+
+        self.assertEqual(1, len(orders))
+        self.assertEqual(MarketEvent.BuyOrderCompleted.name, orders[0].last_status)
+        self.assertEqual(
+            [MarketEvent.BuyOrderCreated.name, MarketEvent.OrderFilled.name, MarketEvent.BuyOrderCompleted.name],
+            [status.status for status in order_status])
+        self.assertEqual(1, len(trade_fills))
+
+        metrics = recorder.write_queue_metrics
+        self.assertEqual(0, metrics["queue_depth"])
+        self.assertEqual(3, metrics["committed_writes"])
+        self.assertEqual(0, metrics["failed_writes"])
+        self.assertGreater(metrics["max_commit_latency"], 0)
+
+    def test_write_behind_durable_fill_is_committed_before_returning(self):
+        manager = self._thread_shared_sql_manager()
+        recorder = MarketsRecorder(
+            sql=manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+            markets_recorder_config=MarketsRecorderConfigMap(
+                write_behind_enabled=True,
+                durable_fills=True,
+            ),
+        )
+        recorder.start()
+        self.addCleanup(recorder.stop)
+
+        create_event = SellOrderCreatedEvent(
+            timestamp=1642010000,
+            type=OrderType.LIMIT,
+            trading_pair=self.trading_pair,
+            amount=Decimal(1),
+            price=Decimal(1000),
+            order_id="OID1-1642010000000000",
+            creation_timestamp=1640001112.223,
+            exchange_order_id="EOID1",
+        )
+        fill_event = OrderFilledEvent(
+            timestamp=1642020000,
+            order_id=create_event.order_id,
+            trading_pair=create_event.trading_pair,
+            trade_type=TradeType.SELL,
+            order_type=create_event.type,
+            price=Decimal(1010),
+            amount=create_event.amount,
+            trade_fee=AddedToCostTradeFee(),
+            exchange_trade_id="TradeId1"
+        )
+
+        recorder._did_create_order(MarketEvent.SellOrderCreated.value, self, create_event)
+        recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event)
+
+        with manager.get_new_session() as session:
+            orders = session.query(Order).all()
+            trade_fills = session.query(TradeFill).all()
+
+        self.assertEqual(1, len(orders))
+        self.assertEqual(MarketEvent.OrderFilled.name, orders[0].last_status)
+        self.assertEqual(1, len(trade_fills))
+
+    def test_write_behind_appends_fill_to_csv_once_after_batch_failure(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        manager = self._thread_shared_sql_manager()
+        recorder = MarketsRecorder(
+            sql=manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+            markets_recorder_config=MarketsRecorderConfigMap(
+                write_behind_enabled=True,
+                durable_fills=False,
+            ),
+        )
+
+        create_event = BuyOrderCreatedEvent(
+            timestamp=1642010000,
+            type=OrderType.LIMIT,
+            trading_pair=self.trading_pair,
+            amount=Decimal(1),
+            price=Decimal(1000),
+            order_id="OID1-1642010000000000",
+            creation_timestamp=1640001112.223,
+            exchange_order_id="EOID1",
+        )
+        fill_event = OrderFilledEvent(
+            timestamp=1642020000,
+            order_id=create_event.order_id,
+            trading_pair=create_event.trading_pair,
+            trade_type=TradeType.BUY,
+            order_type=create_event.type,
+            price=Decimal(1010),
+            amount=create_event.amount,
+            trade_fee=AddedToCostTradeFee(),
+            exchange_trade_id="TradeId1"
+        )
+
+        with patch("hummingbot.connector.markets_recorder.data_path", return_value=temp_dir.name):
+            # The writes are queued before the writer starts, so they are committed in the same batch. The repeated
+            # fill violates the trade fill primary key and fails the batch, and then fails again on its own.
+            recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, create_event)
+            recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event)
+            recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event)
+            recorder.start()
+            recorder.stop()
+
+        with manager.get_new_session() as session:
+            self.assertEqual(1, session.query(TradeFill).count())
+        self.assertEqual(1, recorder.write_queue_metrics["failed_writes"])
+        csv_file_names = [file_name for file_name in os.listdir(temp_dir.name) if file_name.startswith("trades_")]
+        self.assertEqual(1, len(csv_file_names))
+        with open(os.path.join(temp_dir.name, csv_file_names[0])) as csv_file:
+            rows = list(csv.reader(csv_file))
+        self.assertEqual(2, len(rows))
+        self.assertEqual(fill_event.exchange_trade_id, rows[1][rows[0].index("exchange_trade_id")])
+
+    def _exchange_mock(self) -> MagicMock:
+        exchange = MagicMock(spec=ExchangePyBase)
+        exchange.display_name = self.display_name
+        return exchange
+
+    def _recorder_with_markets(self, markets) -> MarketsRecorder:
+        return MarketsRecorder(
+            sql=self.manager,
+            markets=markets,
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+        )
+
+    def _buy_order_created_event(self, order_id: str) -> BuyOrderCreatedEvent:
+        return BuyOrderCreatedEvent(
+            timestamp=1642010000,
+            type=OrderType.LIMIT,
+            trading_pair=self.trading_pair,
+            amount=Decimal(1),
+            price=Decimal(1000),
+            order_id=order_id,
+            creation_timestamp=1640001112.223,
+            exchange_order_id=f"E{order_id}",
+        )
+
+    def test_order_events_journal_single_order_states(self):
+        exchange = self._exchange_mock()
+        recorder = self._recorder_with_markets([exchange])
+        exchange.tracking_state.side_effect = lambda order_id: {"client_order_id": order_id}
+
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, exchange, self._buy_order_created_event("OID1"))
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, exchange, self._buy_order_created_event("OID2"))
+        exchange.tracking_state.side_effect = lambda order_id: None
+        recorder._did_complete_order(
+            MarketEvent.BuyOrderCompleted.value,
+            exchange,
+            BuyOrderCompletedEvent(
+                timestamp=1642020000,
+                order_id="OID1",
+                base_asset=self.base,
+                quote_asset=self.quote,
+                base_asset_amount=Decimal(1),
+                quote_asset_amount=Decimal(1000),
+                order_type=OrderType.LIMIT))
+
+        with self.manager.get_new_session() as session:
+            journal = session.query(MarketStateJournal).order_by(MarketStateJournal.id).all()
+            market_states = session.query(MarketState).all()
+
+        self.assertEqual(0, len(market_states))
+        self.assertEqual(["OID1", "OID2", "OID1"], [entry.order_id for entry in journal])
+        self.assertIsNone(journal[2].saved_state)
+
+        restored_exchange = self._exchange_mock()
+        recorder.restore_market_states(self.config_file_path, restored_exchange)
+
+        restored_exchange.restore_tracking_states.assert_called_once_with({"OID2": {"client_order_id": "OID2"}})
+
+    @patch("hummingbot.connector.markets_recorder.MarketsRecorder.MARKET_STATE_COMPACTION_INTERVAL", 2)
+    def test_order_status_update_saves_market_states_without_order_record(self):
+        exchange = self._exchange_mock()
+        recorder = self._recorder_with_markets([exchange])
+        exchange.tracking_state.side_effect = lambda order_id: {"client_order_id": order_id}
+        exchange.tracking_states = {"OID1": {"client_order_id": "OID1"}}
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, exchange, self._buy_order_created_event("OID1"))
+        with self.manager.get_new_session() as session:
+            session.query(Order).delete()
+            session.commit()
+
+        # The order record is missing, but the order must not be restored as active
+        exchange.tracking_state.side_effect = lambda order_id: None
+        recorder._did_cancel_order(
+            MarketEvent.OrderCancelled.value, exchange, OrderCancelledEvent(timestamp=1642020000, order_id="OID1"))
+
+        with self.manager.get_new_session() as session:
+            journal = session.query(MarketStateJournal).order_by(MarketStateJournal.id).all()
+
+        self.assertEqual(["OID1", "OID1"], [entry.order_id for entry in journal])
+        self.assertIsNone(journal[1].saved_state)
+
+        restored_exchange = self._exchange_mock()
+        recorder.restore_market_states(self.config_file_path, restored_exchange)
+
+        restored_exchange.restore_tracking_states.assert_called_once_with({})
+
+        # The next event is the compaction turn, and the failure of an order without record saves the snapshot
+        exchange.tracking_states = {}
+        recorder._did_fail_order(
+            MarketEvent.OrderFailure.value,
+            exchange,
+            MarketOrderFailureEvent(timestamp=1642020000, order_id="OID2", order_type=OrderType.LIMIT))
+
+        with self.manager.get_new_session() as session:
+            journal = session.query(MarketStateJournal).all()
+            market_states = session.query(MarketState).all()
+
+        self.assertEqual(0, len(journal))
+        self.assertEqual(1, len(market_states))
+        self.assertEqual({}, market_states[0].saved_state)
+
+    @patch("hummingbot.connector.markets_recorder.MarketsRecorder.MARKET_STATE_COMPACTION_INTERVAL", 2)
+    def test_journal_is_compacted_into_market_state_snapshot(self):
+        exchange = self._exchange_mock()
+        recorder = self._recorder_with_markets([exchange])
+        exchange.tracking_state.side_effect = lambda order_id: {"client_order_id": order_id}
+        exchange.tracking_states = {"OID1": {"client_order_id": "OID1"},
+                                    "OID2": {"client_order_id": "OID2"},
+                                    "OID3": {"client_order_id": "OID3"}}
+
+        for order_id in ["OID1", "OID2", "OID3", "OID4"]:
+            recorder._did_create_order(
+                MarketEvent.BuyOrderCreated.value, exchange, self._buy_order_created_event(order_id))
+
+        with self.manager.get_new_session() as session:
+            journal = session.query(MarketStateJournal).all()
+            market_states = session.query(MarketState).all()
+
+        self.assertEqual(1, len(market_states))
+        self.assertEqual(exchange.tracking_states, market_states[0].saved_state)
+        self.assertEqual(["OID4"], [entry.order_id for entry in journal])
+
+        restored_exchange = self._exchange_mock()
+        recorder.restore_market_states(self.config_file_path, restored_exchange)
+
+        restored_exchange.restore_tracking_states.assert_called_once_with(
+            {"OID1": {"client_order_id": "OID1"},
+             "OID2": {"client_order_id": "OID2"},
+             "OID3": {"client_order_id": "OID3"},
+             "OID4": {"client_order_id": "OID4"}})
+
+        recorder.stop()
+
+        with self.manager.get_new_session() as session:
+            journal = session.query(MarketStateJournal).all()
+
+        self.assertEqual(0, len(journal))
@@ -0,0 +1,272 @@
+import asyncio
+import logging
+import math
+import sys
+import time
+import unittest
+from decimal import Decimal
+from typing import Awaitable, List
+from unittest.mock import patch
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.core.api_throttler.async_sliding_window_throttler import (
+    AsyncSlidingWindowRequestContext,
+    AsyncSlidingWindowThrottler,
+    RateLimitWindow,
+)
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit
+from hummingbot.logger.struct_logger import METRICS_LOG_LEVEL
+
+TEST_PATH_URL = "/hummingbot"
+TEST_POOL_ID = "TEST"
+TEST_WEIGHTED_POOL_ID = "TEST_WEIGHTED"
+TEST_WEIGHTED_TASK_1_ID = "/weighted_task_1"
+TEST_WEIGHTED_TASK_2_ID = "/weighted_task_2"
+
+logging.basicConfig(level=METRICS_LOG_LEVEL)
+
+
+class AsyncSlidingWindowThrottlerUnitTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+
+        cls.rate_limits: List[RateLimit] = [
+            RateLimit(limit_id=TEST_POOL_ID, limit=1, time_interval=5.0),
+            RateLimit(limit_id=TEST_PATH_URL, limit=1, time_interval=5.0,
+                      linked_limits=[LinkedLimitWeightPair(TEST_POOL_ID)]),
+            RateLimit(limit_id=TEST_WEIGHTED_POOL_ID, limit=10, time_interval=5.0),
+            RateLimit(limit_id=TEST_WEIGHTED_TASK_1_ID,
+                      limit=1000,
+                      time_interval=5.0,
+                      linked_limits=[LinkedLimitWeightPair(TEST_WEIGHTED_POOL_ID, 5)]),
+            RateLimit(limit_id=TEST_WEIGHTED_TASK_2_ID,
+                      limit=1000,
+                      time_interval=5.0,
+                      linked_limits=[LinkedLimitWeightPair(TEST_WEIGHTED_POOL_ID, 1)]),
+        ]
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.throttler = AsyncSlidingWindowThrottler(rate_limits=self.rate_limits)
+        self.client_config_map = ClientConfigAdapter(ClientConfigMap())
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def test_init_without_rate_limits_share_pct(self):
+        self.assertEqual(0.1, self.throttler._retry_interval)
+        self.assertEqual(5, len(self.throttler._rate_limits))
+        self.assertEqual(1, self.throttler._id_to_limit_map[TEST_POOL_ID].limit)
+        self.assertEqual(1, self.throttler._id_to_limit_map[TEST_PATH_URL].limit)
+        self.assertEqual(1, self.throttler.window(TEST_POOL_ID).limit)
+
+    @patch("hummingbot.core.api_throttler.async_throttler_base.AsyncThrottlerBase._client_config_map")
+    def test_init_with_rate_limits_share_pct(self, config_map_mock):
+        rate_share_pct: Decimal = Decimal("55")
+        self.client_config_map.rate_limits_share_pct = rate_share_pct
+        config_map_mock.return_value = self.client_config_map
+
+        rate_limits = self.rate_limits.copy()
+        rate_limits.append(RateLimit(limit_id="ANOTHER_TEST", limit=10, time_interval=5))
+        expected_limit = math.floor(Decimal("10") * rate_share_pct / Decimal("100"))
+
+        throttler = AsyncSlidingWindowThrottler(rate_limits=rate_limits)
+        self.assertEqual(6, len(throttler._rate_limits))
+        self.assertEqual(Decimal("1"), throttler._id_to_limit_map[TEST_POOL_ID].limit)
+        self.assertEqual(Decimal("1"), throttler._id_to_limit_map[TEST_PATH_URL].limit)
+        self.assertEqual(expected_limit, throttler._id_to_limit_map["ANOTHER_TEST"].limit)
+        self.assertEqual(expected_limit, throttler.window("ANOTHER_TEST").limit)
+
+    def test_set_rate_limits_keeps_used_capacity(self):
+        self.async_run_with_timeout(self.throttler.execute_task(TEST_POOL_ID).acquire())
+
+        self.throttler.set_rate_limits([RateLimit(limit_id=TEST_POOL_ID, limit=2, time_interval=5.0)])
+
+        self.assertEqual(1, self.throttler.window(TEST_POOL_ID).capacity_used)
+        self.assertEqual(2, self.throttler.window(TEST_POOL_ID).limit)
+        self.assertTrue(self.throttler.execute_task(TEST_POOL_ID).within_capacity())
+
+    def test_get_related_limits(self):
+        rate_limit, related_limits = self.throttler.get_related_limits(TEST_POOL_ID)
+        self.assertEqual(TEST_POOL_ID, rate_limit.limit_id)
+        self.assertEqual(0, len(related_limits))
+
+        rate_limit, related_limits = self.throttler.get_related_limits(TEST_PATH_URL)
+        self.assertEqual(TEST_PATH_URL, rate_limit.limit_id)
+        self.assertEqual(1, len(related_limits))
+
+    def test_window_expires_only_elapsed_entries(self):
+        window = self.throttler.window(TEST_POOL_ID)
+        now = time.time()
+        window.add(1.0, 1)
+        window.add(now, 1)
+
+        window.expire(now)
+
+        self.assertEqual(1, window.capacity_used)
+
+    def test_within_capacity_singular_non_weighted_task_returns_false(self):
+        self.throttler.window(TEST_POOL_ID).add(time.time(), 1)
+
+        context = self.throttler.execute_task(limit_id=TEST_POOL_ID)
+        self.assertFalse(context.within_capacity())
+
+    def test_within_capacity_singular_non_weighted_task_returns_true(self):
+        context = self.throttler.execute_task(limit_id=TEST_POOL_ID)
+        self.assertTrue(context.within_capacity())
+
+    def test_within_capacity_pool_non_weighted_task_returns_false(self):
+        self.throttler.window(TEST_POOL_ID).add(time.time(), 1)
+
+        context = self.throttler.execute_task(limit_id=TEST_PATH_URL)
+        self.assertFalse(context.within_capacity())
+
+    def test_within_capacity_pool_non_weighted_task_returns_true(self):
+        context = self.throttler.execute_task(limit_id=TEST_PATH_URL)
+        self.assertTrue(context.within_capacity())
+
+    def test_within_capacity_pool_weighted_tasks(self):
+        # Simulate Weighted Task 1 and Task 2 already executed, resulting in a used capacity of 6/10
+        self.async_run_with_timeout(self.throttler.execute_task(TEST_WEIGHTED_TASK_1_ID).acquire())
+        self.async_run_with_timeout(self.throttler.execute_task(TEST_WEIGHTED_TASK_2_ID).acquire())
+        self.assertEqual(6, self.throttler.window(TEST_WEIGHTED_POOL_ID).capacity_used)
+
+        # Another Task 1(weight=5) will exceed the capacity(11/10)
+        self.assertFalse(self.throttler.execute_task(TEST_WEIGHTED_TASK_1_ID).within_capacity())
+
+        # However Task 2(weight=1) will not exceed the capacity(7/10)
+        self.assertTrue(self.throttler.execute_task(TEST_WEIGHTED_TASK_2_ID).within_capacity())
+
+    def test_acquire_records_used_capacity(self):
+        context = self.throttler.execute_task(limit_id=TEST_PATH_URL)
+        self.async_run_with_timeout(context.acquire())
+
+        self.assertEqual(1, self.throttler.window(TEST_PATH_URL).capacity_used)
+        self.assertEqual(1, self.throttler.window(TEST_POOL_ID).capacity_used)
+        self.assertEqual(0, self.throttler.window(TEST_WEIGHTED_POOL_ID).capacity_used)
+
+    def test_acquire_awaits_when_exceed_capacity(self):
+        self.throttler.window(TEST_POOL_ID).add(time.time(), 1)
+        context = self.throttler.execute_task(limit_id=TEST_POOL_ID)
+
+        with self.assertRaises(asyncio.exceptions.TimeoutError):
+            self.async_run_with_timeout(context.acquire(), timeout=1.0)
+
+    def test_within_capacity_returns_true_for_throttler_without_configured_limits(self):
+        throttler = AsyncSlidingWindowThrottler(rate_limits=[])
+        context = throttler.execute_task(limit_id="test_limit_id")
+        self.assertTrue(context.within_capacity())
+        self.async_run_with_timeout(context.acquire())
+
+    @patch("hummingbot.core.api_throttler.async_sliding_window_throttler.AsyncSlidingWindowThrottler._time")
+    def test_within_capacity_for_limits_with_milliseconds_interval(self, time_mock):
+        per_second_limit = RateLimit(limit_id="generic_per_second", limit=3, time_interval=1)
+        per_millisecond_limit = RateLimit(limit_id="generic_per_millisecond", limit=2, time_interval=0.2)
+        specific_limit = RateLimit(limit_id="specific_limit", limit=sys.maxsize, time_interval=1, linked_limits=[
+            LinkedLimitWeightPair(per_second_limit.limit_id),
+            LinkedLimitWeightPair(per_millisecond_limit.limit_id),
+        ])
+        throttler = AsyncSlidingWindowThrottler(
+            rate_limits=[per_second_limit, per_millisecond_limit, specific_limit],
+            safety_margin_pct=0)
+
+        # Scenario where one specific task was executed at 0 milliseconds
+        throttler.window(per_millisecond_limit.limit_id).add(1640000000.0000, 1)
+        throttler.window(per_second_limit.limit_id).add(1640000000.0000, 1)
+
+        context = throttler.execute_task(limit_id=specific_limit.limit_id)
+
+        time_mock.return_value = 1640000000.0100
+        self.assertTrue(context.within_capacity())
+
+        # Add one more occurrence of the same task but at millisecond 1
+        throttler.window(per_millisecond_limit.limit_id).add(1640000000.1000, 1)
+        throttler.window(per_second_limit.limit_id).add(1640000000.1000, 1)
+
+        time_mock.return_value = 1640000000.1000
+        self.assertFalse(context.within_capacity())
+
+        time_mock.return_value = 1640000000.1900
+        self.assertFalse(context.within_capacity())
+
+        time_mock.return_value = 1640000000.2000
+        self.assertFalse(context.within_capacity())
+
+        time_mock.return_value = 1640000000.2100
+        self.assertTrue(context.within_capacity())
+
+    def test_capacity_available_time(self):
+        window = RateLimitWindow(rate_limit=RateLimit(limit_id="A", limit=3, time_interval=1), safety_margin_pct=0)
+        window.add(10.0, 1)
+        window.add(10.5, 2)
+
+        self.assertEqual(0, window.capacity_available_time(0))
+        self.assertAlmostEqual(11.0, window.capacity_available_time(1), places=5)
+        self.assertAlmostEqual(11.5, window.capacity_available_time(2), places=5)
+        self.assertIsNone(window.capacity_available_time(4))
+
+    def test_waiters_are_woken_in_fifo_order_without_polling(self):
+        throttler = AsyncSlidingWindowThrottler(
+            rate_limits=[RateLimit(limit_id=TEST_POOL_ID, limit=1, time_interval=0.1)],
+            safety_margin_pct=0)
+        execution_order = []
+
+        async def execute(task_id: int):
+            async with throttler.execute_task(TEST_POOL_ID):
+                execution_order.append((task_id, time.time()))
+
+        async def execute_all():
+            await asyncio.gather(*[execute(task_id) for task_id in range(4)])
+
+        with patch.object(throttler, "_process_waiters", wraps=throttler._process_waiters) as process_mock:
+            self.async_run_with_timeout(execute_all())
+
+        self.assertEqual([0, 1, 2, 3], [task_id for task_id, _ in execution_order])
+        for (_, previous_ts), (_, ts) in zip(execution_order, execution_order[1:]):
+            self.assertGreaterEqual(ts - previous_ts, 0.1 - 0.01)
+        # One wakeup per queued task
+        self.assertEqual(3, process_mock.call_count)
+
+    def test_waiter_does_not_block_tasks_on_other_limits(self):
+        self.throttler.window(TEST_POOL_ID).add(time.time(), 1)
+        blocked_task = self.ev_loop.create_task(self.throttler.execute_task(TEST_POOL_ID).acquire())
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+        self.async_run_with_timeout(self.throttler.execute_task(TEST_WEIGHTED_TASK_2_ID).acquire())
+
+        self.assertFalse(blocked_task.done())
+        self.assertEqual(1, self.throttler.window(TEST_WEIGHTED_POOL_ID).capacity_used)
+        blocked_task.cancel()
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+    def test_later_task_waits_behind_queued_task_sharing_a_limit(self):
+        # Task 1 (weight 5) does not fit, but task 2 (weight 1) would. Task 2 has to wait to keep the FIFO order.
+        window = self.throttler.window(TEST_WEIGHTED_POOL_ID)
+        window.add(time.time(), 6)
+        first_task = self.ev_loop.create_task(self.throttler.execute_task(TEST_WEIGHTED_TASK_1_ID).acquire())
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+        second_task = self.ev_loop.create_task(self.throttler.execute_task(TEST_WEIGHTED_TASK_2_ID).acquire())
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+        self.assertFalse(first_task.done())
+        self.assertFalse(second_task.done())
+
+        # Once the first waiter is cancelled the second one gets its capacity right away
+        first_task.cancel()
+        self.async_run_with_timeout(second_task)
+
+        self.assertEqual(7, window.capacity_used)
+        self.assertEqual(0, len(self.throttler._waiting_limit_ids))
+        self.assertEqual(0, len(self.throttler._waiters))
+
+    def test_context_windows_include_related_limits(self):
+        context = self.throttler.execute_task(TEST_WEIGHTED_TASK_1_ID)
+
+        self.assertIsInstance(context, AsyncSlidingWindowRequestContext)
+        self.assertEqual(
+            [(TEST_WEIGHTED_TASK_1_ID, 1), (TEST_WEIGHTED_POOL_ID, 5)],
+            [(window.rate_limit.limit_id, weight) for window, weight in context.windows])
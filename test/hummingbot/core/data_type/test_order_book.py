@@ -3,6 +3,8 @@
 import logging
 import unittest
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import NumericOrderBookMessage, OrderBookMessage, \
+    OrderBookMessageType
 import numpy as np
 
 
@@ -50,6 +52,109 @@ class OrderBookUnitTest(unittest.TestCase):
         self.assertEqual(best_bid, [50., 0.01, 6.])
         self.assertEqual(best_ask, 0)
 
+    def test_apply_numpy_diffs_with_explicit_update_id(self):
+        order_book = OrderBook()
+        order_book.apply_numpy_snapshot(np.array([[1, 1, 1]], dtype=np.float64),
+                                        np.array([[2, 1, 1]], dtype=np.float64),
+                                        update_id=5)
+        self.assertEqual(5, order_book.snapshot_uid)
+
+        empty = np.empty((0, 3), dtype=np.float64)
+        order_book.apply_numpy_diffs(empty, empty, update_id=7)
+        self.assertEqual(7, order_book.last_diff_uid)
+
+        order_book.apply_numpy_diffs(np.array([[1.5, 2, 8]], dtype=np.float64), empty)
+        self.assertEqual(8, order_book.last_diff_uid)
+        self.assertEqual(1.5, order_book.get_price(False))
+
+    def test_numeric_messages_produce_same_book_as_row_based_messages(self):
+        snapshot_content = {
+            "trading_pair": "COINALPHA-HBOT",
+            "update_id": 1,
+            "bids": [["10", "1"], ["9.5", "2"], ["9", "3"]],
+            "asks": [["11", "1"], ["11.5", "2"]],
+        }
+        diff_contents = [
+            {"trading_pair": "COINALPHA-HBOT", "update_id": 2,
+             "bids": [["10", "0"], ["9.8", "4"]], "asks": [["11", "0.5"]]},
+            {"trading_pair": "COINALPHA-HBOT", "update_id": 3,
+             "bids": [], "asks": [["10.9", "7"], ["11.5", "0"]]},
+        ]
+
+        row_book = OrderBook()
+        row_book.restore_from_snapshot_and_diffs(
+            OrderBookMessage(OrderBookMessageType.SNAPSHOT, snapshot_content, 1),
+            [OrderBookMessage(OrderBookMessageType.DIFF, content, 2) for content in diff_contents])
+
+        numeric_book = OrderBook()
+        numeric_book.apply_snapshot_message(
+            NumericOrderBookMessage(OrderBookMessageType.SNAPSHOT, snapshot_content, 1))
+        for content in diff_contents:
+            numeric_book.apply_diff_message(NumericOrderBookMessage(OrderBookMessageType.DIFF, content, 2))
+
+        self.assertEqual(list(row_book.bid_entries()), list(numeric_book.bid_entries()))
+        self.assertEqual(list(row_book.ask_entries()), list(numeric_book.ask_entries()))
+        self.assertEqual(row_book.last_diff_uid, numeric_book.last_diff_uid)
+        self.assertEqual(1, numeric_book.snapshot_uid)
+        self.assertEqual(3, numeric_book.last_diff_uid)
+        self.assertEqual(9.8, numeric_book.get_price(False))
+        self.assertEqual(10.9, numeric_book.get_price(True))
+
+    def _assert_queries_match_linear_walk(self, indexed_book: OrderBook, linear_book: OrderBook):
+        for is_buy in (True, False):
+            for volume in (0.5, 1, 2.5, 7, 1000, float("nan")):
+                self.assertEqual(str(linear_book.get_price_for_volume(is_buy, volume)),
+                                 str(indexed_book.get_price_for_volume(is_buy, volume)))
+                self.assertEqual(str(linear_book.get_vwap_for_volume(is_buy, volume)),
+                                 str(indexed_book.get_vwap_for_volume(is_buy, volume)))
+                self.assertEqual(str(linear_book.get_price_for_quote_volume(is_buy, volume * 10)),
+                                 str(indexed_book.get_price_for_quote_volume(is_buy, volume * 10)))
+                self.assertEqual(str(linear_book.get_quote_volume_for_base_amount(is_buy, volume)),
+                                 str(indexed_book.get_quote_volume_for_base_amount(is_buy, volume)))
+            for price in (0, 9, 9.75, 10, 10.5, 11, 11.25, 100, float("nan")):
+                self.assertEqual(str(linear_book.get_volume_for_price(is_buy, price)),
+                                 str(indexed_book.get_volume_for_price(is_buy, price)))
+                self.assertEqual(str(linear_book.get_quote_volume_for_price(is_buy, price)),
+                                 str(indexed_book.get_quote_volume_for_price(is_buy, price)))
+
+    def test_depth_index_queries_match_linear_walk(self):
+        indexed_book = OrderBook()
+        linear_book = OrderBook()
+        linear_book.depth_index_enabled = False
+        self.assertTrue(indexed_book.depth_index_enabled)
+        self.assertFalse(linear_book.depth_index_enabled)
+
+        bids_array = np.array([[10, 1, 1], [9.75, 2, 1], [9.5, 0.3, 1], [9, 3, 1]], dtype=np.float64)
+        asks_array = np.array([[11, 1, 1], [11.25, 0.7, 1], [11.5, 2, 1], [12, 5, 1]], dtype=np.float64)
+        for book in (indexed_book, linear_book):
+            book.apply_numpy_snapshot(bids_array, asks_array)
+        self._assert_queries_match_linear_walk(indexed_book, linear_book)
+
+        diffs = [
+            # Changes deep in the book
+            (np.array([[9, 0, 2], [8.5, 4, 2]], dtype=np.float64), np.array([[12, 1.5, 2]], dtype=np.float64)),
+            # Changes at the top of the book
+            (np.array([[10.25, 0.4, 3]], dtype=np.float64), np.array([[11, 0, 3], [10.75, 0.1, 3]], dtype=np.float64)),
+            # Overlapping entries are truncated
+            (np.array([[11.5, 0.2, 4]], dtype=np.float64), np.empty((0, 3), dtype=np.float64)),
+        ]
+        for bids_diff, asks_diff in diffs:
+            for book in (indexed_book, linear_book):
+                book.apply_numpy_diffs(bids_diff, asks_diff)
+            self._assert_queries_match_linear_walk(indexed_book, linear_book)
+
+    def test_depth_index_after_snapshot_replaces_the_book(self):
+        order_book = OrderBook()
+        order_book.apply_numpy_snapshot(np.array([[10, 1, 1]], dtype=np.float64),
+                                        np.array([[11, 1, 1]], dtype=np.float64))
+        self.assertEqual(1, order_book.get_volume_for_price(True, 20).result_volume)
+
+        order_book.apply_numpy_snapshot(np.array([[9, 4, 2]], dtype=np.float64),
+                                        np.array([[12, 2, 2], [13, 3, 2]], dtype=np.float64))
+        self.assertEqual(5, order_book.get_volume_for_price(True, 20).result_volume)
+        self.assertEqual(13, order_book.get_price_for_volume(True, 4).result_price)
+        self.assertEqual(4, order_book.get_volume_for_price(False, 0).result_volume)
+
 
 def main():
     logging.basicConfig(level=logging.INFO)
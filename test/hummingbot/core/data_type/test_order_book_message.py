@@ -1,7 +1,9 @@
 import time
 import unittest
 
-from hummingbot.core.data_type.order_book_message import OrderBookMessage, \
+import numpy as np
+
+from hummingbot.core.data_type.order_book_message import NumericOrderBookMessage, OrderBookMessage, \
     OrderBookMessageType
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
@@ -248,3 +250,35 @@ class OrderBookMessageTest(unittest.TestCase):
         self.assertTrue(diff1 < snapshot2)  # based on id
         self.assertTrue(trade1 < snapshot1)  # based on timestamp
         self.assertTrue(diff2 < trade1)  # if same ts, ob messages < trade messages
+
+    def test_numeric_message_parses_entries_into_arrays(self):
+        msg = NumericOrderBookMessage(
+            message_type=OrderBookMessageType.DIFF,
+            content={
+                "update_id": 10,
+                "bids": [["5.5", "6"], ["7", "0"]],
+                "asks": [["1", "2", "9"]],
+            },
+            timestamp=time.time(),
+        )
+
+        np.testing.assert_array_equal(np.array([[5.5, 6, 10], [7, 0, 10]]), msg.bids_array)
+        np.testing.assert_array_equal(np.array([[1, 2, 10]]), msg.asks_array)
+        self.assertEqual(np.float64, msg.bids_array.dtype)
+        self.assertTrue(msg.bids_array.flags["C_CONTIGUOUS"])
+        # The entries are parsed only once
+        self.assertIs(msg.bids_array, msg.bids_array)
+
+        self.assertEqual([OrderBookRow(5.5, 6, 10), OrderBookRow(7, 0, 10)], msg.bids)
+        self.assertEqual([OrderBookRow(1, 2, 10)], msg.asks)
+
+    def test_numeric_message_with_no_entries(self):
+        msg = NumericOrderBookMessage(
+            message_type=OrderBookMessageType.DIFF,
+            content={"update_id": 10, "bids": [], "asks": []},
+            timestamp=time.time(),
+        )
+
+        self.assertEqual((0, 3), msg.bids_array.shape)
+        self.assertEqual((0, 3), msg.asks_array.shape)
+        self.assertEqual([], msg.bids)
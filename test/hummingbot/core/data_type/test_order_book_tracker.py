@@ -0,0 +1,261 @@
+import asyncio
+import unittest
+from typing import Awaitable, Dict, List, Optional
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+
+
+class MockOrderBookTrackerDataSource(OrderBookTrackerDataSource):
+
+    def __init__(self, trading_pairs: List[str]):
+        super().__init__(trading_pairs=trading_pairs)
+        self.snapshot_requests: List[str] = []
+        self.requests_in_flight: int = 0
+        self.max_requests_in_flight: int = 0
+        self.release_event: Optional[asyncio.Event] = None
+        self.snapshot_update_id: int = 1
+
+    async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None) -> Dict[str, float]:
+        return {}
+
+    async def _order_book_snapshot(self, trading_pair: str) -> OrderBookMessage:
+        self.snapshot_requests.append(trading_pair)
+        self.requests_in_flight += 1
+        self.max_requests_in_flight = max(self.max_requests_in_flight, self.requests_in_flight)
+        try:
+            if self.release_event is not None:
+                await self.release_event.wait()
+            else:
+                await asyncio.sleep(0)
+        finally:
+            self.requests_in_flight -= 1
+        return OrderBookMessage(
+            message_type=OrderBookMessageType.SNAPSHOT,
+            content={
+                "trading_pair": trading_pair,
+                "update_id": self.snapshot_update_id,
+                "bids": [["10", "1"]],
+                "asks": [["11", "1"]],
+            },
+            timestamp=1)
+
+
+class OrderBookTrackerTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+        cls.trading_pairs = [f"COIN{i}-HBOT" for i in range(10)]
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.data_source = MockOrderBookTrackerDataSource(trading_pairs=self.trading_pairs)
+        self.tracker: Optional[OrderBookTracker] = None
+
+    def tearDown(self) -> None:
+        self.tracker and self.tracker.stop()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def test_sequential_init_order_books(self):
+        self.tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=self.trading_pairs[:2])
+        sleep_calls = []
+
+        async def _sleep(delay: float):
+            sleep_calls.append(delay)
+
+        self.tracker._sleep = _sleep
+
+        self.async_run_with_timeout(self.tracker._init_order_books())
+
+        self.assertTrue(self.tracker.ready)
+        self.assertEqual(self.trading_pairs[:2], self.data_source.snapshot_requests)
+        self.assertEqual(1, self.data_source.max_requests_in_flight)
+        self.assertEqual([1, 1], sleep_calls)
+        self.assertEqual(self.trading_pairs[:2], self.tracker.ready_trading_pairs)
+
+    def test_concurrent_init_order_books_respects_concurrency_cap(self):
+        self.tracker = OrderBookTracker(
+            data_source=self.data_source,
+            trading_pairs=self.trading_pairs,
+            concurrent_init=True,
+            max_concurrent_inits=3)
+        self.data_source.release_event = asyncio.Event()
+
+        init_task = self.ev_loop.create_task(self.tracker._init_order_books())
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        self.assertEqual(3, self.data_source.requests_in_flight)
+        self.assertFalse(self.tracker.ready)
+
+        self.data_source.release_event.set()
+        self.async_run_with_timeout(init_task)
+
+        self.assertTrue(self.tracker.ready)
+        self.assertEqual(3, self.data_source.max_requests_in_flight)
+        self.assertEqual(set(self.trading_pairs), set(self.tracker.order_books.keys()))
+        self.assertEqual(self.trading_pairs, self.tracker.ready_trading_pairs)
+
+    def test_order_book_marked_ready_before_all_books_are_initialized(self):
+        self.tracker = OrderBookTracker(
+            data_source=self.data_source,
+            trading_pairs=self.trading_pairs[:2],
+            concurrent_init=True,
+            max_concurrent_inits=1)
+        self.data_source.release_event = asyncio.Event()
+        original_snapshot = self.data_source._order_book_snapshot
+
+        async def snapshot(trading_pair: str) -> OrderBookMessage:
+            if trading_pair == self.trading_pairs[0]:
+                self.data_source.snapshot_requests.append(trading_pair)
+                return OrderBookMessage(
+                    message_type=OrderBookMessageType.SNAPSHOT,
+                    content={"trading_pair": trading_pair, "update_id": 1, "bids": [], "asks": []},
+                    timestamp=1)
+            return await original_snapshot(trading_pair)
+
+        self.data_source._order_book_snapshot = snapshot
+
+        init_task = self.ev_loop.create_task(self.tracker._init_order_books())
+        self.async_run_with_timeout(self.tracker.wait_order_book_ready(self.trading_pairs[0]))
+
+        self.assertTrue(self.tracker.is_order_book_ready(self.trading_pairs[0]))
+        self.assertFalse(self.tracker.is_order_book_ready(self.trading_pairs[1]))
+        self.assertFalse(self.tracker.ready)
+        self.assertEqual([self.trading_pairs[0]], self.tracker.ready_trading_pairs)
+
+        self.data_source.release_event.set()
+        self.async_run_with_timeout(init_task)
+
+        self.assertTrue(self.tracker.is_order_book_ready(self.trading_pairs[1]))
+        self.assertTrue(self.tracker.ready)
+
+    def test_stop_clears_order_book_ready_flags(self):
+        self.tracker = OrderBookTracker(
+            data_source=self.data_source, trading_pairs=self.trading_pairs[:1], concurrent_init=True)
+
+        self.async_run_with_timeout(self.tracker._init_order_books())
+        self.assertTrue(self.tracker.is_order_book_ready(self.trading_pairs[0]))
+
+        self.tracker.stop()
+
+        self.assertFalse(self.tracker.is_order_book_ready(self.trading_pairs[0]))
+        self.assertFalse(self.tracker.ready)
+
+    def _diff_message(self, first_update_id: Optional[int], update_id: int, bids=None, asks=None) -> OrderBookMessage:
+        content = {
+            "trading_pair": self.trading_pairs[0],
+            "update_id": update_id,
+            "bids": bids or [],
+            "asks": asks or [],
+        }
+        if first_update_id is not None:
+            content["first_update_id"] = first_update_id
+        return OrderBookMessage(message_type=OrderBookMessageType.DIFF, content=content, timestamp=update_id)
+
+    def _start_tracking_single_book(self, snapshot_update_id: int) -> asyncio.Task:
+        trading_pair = self.trading_pairs[0]
+        self.tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=[trading_pair])
+        order_book = OrderBook()
+        order_book.apply_snapshot([], [], snapshot_update_id)
+        self.tracker._order_books[trading_pair] = order_book
+        self.tracker._tracking_message_queues[trading_pair] = asyncio.Queue()
+        return self.ev_loop.create_task(self.tracker._track_single_book(trading_pair))
+
+    def test_track_single_book_applies_continuous_diffs(self):
+        trading_pair = self.trading_pairs[0]
+        task = self._start_tracking_single_book(snapshot_update_id=10)
+        queue = self.tracker._tracking_message_queues[trading_pair]
+
+        queue.put_nowait(self._diff_message(first_update_id=9, update_id=12, bids=[["10", "1"]]))
+        queue.put_nowait(self._diff_message(first_update_id=13, update_id=15, asks=[["11", "2"]]))
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+        task.cancel()
+
+        order_book = self.tracker.order_books[trading_pair]
+        self.assertEqual(15, order_book.last_diff_uid)
+        self.assertEqual(10, order_book.get_price(False))
+        self.assertEqual(11, order_book.get_price(True))
+        self.assertEqual(0, self.tracker.sequence_gaps_count.get(trading_pair, 0))
+        self.assertEqual(0, len(self.data_source.snapshot_requests))
+
+    def test_track_single_book_skips_diffs_already_included(self):
+        trading_pair = self.trading_pairs[0]
+        task = self._start_tracking_single_book(snapshot_update_id=10)
+        queue = self.tracker._tracking_message_queues[trading_pair]
+
+        queue.put_nowait(self._diff_message(first_update_id=5, update_id=10, bids=[["10", "1"]]))
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+        task.cancel()
+
+        order_book = self.tracker.order_books[trading_pair]
+        self.assertEqual(0, order_book.last_diff_uid)
+        self.assertEqual(0, len(list(order_book.bid_entries())))
+
+    def test_track_single_book_resyncs_after_sequence_gap(self):
+        trading_pair = self.trading_pairs[0]
+        task = self._start_tracking_single_book(snapshot_update_id=10)
+        queue = self.tracker._tracking_message_queues[trading_pair]
+        self.data_source.snapshot_update_id = 20
+
+        queue.put_nowait(self._diff_message(first_update_id=11, update_id=15, bids=[["9", "1"]]))
+        # Updates 16 to 17 are lost
+        queue.put_nowait(self._diff_message(first_update_id=18, update_id=22, asks=[["12", "3"]]))
+        queue.put_nowait(self._diff_message(first_update_id=23, update_id=25, asks=[["13", "1"]]))
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+        task.cancel()
+
+        order_book = self.tracker.order_books[trading_pair]
+        self.assertEqual([trading_pair], self.data_source.snapshot_requests)
+        self.assertEqual({trading_pair: 1}, self.tracker.sequence_gaps_count)
+        self.assertEqual({trading_pair: 1}, self.tracker.resyncs_count)
+        self.assertEqual(20, order_book.snapshot_uid)
+        self.assertEqual(25, order_book.last_diff_uid)
+        bids = list(order_book.bid_entries())
+        asks = list(order_book.ask_entries())
+        self.assertEqual([10], [bid.price for bid in bids])
+        self.assertEqual([11, 12, 13], [ask.price for ask in asks])
+
+    def test_track_single_book_retries_resync_when_snapshot_does_not_connect_with_diffs(self):
+        trading_pair = self.trading_pairs[0]
+        task = self._start_tracking_single_book(snapshot_update_id=10)
+        queue = self.tracker._tracking_message_queues[trading_pair]
+        sleep_calls = []
+        snapshot_ids = [12, 20]
+
+        async def _sleep(delay: float):
+            sleep_calls.append(delay)
+            self.data_source.snapshot_update_id = snapshot_ids.pop(0)
+
+        self.tracker._sleep = _sleep
+        self.data_source.snapshot_update_id = snapshot_ids.pop(0)
+
+        queue.put_nowait(self._diff_message(first_update_id=15, update_id=22, asks=[["12", "3"]]))
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+        task.cancel()
+
+        order_book = self.tracker.order_books[trading_pair]
+        self.assertEqual([trading_pair, trading_pair], self.data_source.snapshot_requests)
+        self.assertEqual([self.tracker.RESYNC_RETRY_DELAY], sleep_calls)
+        self.assertEqual({trading_pair: 1}, self.tracker.resyncs_count)
+        self.assertEqual(20, order_book.snapshot_uid)
+        self.assertEqual(22, order_book.last_diff_uid)
+
+    def test_track_single_book_does_not_check_gaps_without_first_update_id(self):
+        trading_pair = self.trading_pairs[0]
+        task = self._start_tracking_single_book(snapshot_update_id=10)
+        queue = self.tracker._tracking_message_queues[trading_pair]
+
+        queue.put_nowait(self._diff_message(first_update_id=None, update_id=1000, bids=[["10", "1"]]))
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+        task.cancel()
+
+        self.assertEqual(1000, self.tracker.order_books[trading_pair].last_diff_uid)
+        self.assertEqual(0, len(self.data_source.snapshot_requests))
@@ -3,10 +3,12 @@ import json
 import unittest
 from decimal import Decimal
 from typing import Awaitable
+from unittest.mock import AsyncMock, patch
 
 from aioresponses import aioresponses
 
 from hummingbot.connector.exchange.binance import binance_constants as CONSTANTS, binance_web_utils as web_utils
+from hummingbot.connector.test_support.network_mocking_assistant import NetworkMockingAssistant
 from hummingbot.connector.utils import combine_to_hb_trading_pair
 from hummingbot.core.rate_oracle.sources.binance_rate_source import BinanceRateSource
 
@@ -107,3 +109,36 @@ class BinanceRateSourceTest(unittest.TestCase):
         self.assertEqual(expected_rate, prices[self.trading_pair])
         self.assertIn(self.us_trading_pair, prices)
         self.assertNotIn(self.ignored_trading_pair, prices)
+
+    @aioresponses()
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_get_prices_from_tickers_stream(self, mock_api, ws_connect_mock):
+        self.setup_binance_responses(mock_api=mock_api, expected_rate=Decimal("10"))
+        mocking_assistant = NetworkMockingAssistant()
+        ws_connect_mock.return_value = mocking_assistant.create_websocket_mock()
+        tickers_event = [
+            {"e": "24hrTicker", "s": self.binance_pair, "c": "12.05", "b": "11.9", "a": "12.1"},
+            {"e": "24hrTicker", "s": self.binance_ignored_pair, "c": "1", "b": "1", "a": "1"},
+        ]
+        mocking_assistant.add_websocket_aiohttp_message(
+            websocket_mock=ws_connect_mock.return_value, message=json.dumps({"result": None, "id": 1}))
+        mocking_assistant.add_websocket_aiohttp_message(
+            websocket_mock=ws_connect_mock.return_value, message=json.dumps(tickers_event))
+
+        rate_source = BinanceRateSource(stream_prices=True)
+        rate_source._ensure_exchanges()
+        stream_task = self.ev_loop.create_task(
+            rate_source._listen_to_tickers_stream(exchange=rate_source._binance_exchange))
+        rate_source._stream_tasks = [stream_task]
+        try:
+            mocking_assistant.run_until_all_aiohttp_messages_delivered(ws_connect_mock.return_value)
+
+            sent_messages = mocking_assistant.json_messages_sent_through_websocket(
+                websocket_mock=ws_connect_mock.return_value)
+            self.assertEqual([{"method": "SUBSCRIBE", "params": ["!ticker@arr"], "id": 1}], sent_messages)
+
+            prices = self.async_run_with_timeout(rate_source.get_prices())
+            self.assertEqual(Decimal("12"), prices[self.trading_pair])
+            self.assertNotIn(self.ignored_trading_pair, prices)
+        finally:
+            stream_task.cancel()
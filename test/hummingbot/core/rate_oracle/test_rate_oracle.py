@@ -10,7 +10,7 @@ from hummingbot.connector.utils import combine_to_hb_trading_pair
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.core.rate_oracle.sources.coin_gecko_rate_source import CoinGeckoRateSource
 from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
-from hummingbot.core.rate_oracle.utils import find_rate
+from hummingbot.core.rate_oracle.utils import ConversionRateIndex, find_rate
 
 
 class DummyRateSource(RateSourceBase):
@@ -67,6 +67,15 @@ class RateOracleTest(unittest.TestCase):
 
         self.assertEqual(0, len(rate_oracle.prices))
 
+    def test_rate_async_uses_stored_prices(self):
+        rate_oracle = RateOracle(source=DummyRateSource(price_dict={self.trading_pair: Decimal("10")}))
+        rate_oracle._prices = {self.trading_pair: Decimal("11")}
+
+        rate = self.async_run_with_timeout(rate_oracle.rate_async(self.trading_pair))
+        self.assertEqual(Decimal("11"), rate)
+        rate = self.async_run_with_timeout(rate_oracle.get_rate(self.target_token))
+        self.assertIsNone(rate)
+
     def test_find_rate(self):
         prices = {"HBOT-USDT": Decimal("100"), "AAVE-USDT": Decimal("50"), "USDT-GBP": Decimal("0.75")}
         rate = find_rate(prices, "HBOT-USDT")
@@ -82,6 +91,81 @@ class RateOracleTest(unittest.TestCase):
         rate = find_rate(prices, "HBOT-GBP")
         self.assertEqual(rate, Decimal("75"))
 
+    def test_conversion_index_finds_same_rates_as_find_rate(self):
+        prices = {"HBOT-USDT": Decimal("100"), "AAVE-USDT": Decimal("50"), "USDT-GBP": Decimal("0.75")}
+        conversion_index = ConversionRateIndex(prices=prices, bridge_tokens=())
+
+        for pair in ["HBOT-USDT", "ZBOT-USDT", "USDT-HBOT", "HBOT-AAVE", "AAVE-HBOT", "HBOT-GBP", "HBOT-HBOT"]:
+            self.assertEqual(find_rate(prices, pair), conversion_index.find_rate(pair))
+
+    def test_conversion_index_uses_only_find_rate_routes_without_bridge_tokens(self):
+        for prices, pair in [({"X-A": Decimal("2"), "X-Q": Decimal("3")}, "A-Q"),
+                             ({"WETH-USDT": Decimal("2000")}, "ETH-USDT"),
+                             ({"A-WETH": Decimal("2"), "ETH-Q": Decimal("3")}, "A-Q"),
+                             ({"A-B": Decimal("2"), "A-C": Decimal("4"), "B-Q": Decimal("3"), "Q-C": Decimal("5")},
+                              "A-Q"),
+                             ({"A-B": Decimal("2"), "Q-B": Decimal("4")}, "A-Q")]:
+            conversion_index = ConversionRateIndex(prices=prices, bridge_tokens=())
+            self.assertEqual(find_rate(prices, pair), conversion_index.find_rate(pair))
+
+    def test_conversion_index_bridged_routes_unwrap_tokens_and_use_inverse_prices(self):
+        prices = {"A-WETH": Decimal("2"), "ETH-Q": Decimal("3"), "X-A": Decimal("4")}
+
+        self.assertIsNone(find_rate(prices, "A-Q"))
+        self.assertIsNone(find_rate(prices, "Q-X"))
+
+        conversion_index = ConversionRateIndex(prices=prices, bridge_tokens=("ETH",))
+        self.assertEqual(Decimal("6"), conversion_index.find_rate("A-Q"))
+        self.assertEqual(Decimal("1") / Decimal("3") * (Decimal("1") / Decimal("2") / Decimal("4")),
+                         conversion_index.find_rate("Q-X"))
+
+    def test_conversion_index_routes_through_bridge_tokens(self):
+        prices = {"HBOT-ETH": Decimal("0.05"),
+                  "ETH-BTC": Decimal("0.1"),
+                  "BTC-USDT": Decimal("20000"),
+                  "USDT-EUR": Decimal("0.9")}
+
+        self.assertIsNone(find_rate(prices, "HBOT-EUR"))
+        self.assertIsNone(ConversionRateIndex(prices=prices, bridge_tokens=()).find_rate("HBOT-EUR"))
+
+        conversion_index = ConversionRateIndex(prices=prices, bridge_tokens=("USDC", "BTC"))
+        self.assertEqual(Decimal("0.05") * Decimal("0.1") * Decimal("20000") * Decimal("0.9"),
+                         conversion_index.find_rate("HBOT-EUR"))
+        self.assertEqual(Decimal("1") / Decimal("0.9") / Decimal("20000") / Decimal("0.1") / Decimal("0.05"),
+                         conversion_index.find_rate("EUR-HBOT"))
+
+    def test_rate_async_routes_through_bridge_tokens_with_network_stopped(self):
+        prices = {"HBOT-ETH": Decimal("0.05"),
+                  "ETH-BTC": Decimal("0.1"),
+                  "BTC-USDT": Decimal("20000"),
+                  "USDT-EUR": Decimal("0.9")}
+        expected_rate = Decimal("0.05") * Decimal("0.1") * Decimal("20000") * Decimal("0.9")
+        rate_oracle = RateOracle(source=DummyRateSource(price_dict=prices), quote_token="EUR",
+                                 bridge_tokens=("USDC", "BTC"))
+
+        rate = self.async_run_with_timeout(rate_oracle.rate_async("HBOT-EUR"))
+        self.assertEqual(expected_rate, rate)
+        rate = self.async_run_with_timeout(rate_oracle.get_rate("HBOT"))
+        self.assertEqual(expected_rate, rate)
+
+        # The stored prices of a started network give the same rate
+        rate_oracle._prices = deepcopy(prices)
+        self.assertEqual(expected_rate, rate_oracle.get_pair_rate("HBOT-EUR"))
+
+    def test_get_pair_rate_uses_refreshed_prices(self):
+        rate_oracle = RateOracle(source=DummyRateSource(price_dict={}))
+
+        rate_oracle._prices = {"BTC-USDT": Decimal("20000")}
+        self.assertEqual(Decimal("20000"), rate_oracle.get_pair_rate("BTC-USDT"))
+        self.assertIsNone(rate_oracle.get_pair_rate("ETH-USDT"))
+
+        rate_oracle._prices = {"BTC-USDT": Decimal("21000"), "ETH-BTC": Decimal("0.1")}
+        self.assertEqual(Decimal("21000"), rate_oracle.get_pair_rate("BTC-USDT"))
+        self.assertEqual(Decimal("2100"), rate_oracle.get_pair_rate("ETH-USDT"))
+
+        rate_oracle._prices["HBOT-USDT"] = Decimal("10")
+        self.assertEqual(Decimal("10"), rate_oracle.get_pair_rate("HBOT-USDT"))
+
     def test_rate_oracle_single_instance_rate_source_reset_after_configuration_change(self):
         config_map = ClientConfigAdapter(ClientConfigMap())
         config_map.rate_oracle_source = "binance"
@@ -7,6 +7,7 @@ from hummingbot.core.clock import (
     Clock,
     ClockMode
 )
+from hummingbot.core.clock_profiler import ClockProfiler
 from hummingbot.core.time_iterator import TimeIterator
 
 
@@ -124,3 +125,27 @@ class ClockUnitTest(unittest.TestCase):
         self.clock_backtest.backtest_til(self.backtest_start_timestamp + self.tick_size)
         self.assertGreater(self.clock_backtest.current_timestamp, self.clock_backtest.start_time)
         self.assertLess(self.clock_backtest.current_timestamp, self.backtest_end_timestamp)
+
+    def test_backtest_with_profiler(self):
+        profiler = ClockProfiler()
+        self.clock_backtest.profiler = profiler
+        self.clock_backtest.add_iterator(TimeIterator())
+        self.clock_backtest.add_iterator(TimeIterator())
+
+        self.clock_backtest.backtest_til(self.backtest_start_timestamp + 10 * self.tick_size)
+
+        self.assertEqual(["TimeIterator", "TimeIterator (2)"], list(profiler.iterator_durations))
+        self.assertEqual(10, profiler.iterator_durations["TimeIterator"].count)
+        self.assertEqual(10, profiler.iterator_durations["TimeIterator (2)"].count)
+
+    def test_run_til_with_profiler(self):
+        profiler = ClockProfiler()
+        self.clock_realtime.profiler = profiler
+        self.clock_realtime.add_iterator(TimeIterator())
+
+        with self.clock_realtime:
+            self.ev_loop.run_until_complete(self.clock_realtime.run_til(self.realtime_end_timestamp))
+
+        ticks = profiler.iterator_durations["TimeIterator"].count
+        self.assertGreater(ticks, 0)
+        self.assertEqual(ticks, profiler.tick_lag.count)
@@ -0,0 +1,103 @@
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+from typing import Awaitable
+
+from hummingbot.core.clock_profiler import ClockProfiler, DurationHistogram
+from hummingbot.core.time_iterator import TimeIterator
+
+
+class DurationHistogramTests(unittest.TestCase):
+    def test_record(self):
+        histogram = DurationHistogram(buckets=(0.001, 0.01, 0.1))
+        for value in (0.0005, 0.002, 0.003, 0.05, 2.0):
+            histogram.record(value)
+
+        self.assertEqual(5, histogram.count)
+        self.assertAlmostEqual(2.0555, histogram.total)
+        self.assertAlmostEqual(0.4111, histogram.mean)
+        self.assertEqual(2.0, histogram.max)
+        self.assertEqual([1, 2, 1, 1], [bucket["count"] for bucket in histogram.to_dict()["buckets"]])
+        self.assertEqual("+Inf", histogram.to_dict()["buckets"][-1]["le"])
+
+    def test_quantile(self):
+        histogram = DurationHistogram(buckets=(0.001, 0.01, 0.1))
+        self.assertEqual(0.0, histogram.quantile(0.5))
+
+        for value in [0.0005] * 98 + [0.05, 0.5]:
+            histogram.record(value)
+
+        self.assertEqual(0.001, histogram.quantile(0.5))
+        self.assertEqual(0.1, histogram.quantile(0.99))
+        self.assertEqual(0.5, histogram.quantile(1))
+
+
+class ClockProfilerTests(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+        self.profiler = ClockProfiler(loop_lag_sample_interval=0.01)
+
+    def tearDown(self) -> None:
+        self.profiler.stop()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def test_top_offenders_sorted_by_total_time(self):
+        fast_iterator = TimeIterator()
+        slow_iterator = TimeIterator()
+        for _ in range(3):
+            self.profiler.record_iterator_tick(fast_iterator, 0.001)
+            self.profiler.record_iterator_tick(slow_iterator, 0.2)
+
+        offenders = self.profiler.top_offenders()
+
+        self.assertEqual(["TimeIterator (2)", "TimeIterator"], offenders["Iterator"].tolist())
+        self.assertEqual([3, 3], offenders["Ticks"].tolist())
+        self.assertAlmostEqual(200, offenders["Mean (ms)"][0])
+        self.assertAlmostEqual(0.6, offenders["Total (s)"][0])
+        self.assertEqual(1, len(self.profiler.top_offenders(limit=1)))
+
+    def test_negative_lags_are_recorded_as_zero(self):
+        self.profiler.record_tick_lag(-0.001)
+
+        self.assertEqual(1, self.profiler.tick_lag.count)
+        self.assertEqual(0.0, self.profiler.tick_lag.max)
+
+    def test_watchdog_samples_loop_lag(self):
+        self.profiler.start()
+        self.assertTrue(self.profiler.started)
+
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        self.assertGreater(self.profiler.loop_lag.count, 0)
+        self.profiler.stop()
+        self.assertFalse(self.profiler.started)
+
+    def test_reset(self):
+        self.profiler.record_iterator_tick(TimeIterator(), 0.001)
+        self.profiler.record_tick_lag(0.01)
+
+        self.profiler.reset()
+
+        self.assertEqual(0, len(self.profiler.iterator_durations))
+        self.assertEqual(0, self.profiler.tick_lag.count)
+
+    def test_export(self):
+        self.profiler.record_iterator_tick(TimeIterator(), 0.001)
+        self.profiler.record_loop_lag(0.002)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, "profile.json")
+            self.profiler.export(file_path)
+            with open(file_path) as export_file:
+                exported = json.load(export_file)
+
+        self.assertEqual(1, exported["iterator_tick_durations"]["TimeIterator"]["count"])
+        self.assertEqual(1, exported["loop_lag"]["count"])
+        self.assertEqual(0, exported["tick_lag"]["count"])
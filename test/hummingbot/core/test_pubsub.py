@@ -3,11 +3,34 @@ import gc
 import weakref
 
 from hummingbot.core.pubsub import PubSub
+from hummingbot.core.event.event_listener import EventListener
 from hummingbot.core.event.event_logger import EventLogger
 
 from test.mock.mock_events import MockEventType, MockEvent
 
 
+class RemovingListener(EventListener):
+    def __init__(self, pubsub: PubSub, event_tag: MockEventType, listener: EventListener):
+        super().__init__()
+        self.pubsub = pubsub
+        self.event_tag = event_tag
+        self.listener = listener
+
+    def __call__(self, arg):
+        self.pubsub.remove_listener(self.event_tag, self.listener)
+
+
+class AddingListener(EventListener):
+    def __init__(self, pubsub: PubSub, event_tag: MockEventType, listener: EventListener):
+        super().__init__()
+        self.pubsub = pubsub
+        self.event_tag = event_tag
+        self.listener = listener
+
+    def __call__(self, arg):
+        self.pubsub.add_listener(self.event_tag, self.listener)
+
+
 class PubSubTest(unittest.TestCase):
     def setUp(self) -> None:
         self.pubsub = PubSub()
@@ -89,6 +112,62 @@ class PubSubTest(unittest.TestCase):
         listeners = self.pubsub.get_listeners(self.event_tag_zero)
         self.assertEqual(0, len(listeners))
 
+    def test_lapsed_listener_remove_on_trigger_event(self):
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_one)
+        self.listener_zero = None  # remove strong reference
+        gc.collect()
+
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+
+        self.assertEqual(1, len(self.listener_one.event_log))
+        self.assertEqual([self.listener_one], self.pubsub.get_listeners(self.event_tag_zero))
+
+    def test_trigger_event_no_listeners(self):
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+        self.pubsub.remove_listener(self.event_tag_zero, self.listener_zero)
+
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.pubsub.trigger_event(self.event_tag_one, self.event)
+
+        self.assertEqual(0, len(self.listener_zero.event_log))
+
+    def test_remove_listener_while_dispatching(self):
+        removing_listener = RemovingListener(self.pubsub, self.event_tag_zero, self.listener_zero)
+        self.pubsub.add_listener(self.event_tag_zero, removing_listener)
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+
+        # The dispatch in progress is not affected by the removal
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.assertEqual(1, len(self.listener_zero.event_log))
+        self.assertEqual([removing_listener], self.pubsub.get_listeners(self.event_tag_zero))
+
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.assertEqual(1, len(self.listener_zero.event_log))
+
+    def test_add_listener_while_dispatching(self):
+        adding_listener = AddingListener(self.pubsub, self.event_tag_zero, self.listener_zero)
+        self.pubsub.add_listener(self.event_tag_zero, adding_listener)
+
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.assertEqual(0, len(self.listener_zero.event_log))
+        self.assertEqual([adding_listener, self.listener_zero], self.pubsub.get_listeners(self.event_tag_zero))
+
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.assertEqual(1, len(self.listener_zero.event_log))
+
+    def test_pubsub_is_garbage_collected_with_listeners(self):
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+        pubsub_weakref = weakref.ref(self.pubsub)
+
+        self.pubsub = None
+        gc.collect()
+
+        self.assertIsNone(pubsub_weakref())
+        # The listener dying after the PubSub does not fail
+        self.listener_zero = None
+        gc.collect()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -21,3 +21,37 @@ class AsyncTTLCacheUnitTest(unittest.TestCase):
         time.sleep(2)
         ret_4 = asyncio.get_event_loop().run_until_complete(self.get_timestamp())
         self.assertGreater(ret_4, ret_3)
+
+    def test_concurrent_calls_share_in_flight_call(self):
+        calls = []
+
+        @async_ttl_cache(ttl=3, maxsize=1)
+        async def get_value():
+            calls.append(1)
+            await asyncio.sleep(0.1)
+            return len(calls)
+
+        async def get_values_concurrently():
+            return await asyncio.gather(*[get_value() for _ in range(5)])
+
+        values = asyncio.get_event_loop().run_until_complete(get_values_concurrently())
+
+        self.assertEqual([1] * 5, values)
+        self.assertEqual(1, len(calls))
+
+    def test_concurrent_calls_share_in_flight_call_exception(self):
+        calls = []
+
+        @async_ttl_cache(ttl=3, maxsize=1)
+        async def get_value():
+            calls.append(1)
+            await asyncio.sleep(0.1)
+            raise ValueError("Test error")
+
+        async def get_values_concurrently():
+            return await asyncio.gather(*[get_value() for _ in range(3)], return_exceptions=True)
+
+        results = asyncio.get_event_loop().run_until_complete(get_values_concurrently())
+
+        self.assertTrue(all(isinstance(result, ValueError) for result in results))
+        self.assertEqual(1, len(calls))
@@ -0,0 +1,122 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.utils.columnar_market_data import (
+    ColumnarMarketDataReader,
+    ColumnarMarketDataWriter,
+    market_data_dtype,
+)
+
+
+class ColumnarMarketDataTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.data_dir = self.temp_dir.name
+        self.exchange = "binance"
+        self.trading_pair = "COINALPHA-HBOT"
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def append_snapshot(self, writer: ColumnarMarketDataWriter, timestamp: int, levels: int = 3):
+        bids = (OrderBookRow(100.0 - level, 1.0 + level, 1) for level in range(levels))
+        asks = (OrderBookRow(101.0 + level, 2.0 + level, 1) for level in range(levels))
+        writer.append(exchange=self.exchange, trading_pair=self.trading_pair, timestamp=timestamp,
+                      mid_price=100.5, best_bid=100.0, best_ask=101.0, bids=bids, asks=asks)
+
+    def test_append_and_read_snapshots(self):
+        writer = ColumnarMarketDataWriter(data_dir=self.data_dir, depth=2)
+        self.append_snapshot(writer, timestamp=1000)
+        self.append_snapshot(writer, timestamp=2000, levels=1)
+        writer.close()
+
+        records = ColumnarMarketDataReader(self.data_dir).read(self.exchange, self.trading_pair)
+
+        self.assertEqual(market_data_dtype(2), records.dtype)
+        self.assertEqual([1000, 2000], records["timestamp"].tolist())
+        self.assertEqual([100.0, 99.0], records["bid_prices"][0].tolist())
+        self.assertEqual([1.0, 2.0], records["bid_amounts"][0].tolist())
+        self.assertEqual([101.0, 102.0], records["ask_prices"][0].tolist())
+        self.assertEqual(101.0, records["ask_prices"][1][0])
+        self.assertTrue(np.isnan(records["ask_prices"][1][1]))
+
+    def test_writer_consumes_only_depth_entries(self):
+        consumed = []
+
+        def entries():
+            for level in range(100):
+                consumed.append(level)
+                yield OrderBookRow(100.0 - level, 1.0, 1)
+
+        writer = ColumnarMarketDataWriter(data_dir=self.data_dir, depth=5)
+        writer.append(exchange=self.exchange, trading_pair=self.trading_pair, timestamp=1000,
+                      mid_price=100.5, best_bid=100.0, best_ask=101.0, bids=entries(), asks=iter([]))
+        writer.close()
+
+        self.assertEqual(5, len(consumed))
+
+    def test_read_time_range_across_segments(self):
+        writer = ColumnarMarketDataWriter(data_dir=self.data_dir, depth=2, max_segment_records=2)
+        for timestamp in range(1000, 6000, 1000):
+            self.append_snapshot(writer, timestamp=timestamp)
+        writer.close()
+        reader = ColumnarMarketDataReader(self.data_dir)
+
+        records = reader.read(self.exchange, self.trading_pair, start_timestamp=2000, end_timestamp=4000)
+
+        self.assertEqual([2000, 3000, 4000], records["timestamp"].tolist())
+        pair_dir = os.path.join(self.data_dir, self.exchange, self.trading_pair)
+        self.assertEqual(3, len([name for name in os.listdir(pair_dir) if name.endswith(".bin")]))
+        self.assertEqual(0, len(reader.read(self.exchange, self.trading_pair, start_timestamp=6000)))
+
+    def test_writer_continues_last_segment_and_drops_incomplete_record(self):
+        writer = ColumnarMarketDataWriter(data_dir=self.data_dir, depth=2)
+        self.append_snapshot(writer, timestamp=1000)
+        writer.close()
+        segment_path = os.path.join(self.data_dir, self.exchange, self.trading_pair, "segment_000000.bin")
+        with open(segment_path, "ab") as segment_file:
+            segment_file.write(b"\x00" * 10)
+
+        writer = ColumnarMarketDataWriter(data_dir=self.data_dir, depth=2)
+        self.append_snapshot(writer, timestamp=2000)
+        writer.close()
+
+        records = ColumnarMarketDataReader(self.data_dir).read(self.exchange, self.trading_pair)
+        self.assertEqual([1000, 2000], records["timestamp"].tolist())
+        self.assertEqual(2 * market_data_dtype(2).itemsize, os.path.getsize(segment_path))
+
+    def test_segments_with_different_depth_are_padded(self):
+        writer = ColumnarMarketDataWriter(data_dir=self.data_dir, depth=1)
+        self.append_snapshot(writer, timestamp=1000)
+        writer.close()
+        writer = ColumnarMarketDataWriter(data_dir=self.data_dir, depth=3)
+        self.append_snapshot(writer, timestamp=2000)
+        writer.close()
+
+        records = ColumnarMarketDataReader(self.data_dir).read(self.exchange, self.trading_pair)
+
+        self.assertEqual(market_data_dtype(3), records.dtype)
+        self.assertEqual(100.0, records["bid_prices"][0][0])
+        self.assertTrue(np.isnan(records["bid_prices"][0][1]))
+        self.assertEqual([100.0, 99.0, 98.0], records["bid_prices"][1].tolist())
+
+    def test_read_dataframe(self):
+        writer = ColumnarMarketDataWriter(data_dir=self.data_dir, depth=2)
+        self.append_snapshot(writer, timestamp=1000)
+        writer.close()
+        reader = ColumnarMarketDataReader(self.data_dir)
+
+        df = reader.read_dataframe(self.exchange, self.trading_pair)
+
+        self.assertEqual([(self.exchange, self.trading_pair)], reader.markets())
+        self.assertEqual(["timestamp", "mid_price", "best_bid", "best_ask",
+                          "bid_price_0", "bid_amount_0", "bid_price_1", "bid_amount_1",
+                          "ask_price_0", "ask_amount_0", "ask_price_1", "ask_amount_1"], list(df.columns))
+        self.assertEqual(99.0, df["bid_price_1"][0])
+        self.assertEqual(3.0, df["ask_amount_1"][0])
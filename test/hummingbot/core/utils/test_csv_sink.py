@@ -0,0 +1,84 @@
+import csv
+import os
+import tempfile
+import unittest
+
+from hummingbot.core.utils.csv_sink import CSVSink
+
+
+class CSVSinkTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.temp_dir.name, "trades.csv")
+        self.header = ("timestamp", "price", "amount")
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def _read_rows(self, file_path: str):
+        with open(file_path, newline="") as csv_file:
+            return list(csv.reader(csv_file))
+
+    def test_write_rows_to_new_file_with_header(self):
+        sink = CSVSink(file_path=self.file_path, header=self.header)
+        sink.write_row((1, "10.5", None))
+        sink.write_rows([(2, "11", 3), (3, "12", 4)])
+        sink.close()
+
+        self.assertFalse(sink.is_open)
+        self.assertEqual(
+            [list(self.header), ["1", "10.5", ""], ["2", "11", "3"], ["3", "12", "4"]],
+            self._read_rows(self.file_path))
+
+    def test_flush_writes_buffered_rows_without_closing(self):
+        sink = CSVSink(file_path=self.file_path, header=self.header, flush_interval=60)
+        sink.write_row((1, "10.5", "2"))
+        sink.flush()
+
+        self.assertTrue(sink.is_open)
+        self.assertEqual([list(self.header), ["1", "10.5", "2"]], self._read_rows(self.file_path))
+        sink.close()
+
+    def test_existing_file_with_same_header_is_continued(self):
+        sink = CSVSink(file_path=self.file_path, header=self.header)
+        sink.write_row((1, "10.5", "2"))
+        sink.close()
+
+        sink = CSVSink(file_path=self.file_path, header=self.header)
+        sink.write_row((2, "11", "3"))
+        sink.close()
+
+        self.assertEqual(
+            [list(self.header), ["1", "10.5", "2"], ["2", "11", "3"]],
+            self._read_rows(self.file_path))
+
+    def test_existing_file_with_different_header_is_renamed(self):
+        old_sink = CSVSink(file_path=self.file_path, header=("timestamp", "price"))
+        old_sink.write_row((1, "10.5"))
+        old_sink.close()
+
+        sink = CSVSink(file_path=self.file_path, header=self.header)
+        sink.write_row((2, "11", "3"))
+        sink.close()
+
+        self.assertEqual([list(self.header), ["2", "11", "3"]], self._read_rows(self.file_path))
+        old_files = [name for name in os.listdir(self.temp_dir.name) if name.startswith("trades_old_")]
+        self.assertEqual(1, len(old_files))
+        self.assertEqual(
+            [["timestamp", "price"], ["1", "10.5"]],
+            self._read_rows(os.path.join(self.temp_dir.name, old_files[0])))
+
+    def test_rotate_continues_in_new_file(self):
+        new_file_path = os.path.join(self.temp_dir.name, "trades_2.csv")
+        sink = CSVSink(file_path=self.file_path, header=self.header)
+        sink.write_row((1, "10.5", "2"))
+        sink.rotate(new_file_path)
+        sink.write_row((2, "11", "3"))
+        sink.close()
+
+        self.assertEqual(new_file_path, sink.file_path)
+        self.assertEqual([list(self.header), ["1", "10.5", "2"]], self._read_rows(self.file_path))
+        self.assertEqual([list(self.header), ["2", "11", "3"]], self._read_rows(new_file_path))
@@ -0,0 +1,81 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.core.utils.exchange_info_cache import ExchangeInfoCache
+
+
+class ExchangeInfoCacheTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = ExchangeInfoCache(ttl=60, cache_dir=self.temp_dir.name)
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def test_from_client_config_returns_none_when_disabled(self):
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+
+        self.assertIsNone(ExchangeInfoCache.from_client_config(client_config_map))
+
+        client_config_map.exchange_info_cache.exchange_info_cache_enabled = True
+        client_config_map.exchange_info_cache.exchange_info_cache_ttl = 10
+
+        cache = ExchangeInfoCache.from_client_config(client_config_map)
+        self.assertEqual(10, cache.ttl)
+
+    def test_set_and_get_entries_of_each_connector(self):
+        self.cache.set(connector_name="binance", key="trading_pairs_request", data={"symbols": [{"symbol": "ETHBTC"}]})
+        self.cache.set(connector_name="binance", key="all_trading_pairs", data=["ETH-BTC"])
+        self.cache.set(connector_name="kucoin", key="all_trading_pairs", data=["ETH-USDT"])
+
+        self.assertEqual({"symbols": [{"symbol": "ETHBTC"}]},
+                         self.cache.get(connector_name="binance", key="trading_pairs_request"))
+        self.assertEqual(["ETH-BTC"], self.cache.get(connector_name="binance", key="all_trading_pairs"))
+        self.assertEqual(["ETH-USDT"], self.cache.get(connector_name="kucoin", key="all_trading_pairs"))
+        self.assertIsNone(self.cache.get(connector_name="kucoin", key="trading_pairs_request"))
+        self.assertIsNone(self.cache.get(connector_name="gate_io", key="all_trading_pairs"))
+
+    @patch("hummingbot.core.utils.exchange_info_cache.time.time")
+    def test_expired_entries_are_ignored(self, time_mock):
+        time_mock.return_value = 1000
+        self.cache.set(connector_name="binance", key="all_trading_pairs", data=["ETH-BTC"])
+
+        time_mock.return_value = 1060
+        self.assertEqual(["ETH-BTC"], self.cache.get(connector_name="binance", key="all_trading_pairs"))
+        time_mock.return_value = 1061
+        self.assertIsNone(self.cache.get(connector_name="binance", key="all_trading_pairs"))
+
+    def test_files_of_other_versions_are_ignored(self):
+        self.cache.set(connector_name="binance", key="all_trading_pairs", data=["ETH-BTC"])
+        file_path = os.path.join(self.temp_dir.name, "binance.json")
+        with open(file_path) as cache_file:
+            contents = json.load(cache_file)
+        contents["version"] = 0
+        with open(file_path, "w") as cache_file:
+            json.dump(contents, cache_file)
+
+        self.assertIsNone(self.cache.get(connector_name="binance", key="all_trading_pairs"))
+
+    def test_invalid_files_and_data_are_ignored(self):
+        with open(os.path.join(self.temp_dir.name, "binance.json"), "w") as cache_file:
+            cache_file.write("{invalid")
+
+        self.assertIsNone(self.cache.get(connector_name="binance", key="all_trading_pairs"))
+
+        self.cache.set(connector_name="kucoin", key="all_trading_pairs", data=object())
+        self.assertIsNone(self.cache.get(connector_name="kucoin", key="all_trading_pairs"))
+
+    def test_clear(self):
+        self.cache.set(connector_name="binance", key="all_trading_pairs", data=["ETH-BTC"])
+
+        self.cache.clear(connector_name="binance")
+
+        self.assertIsNone(self.cache.get(connector_name="binance", key="all_trading_pairs"))
@@ -1,5 +1,6 @@
 import asyncio
 import json
+import tempfile
 import unittest
 from decimal import Decimal
 from typing import Any, Awaitable, Dict
@@ -13,6 +14,7 @@ from hummingbot.client.config.config_var import ConfigVar
 from hummingbot.client.settings import ConnectorSetting, ConnectorType
 from hummingbot.connector.exchange.binance import binance_constants as CONSTANTS, binance_web_utils
 from hummingbot.core.data_type.trade_fee import TradeFeeSchema
+from hummingbot.core.utils.exchange_info_cache import ExchangeInfoCache
 from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher
 
 
@@ -82,12 +84,61 @@ class TestTradingPairFetcher(unittest.TestCase):
         }
 
         client_config_map = ClientConfigAdapter(ClientConfigMap())
+        client_config_map.fetch_pairs_from_all_exchanges = True
         trading_pair_fetcher = TradingPairFetcher(client_config_map)
         self.async_run_with_timeout(self.wait_until_trading_pair_fetcher_ready(trading_pair_fetcher), 1.0)
         trading_pairs = trading_pair_fetcher.trading_pairs
         self.assertEqual(2, len(trading_pairs))
         self.assertEqual({"mockConnector": ["MOCK-HBOT"], "mock_paper_trade": ["MOCK-HBOT"]}, trading_pairs)
 
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._sf_shared_instance")
+    def test_trading_pairs_fetched_lazily_for_each_connector(self, _, mock_connector_settings):
+        connector_1 = AsyncMock()
+        connector_1.all_trading_pairs.return_value = ["MOCK-HBOT"]
+        connector_2 = AsyncMock()
+        connector_2.all_trading_pairs.return_value = ["OTHER-HBOT"]
+        mock_connector_settings.return_value = {
+            "mock_exchange_1": self.MockConnectorSetting(name="mock_exchange_1", connector=connector_1),
+            "mock_exchange_2": self.MockConnectorSetting(name="mock_exchange_2", connector=connector_2),
+            "mock_paper_trade": self.MockConnectorSetting(name="mock_paper_trade", parent_name="mock_exchange_1")
+        }
+
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        trading_pair_fetcher = TradingPairFetcher(client_config_map)
+
+        self.assertTrue(trading_pair_fetcher.ready)
+        self.assertEqual([], trading_pair_fetcher.trading_pairs_for_connector("mock_paper_trade"))
+        self.async_run_with_timeout(trading_pair_fetcher._fetch_pairs_tasks["mock_paper_trade"])
+
+        self.assertEqual(["MOCK-HBOT"], trading_pair_fetcher.trading_pairs_for_connector("mock_paper_trade"))
+        self.assertEqual({"mock_paper_trade": ["MOCK-HBOT"]}, trading_pair_fetcher.trading_pairs)
+        connector_1.all_trading_pairs.assert_called_once()
+        connector_2.all_trading_pairs.assert_not_called()
+        self.assertEqual([], trading_pair_fetcher.trading_pairs_for_connector("unknown_exchange"))
+
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._sf_shared_instance")
+    def test_trading_pairs_loaded_from_exchange_info_cache(self, _, mock_connector_settings):
+        connector = AsyncMock()
+        connector.all_trading_pairs.return_value = ["MOCK-HBOT"]
+        mock_connector_settings.return_value = {
+            "mock_exchange_1": self.MockConnectorSetting(name="mock_exchange_1", connector=connector),
+        }
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            client_config_map = ClientConfigAdapter(ClientConfigMap())
+            trading_pair_fetcher = TradingPairFetcher(client_config_map)
+            trading_pair_fetcher._exchange_info_cache = ExchangeInfoCache(ttl=60, cache_dir=cache_dir)
+            trading_pair_fetcher.trading_pairs_for_connector("mock_exchange_1")
+            self.async_run_with_timeout(trading_pair_fetcher._fetch_pairs_tasks["mock_exchange_1"])
+
+            trading_pair_fetcher = TradingPairFetcher(client_config_map)
+            trading_pair_fetcher._exchange_info_cache = ExchangeInfoCache(ttl=60, cache_dir=cache_dir)
+
+            self.assertEqual(["MOCK-HBOT"], trading_pair_fetcher.trading_pairs_for_connector("mock_exchange_1"))
+            connector.all_trading_pairs.assert_called_once()
+
     @aioresponses()
     @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
     @patch("hummingbot.core.gateway.gateway_http_client.GatewayHttpClient.get_perp_markets")
@@ -240,6 +291,7 @@ class TestTradingPairFetcher(unittest.TestCase):
         }
 
         client_config_map = ClientConfigAdapter(ClientConfigMap())
+        client_config_map.fetch_pairs_from_all_exchanges = True
         fetcher = TradingPairFetcher(client_config_map)
         asyncio.get_event_loop().run_until_complete(fetcher._fetch_task)
         trading_pairs = fetcher.trading_pairs
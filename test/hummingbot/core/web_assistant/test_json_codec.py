@@ -0,0 +1,88 @@
+import json
+import math
+import unittest
+from unittest.mock import patch
+
+from hummingbot.core.web_assistant import json_codec
+from hummingbot.core.web_assistant.json_codec import JSONCodec, OrjsonCodec, get_json_codec, set_json_codec
+
+
+class JSONCodecTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        set_json_codec(None)
+
+    def tearDown(self) -> None:
+        set_json_codec(None)
+        super().tearDown()
+
+    def test_dumps_and_loads_like_json_module(self):
+        codec = JSONCodec()
+        payload = {"symbol": "COINALPHA-HBOT", "price": 10.5, "amount": 1, "tags": ["a", "b"], "active": True}
+
+        encoded = codec.dumps(payload)
+
+        self.assertEqual(json.dumps(payload), encoded)
+        self.assertEqual(payload, codec.loads(encoded))
+        self.assertEqual(payload, codec.loads(encoded.encode()))
+
+    def test_loads_raises_on_invalid_json(self):
+        with self.assertRaises(json.JSONDecodeError):
+            JSONCodec().loads("pong")
+
+    def test_default_codec_is_orjson_when_installed(self):
+        codec = get_json_codec()
+
+        if json_codec.orjson is None:
+            self.assertEqual("json", codec.name)
+        else:
+            self.assertIsInstance(codec, OrjsonCodec)
+        self.assertIs(codec, get_json_codec())
+
+    @patch("hummingbot.core.web_assistant.json_codec.orjson", None)
+    def test_default_codec_falls_back_to_json_module(self):
+        codec = get_json_codec()
+
+        self.assertEqual("json", codec.name)
+        self.assertNotIsInstance(codec, OrjsonCodec)
+        with self.assertRaises(ImportError):
+            OrjsonCodec()
+
+    def test_set_json_codec(self):
+        codec = JSONCodec()
+
+        set_json_codec(codec)
+
+        self.assertIs(codec, get_json_codec())
+
+
+@unittest.skipIf(json_codec.orjson is None, "orjson is not installed")
+class OrjsonCodecTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.codec = OrjsonCodec()
+
+    def test_dumps_and_loads(self):
+        payload = {"symbol": "COINALPHA-HBOT", "price": 10.5, "amount": 1, "tags": ["a", "b"], "active": None}
+
+        encoded = self.codec.dumps(payload)
+
+        self.assertIsInstance(encoded, str)
+        self.assertEqual(payload, json.loads(encoded))
+        self.assertEqual(payload, self.codec.loads(encoded))
+        self.assertEqual(payload, self.codec.loads(encoded.encode()))
+
+    def test_dumps_non_string_keys(self):
+        self.assertEqual({"1": "one"}, json.loads(self.codec.dumps({1: "one"})))
+
+    def test_dumps_falls_back_to_json_module(self):
+        payload = {"id": 2 ** 70}
+
+        self.assertEqual(json.dumps(payload), self.codec.dumps(payload))
+
+    def test_loads_falls_back_to_json_module(self):
+        self.assertTrue(math.isnan(self.codec.loads('{"price": NaN}')["price"]))
+
+    def test_loads_raises_on_invalid_json(self):
+        with self.assertRaises(json.JSONDecodeError):
+            self.codec.loads("pong")
@@ -100,3 +100,58 @@ class RESTAssistantTest(unittest.TestCase):
         self.assertIsNotNone(call_request)
         self.assertIsNotNone(call_request.headers)
         self.assertEqual(call_request.headers, auth_header)
+
+    @patch("hummingbot.core.web_assistant.connections.rest_connection.RESTConnection.call")
+    def test_rest_assistant_does_not_modify_caller_request(self, mocked_call):
+        url = "https://www.test.com/url"
+        call_request: Optional[RESTRequest] = None
+
+        async def register_request_and_return(request: RESTRequest):
+            nonlocal call_request
+            call_request = request
+            return {"one": 1}
+
+        mocked_call.side_effect = register_request_and_return
+
+        class PreProcessorDummy(RESTPreProcessorBase):
+            async def pre_process(self, request: RESTRequest) -> RESTRequest:
+                request.headers["Content-Type"] = "application/json"
+                request.data["nonce"] = 1
+                return request
+
+        class AuthDummy(AuthBase):
+            async def rest_authenticate(self, request: RESTRequest) -> RESTRequest:
+                request.params["signature"] = "signed"
+                request.headers.update({"authenticated": True})
+                return request
+
+            async def ws_authenticate(self, request: WSRequest) -> WSRequest:
+                pass
+
+        connection = RESTConnection(aiohttp.ClientSession())
+        assistant = RESTAssistant(
+            connection,
+            throttler=AsyncThrottler(rate_limits=[]),
+            rest_pre_processors=[PreProcessorDummy()],
+            auth=AuthDummy(),
+        )
+        params = {"symbol": "COINALPHA-HBOT"}
+        data = {"side": "BUY", "quantity": ["1", "2"]}
+        headers = {"X-Header": "value"}
+        req = RESTRequest(
+            method=RESTMethod.POST, url=url, params=params, data=data, headers=headers, is_auth_required=True
+        )
+
+        self.async_run_with_timeout(assistant.call(req))
+
+        self.assertEqual({"symbol": "COINALPHA-HBOT", "signature": "signed"}, call_request.params)
+        self.assertEqual({"side": "BUY", "quantity": ["1", "2"], "nonce": 1}, call_request.data)
+        self.assertEqual(
+            {"X-Header": "value", "Content-Type": "application/json", "authenticated": True}, call_request.headers
+        )
+        self.assertIs(params, req.params)
+        self.assertIs(data, req.data)
+        self.assertIs(headers, req.headers)
+        self.assertEqual({"symbol": "COINALPHA-HBOT"}, params)
+        self.assertEqual({"side": "BUY", "quantity": ["1", "2"]}, data)
+        self.assertEqual({"X-Header": "value"}, headers)
@@ -3,6 +3,7 @@ import unittest
 from typing import Awaitable
 
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.web_assistant.json_codec import JSONCodec, get_json_codec
 from hummingbot.core.web_assistant.rest_assistant import RESTAssistant
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
@@ -31,3 +32,17 @@ class WebAssistantsFactoryTest(unittest.TestCase):
         ws_assistant = self.async_run_with_timeout(factory.get_ws_assistant())
 
         self.assertIsInstance(ws_assistant, WSAssistant)
+
+    def test_json_codec_is_used_by_the_assistants(self):
+        default_factory = WebAssistantsFactory(throttler=AsyncThrottler(rate_limits=[]))
+        json_codec = JSONCodec()
+        factory = WebAssistantsFactory(throttler=AsyncThrottler(rate_limits=[]), json_codec=json_codec)
+
+        rest_assistant = self.async_run_with_timeout(factory.get_rest_assistant())
+        ws_assistant = self.async_run_with_timeout(factory.get_ws_assistant())
+
+        self.assertIs(get_json_codec(), default_factory.json_codec)
+        self.assertIs(json_codec, factory.json_codec)
+        self.assertIs(json_codec, rest_assistant._json_codec)
+        self.assertIs(json_codec, rest_assistant._connection._json_codec)
+        self.assertIs(json_codec, ws_assistant._connection._json_codec)
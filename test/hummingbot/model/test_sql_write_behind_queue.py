@@ -0,0 +1,70 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.model.funding_payment import FundingPayment
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+from hummingbot.model.sql_write_behind_queue import SQLWriteBehindQueue
+
+
+class SQLWriteBehindQueueTests(TestCase):
+
+    @patch("hummingbot.model.sql_connection_manager.create_engine")
+    def setUp(self, engine_mock) -> None:
+        super().setUp()
+        engine_mock.return_value = create_engine(
+            "sqlite:///:memory:", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        self.manager = SQLConnectionManager(
+            ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS, db_name="test_DB"
+        )
+        self.write_queue = SQLWriteBehindQueue(sql=self.manager, max_batch_size=10)
+
+    def tearDown(self) -> None:
+        self.write_queue.stop(timeout=1)
+        super().tearDown()
+
+    def _add_payment_write(self, timestamp: int):
+        def write(session):
+            session.add(FundingPayment(timestamp=timestamp,
+                                       config_file_path="test_config",
+                                       market="test_market",
+                                       rate=0.01,
+                                       symbol="COINALPHA-HBOT",
+                                       amount=1.0))
+        return write
+
+    def _saved_timestamps(self):
+        with self.manager.get_new_session() as session:
+            return sorted(payment.timestamp for payment in session.query(FundingPayment).all())
+
+    def test_flush_waits_for_queued_writes(self):
+        self.write_queue.start()
+        for timestamp in range(25):
+            self.write_queue.put(self._add_payment_write(timestamp))
+
+        self.assertTrue(self.write_queue.flush(timeout=1))
+
+        self.assertEqual(list(range(25)), self._saved_timestamps())
+        self.assertEqual(0, self.write_queue.metrics["queue_depth"])
+        self.assertEqual(25, self.write_queue.metrics["committed_writes"])
+
+    def test_failed_write_does_not_discard_the_rest_of_the_batch(self):
+        def failing_write(session):
+            raise ValueError("Test error")
+
+        # The writes are queued before starting the writer, so they are committed in the same batch
+        self.write_queue.put(self._add_payment_write(1))
+        self.write_queue.put(failing_write)
+        self.write_queue.put(self._add_payment_write(2))
+        self.write_queue.start()
+
+        self.assertTrue(self.write_queue.stop(timeout=1))
+
+        self.assertEqual([1, 2], self._saved_timestamps())
+        self.assertEqual(2, self.write_queue.metrics["committed_writes"])
+        self.assertEqual(1, self.write_queue.metrics["failed_writes"])
+        self.assertFalse(self.write_queue.started)
@@ -111,6 +111,7 @@ class TestPMMConfigMap(unittest.TestCase):
         fetcher_mock = MagicMock()
         type(fetcher_mock).ready = mock.PropertyMock(return_value=True)
         type(fetcher_mock).trading_pairs = mock.PropertyMock(return_value={"test_market": ["BTC-USDT"]})
+        fetcher_mock.trading_pairs_for_connector.side_effect = lambda connector: {"test_market": ["BTC-USDT"]}.get(connector, [])
         TradingPairFetcher._sf_shared_instance = fetcher_mock
 
         perpetual_mm_config_map.get("derivative").value = "test_market"
@@ -177,6 +178,7 @@ class TestPMMConfigMap(unittest.TestCase):
         fetcher_mock = MagicMock()
         type(fetcher_mock).ready = mock.PropertyMock(return_value=True)
         type(fetcher_mock).trading_pairs = mock.PropertyMock(return_value={"test_market": ["BTC-USDT"]})
+        fetcher_mock.trading_pairs_for_connector.side_effect = lambda connector: {"test_market": ["BTC-USDT"]}.get(connector, [])
         TradingPairFetcher._sf_shared_instance = fetcher_mock
 
         perpetual_mm_config_map.get("price_source_derivative").value = "test_market"
@@ -0,0 +1,113 @@
+import os
+import tempfile
+import unittest
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.core.data_type.common import OrderType
+from hummingbot.strategy.backtest_sweep import BacktestDataset, BacktestSweep, ScriptStrategyTemplate, StrategyTemplate
+from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
+
+
+class LimitBuyScript(ScriptStrategyBase):
+    trading_pair = "COINALPHA-HBOT"
+    markets = {"replay": {trading_pair}}
+    buy_price = 99.0
+    order_placed = False
+
+    def on_tick(self):
+        if not self.order_placed:
+            self.buy("replay", self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal(str(self.buy_price)))
+            self.order_placed = True
+
+
+class BacktestSweepTests(unittest.TestCase):
+    start_timestamp = 1672531200
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        candles_path = os.path.join(self.temp_dir.name, "candles.csv")
+        pd.DataFrame({
+            "timestamp": [(self.start_timestamp + 60 * minute) * 1000 for minute in range(3)],
+            "open": [100.0, 100.0, 100.0],
+            "high": [101.0, 101.0, 101.0],
+            "low": [99.5, 98.0, 99.5],
+            "close": [100.0, 100.0, 100.0],
+            "volume": [10.0, 10.0, 10.0],
+        }).to_csv(candles_path, index=False)
+        self.dataset = BacktestDataset.from_candles_csv(candles_path, "COINALPHA-HBOT", self.temp_dir.name)
+        self.balances = {"COINALPHA": Decimal("0"), "HBOT": Decimal("1000")}
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def test_dataset_is_memory_mapped(self):
+        self.assertIsInstance(self.dataset.records, np.memmap)
+        self.assertTrue(self.dataset.is_candles)
+        self.assertEqual((self.start_timestamp, self.start_timestamp + 180), self.dataset.time_range())
+
+    def test_parameter_sets(self):
+        sweep = BacktestSweep(template=ScriptStrategyTemplate(LimitBuyScript),
+                              datasets=[self.dataset],
+                              parameter_grid={"buy_price": [99, 98.5], "order_placed": [False, True]})
+
+        self.assertEqual([{"buy_price": 99, "order_placed": False},
+                          {"buy_price": 99, "order_placed": True},
+                          {"buy_price": 98.5, "order_placed": False},
+                          {"buy_price": 98.5, "order_placed": True}], sweep.parameter_sets)
+
+    def test_run_in_process(self):
+        sweep = BacktestSweep(template=ScriptStrategyTemplate(LimitBuyScript),
+                              datasets=[self.dataset],
+                              parameter_grid={"buy_price": ["99", "97"]},
+                              balances=self.balances,
+                              max_workers=1)
+
+        results = sweep.run()
+
+        self.assertEqual(["99", "97"], results["buy_price"].tolist())
+        self.assertEqual(["COINALPHA-HBOT", "COINALPHA-HBOT"], results["trading_pair"].tolist())
+        self.assertEqual([1, 0], results["fills"].tolist())
+        self.assertEqual([1.0, 0.0], results["end_base_balance"].tolist())
+        self.assertEqual([901.0, 1000.0], results["end_quote_balance"].tolist())
+        # The position bought at 99 is valued at the last mid price of 100
+        self.assertEqual([1.0, 0.0], results["pnl"].tolist())
+
+    def test_run_in_worker_processes(self):
+        parameter_grid = {"buy_price": [99.0, 97.0]}
+        in_process_results = BacktestSweep(template=ScriptStrategyTemplate(LimitBuyScript),
+                                           datasets=[self.dataset],
+                                           parameter_grid=parameter_grid,
+                                           balances=self.balances,
+                                           max_workers=1).run()
+
+        results = BacktestSweep(template=ScriptStrategyTemplate(LimitBuyScript),
+                                datasets=[self.dataset],
+                                parameter_grid=parameter_grid,
+                                balances=self.balances,
+                                max_workers=2).run()
+
+        pd.testing.assert_frame_equal(in_process_results, results)
+
+    def test_failed_run_is_reported(self):
+        sweep = BacktestSweep(template=ScriptStrategyTemplate(LimitBuyScript),
+                              datasets=[self.dataset],
+                              parameter_grid={"unknown_parameter": [1]},
+                              balances=self.balances,
+                              max_workers=1)
+
+        results = sweep.run()
+
+        self.assertEqual(1, len(results))
+        self.assertEqual("LimitBuyScript has no attribute unknown_parameter.", results["error"][0])
+
+    def test_strategy_template_without_create_strategy_cannot_be_created(self):
+        class IncompleteTemplate(StrategyTemplate):
+            pass
+
+        with self.assertRaises(TypeError):
+            IncompleteTemplate()
@@ -1,3 +1,6 @@
+import csv
+import os
+import tempfile
 import unittest
 from unittest.mock import MagicMock, patch
 
@@ -107,3 +110,26 @@ class DirectionalStrategyBaseTest(unittest.TestCase):
     def test_get_position_config_signal_positive(self, signal):
         signal.return_value = 1
         self.assertIsNotNone(self.strategy.get_position_config())
+
+    def test_clean_and_store_executors_appends_closed_executors_to_csv(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        csv_path = os.path.join(temp_dir.name, "executors.csv")
+        closed_executor = MagicMock()
+        closed_executor.is_closed = True
+        active_executor = MagicMock()
+        active_executor.is_closed = False
+        self.strategy.active_executors = [closed_executor, active_executor]
+        self.strategy.stored_executors = []
+
+        with patch.object(self.strategy, "get_csv_path", return_value=csv_path):
+            self.strategy.clean_and_store_executors()
+            self.strategy.clean_and_store_executors()
+        self.strategy.on_stop()
+
+        with open(csv_path, newline="") as csv_file:
+            rows = list(csv.reader(csv_file))
+        self.assertEqual(list(DirectionalStrategyBase.executors_csv_header), rows[0])
+        self.assertEqual(2, len(rows))
+        self.assertEqual([closed_executor], self.strategy.stored_executors)
+        self.assertEqual([active_executor], self.strategy.active_executors)
@@ -107,3 +107,69 @@ class RingBufferTest(unittest.TestCase):
         self.assertTrue(np.array_equal(buffer.get_as_numpy_array(), np.array([0, 1, 2, 3])))
         buffer.add_value(4)
         self.assertTrue(np.array_equal(buffer.get_as_numpy_array(), np.array([1, 2, 3, 4])))
+
+    def test_buffer_longer_than_int16_range(self):
+        length = 40000
+        buffer = RingBuffer(length)
+        for i in range(length + 5):
+            buffer.add_value(i)
+
+        values = buffer.get_as_numpy_array()
+        self.assertEqual(length, values.size)
+        self.assertEqual(5, values[0])
+        self.assertEqual(length + 4, values[-1])
+        self.assertEqual(np.mean(values), buffer.mean_value)
+
+    def test_get_views(self):
+        buffer = RingBuffer(4)
+        older_values, newer_values = buffer.get_views()
+        self.assertEqual(0, older_values.size + newer_values.size)
+
+        for i in range(3):
+            buffer.add_value(i)
+        older_values, newer_values = buffer.get_views()
+        self.assertTrue(np.array_equal(np.array([0, 1, 2]), np.concatenate((older_values, newer_values))))
+
+        for i in range(3, 6):
+            buffer.add_value(i)
+        older_values, newer_values = buffer.get_views()
+        self.assertTrue(np.array_equal(np.array([2, 3]), older_values))
+        self.assertTrue(np.array_equal(np.array([4, 5]), newer_values))
+        self.assertFalse(older_values.flags.writeable)
+        self.assertFalse(newer_values.flags.writeable)
+
+    def test_rolling_statistics_match_numpy(self):
+        np.random.seed(42)
+        samples = np.random.normal(10000, 0.5, self.BUFFER_LENGTH * 5)
+
+        for sample in samples:
+            self.buffer.add_value(sample)
+            values = self.buffer.get_as_numpy_array()
+            self.assertEqual(values.size, self.buffer.size)
+            self.assertAlmostEqual(np.sum(values), self.buffer.sum, 6)
+            self.assertAlmostEqual(np.mean(values), self.buffer.window_mean, 9)
+            self.assertAlmostEqual(np.var(values), self.buffer.window_variance, 9)
+            if self.buffer.is_full:
+                self.assertAlmostEqual(np.mean(values), self.buffer.mean_value, 9)
+                self.assertAlmostEqual(np.var(values), self.buffer.variance, 9)
+                self.assertAlmostEqual(np.std(values), self.buffer.std_dev, 9)
+
+    def test_rolling_statistics_recover_after_nan_leaves_the_buffer(self):
+        self.buffer.add_value(np.nan)
+        for i in range(self.BUFFER_LENGTH - 1):
+            self.buffer.add_value(1)
+        self.assertTrue(np.isnan(self.buffer.mean_value))
+
+        self.buffer.add_value(1)
+        self.assertEqual(1, self.buffer.mean_value)
+        self.assertEqual(0, self.buffer.variance)
+
+    def test_change_length(self):
+        for i in range(self.BUFFER_LENGTH):
+            self.buffer.add_value(i)
+
+        self.buffer.length = 10
+
+        self.assertTrue(self.buffer.is_full)
+        self.assertTrue(np.array_equal(np.arange(20, 30), self.buffer.get_as_numpy_array()))
+        self.assertEqual(24.5, self.buffer.mean_value)
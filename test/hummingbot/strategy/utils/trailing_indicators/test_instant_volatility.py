@@ -20,3 +20,19 @@ class InstantVolatilityTest(unittest.TestCase):
             self.indicator.add_sample(sample)
 
         self.assertAlmostEqual(self.indicator.current_value, 14.068197250366211, 4)
+
+    def test_volatility_matches_full_recalculation(self):
+        samples = np.random.normal(100, 1, 200)
+        self.indicator = InstantVolatilityIndicator(50, 1)
+
+        for i, sample in enumerate(samples):
+            self.indicator.add_sample(sample)
+            window = samples[max(0, i - 49):i + 1]
+            expected = np.sqrt(np.sum(np.square(np.diff(window))) / window.size)
+            self.assertAlmostEqual(expected, self.indicator.current_value, 9)
+
+        self.indicator.sampling_length = 20
+        self.indicator.add_sample(100)
+        window = np.append(samples, 100)[-20:]
+        expected = np.sqrt(np.sum(np.square(np.diff(window))) / window.size)
+        self.assertAlmostEqual(expected, self.indicator.current_value, 9)
@@ -1,4 +1,5 @@
 import math
+import time
 import unittest
 from decimal import Decimal
 
@@ -13,6 +14,7 @@ from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.trade_fee import TradeFeeSchema
 from hummingbot.core.event.events import OrderBookTradeEvent
+from hummingbot.strategy.__utils__.trailing_indicators import trading_intensity
 from hummingbot.strategy.__utils__.trailing_indicators.trading_intensity import TradingIntensityIndicator
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.strategy.order_book_asset_price_delegate import OrderBookAssetPriceDelegate
@@ -259,3 +261,76 @@ class TradingIntensityTest(unittest.TestCase):
 
         self.assertAlmostEqual(a, alpha, 10)
         self.assertAlmostEqual(b, kappa, 10)
+
+    def _register_trades_at_levels(self, indicator: TradingIntensityIndicator, timestamp: float, last_price: float):
+        for p in [2, 3, 4, 5]:
+            indicator.register_trade(OrderBookTradeEvent(
+                trading_pair="COINALPHAHBOT",
+                timestamp=timestamp,
+                price=p,
+                amount=2 * np.exp(-0.1 * (p - last_price)),
+                type=TradeType.SELL,
+            ))
+
+    def test_trades_are_matched_with_the_last_quote_before_them(self):
+        indicator = TradingIntensityIndicator(OrderBook(), self.price_delegate, 2)
+        indicator.last_quotes = [{"timestamp": 3, "price": 30}, {"timestamp": 2, "price": 20}, {"timestamp": 1, "price": 10}]
+
+        indicator.register_trade(OrderBookTradeEvent("COINALPHAHBOT", 2.5, TradeType.SELL, 21, 1))
+        indicator.register_trade(OrderBookTradeEvent("COINALPHAHBOT", 1, TradeType.SELL, 5, 1))
+        indicator.calculate(4)
+
+        self.assertFalse(indicator.is_sampling_buffer_full)
+        self.assertTrue(indicator.is_sampling_buffer_changed)
+        self.assertFalse(indicator.is_sampling_buffer_changed)
+        # The quotes before the one matched with the latest trade are dropped
+        self.assertEqual([4, 3, 2], [quote["timestamp"] for quote in indicator.last_quotes])
+
+    def test_intensity_is_only_estimated_when_new_samples_arrive(self):
+        indicator = TradingIntensityIndicator(OrderBook(), self.price_delegate, 1)
+        indicator.last_quotes = [{"timestamp": self.start_timestamp, "price": 1}]
+        fit_calls = []
+        original_fit_intensity = trading_intensity.fit_intensity
+
+        def fit_intensity(*args):
+            fit_calls.append(args)
+            return original_fit_intensity(*args)
+
+        trading_intensity.fit_intensity = fit_intensity
+        try:
+            self._register_trades_at_levels(indicator, self.start_timestamp + 1, 1)
+            indicator.calculate(self.start_timestamp + 1)
+            indicator.calculate(self.start_timestamp + 2)
+            indicator.calculate(self.start_timestamp + 3)
+        finally:
+            trading_intensity.fit_intensity = original_fit_intensity
+
+        self.assertEqual(1, len(fit_calls))
+        alpha, kappa = indicator.current_value
+        self.assertAlmostEqual(2, alpha, 10)
+        self.assertAlmostEqual(0.1, kappa, 10)
+
+    def test_intensity_estimated_in_background(self):
+        indicator = TradingIntensityIndicator(OrderBook(), self.price_delegate, 1, fit_in_background=True)
+        indicator.last_quotes = [{"timestamp": self.start_timestamp, "price": 1}]
+
+        self._register_trades_at_levels(indicator, self.start_timestamp + 1, 1)
+        indicator.calculate(self.start_timestamp + 1)
+        for timestamp in range(2, 100):
+            if indicator.current_value != (0, 0):
+                break
+            time.sleep(0.01)
+            indicator.calculate(self.start_timestamp + timestamp)
+
+        alpha, kappa = indicator.current_value
+        self.assertAlmostEqual(2, alpha, 10)
+        self.assertAlmostEqual(0.1, kappa, 10)
+
+    def test_quotes_memory_is_bounded(self):
+        indicator = TradingIntensityIndicator(OrderBook(), self.price_delegate, 1)
+
+        for timestamp in range(trading_intensity.MAX_QUOTES + 10):
+            indicator.calculate(self.start_timestamp + timestamp)
+
+        self.assertLessEqual(len(indicator.last_quotes), trading_intensity.MAX_QUOTES)
+        self.assertEqual(self.start_timestamp + trading_intensity.MAX_QUOTES + 9, indicator.last_quotes[0]["timestamp"])